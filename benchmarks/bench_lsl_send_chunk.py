@@ -0,0 +1,78 @@
+"""Compare the list and NumPy ``send_chunk`` paths of ``LSLBreathingSender``.
+
+Run from the repository root with liblsl available:
+
+    python benchmarks/bench_lsl_send_chunk.py --channels 1 8 --rows 50 200
+
+Each case pushes the same explicitly timestamped chunk repeatedly through a
+real LSL outlet (no inlet is connected, so the cost measured is the Python
+and liblsl enqueue cost on the sending side).
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from pathlib import Path
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.lsl_out import LSLBreathingSender  # noqa: E402
+
+
+def _bench_case(channel_count: int, rows: int, repeats: int) -> tuple[float, float]:
+    sender = LSLBreathingSender(
+        name=f"BenchSendChunk{channel_count}",
+        channel_count=channel_count,
+        nominal_srate=1000.0,
+        source_id=f"bench_send_chunk_{channel_count}",
+        channel_labels=None,
+    )
+    rng = np.random.default_rng(0)
+    samples = rng.random((rows, channel_count)).astype(np.float32)
+    timestamps = 1000.0 + np.arange(rows, dtype=np.float64) / 1000.0
+    # The list path is what the acquisition loop produced before the array
+    # path existed: Python floats per sample and a Python timestamp list.
+    list_samples = samples.tolist() if channel_count > 1 else samples[:, 0].tolist()
+    list_timestamps = timestamps.tolist()
+
+    list_s = min(
+        timeit.repeat(
+            lambda: sender.send_chunk(list_samples, timestamps=list_timestamps),
+            number=repeats,
+            repeat=5,
+        )
+    )
+    array_s = min(
+        timeit.repeat(
+            lambda: sender.send_chunk_array(samples, timestamps),
+            number=repeats,
+            repeat=5,
+        )
+    )
+    return list_s / repeats, array_s / repeats
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--channels", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--rows", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    print(f"{'channels':>8} {'rows':>6} {'list us':>10} {'array us':>10} {'speedup':>8}")
+    for channel_count in args.channels:
+        for rows in args.rows:
+            list_s, array_s = _bench_case(channel_count, rows, args.repeats)
+            print(
+                f"{channel_count:>8} {rows:>6} {list_s * 1e6:>10.1f} "
+                f"{array_s * 1e6:>10.1f} {list_s / array_s:>7.1f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,755 @@
+"""Benchmark the acquisition-to-output hot path and write the results as JSON.
+
+Run from the repository root:
+
+    python benchmarks/run_benchmarks.py --output baseline.json
+    python benchmarks/run_benchmarks.py --cases pipeline_row raw_qc --compare baseline.json
+
+Every selected case runs at each ``--rates`` x ``--channels`` combination on
+``--seconds`` of synthetic BITalino rows (a fixed seed, so runs are
+repeatable) and reports throughput in samples/s plus latency percentiles of
+each timed call and per sample. The cases are:
+
+- ``pipeline_row``: ``process_device_row`` once per row, in every mode
+- ``pipeline_block``: ``process_device_rows`` once per chunk, in every mode;
+  with more than one channel every analog column is processed through
+  ``process_multichannel_rows`` as in a live multi-column run
+- ``pipeline_block_crossover``: single-column ``process_device_rows`` at a
+  range of block sizes, once forced through the per-row loop and once
+  through the span path, in every mode; records samples/s of both paths per
+  size and the smallest size at which the span path wins, next to the
+  ``_MIN_BLOCK_SAMPLES`` threshold the pipeline uses
+- ``raw_qc``: ``update_raw_qc`` once per row and analog column
+- ``raw_qc_block``: ``update_raw_qc_block`` once per chunk and analog column
+- ``session_writer_csv``: one chunk of device rows, signal trace (and channel
+  trace) rows plus ``flush_incremental`` per call, with the default
+  ``output.durability`` policy, in a temporary directory
+- ``lsl_send_chunk`` / ``lsl_send_chunk_array``: ``LSLBreathingSender`` chunk
+  pushes of ``--channels`` control values into a local stand-in outlet, so
+  only the Python-side cost is measured and no LSL network traffic happens;
+  the stand-in exposes ``do_push_chunk_n`` so ``send_chunk_array`` takes the
+  same raw-buffer path it uses with liblsl
+- ``breathbelt_ring``: ``BreathBelt`` reader thread plus ``get_block``
+  consumer over a fake device that returns chunks as fast as they are read
+
+``--compare`` prints the samples/s ratio against an earlier JSON file for
+every matching case, mode, rate and channel count.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+import ctypes
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime
+import json
+from pathlib import Path
+import platform
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src import __version__  # noqa: E402
+from src.connect import BreathBelt  # noqa: E402
+from src.multichannel import create_multichannel_state, process_multichannel_rows  # noqa: E402
+import src.pipeline as pipeline_module  # noqa: E402
+from src.pipeline import (  # noqa: E402
+    PipelineConfig,
+    create_pipeline_state,
+    process_device_row,
+    process_device_rows,
+)
+from src.quality import create_raw_qc_state, update_raw_qc, update_raw_qc_block  # noqa: E402
+from src.session_writer import SessionWriter  # noqa: E402
+from src.settings import (  # noqa: E402
+    BITALINO_ANALOG_START_COLUMN,
+    AppConfig,
+    default_config,
+    expected_bitalino_row_width,
+)
+from src.synthetic_device import SyntheticBITalino  # noqa: E402
+
+SCHEMA_VERSION = 1
+PROCESSING_MODES = ("control", "movement", "adaptive")
+_CROSSOVER_BLOCK_SIZES = (8, 16, 24, 32, 48, 64, 96, 128)
+_PERCENTILES = (50, 90, 99, 99.9)
+
+
+@dataclass(frozen=True)
+class _Timing:
+    """Raw measurements of one case run."""
+
+    unit: str
+    durations_ns: np.ndarray
+    samples_per_call: np.ndarray
+    elapsed_s: float
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """One case at one mode, sampling rate and channel count."""
+
+    case: str
+    mode: str | None
+    sampling_rate_hz: int
+    channels: int
+    chunk_size: int
+    unit: str
+    calls: int
+    samples: int
+    elapsed_s: float
+    samples_per_s: float
+    latency_us: dict[str, float]
+    per_sample_latency_us: dict[str, float]
+    extra: dict[str, Any]
+
+    @property
+    def key(self) -> tuple[str, str | None, int, int]:
+        return (self.case, self.mode, self.sampling_rate_hz, self.channels)
+
+
+def _bench_config(sampling_rate_hz: int, channel_count: int, chunk_size: int) -> AppConfig:
+    defaults = default_config()
+    return replace(
+        defaults,
+        device=replace(
+            defaults.device,
+            sampling_rate_hz=sampling_rate_hz,
+            channels=tuple(range(channel_count)),
+            chunk_size=chunk_size,
+        ),
+        output=replace(defaults.output, format="csv", writer="sync"),
+        synthetic_device=replace(defaults.synthetic_device, realtime=False, seed=0),
+    )
+
+
+def _multichannel_config(config: AppConfig) -> AppConfig:
+    columns = tuple(
+        BITALINO_ANALOG_START_COLUMN + offset for offset in range(len(config.device.channels))
+    )
+    return replace(config, device=replace(config.device, processed_sensor_columns=columns))
+
+
+def _synthetic_rows(config: AppConfig, row_count: int) -> np.ndarray:
+    device = SyntheticBITalino(config.synthetic_device)
+    device.start(config.device.sampling_rate_hz, list(config.device.channels))
+    return device.read(row_count)
+
+
+def _chunks(row_count: int, chunk_size: int) -> list[slice]:
+    return [slice(start, min(start + chunk_size, row_count)) for start in range(0, row_count, chunk_size)]
+
+
+def _timed_chunks(
+    rows: np.ndarray,
+    chunk_size: int,
+    call: Callable[[slice], None],
+) -> _Timing:
+    chunks = _chunks(len(rows), chunk_size)
+    durations_ns = np.empty(len(chunks), dtype=np.int64)
+    for position, chunk in enumerate(chunks):
+        started_ns = time.perf_counter_ns()
+        call(chunk)
+        durations_ns[position] = time.perf_counter_ns() - started_ns
+    return _Timing(
+        unit="chunk",
+        durations_ns=durations_ns,
+        samples_per_call=np.array([chunk.stop - chunk.start for chunk in chunks]),
+        elapsed_s=float(durations_ns.sum()) / 1e9,
+    )
+
+
+def _bench_pipeline_row(config: AppConfig, rows: np.ndarray, mode: str | None) -> _Timing:
+    cfg = PipelineConfig.from_app_config(config, mode)
+    state = create_pipeline_state(cfg)
+    durations_ns = np.empty(len(rows), dtype=np.int64)
+    for position, row in enumerate(rows):
+        started_ns = time.perf_counter_ns()
+        _, state = process_device_row(row, state, cfg)
+        durations_ns[position] = time.perf_counter_ns() - started_ns
+    return _Timing(
+        unit="sample",
+        durations_ns=durations_ns,
+        samples_per_call=np.ones(len(rows), dtype=np.int64),
+        elapsed_s=float(durations_ns.sum()) / 1e9,
+    )
+
+
+def _bench_pipeline_block(config: AppConfig, rows: np.ndarray, mode: str | None) -> _Timing:
+    if len(config.device.channels) > 1:
+        cfg = PipelineConfig.from_app_config(_multichannel_config(config), mode)
+        multichannel_state = create_multichannel_state(cfg)
+
+        def call(chunk: slice) -> None:
+            nonlocal multichannel_state
+            _, multichannel_state = process_multichannel_rows(rows[chunk], multichannel_state, cfg)
+
+    else:
+        cfg = PipelineConfig.from_app_config(config, mode)
+        state = create_pipeline_state(cfg)
+
+        def call(chunk: slice) -> None:
+            nonlocal state
+            _, state = process_device_rows(rows[chunk], state, cfg)
+
+    timing = _timed_chunks(rows, config.device.chunk_size, call)
+    if len(config.device.channels) == 1:
+        timing.extra["block_path"] = (
+            "row_loop"
+            if config.device.chunk_size < pipeline_module._MIN_BLOCK_SAMPLES
+            else "span"
+        )
+    return timing
+
+
+def _bench_pipeline_block_crossover(
+    config: AppConfig,
+    rows: np.ndarray,
+    mode: str | None,
+) -> _Timing:
+    cfg = PipelineConfig.from_app_config(config, mode)
+    single_column_rows = rows[:, : BITALINO_ANALOG_START_COLUMN + 1]
+    durations: list[np.ndarray] = []
+    samples_per_call: list[np.ndarray] = []
+    rates: dict[str, list[float]] = {"row_loop": [], "span": []}
+    for block_size in _CROSSOVER_BLOCK_SIZES:
+        for path, threshold in (("row_loop", sys.maxsize), ("span", 0)):
+            state = create_pipeline_state(cfg)
+
+            def call(chunk: slice) -> None:
+                nonlocal state
+                _, state = process_device_rows(single_column_rows[chunk], state, cfg)
+
+            with mock.patch.object(pipeline_module, "_MIN_BLOCK_SAMPLES", threshold):
+                timing = _timed_chunks(single_column_rows, block_size, call)
+            rates[path].append(
+                float(timing.samples_per_call.sum()) / timing.elapsed_s if timing.elapsed_s > 0.0 else 0.0
+            )
+            durations.append(timing.durations_ns)
+            samples_per_call.append(timing.samples_per_call)
+    durations_ns = np.concatenate(durations)
+    crossover_rows = next(
+        (
+            block_size
+            for block_size, loop_rate, span_rate in zip(
+                _CROSSOVER_BLOCK_SIZES,
+                rates["row_loop"],
+                rates["span"],
+            )
+            if span_rate >= loop_rate
+        ),
+        None,
+    )
+    return _Timing(
+        unit="chunk",
+        durations_ns=durations_ns,
+        samples_per_call=np.concatenate(samples_per_call),
+        elapsed_s=float(durations_ns.sum()) / 1e9,
+        extra={
+            "block_sizes": list(_CROSSOVER_BLOCK_SIZES),
+            "row_loop_samples_per_s": rates["row_loop"],
+            "span_samples_per_s": rates["span"],
+            "crossover_rows": crossover_rows,
+            "min_block_samples": pipeline_module._MIN_BLOCK_SAMPLES,
+        },
+    )
+
+
+def _bench_raw_qc(config: AppConfig, rows: np.ndarray, mode: str | None) -> _Timing:
+    del mode
+    fs_hz = float(config.device.sampling_rate_hz)
+    columns = range(BITALINO_ANALOG_START_COLUMN, rows.shape[1])
+    states = [create_raw_qc_state() for _ in columns]
+    values = rows[:, BITALINO_ANALOG_START_COLUMN:].tolist()
+    durations_ns = np.empty(len(rows), dtype=np.int64)
+    event_count = 0
+    for sample_index, row_values in enumerate(values):
+        relative_time_s = sample_index / fs_hz
+        started_ns = time.perf_counter_ns()
+        for raw_value, state in zip(row_values, states):
+            events, _ = update_raw_qc(
+                raw_value,
+                "runtime",
+                sample_index,
+                relative_time_s,
+                state,
+                config.raw_qc,
+                fs_hz,
+            )
+            event_count += len(events)
+        durations_ns[sample_index] = time.perf_counter_ns() - started_ns
+    return _Timing(
+        unit="sample",
+        durations_ns=durations_ns,
+        samples_per_call=np.ones(len(rows), dtype=np.int64),
+        elapsed_s=float(durations_ns.sum()) / 1e9,
+        extra={"qc_events": event_count},
+    )
+
+
+def _bench_raw_qc_block(config: AppConfig, rows: np.ndarray, mode: str | None) -> _Timing:
+    del mode
+    fs_hz = float(config.device.sampling_rate_hz)
+    columns = range(BITALINO_ANALOG_START_COLUMN, rows.shape[1])
+    states = [create_raw_qc_state() for _ in columns]
+    values = rows[:, BITALINO_ANALOG_START_COLUMN:].astype(float)
+    event_count = 0
+
+    def call(chunk: slice) -> None:
+        nonlocal event_count
+        sample_indices = np.arange(chunk.start, chunk.stop)
+        relative_times_s = sample_indices / fs_hz
+        for position, state in enumerate(states):
+            events, _ = update_raw_qc_block(
+                values[chunk, position],
+                "runtime",
+                sample_indices,
+                relative_times_s,
+                state,
+                config.raw_qc,
+                fs_hz,
+            )
+            event_count += len(events)
+
+    timing = _timed_chunks(rows, config.device.chunk_size, call)
+    timing.extra["qc_events"] = event_count
+    return timing
+
+
+def _bench_session_writer_csv(config: AppConfig, rows: np.ndarray, mode: str | None) -> _Timing:
+    del mode
+    multichannel = len(config.device.channels) > 1
+    if multichannel:
+        config = _multichannel_config(config)
+    cfg = PipelineConfig.from_app_config(config, "control")
+    chunk_size = config.device.chunk_size
+    batches = []
+    if multichannel:
+        multichannel_state = create_multichannel_state(cfg)
+        for chunk in _chunks(len(rows), chunk_size):
+            channel_batch, multichannel_state = process_multichannel_rows(
+                rows[chunk],
+                multichannel_state,
+                cfg,
+            )
+            batches.append(
+                (channel_batch.channel(multichannel_state.primary_position), channel_batch)
+            )
+    else:
+        state = create_pipeline_state(cfg)
+        for chunk in _chunks(len(rows), chunk_size):
+            batch, state = process_device_rows(rows[chunk], state, cfg)
+            batches.append((batch, None))
+    source_sample_indices = np.arange(len(rows), dtype=np.int64)
+    capture_times_lsl_s = 1000.0 + source_sample_indices / config.device.sampling_rate_hz
+
+    with tempfile.TemporaryDirectory(prefix="bench-session-writer-") as root_dir:
+        writer = SessionWriter(
+            root_dir,
+            config,
+            device_sample_width=expected_bitalino_row_width(config.device.channels),
+            **({"channel_columns": cfg.processed_sensor_columns} if multichannel else {}),
+        )
+        chunk_batches = iter(batches)
+
+        def call(chunk: slice) -> None:
+            batch, channel_batch = next(chunk_batches)
+            indices = source_sample_indices[chunk].tolist()
+            capture_times = capture_times_lsl_s[chunk].tolist()
+            writer.write_device_rows(
+                batch,
+                rows[chunk],
+                source_sample_indices=indices,
+                capture_times_lsl_s=capture_times,
+                lsl_timestamps_s=capture_times,
+            )
+            writer.write_signal_batch(
+                batch,
+                source_sample_indices=indices,
+                capture_times_lsl_s=capture_times,
+                lsl_timestamps_s=capture_times,
+                event_timestamps_lsl_s=[None] * len(batch),
+            )
+            if channel_batch is not None:
+                writer.write_channel_batch(
+                    channel_batch,
+                    source_sample_indices=indices,
+                    lsl_timestamps_s=capture_times,
+                )
+            writer.flush_incremental()
+
+        timing = _timed_chunks(rows, chunk_size, call)
+        writer.close()
+    return replace(timing, extra={"durability": config.output.durability})
+
+
+_FLOAT_POINTER = ctypes.POINTER(ctypes.c_float)
+_DOUBLE_POINTER = ctypes.POINTER(ctypes.c_double)
+
+
+class _StandInOutlet:
+    """Accept pushes like ``pylsl.StreamOutlet`` without any network I/O."""
+
+    def __init__(self, info: Any, *args: Any, **kwargs: Any) -> None:
+        del args, kwargs
+        self.channel_count = int(info.channel_count())
+        self.samples_pushed = 0
+        self.last_sample: float | None = None
+        self.last_timestamp: float | None = None
+        self.obj = ctypes.c_void_p(0)
+
+    def push_sample(self, sample: Any, timestamp: float | None = None) -> None:
+        del sample, timestamp
+        self.samples_pushed += 1
+
+    def push_chunk(self, samples: Any, timestamps: Any = None) -> None:
+        del timestamps
+        self.samples_pushed += len(samples)
+
+    def do_push_chunk_n(
+        self,
+        obj: Any,
+        data_ptr: ctypes.c_void_p,
+        n: ctypes.c_long,
+        ts_ptr: ctypes.c_void_p,
+        pushthrough: ctypes.c_int,
+    ) -> int:
+        """Read the raw buffers like liblsl's ``lsl_push_chunk_ftnp``."""
+
+        del obj, pushthrough
+        value_count = n.value
+        rows = value_count // self.channel_count
+        self.last_sample = ctypes.cast(data_ptr, _FLOAT_POINTER)[value_count - 1]
+        self.last_timestamp = ctypes.cast(ts_ptr, _DOUBLE_POINTER)[rows - 1]
+        self.samples_pushed += rows
+        return 0
+
+
+def _stand_in_sender(channel_count: int, sampling_rate_hz: int):
+    from src import lsl_out
+
+    with mock.patch.object(lsl_out, "StreamOutlet", _StandInOutlet):
+        return lsl_out.LSLBreathingSender(
+            name="BenchBreathingBelt",
+            channel_count=channel_count,
+            nominal_srate=sampling_rate_hz,
+            source_id="bench_breathing_belt",
+            channel_labels=None,
+        )
+
+
+def _bench_lsl_send_chunk(config: AppConfig, rows: np.ndarray, mode: str | None) -> _Timing:
+    del mode
+    channel_count = len(config.device.channels)
+    sender = _stand_in_sender(channel_count, config.device.sampling_rate_hz)
+    values = rows[:, BITALINO_ANALOG_START_COLUMN:] / 1023.0
+    timestamps = 1000.0 + np.arange(len(rows)) / config.device.sampling_rate_hz
+    # The acquisition loop used to build these lists for every chunk.
+    sample_lists = values.tolist() if channel_count > 1 else values[:, 0].tolist()
+    timestamp_list = timestamps.tolist()
+    return _timed_chunks(
+        rows,
+        config.device.chunk_size,
+        lambda chunk: sender.send_chunk(sample_lists[chunk], timestamps=timestamp_list[chunk]),
+    )
+
+
+def _bench_lsl_send_chunk_array(config: AppConfig, rows: np.ndarray, mode: str | None) -> _Timing:
+    del mode
+    sender = _stand_in_sender(len(config.device.channels), config.device.sampling_rate_hz)
+    values = (rows[:, BITALINO_ANALOG_START_COLUMN:] / 1023.0).astype(np.float32)
+    timestamps = 1000.0 + np.arange(len(rows)) / config.device.sampling_rate_hz
+    timing = _timed_chunks(
+        rows,
+        config.device.chunk_size,
+        lambda chunk: sender.send_chunk_array(values[chunk], timestamps[chunk]),
+    )
+    if sender.outlet.last_timestamp != timestamps[-1]:
+        raise RuntimeError("send_chunk_array did not take the raw-buffer push path.")
+    return timing
+
+
+class _ReplayDevice:
+    """Fake BITalino that returns precomputed rows as fast as they are read."""
+
+    def __init__(self, rows: np.ndarray) -> None:
+        self._rows = rows
+        self._position = 0
+        self.exhausted = threading.Event()
+
+    def start(self, sampling_rate: int, channels: list[int]) -> None:
+        del sampling_rate, channels
+
+    def read(self, n_samples: int) -> np.ndarray:
+        if self._position >= len(self._rows):
+            self.exhausted.set()
+            time.sleep(0.001)
+            return self._rows[:0]
+        chunk = self._rows[self._position : self._position + n_samples]
+        self._position += len(chunk)
+        return chunk
+
+    def stop(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+def _bench_breathbelt_ring(config: AppConfig, rows: np.ndarray, mode: str | None) -> _Timing:
+    del mode
+    device = _ReplayDevice(rows)
+    belt = BreathBelt(
+        mac_address="",
+        sampling_rate=config.device.sampling_rate_hz,
+        channels=config.device.channels,
+        read_chunk_size=config.device.chunk_size,
+        queue_max_samples=config.device.queue_max_samples,
+        device_factory=lambda: device,
+    )
+    durations_ns: list[int] = []
+    samples_per_call: list[int] = []
+    started = time.perf_counter()
+    belt.start()
+    try:
+        while True:
+            # Check exhaustion first so rows stored just before it are drained.
+            exhausted = device.exhausted.is_set()
+            if belt.wait_for_rows(timeout=0.01):
+                call_started_ns = time.perf_counter_ns()
+                block = belt.get_block()
+                durations_ns.append(time.perf_counter_ns() - call_started_ns)
+                samples_per_call.append(len(block))
+            elif exhausted:
+                break
+        elapsed_s = time.perf_counter() - started
+    finally:
+        belt.stop()
+    return _Timing(
+        unit="get_block",
+        durations_ns=np.asarray(durations_ns, dtype=np.int64),
+        samples_per_call=np.asarray(samples_per_call, dtype=np.int64),
+        elapsed_s=elapsed_s,
+        extra={
+            "rows_consumed": int(sum(samples_per_call)),
+            "dropped_rows": belt.dropped_rows_total,
+        },
+    )
+
+
+CASES: dict[str, tuple[Callable[[AppConfig, np.ndarray, str | None], _Timing], bool]] = {
+    # name: (runner, runs once per processing mode)
+    "pipeline_row": (_bench_pipeline_row, True),
+    "pipeline_block": (_bench_pipeline_block, True),
+    "pipeline_block_crossover": (_bench_pipeline_block_crossover, True),
+    "raw_qc": (_bench_raw_qc, False),
+    "raw_qc_block": (_bench_raw_qc_block, False),
+    "session_writer_csv": (_bench_session_writer_csv, False),
+    "lsl_send_chunk": (_bench_lsl_send_chunk, False),
+    "lsl_send_chunk_array": (_bench_lsl_send_chunk_array, False),
+    "breathbelt_ring": (_bench_breathbelt_ring, False),
+}
+
+
+def _percentiles_us(values_ns: np.ndarray) -> dict[str, float]:
+    if values_ns.size == 0:
+        return {}
+    values_us = np.asarray(values_ns, dtype=float) / 1e3
+    summary = {
+        f"p{percentile:g}": float(np.percentile(values_us, percentile))
+        for percentile in _PERCENTILES
+    }
+    summary["mean"] = float(values_us.mean())
+    summary["max"] = float(values_us.max())
+    return summary
+
+
+def run_case(
+    case: str,
+    *,
+    sampling_rate_hz: int,
+    channels: int,
+    seconds: float,
+    chunk_size: int,
+    mode: str | None = None,
+) -> BenchmarkResult:
+    """Run one benchmark case and summarize its timings."""
+
+    runner, _ = CASES[case]
+    config = _bench_config(sampling_rate_hz, channels, chunk_size)
+    rows = _synthetic_rows(config, int(round(seconds * sampling_rate_hz)))
+    timing = runner(config, rows, mode)
+    samples = int(timing.samples_per_call.sum())
+    if case == "breathbelt_ring":
+        samples += int(timing.extra["dropped_rows"])
+    nonempty = timing.samples_per_call > 0
+    return BenchmarkResult(
+        case=case,
+        mode=mode,
+        sampling_rate_hz=sampling_rate_hz,
+        channels=channels,
+        chunk_size=chunk_size,
+        unit=timing.unit,
+        calls=int(timing.durations_ns.size),
+        samples=samples,
+        elapsed_s=timing.elapsed_s,
+        samples_per_s=samples / timing.elapsed_s if timing.elapsed_s > 0.0 else 0.0,
+        latency_us=_percentiles_us(timing.durations_ns),
+        per_sample_latency_us=_percentiles_us(
+            timing.durations_ns[nonempty] / timing.samples_per_call[nonempty]
+        ),
+        extra=timing.extra,
+    )
+
+
+def run_suite(
+    cases: list[str],
+    *,
+    rates: list[int],
+    channel_counts: list[int],
+    seconds: float,
+    chunk_size: int,
+    on_result: Callable[[BenchmarkResult], None] | None = None,
+) -> list[BenchmarkResult]:
+    """Run every case at every rate and channel count (and mode, where relevant)."""
+
+    unknown = sorted(set(cases) - set(CASES))
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases: {unknown}.")
+    results = []
+    for case in cases:
+        modes = PROCESSING_MODES if CASES[case][1] else (None,)
+        for sampling_rate_hz in rates:
+            for channels in channel_counts:
+                for mode in modes:
+                    result = run_case(
+                        case,
+                        sampling_rate_hz=sampling_rate_hz,
+                        channels=channels,
+                        seconds=seconds,
+                        chunk_size=chunk_size,
+                        mode=mode,
+                    )
+                    results.append(result)
+                    if on_result is not None:
+                        on_result(result)
+    return results
+
+
+def results_document(results: list[BenchmarkResult], arguments: dict[str, Any]) -> dict[str, Any]:
+    """Return the JSON document written by ``--output``."""
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now().astimezone().isoformat(),
+        "software_version": __version__,
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        },
+        "arguments": arguments,
+        "results": [asdict(result) for result in results],
+    }
+
+
+def _format_result(result: BenchmarkResult) -> str:
+    label = result.case if result.mode is None else f"{result.case}[{result.mode}]"
+    line = (
+        f"{label:<30} {result.sampling_rate_hz:>5} Hz {result.channels:>2} ch "
+        f"{result.samples_per_s:>12,.0f} samples/s  "
+        f"p50 {result.latency_us.get('p50', 0.0):>9.1f} us  "
+        f"p99 {result.latency_us.get('p99', 0.0):>9.1f} us per {result.unit}"
+    )
+    if "crossover_rows" in result.extra:
+        line += (
+            f"  span path wins from {result.extra['crossover_rows']} rows"
+            f" (threshold {result.extra['min_block_samples']})"
+        )
+    return line
+
+
+def _compare(results: list[BenchmarkResult], baseline_path: Path) -> list[str]:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    baseline_rates = {
+        (entry["case"], entry["mode"], entry["sampling_rate_hz"], entry["channels"]): entry[
+            "samples_per_s"
+        ]
+        for entry in baseline["results"]
+    }
+    lines = [f"Compared with {baseline_path} (samples/s, current / baseline):"]
+    for result in results:
+        baseline_rate = baseline_rates.get(result.key)
+        if not baseline_rate:
+            continue
+        label = result.case if result.mode is None else f"{result.case}[{result.mode}]"
+        lines.append(
+            f"{label:<30} {result.sampling_rate_hz:>5} Hz {result.channels:>2} ch "
+            f"{result.samples_per_s / baseline_rate:>6.2f}x"
+        )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--rates", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--channels", type=int, nargs="+", default=[1, 6])
+    parser.add_argument(
+        "--seconds",
+        type=float,
+        default=120.0,
+        help="Seconds of synthetic signal per case (default: 120).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=default_config().device.chunk_size,
+        help="Rows per chunk for chunked cases (default: device.chunk_size).",
+    )
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file.")
+    parser.add_argument("--compare", type=Path, help="Earlier JSON results to compare against.")
+    args = parser.parse_args(argv)
+    if args.seconds <= 0.0 or args.chunk_size <= 0:
+        parser.error("--seconds and --chunk-size must be positive.")
+    if any(channels < 1 or channels > 6 for channels in args.channels):
+        parser.error("--channels must be between 1 and 6.")
+
+    results = run_suite(
+        args.cases,
+        rates=args.rates,
+        channel_counts=args.channels,
+        seconds=args.seconds,
+        chunk_size=args.chunk_size,
+        on_result=lambda result: print(_format_result(result), flush=True),
+    )
+    if args.output is not None:
+        arguments = {
+            "cases": args.cases,
+            "rates": args.rates,
+            "channels": args.channels,
+            "seconds": args.seconds,
+            "chunk_size": args.chunk_size,
+        }
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps(results_document(results, arguments), indent=2) + "\n",
+            encoding="utf-8",
+        )
+        print(f"Wrote benchmark results to {args.output}")
+    if args.compare is not None:
+        print("\n".join(_compare(results, args.compare)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
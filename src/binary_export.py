@@ -0,0 +1,253 @@
+"""Append-only binary columnar tables for long-running session exports.
+
+Each table is stored as two files next to each other:
+
+- ``<name>.bin``: fixed-size little-endian records appended as NumPy
+  structured arrays, one record per row, with the same columns as the CSV
+  export.
+- ``<name>.schema.json``: the record dtype plus the category tables used to
+  encode string columns (``stage``, ``processing_mode``, labels, messages) as
+  small integer codes.
+
+The ``.bin`` file can be memory-mapped or loaded with ``np.fromfile`` using
+the schema dtype; :func:`read_binary_table` does that and decodes the string
+columns. A trailing partial record left by an interrupted write is ignored.
+Missing optional values are stored as NaN, as in :class:`PipelineBatch`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+BINARY_TABLE_FORMAT = "breathing-belt-columnar"
+BINARY_TABLE_VERSION = 1
+
+
+def device_samples_dtype(device_sample_width: int) -> np.dtype:
+    """Record dtype of the binary ``device_samples`` table."""
+
+    return np.dtype(
+        [
+            ("stage", "<u2"),
+            ("sample_index", "<i8"),
+            ("relative_time_s", "<f8"),
+            ("source_sample_index", "<i8"),
+            ("capture_time_lsl_s", "<f8"),
+            ("lsl_timestamp_s", "<f8"),
+            *((f"device_col_{idx}", "<f8") for idx in range(device_sample_width)),
+        ]
+    )
+
+
+def channel_trace_column_names(channel_columns: Sequence[int]) -> list[str]:
+    """Per-channel column names of the ``channel_trace`` table, in export order."""
+
+    return [
+        f"{name}_col{column}"
+        for column in channel_columns
+        for name in (
+            "raw",
+            "filtered",
+            "normalized",
+            "movement",
+            "hold_mode_active",
+            "extrema_event_code",
+        )
+    ]
+
+
+def channel_trace_dtype(channel_columns: Sequence[int]) -> np.dtype:
+    """Record dtype of the binary ``channel_trace`` table."""
+
+    return np.dtype(
+        [
+            ("stage", "<u2"),
+            ("sample_index", "<i8"),
+            ("relative_time_s", "<f8"),
+            ("source_sample_index", "<i8"),
+            ("lsl_timestamp_s", "<f8"),
+            *(
+                (name, "u1" if name.startswith("hold_mode_active") else "<f8")
+                for name in channel_trace_column_names(channel_columns)
+            ),
+        ]
+    )
+
+
+SIGNAL_TRACE_DTYPE = np.dtype(
+    [
+        ("stage", "<u2"),
+        ("sample_index", "<i8"),
+        ("relative_time_s", "<f8"),
+        ("source_sample_index", "<i8"),
+        ("capture_time_lsl_s", "<f8"),
+        ("lsl_timestamp_s", "<f8"),
+        ("event_timestamp_lsl_s", "<f8"),
+        ("processing_mode", "<u2"),
+        ("selected_sensor_raw", "<f8"),
+        ("filtered_value", "<f8"),
+        ("cleaned_value", "<f8"),
+        ("normalized_value", "<f8"),
+        ("movement_value", "<f8"),
+        ("hold_mode_active", "u1"),
+        ("extrema_event_code", "<f8"),
+        ("extrema_event_label", "<u2"),
+    ]
+)
+
+QC_EVENTS_DTYPE = np.dtype(
+    [
+        ("event_type", "<u2"),
+        ("stage", "<u2"),
+        ("sample_index", "<i8"),
+        ("relative_time_s", "<f8"),
+        ("raw_value", "<f8"),
+        ("threshold", "<f8"),
+        ("message", "<u4"),
+    ]
+)
+
+
+class BinaryTableWriter:
+    """Append structured records to ``<stem>.bin`` and describe them in a schema.
+
+    String columns listed in ``categorical_columns`` are encoded through
+    :meth:`encode`, which assigns each distinct value a stable integer code.
+    The schema file is rewritten on :meth:`flush` whenever a new category
+    value has appeared since the last write.
+    """
+
+    def __init__(
+        self,
+        stem: str | Path,
+        dtype: np.dtype,
+        *,
+        categorical_columns: Sequence[str] = (),
+        categories: dict[str, Sequence[str]] | None = None,
+    ) -> None:
+        self.dtype = np.dtype(dtype)
+        self.data_path = Path(f"{stem}.bin")
+        self.schema_path = Path(f"{stem}.schema.json")
+        unknown = [name for name in categorical_columns if name not in self.dtype.names]
+        if unknown:
+            raise ValueError(f"Categorical columns {unknown} are not in the record dtype.")
+        self._categories: dict[str, list[str]] = {name: [] for name in categorical_columns}
+        self._codes: dict[str, dict[str, int]] = {name: {} for name in categorical_columns}
+        for name, values in (categories or {}).items():
+            for value in values:
+                self._code_for(name, value)
+        self.row_count = 0
+        self._schema_dirty = True
+        self._handle = self.data_path.open("wb")
+        self._write_schema()
+
+    def encode(self, column: str, values: Iterable[str]) -> np.ndarray:
+        """Return the integer category codes for ``values`` of one string column."""
+
+        return np.fromiter(
+            (self._code_for(column, value) for value in values),
+            dtype=self.dtype[column],
+        )
+
+    def empty_records(self, row_count: int) -> np.ndarray:
+        """Return an uninitialized record array to fill and pass to :meth:`append`."""
+
+        return np.empty(row_count, dtype=self.dtype)
+
+    def append(self, records: np.ndarray) -> None:
+        """Append a block of records with exactly this table's dtype."""
+
+        if records.dtype != self.dtype:
+            raise ValueError("Binary table records do not match the table dtype.")
+        if self._handle is None:
+            raise RuntimeError(f"Binary table {self.data_path} is closed.")
+        self._handle.write(records.tobytes())
+        self.row_count += int(records.shape[0])
+
+    def flush(self, *, fsync: bool = True) -> None:
+        """Flush appended records and refresh the schema if categories changed."""
+
+        if self._handle is None:
+            return
+        self._handle.flush()
+        if fsync:
+            os.fsync(self._handle.fileno())
+        self._write_schema()
+
+    def close(self) -> None:
+        """Flush and close the record file."""
+
+        if self._handle is None:
+            return
+        self._handle.flush()
+        self._handle.close()
+        self._handle = None
+        self._write_schema()
+
+    def _code_for(self, column: str, value: str) -> int:
+        codes = self._codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = len(codes)
+            codes[value] = code
+            self._categories[column].append(value)
+            self._schema_dirty = True
+        return code
+
+    def _write_schema(self) -> None:
+        if not self._schema_dirty:
+            return
+        schema = {
+            "format": BINARY_TABLE_FORMAT,
+            "version": BINARY_TABLE_VERSION,
+            "data_file": self.data_path.name,
+            "dtype": [[name, self.dtype[name].str] for name in self.dtype.names],
+            "categories": self._categories,
+        }
+        # Write-then-rename keeps a readable schema on disk if the run dies here.
+        temporary_path = self.schema_path.with_suffix(".json.tmp")
+        temporary_path.write_text(json.dumps(schema, indent=2), encoding="utf-8")
+        os.replace(temporary_path, self.schema_path)
+        self._schema_dirty = False
+
+
+def binary_table_exists(stem: str | Path) -> bool:
+    """Return whether ``<stem>.bin`` and its schema are both present."""
+
+    return Path(f"{stem}.bin").exists() and Path(f"{stem}.schema.json").exists()
+
+
+def read_binary_table(stem: str | Path) -> dict[str, np.ndarray]:
+    """Load one binary table into a column mapping.
+
+    Numeric columns keep their stored dtype; categorical columns are decoded
+    back to arrays of Python strings.
+    """
+
+    schema_path = Path(f"{stem}.schema.json")
+    schema: dict[str, Any] = json.loads(schema_path.read_text(encoding="utf-8"))
+    if schema.get("format") != BINARY_TABLE_FORMAT:
+        raise ValueError(f"{schema_path} is not a {BINARY_TABLE_FORMAT} schema.")
+    if int(schema.get("version", 0)) > BINARY_TABLE_VERSION:
+        raise ValueError(
+            f"{schema_path} uses format version {schema['version']}; "
+            f"this reader supports up to {BINARY_TABLE_VERSION}."
+        )
+    dtype = np.dtype([(str(name), str(code)) for name, code in schema["dtype"]])
+    data_path = schema_path.with_name(str(schema["data_file"]))
+    whole_records = data_path.stat().st_size // dtype.itemsize
+    records = np.fromfile(data_path, dtype=dtype, count=whole_records)
+
+    columns: dict[str, np.ndarray] = {}
+    for name in dtype.names:
+        categories = schema["categories"].get(name)
+        if categories is None:
+            columns[name] = records[name].copy()
+        else:
+            columns[name] = np.asarray(categories, dtype=object)[records[name]]
+    return columns
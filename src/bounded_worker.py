@@ -0,0 +1,120 @@
+"""Bounded-queue worker thread shared by the asynchronous writer and sender."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import queue
+import threading
+import time
+from typing import Any
+
+
+class BoundedWorker:
+    """Run submitted calls in order on one daemon thread behind a bounded queue.
+
+    When the queue is full :meth:`submit` blocks until the thread catches up;
+    such back-pressure waits are counted. The first failing call is latched:
+    later queued calls are skipped and :meth:`raise_error` re-raises it as
+    ``RuntimeError(error_message)`` on the caller's thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        max_items: int,
+        error_message: str,
+        on_complete: Callable[[float], None] | None = None,
+    ) -> None:
+        if max_items <= 0:
+            raise ValueError("max_items must be positive.")
+        self.name = name
+        self.max_items = max_items
+        self._error_message = error_message
+        self._on_complete = on_complete
+        self._queue: queue.Queue = queue.Queue(maxsize=max_items)
+        self._error: BaseException | None = None
+        self.closed = False
+        self.items_enqueued = 0
+        self.items_completed = 0
+        self.max_queue_depth = 0
+        self.backpressure_waits = 0
+        self.backpressure_wait_s_total = 0.0
+        self.latency_s_total = 0.0
+        self.latency_s_max = 0.0
+        self.busy_s_total = 0.0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def error(self) -> BaseException | None:
+        return self._error
+
+    def submit(self, call: Callable[[], Any]) -> None:
+        """Queue ``call``; its arguments must not be mutated afterwards."""
+
+        self.raise_error()
+        if self.closed:
+            raise RuntimeError(f"{self.name} is closed.")
+        item = (time.perf_counter(), call)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            wait_started = time.perf_counter()
+            self._queue.put(item)
+            self.backpressure_waits += 1
+            self.backpressure_wait_s_total += time.perf_counter() - wait_started
+        self.items_enqueued += 1
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+
+    def drain(self) -> None:
+        """Block until every queued call has run, then re-raise a latched failure."""
+
+        if not self.closed:
+            self._queue.join()
+        self.raise_error()
+
+    def shutdown(self) -> None:
+        """Run the remaining queued calls and stop the thread without raising."""
+
+        if self.closed:
+            return
+        self.closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def close(self) -> None:
+        """Shut down, then re-raise a latched failure."""
+
+        self.shutdown()
+        self.raise_error()
+
+    def raise_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(self._error_message) from self._error
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                if self._error is not None:
+                    continue
+                enqueued_at, call = item
+                started = time.perf_counter()
+                try:
+                    call()
+                except BaseException as error:  # surfaced on the caller's next call
+                    self._error = error
+                    continue
+                finished = time.perf_counter()
+                latency_s = finished - enqueued_at
+                self.items_completed += 1
+                self.busy_s_total += finished - started
+                self.latency_s_total += latency_s
+                self.latency_s_max = max(self.latency_s_max, latency_s)
+                if self._on_complete is not None:
+                    self._on_complete(latency_s)
+            finally:
+                self._queue.task_done()
@@ -12,12 +12,18 @@ samples to a normalized VR control signal in ``[0, 1]``.
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass
 import math
 import time
-from typing import Callable
+from typing import Callable, Literal
 
 import numpy as np
+from scipy.signal import lfilter
+
+
+CalibrationEngine = Literal["batch", "streaming"]
+CALIBRATION_ENGINES: tuple[CalibrationEngine, ...] = ("batch", "streaming")
 
 
 @dataclass(frozen=True)
@@ -59,6 +65,7 @@ class CalibrationResult:
     saturated_count: int
     lo_idx: int
     hi_idx: int
+    engine: CalibrationEngine = "batch"
 
 
 @dataclass(frozen=True)
@@ -105,19 +112,50 @@ def run_range_calibration(
         raise ValueError("Calibration requires at least one sample.")
 
     sorted_samples = np.sort(arr)
+    lo_idx, hi_idx = percentile_indices(n, cfg.percentile_lo, cfg.percentile_hi)
+    saturated_mask = (arr <= cfg.saturation_lo) | (arr >= cfg.saturation_hi)
+    return _build_range_calibration_result(
+        global_min=float(sorted_samples[lo_idx]),
+        global_max=float(sorted_samples[hi_idx]),
+        n_samples=n,
+        saturated_count=int(np.count_nonzero(saturated_mask)),
+        lo_idx=lo_idx,
+        hi_idx=hi_idx,
+        cfg=cfg,
+        engine="batch",
+    )
+
+
+def percentile_indices(
+    n_samples: int,
+    percentile_lo: float,
+    percentile_hi: float,
+) -> tuple[int, int]:
+    """Return the sorted-order indices used as robust low/high bounds."""
 
-    lo_idx = int(n * cfg.percentile_lo / 100.0)
-    hi_idx = int(n * cfg.percentile_hi / 100.0) - 1
+    lo_idx = int(n_samples * percentile_lo / 100.0)
+    hi_idx = int(n_samples * percentile_hi / 100.0) - 1
 
-    lo_idx = max(0, min(lo_idx, n - 1))
-    hi_idx = max(0, min(hi_idx, n - 1))
+    lo_idx = max(0, min(lo_idx, n_samples - 1))
+    hi_idx = max(0, min(hi_idx, n_samples - 1))
 
     if hi_idx < lo_idx:
         lo_idx = 0
-        hi_idx = n - 1
-
-    global_min = float(sorted_samples[lo_idx])
-    global_max = float(sorted_samples[hi_idx])
+        hi_idx = n_samples - 1
+    return lo_idx, hi_idx
+
+
+def _build_range_calibration_result(
+    *,
+    global_min: float,
+    global_max: float,
+    n_samples: int,
+    saturated_count: int,
+    lo_idx: int,
+    hi_idx: int,
+    cfg: CalibrationConfig,
+    engine: CalibrationEngine,
+) -> CalibrationResult:
     center = 0.5 * (global_max + global_min)
 
     raw_amplitude = 0.5 * (global_max - global_min)
@@ -127,10 +165,6 @@ def run_range_calibration(
     y_min = global_min - padding
     y_max = global_max + padding
 
-    saturated_mask = (arr <= cfg.saturation_lo) | (arr >= cfg.saturation_hi)
-    saturated_count = int(np.count_nonzero(saturated_mask))
-    saturated = saturated_count > 0
-
     return CalibrationResult(
         global_min=global_min,
         global_max=global_max,
@@ -138,11 +172,159 @@ def run_range_calibration(
         amplitude=amplitude,
         y_min=y_min,
         y_max=y_max,
-        saturated=saturated,
-        n_samples=n,
+        saturated=saturated_count > 0,
+        n_samples=n_samples,
         saturated_count=saturated_count,
         lo_idx=lo_idx,
         hi_idx=hi_idx,
+        engine=engine,
+    )
+
+
+class StreamingCalibrationWindow:
+    """Exact order-statistic accumulator for streaming startup calibration.
+
+    Samples are kept in a list of short sorted blocks with a running sum per
+    block, so each insert costs a binary search plus a short list insert and
+    percentile, median, and mean-absolute-deviation queries only walk the
+    block index instead of sorting the whole window. Results are exact order
+    statistics, identical to sorting the collected samples.
+    """
+
+    _BLOCK_SIZE = 64
+
+    def __init__(self) -> None:
+        self._blocks: list[list[float]] = []
+        self._block_maxima: list[float] = []
+        self._block_sums: list[float] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, value: float) -> None:
+        """Insert one calibration sample."""
+
+        value = float(value)
+        if not self._blocks:
+            self._blocks.append([value])
+            self._block_maxima.append(value)
+            self._block_sums.append(value)
+            self._count = 1
+            return
+
+        block_index = min(bisect_left(self._block_maxima, value), len(self._blocks) - 1)
+        block = self._blocks[block_index]
+        insort(block, value)
+        self._block_maxima[block_index] = block[-1]
+        self._block_sums[block_index] += value
+        self._count += 1
+
+        if len(block) > 2 * self._BLOCK_SIZE:
+            upper = block[self._BLOCK_SIZE :]
+            del block[self._BLOCK_SIZE :]
+            self._blocks.insert(block_index + 1, upper)
+            self._block_maxima[block_index] = block[-1]
+            self._block_maxima.insert(block_index + 1, upper[-1])
+            self._block_sums[block_index] = math.fsum(block)
+            self._block_sums.insert(block_index + 1, math.fsum(upper))
+
+    def order_statistic(self, index: int) -> float:
+        """Return the ``index``-th smallest sample (zero-based)."""
+
+        if not 0 <= index < self._count:
+            raise IndexError("order statistic index out of range.")
+        for block in self._blocks:
+            if index < len(block):
+                return block[index]
+            index -= len(block)
+        raise IndexError("order statistic index out of range.")
+
+    def median(self) -> float:
+        """Return the median with the same even-length convention as ``np.median``."""
+
+        if self._count == 0:
+            raise ValueError("median requires at least one sample.")
+        upper = self.order_statistic(self._count // 2)
+        if self._count % 2:
+            return upper
+        lower = self.order_statistic(self._count // 2 - 1)
+        return float(np.mean([lower, upper]))
+
+    def count_at_or_below(self, value: float) -> int:
+        """Return the number of samples ``<= value``."""
+
+        total = 0
+        for block in self._blocks:
+            if block[-1] <= value:
+                total += len(block)
+            else:
+                return total + bisect_right(block, value)
+        return total
+
+    def count_at_or_above(self, value: float) -> int:
+        """Return the number of samples ``>= value``."""
+
+        total = 0
+        for block in reversed(self._blocks):
+            if block[0] >= value:
+                total += len(block)
+            else:
+                return total + len(block) - bisect_left(block, value)
+        return total
+
+    def mean_abs_deviation(self, center: float) -> float:
+        """Return ``mean(|x - center|)`` from the per-block running sums."""
+
+        if self._count == 0:
+            raise ValueError("mean_abs_deviation requires at least one sample.")
+        center = float(center)
+        below_sum = 0.0
+        below_count = 0
+        above_sum = 0.0
+        above_count = 0
+        for block, block_sum in zip(self._blocks, self._block_sums):
+            if block[-1] <= center:
+                below_sum += block_sum
+                below_count += len(block)
+            elif block[0] > center:
+                above_sum += block_sum
+                above_count += len(block)
+            else:
+                split = bisect_right(block, center)
+                below_sum += math.fsum(block[:split])
+                below_count += split
+                above_sum += math.fsum(block[split:])
+                above_count += len(block) - split
+        total = (center * below_count - below_sum) + (above_sum - center * above_count)
+        return total / self._count
+
+
+def finalize_streaming_range_calibration(
+    window: StreamingCalibrationWindow,
+    cfg: CalibrationConfig,
+) -> CalibrationResult:
+    """Build the :func:`run_range_calibration` result from a streaming window."""
+
+    n = len(window)
+    if n == 0:
+        raise ValueError("Calibration requires at least one sample.")
+
+    lo_idx, hi_idx = percentile_indices(n, cfg.percentile_lo, cfg.percentile_hi)
+    return _build_range_calibration_result(
+        global_min=window.order_statistic(lo_idx),
+        global_max=window.order_statistic(hi_idx),
+        n_samples=n,
+        saturated_count=(
+            n
+            if cfg.saturation_lo >= cfg.saturation_hi
+            else window.count_at_or_below(cfg.saturation_lo)
+            + window.count_at_or_above(cfg.saturation_hi)
+        ),
+        lo_idx=lo_idx,
+        hi_idx=hi_idx,
+        cfg=cfg,
+        engine="streaming",
     )
 
 
@@ -186,10 +368,25 @@ def initialize_adaptive_range(
     if arr.size == 0:
         raise ValueError("initialize_adaptive_range requires at least one sample.")
 
+    abs_dev_ema = float(np.mean(np.abs(arr - float(calibration_result.center))))
+    return initialize_adaptive_range_from_abs_dev(abs_dev_ema, calibration_result, cfg)
+
+
+def initialize_adaptive_range_from_abs_dev(
+    abs_dev_ema: float,
+    calibration_result: CalibrationResult,
+    cfg: AdaptiveRangeConfig,
+) -> AdaptiveRangeState:
+    """Seed adaptive range state from a precomputed mean absolute deviation."""
+
+    if cfg.fs_hz <= 0.0:
+        raise ValueError("fs_hz must be positive.")
+    if cfg.amplitude_floor <= 0.0:
+        raise ValueError("amplitude_floor must be positive.")
+
     center = float(calibration_result.center)
     amplitude = max(float(calibration_result.amplitude), float(cfg.amplitude_floor))
-
-    abs_dev_ema = float(np.mean(np.abs(arr - center)))
+    abs_dev_ema = float(abs_dev_ema)
     eps = 1e-12
     abs_dev_to_amplitude_scale = amplitude / max(abs_dev_ema, eps)
 
@@ -201,6 +398,23 @@ def initialize_adaptive_range(
     )
 
 
+def tau_to_alpha(tau_s: float, fs_hz: float) -> float:
+    """Return the per-sample EMA coefficient for time constant ``tau_s``."""
+
+    if tau_s <= 0.0:
+        return 1.0
+    return 1.0 - math.exp(-1.0 / (fs_hz * tau_s))
+
+
+def adaptive_range_alphas(cfg: AdaptiveRangeConfig) -> tuple[float, float]:
+    """Return the per-sample ``(center, amplitude)`` EMA coefficients."""
+
+    return (
+        tau_to_alpha(cfg.center_tau_s, cfg.fs_hz),
+        tau_to_alpha(cfg.amplitude_tau_s, cfg.fs_hz),
+    )
+
+
 def update_adaptive_range(
     x: float,
     state: AdaptiveRangeState,
@@ -208,8 +422,13 @@ def update_adaptive_range(
     allow_update: bool = True,
     allow_center_update: bool | None = None,
     allow_amplitude_update: bool | None = None,
+    alphas: tuple[float, float] | None = None,
 ) -> tuple[float, AdaptiveRangeState]:
-    """Normalize one sample and optionally update adaptive map parameters."""
+    """Normalize one sample and optionally update adaptive map parameters.
+
+    ``alphas`` may carry ``adaptive_range_alphas(cfg)`` precomputed by a
+    caller that updates many samples with the same configuration.
+    """
 
     if cfg.fs_hz <= 0.0:
         raise ValueError("fs_hz must be positive.")
@@ -230,22 +449,17 @@ def update_adaptive_range(
     if not allow_center_update and not allow_amplitude_update:
         return normalized, state
 
+    alpha_center, alpha_amp = adaptive_range_alphas(cfg) if alphas is None else alphas
+    # EMAs are written as ``alpha * x + (1 - alpha) * y`` so they round exactly
+    # like the lfilter recursion in update_adaptive_range_block.
     if allow_center_update:
-        if cfg.center_tau_s <= 0.0:
-            alpha_center = 1.0
-        else:
-            alpha_center = 1.0 - math.exp(-1.0 / (cfg.fs_hz * cfg.center_tau_s))
-        updated_center = state.center + alpha_center * (x - state.center)
+        updated_center = alpha_center * x + (1.0 - alpha_center) * state.center
     else:
         updated_center = state.center
 
     if allow_amplitude_update:
-        if cfg.amplitude_tau_s <= 0.0:
-            alpha_amp = 1.0
-        else:
-            alpha_amp = 1.0 - math.exp(-1.0 / (cfg.fs_hz * cfg.amplitude_tau_s))
-        updated_abs_dev_ema = state.abs_dev_ema + alpha_amp * (
-            abs(x - updated_center) - state.abs_dev_ema
+        updated_abs_dev_ema = (
+            alpha_amp * abs(x - updated_center) + (1.0 - alpha_amp) * state.abs_dev_ema
         )
         updated_amplitude = max(
             updated_abs_dev_ema * state.abs_dev_to_amplitude_scale,
@@ -264,6 +478,76 @@ def update_adaptive_range(
     return normalized, updated_state
 
 
+def update_adaptive_range_block(
+    values: np.ndarray,
+    state: AdaptiveRangeState,
+    cfg: AdaptiveRangeConfig,
+    allow_center_update: np.ndarray | bool = True,
+    allow_amplitude_update: np.ndarray | bool = True,
+    alphas: tuple[float, float] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, AdaptiveRangeState]:
+    """Normalize a block of samples, updating the adaptive map after each one.
+
+    Gives the same results as calling :func:`update_adaptive_range` once per
+    sample with the matching entries of the ``allow_*`` flags (scalars or
+    per-sample boolean arrays). Returns the normalized values, the center and
+    amplitude each sample was normalized with, the amplitude after each
+    sample's update, and the final state. Each EMA runs through
+    :func:`scipy.signal.lfilter` when its update flag is constant over the
+    block and as a plain recursion otherwise.
+    """
+
+    if cfg.fs_hz <= 0.0:
+        raise ValueError("fs_hz must be positive.")
+    if cfg.amplitude_floor <= 0.0:
+        raise ValueError("amplitude_floor must be positive.")
+
+    x = np.asarray(values, dtype=float)
+    if x.ndim != 1:
+        raise ValueError(f"values must be one-dimensional, got shape {tuple(x.shape)}.")
+    center_mask = np.broadcast_to(np.asarray(allow_center_update, dtype=bool), x.shape)
+    amplitude_mask = np.broadcast_to(np.asarray(allow_amplitude_update, dtype=bool), x.shape)
+    if x.size == 0:
+        empty = np.zeros(0, dtype=float)
+        return empty, empty, empty, empty, state
+
+    alpha_center, alpha_amp = adaptive_range_alphas(cfg) if alphas is None else alphas
+    floor = float(cfg.amplitude_floor)
+    updated_centers = _gated_ema(x, float(state.center), alpha_center, center_mask)
+    abs_dev = _gated_ema(
+        np.abs(x - updated_centers),
+        float(state.abs_dev_ema),
+        alpha_amp,
+        amplitude_mask,
+    )
+
+    # Without an amplitude update the amplitude is carried over, floored once
+    # any center update has happened.
+    positions = np.arange(x.size)
+    last_amplitude_update = np.maximum.accumulate(np.where(amplitude_mask, positions, -1))
+    any_update = np.logical_or.accumulate(center_mask | amplitude_mask)
+    carried = np.where(any_update, max(state.amplitude, floor), state.amplitude)
+    updated_amplitudes = np.where(
+        last_amplitude_update >= 0,
+        np.maximum(abs_dev * state.abs_dev_to_amplitude_scale, floor)[last_amplitude_update],
+        carried,
+    )
+
+    centers = np.concatenate(([state.center], updated_centers[:-1]))
+    amplitudes = np.concatenate(([state.amplitude], updated_amplitudes[:-1]))
+    normalized = np.minimum(
+        1.0,
+        np.maximum(0.0, 0.5 + (x - centers) / (2.0 * np.maximum(amplitudes, floor))),
+    )
+    updated_state = AdaptiveRangeState(
+        center=float(updated_centers[-1]),
+        amplitude=float(updated_amplitudes[-1]),
+        abs_dev_ema=float(abs_dev[-1]),
+        abs_dev_to_amplitude_scale=float(state.abs_dev_to_amplitude_scale),
+    )
+    return normalized, centers, amplitudes, updated_amplitudes, updated_state
+
+
 def collect_samples(
     get_latest_fn: Callable[[], float],
     cfg: CalibrationConfig,
@@ -295,6 +579,29 @@ def collect_samples(
     return step
 
 
+def _gated_ema(
+    values: np.ndarray,
+    initial: float,
+    alpha: float,
+    mask: np.ndarray,
+) -> np.ndarray:
+    """Return the EMA after each sample, advancing only where ``mask`` is set."""
+
+    decay = 1.0 - alpha
+    if mask.all():
+        smoothed, _ = lfilter([alpha], [1.0, -decay], values, zi=[decay * initial])
+        return smoothed
+    if not mask.any():
+        return np.full(values.shape, initial)
+    smoothed_list = []
+    current = initial
+    for value, update in zip(values.tolist(), mask.tolist()):
+        if update:
+            current = alpha * value + decay * current
+        smoothed_list.append(current)
+    return np.asarray(smoothed_list, dtype=float)
+
+
 if __name__ == "__main__":
     rng = np.random.default_rng(7)
     fs_hz = 100.0
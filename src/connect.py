@@ -3,18 +3,16 @@
 This module wraps the BITalino interface used by the breathing-belt
 application. The public API separates one-shot device actions from the
 ``BreathBelt`` reader, which maintains a background acquisition thread and a
-bounded in-memory sample buffer for non-blocking access from the main loop.
+bounded in-memory ring buffer for non-blocking access from the main loop.
 """
 
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass
 import threading
 import time
-from typing import Any
+from typing import Any, Callable
 
-import bitalino
 import numpy as np
 
 
@@ -50,6 +48,176 @@ class AcquiredRow:
         )
 
 
+@dataclass(frozen=True)
+class AcquiredBlock:
+    """Consecutively drained device rows with per-row timing provenance.
+
+    Rows are stored column-wise: ``device_rows`` has shape ``(n, width)`` and
+    ``source_sample_indices`` / ``capture_time_lsl_s`` hold one entry per row.
+    """
+
+    device_rows: np.ndarray
+    source_sample_indices: np.ndarray
+    capture_times_lsl_s: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.source_sample_indices.shape[0])
+
+    def row(self, offset: int) -> AcquiredRow:
+        """Return one row as an :class:`AcquiredRow`."""
+
+        return AcquiredRow(
+            device_row=self.device_rows[offset].copy(),
+            source_sample_index=int(self.source_sample_indices[offset]),
+            capture_time_lsl_s=float(self.capture_times_lsl_s[offset]),
+        )
+
+    def rows(self) -> list[AcquiredRow]:
+        """Expand the block into per-row :class:`AcquiredRow` objects."""
+
+        return [self.row(offset) for offset in range(len(self))]
+
+    def contiguous_spans(self) -> list["AcquiredBlock"]:
+        """Split the block wherever source sample indices are not consecutive."""
+
+        if len(self) == 0:
+            return []
+        breaks = (np.flatnonzero(np.diff(self.source_sample_indices) != 1) + 1).tolist()
+        bounds = [0, *breaks, len(self)]
+        return [
+            AcquiredBlock(
+                device_rows=self.device_rows[start:stop],
+                source_sample_indices=self.source_sample_indices[start:stop],
+                capture_times_lsl_s=self.capture_times_lsl_s[start:stop],
+            )
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+
+    @classmethod
+    def empty(cls, width: int = 0) -> "AcquiredBlock":
+        """Return a zero-row block."""
+
+        return cls(
+            device_rows=np.zeros((0, width), dtype=float),
+            source_sample_indices=np.zeros(0, dtype=np.int64),
+            capture_times_lsl_s=np.zeros(0, dtype=float),
+        )
+
+    @classmethod
+    def from_rows(cls, rows: list[AcquiredRow]) -> "AcquiredBlock":
+        """Stack per-row :class:`AcquiredRow` objects into one block."""
+
+        if not rows:
+            return cls.empty()
+        return cls(
+            device_rows=np.stack([np.asarray(row.device_row) for row in rows]),
+            source_sample_indices=np.asarray(
+                [row.source_sample_index for row in rows],
+                dtype=np.int64,
+            ),
+            capture_times_lsl_s=np.asarray(
+                [row.capture_time_lsl_s for row in rows],
+                dtype=float,
+            ),
+        )
+
+
+class _AcquisitionRing:
+    """Preallocated ring of device rows plus their timing provenance.
+
+    Storage is allocated on the first write once the device row width is
+    known. Writes overwrite the oldest rows when full, and drains return one
+    copied block, concatenating at most two slices on wraparound.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = int(capacity)
+        self._device_rows: np.ndarray | None = None
+        self._source_sample_indices = np.zeros(self.capacity, dtype=np.int64)
+        self._capture_times_lsl_s = np.zeros(self.capacity, dtype=float)
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+
+    def write(
+        self,
+        device_rows: np.ndarray,
+        *,
+        first_source_sample_index: int,
+        capture_times_lsl_s: np.ndarray,
+    ) -> int:
+        """Append rows and return how many buffered or incoming rows were dropped."""
+
+        row_count, width = device_rows.shape
+        if self._device_rows is None or self._device_rows.shape[1] != width:
+            if self._device_rows is not None and self._count > 0:
+                raise ValueError(
+                    "Device row width changed while rows were buffered: "
+                    f"expected {self._device_rows.shape[1]}, observed {width}."
+                )
+            self._device_rows = np.zeros((self.capacity, width), dtype=float)
+
+        source_sample_indices = first_source_sample_index + np.arange(row_count, dtype=np.int64)
+        dropped = max(0, self._count + row_count - self.capacity)
+        if row_count > self.capacity:
+            skip = row_count - self.capacity
+            device_rows = device_rows[skip:]
+            source_sample_indices = source_sample_indices[skip:]
+            capture_times_lsl_s = capture_times_lsl_s[skip:]
+            row_count = self.capacity
+        evicted = max(0, self._count + row_count - self.capacity)
+        self._head = (self._head + evicted) % self.capacity
+        self._count -= evicted
+
+        tail = (self._head + self._count) % self.capacity
+        first_part = min(row_count, self.capacity - tail)
+        for target, values in (
+            (self._device_rows, device_rows),
+            (self._source_sample_indices, source_sample_indices),
+            (self._capture_times_lsl_s, capture_times_lsl_s),
+        ):
+            target[tail : tail + first_part] = values[:first_part]
+            target[: row_count - first_part] = values[first_part:]
+        self._count += row_count
+        return dropped
+
+    def drain(self) -> AcquiredBlock:
+        """Return and clear all buffered rows as one copied block."""
+
+        if self._count == 0 or self._device_rows is None:
+            width = 0 if self._device_rows is None else int(self._device_rows.shape[1])
+            return AcquiredBlock.empty(width)
+
+        stop = self._head + self._count
+        if stop <= self.capacity:
+            block = AcquiredBlock(
+                device_rows=self._device_rows[self._head : stop].copy(),
+                source_sample_indices=self._source_sample_indices[self._head : stop].copy(),
+                capture_times_lsl_s=self._capture_times_lsl_s[self._head : stop].copy(),
+            )
+        else:
+            wrapped = stop - self.capacity
+            block = AcquiredBlock(
+                device_rows=np.concatenate(
+                    (self._device_rows[self._head :], self._device_rows[:wrapped])
+                ),
+                source_sample_indices=np.concatenate(
+                    (self._source_sample_indices[self._head :], self._source_sample_indices[:wrapped])
+                ),
+                capture_times_lsl_s=np.concatenate(
+                    (self._capture_times_lsl_s[self._head :], self._capture_times_lsl_s[:wrapped])
+                ),
+            )
+        self.clear()
+        return block
+
+
 def _sequence_from_value(value: Any) -> int | None:
     """Return a BITalino sequence value when the input looks valid."""
 
@@ -119,21 +287,12 @@ def timestamp_chunk_rows(
     if contiguous_rows.ndim != 2:
         raise ValueError("data_array must be two-dimensional.")
 
-    dt_s = 1.0 / float(sampling_rate_hz)
-    row_count = int(contiguous_rows.shape[0])
-    acquired_rows: list[AcquiredRow] = []
-    for offset, row in enumerate(contiguous_rows):
-        samples_from_newest = row_count - 1 - offset
-        acquired_rows.append(
-            AcquiredRow(
-                device_row=np.asarray(row).copy(),
-                source_sample_index=int(starting_source_sample_index + offset),
-                capture_time_lsl_s=float(
-                    newest_capture_time_lsl_s - (samples_from_newest * dt_s)
-                ),
-            )
-        )
-    return acquired_rows
+    capture_times_lsl_s = chunk_capture_times(
+        int(contiguous_rows.shape[0]),
+        newest_capture_time_lsl_s=newest_capture_time_lsl_s,
+        sampling_rate_hz=sampling_rate_hz,
+    )
+    return _acquired_rows(contiguous_rows, starting_source_sample_index, capture_times_lsl_s)
 
 
 def timestamp_contiguous_rows(
@@ -152,17 +311,60 @@ def timestamp_contiguous_rows(
     if contiguous_rows.ndim != 2:
         raise ValueError("data_array must be two-dimensional.")
 
+    capture_times_lsl_s = contiguous_capture_times(
+        int(contiguous_rows.shape[0]),
+        first_capture_time_lsl_s=first_capture_time_lsl_s,
+        sampling_rate_hz=sampling_rate_hz,
+    )
+    return _acquired_rows(contiguous_rows, starting_source_sample_index, capture_times_lsl_s)
+
+
+def chunk_capture_times(
+    row_count: int,
+    *,
+    newest_capture_time_lsl_s: float,
+    sampling_rate_hz: int,
+) -> np.ndarray:
+    """Back-fill per-row capture times from the newest row of a returned chunk."""
+
+    if sampling_rate_hz <= 0:
+        raise ValueError("sampling_rate_hz must be positive.")
+
     dt_s = 1.0 / float(sampling_rate_hz)
-    acquired_rows: list[AcquiredRow] = []
-    for offset, row in enumerate(contiguous_rows):
-        acquired_rows.append(
-            AcquiredRow(
-                device_row=np.asarray(row).copy(),
-                source_sample_index=int(starting_source_sample_index + offset),
-                capture_time_lsl_s=float(first_capture_time_lsl_s + (offset * dt_s)),
-            )
+    samples_from_newest = np.arange(row_count - 1, -1, -1, dtype=float)
+    return float(newest_capture_time_lsl_s) - (samples_from_newest * dt_s)
+
+
+def contiguous_capture_times(
+    row_count: int,
+    *,
+    first_capture_time_lsl_s: float,
+    sampling_rate_hz: int,
+) -> np.ndarray:
+    """Extend a contiguous timeline forward from a known first-row capture time."""
+
+    if sampling_rate_hz <= 0:
+        raise ValueError("sampling_rate_hz must be positive.")
+
+    dt_s = 1.0 / float(sampling_rate_hz)
+    return float(first_capture_time_lsl_s) + (np.arange(row_count, dtype=float) * dt_s)
+
+
+def _acquired_rows(
+    contiguous_rows: np.ndarray,
+    starting_source_sample_index: int,
+    capture_times_lsl_s: np.ndarray,
+) -> list[AcquiredRow]:
+    return [
+        AcquiredRow(
+            device_row=np.asarray(row).copy(),
+            source_sample_index=int(starting_source_sample_index + offset),
+            capture_time_lsl_s=float(capture_time_lsl_s),
         )
-    return acquired_rows
+        for offset, (row, capture_time_lsl_s) in enumerate(
+            zip(contiguous_rows, capture_times_lsl_s.tolist())
+        )
+    ]
 
 
 def connect_device(
@@ -185,6 +387,8 @@ def connect_device(
         Optional device timeout forwarded to the BITalino constructor.
     """
 
+    import bitalino
+
     for attempt in range(retries):
         try:
             device = bitalino.BITalino(mac_address, timeout=timeout)
@@ -246,8 +450,16 @@ class BreathBelt:
     """Asynchronous BITalino reader with a bounded sample queue.
 
     The reader continuously acquires data in a daemon thread and stores the
-    newest samples in a deque. This design lets the main application consume
-    all currently buffered samples without blocking on device I/O.
+    newest samples in a preallocated ring buffer. This design lets the main
+    application consume all currently buffered samples without blocking on
+    device I/O.
+
+    ``device_factory`` selects the device backend. When omitted, a hardware
+    BITalino is connected via :func:`connect_device`; any object exposing
+    ``start``/``read``/``stop``/``close`` with BITalino semantics works.
+
+    ``wakeup_event`` is set after every stored chunk in addition to the
+    internal condition, so one consumer can wait on several belts at once.
     """
 
     def __init__(
@@ -261,6 +473,8 @@ class BreathBelt:
         read_error_backoff_s: float = 0.05,
         retries: int = 3,
         retry_delay_s: float = 2.0,
+        device_factory: Callable[[], Any] | None = None,
+        wakeup_event: threading.Event | None = None,
     ) -> None:
         if read_chunk_size <= 0:
             raise ValueError("read_chunk_size must be positive.")
@@ -280,12 +494,15 @@ class BreathBelt:
         self.read_error_backoff_s = float(read_error_backoff_s)
         self.retries = int(retries)
         self.retry_delay_s = float(retry_delay_s)
+        self.device_factory = device_factory
+        self.wakeup_event = wakeup_event
 
         self._device: Any | None = None
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
-        self._queue: deque[AcquiredRow] = deque(maxlen=self.queue_max_samples)
+        self._rows_available = threading.Condition(self._lock)
+        self._ring = _AcquisitionRing(self.queue_max_samples)
         self._latest: AcquiredRow | None = None
         self._sample_width = 0
         self._last_error: Exception | None = None
@@ -341,38 +558,45 @@ class BreathBelt:
                     )
                 )
 
+                row_count = int(data_array.shape[0])
                 if continue_existing_segment:
-                    acquired_rows = timestamp_contiguous_rows(
-                        data_array,
-                        starting_source_sample_index=self._next_source_sample_index,
+                    capture_times_lsl_s = contiguous_capture_times(
+                        row_count,
                         first_capture_time_lsl_s=self._next_capture_time_lsl_s,
                         sampling_rate_hz=self.sampling_rate,
                     )
                 else:
-                    acquired_rows = timestamp_chunk_rows(
-                        data_array,
-                        starting_source_sample_index=self._next_source_sample_index,
+                    capture_times_lsl_s = chunk_capture_times(
+                        row_count,
                         newest_capture_time_lsl_s=lsl_local_clock(),
                         sampling_rate_hz=self.sampling_rate,
                     )
 
-                last_capture_time_lsl_s = acquired_rows[-1].capture_time_lsl_s
+                last_capture_time_lsl_s = float(capture_times_lsl_s[-1])
+                latest = AcquiredRow(
+                    device_row=data_array[-1].copy(),
+                    source_sample_index=self._next_source_sample_index + row_count - 1,
+                    capture_time_lsl_s=last_capture_time_lsl_s,
+                )
 
                 with self._lock:
+                    self._dropped_rows_total += self._ring.write(
+                        data_array,
+                        first_source_sample_index=self._next_source_sample_index,
+                        capture_times_lsl_s=capture_times_lsl_s,
+                    )
                     self._sample_width = int(data_array.shape[1])
-                    self._next_source_sample_index += len(acquired_rows)
-                    self._next_capture_time_lsl_s = float(last_capture_time_lsl_s + dt_s)
+                    self._next_source_sample_index += row_count
+                    self._next_capture_time_lsl_s = last_capture_time_lsl_s + dt_s
                     self._segment_open = True
                     if sequence_continuity_known:
                         self._last_device_sequence = chunk_sequences[-1]
                     else:
                         self._last_device_sequence = None
-                    for acquired_row in acquired_rows:
-                        if len(self._queue) >= self.queue_max_samples:
-                            self._queue.popleft()
-                            self._dropped_rows_total += 1
-                        self._queue.append(acquired_row)
-                        self._latest = acquired_row
+                    self._latest = latest
+                    self._rows_available.notify_all()
+                if self.wakeup_event is not None:
+                    self.wakeup_event.set()
             except Exception as error:
                 with self._lock:
                     self._last_error = error
@@ -389,7 +613,7 @@ class BreathBelt:
             return
 
         with self._lock:
-            self._queue.clear()
+            self._ring.clear()
             self._latest = None
             self._sample_width = 0
             self._last_error = None
@@ -398,12 +622,15 @@ class BreathBelt:
             self._reset_timing_state()
 
         self._stop_event.clear()
-        device = connect_device(
-            self.mac_address,
-            retries=self.retries,
-            retry_delay=self.retry_delay_s,
-            timeout=self.timeout_s,
-        )
+        if self.device_factory is not None:
+            device = self.device_factory()
+        else:
+            device = connect_device(
+                self.mac_address,
+                retries=self.retries,
+                retry_delay=self.retry_delay_s,
+                timeout=self.timeout_s,
+            )
         try:
             start_acquisition(device, self.sampling_rate, list(self.channels))
         except Exception:
@@ -429,6 +656,8 @@ class BreathBelt:
             return
 
         self._stop_event.set()
+        with self._rows_available:
+            self._rows_available.notify_all()
 
         thread = self._thread
         if thread is not None and thread.is_alive():
@@ -467,15 +696,35 @@ class BreathBelt:
                 return None
             return self._latest.copy()
 
-    def get_all(self) -> list[AcquiredRow]:
-        """Return and clear all currently buffered rows."""
+    def wait_for_rows(self, timeout: float | None = None, min_rows: int = 1) -> bool:
+        """Block until at least ``min_rows`` rows are buffered.
+
+        The reader thread signals after every stored chunk, so callers wake as
+        soon as data arrive instead of polling. Returns ``False`` when
+        ``timeout`` seconds pass or the reader stops first. ``min_rows`` is
+        capped at the buffer capacity so the wait can always be satisfied.
+        """
+
+        if min_rows <= 0:
+            raise ValueError("min_rows must be positive.")
+        required_rows = min(int(min_rows), self.queue_max_samples)
+        with self._rows_available:
+            self._rows_available.wait_for(
+                lambda: len(self._ring) >= required_rows or self._stop_event.is_set(),
+                timeout=timeout,
+            )
+            return len(self._ring) >= required_rows
+
+    def get_block(self) -> AcquiredBlock:
+        """Return and clear all currently buffered rows as one copied block."""
 
         with self._lock:
-            if len(self._queue) == 0:
-                return []
-            rows = [row.copy() for row in self._queue]
-            self._queue.clear()
-        return rows
+            return self._ring.drain()
+
+    def get_all(self) -> list[AcquiredRow]:
+        """Return and clear all currently buffered rows as per-row objects."""
+
+        return self.get_block().rows()
 
     @property
     def last_error(self) -> Exception | None:
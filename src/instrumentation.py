@@ -0,0 +1,260 @@
+"""Opt-in latency instrumentation for the live acquisition loop.
+
+Each drained chunk gets a :class:`ChunkTimer`. The loop calls ``lap(stage)``
+after every piece of work, so per-chunk time is attributed to the stage that
+spent it (``pipeline``, ``session_write``, ``lsl_send``, ``plot``,
+``console``), and ``mark(checkpoint)`` at end-to-end checkpoints. End-to-end
+latencies are measured on the LSL clock from the capture time of the oldest
+row in the chunk, i.e. they are the worst case over the chunk's samples.
+
+Values go into :class:`LatencyHistogram`, a fixed-memory log-linear
+histogram in the style of HdrHistogram: exact below 64 ticks and within about
+3% relative error above, so percentiles stay meaningful over multi-hour runs.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Any, Callable
+
+from .connect import AcquiredBlock, lsl_local_clock
+from .settings import InstrumentationConfig
+
+_SUB_BUCKET_BITS = 5
+_SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+_SUMMARY_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+INSTRUMENTED_STAGES = ("pipeline", "session_write", "lsl_send", "plot", "console")
+END_TO_END_CHECKPOINTS = ("dequeue", "control_output", "loop_end")
+
+
+class LatencyHistogram:
+    """Fixed-memory log-linear histogram of non-negative values.
+
+    Values are recorded in integer ticks of ``unit`` (microseconds by
+    default). Values above ``max_value`` are clamped into the top bucket but
+    still update :attr:`max`.
+    """
+
+    def __init__(self, *, unit: float = 1e-6, max_value: float = 3600.0) -> None:
+        if unit <= 0.0:
+            raise ValueError("unit must be positive.")
+        self.unit = float(unit)
+        self._max_ticks = max(2 * _SUB_BUCKET_COUNT, int(math.ceil(max_value / unit)))
+        self._counts = [0] * (self._bucket_index(self._max_ticks) + 1)
+        self.count = 0
+        self._total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, value: float) -> None:
+        """Record one value in the histogram's value unit (e.g. seconds)."""
+
+        value = max(float(value), 0.0)
+        ticks = min(int(value / self.unit), self._max_ticks)
+        self._counts[self._bucket_index(ticks)] += 1
+        self.count += 1
+        self._total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def mean(self) -> float:
+        """Return the exact mean of recorded values, or NaN when empty."""
+
+        return self._total / self.count if self.count else math.nan
+
+    def percentile(self, percent: float) -> float:
+        """Return the value at ``percent`` (0-100), within bucket precision."""
+
+        if self.count == 0:
+            return math.nan
+        rank = max(1, int(math.ceil(percent / 100.0 * self.count)))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index == len(self._counts) - 1:
+                    return self.max  # clamped bucket: only the true max is known
+                value = self._bucket_upper_ticks(index) * self.unit
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float | int | None]:
+        """Return count, min, mean, key percentiles and max as a JSON-ready dict."""
+
+        if self.count == 0:
+            return {"count": 0}
+        payload: dict[str, float | int | None] = {
+            "count": self.count,
+            "min": self.min,
+            "mean": self.mean(),
+        }
+        for percent in _SUMMARY_PERCENTILES:
+            payload[f"p{percent:g}"] = self.percentile(percent)
+        payload["max"] = self.max
+        return payload
+
+    @staticmethod
+    def _bucket_index(ticks: int) -> int:
+        if ticks < 2 * _SUB_BUCKET_COUNT:
+            return ticks
+        shift = ticks.bit_length() - _SUB_BUCKET_BITS - 1
+        return 2 * _SUB_BUCKET_COUNT + (shift - 1) * _SUB_BUCKET_COUNT + (
+            (ticks >> shift) - _SUB_BUCKET_COUNT
+        )
+
+    @staticmethod
+    def _bucket_upper_ticks(index: int) -> int:
+        if index < 2 * _SUB_BUCKET_COUNT:
+            return index
+        offset = index - 2 * _SUB_BUCKET_COUNT
+        shift = offset // _SUB_BUCKET_COUNT + 1
+        sub_bucket = offset % _SUB_BUCKET_COUNT + _SUB_BUCKET_COUNT
+        return ((sub_bucket + 1) << shift) - 1
+
+
+class ChunkTimer:
+    """Attribute one chunk's loop time to stages and record end-to-end checkpoints."""
+
+    def __init__(
+        self,
+        instrumentation: "LoopInstrumentation",
+        *,
+        oldest_capture_time_s: float,
+        dequeued_at: float,
+    ) -> None:
+        self._instrumentation = instrumentation
+        self._oldest_capture_time_s = oldest_capture_time_s
+        self._last_lap_at = dequeued_at
+        self._stage_s: dict[str, float] = {}
+
+    def lap(self, stage: str) -> None:
+        """Charge the time since the previous lap to ``stage``."""
+
+        now = self._instrumentation.clock()
+        self._stage_s[stage] = self._stage_s.get(stage, 0.0) + (now - self._last_lap_at)
+        self._last_lap_at = now
+
+    def mark(self, checkpoint: str) -> None:
+        """Record capture-to-now latency for an end-to-end checkpoint."""
+
+        self._instrumentation.end_to_end[checkpoint].record(
+            self._instrumentation.clock() - self._oldest_capture_time_s
+        )
+
+    def finish(self) -> None:
+        """Close the chunk: record stage durations and the loop-end checkpoint."""
+
+        self.mark("loop_end")
+        for stage, duration_s in self._stage_s.items():
+            self._instrumentation.stages[stage].record(duration_s)
+        self._instrumentation.chunks += 1
+
+
+class _NullChunkTimer:
+    """Chunk timer used when instrumentation is disabled."""
+
+    def lap(self, stage: str) -> None:
+        del stage
+
+    def mark(self, checkpoint: str) -> None:
+        del checkpoint
+
+    def finish(self) -> None:
+        pass
+
+
+_NULL_CHUNK_TIMER = _NullChunkTimer()
+
+
+class LoopInstrumentation:
+    """Per-stage, end-to-end and queue-depth histograms for one live run."""
+
+    def __init__(
+        self,
+        cfg: InstrumentationConfig | None = None,
+        *,
+        clock: Callable[[], float] = lsl_local_clock,
+    ) -> None:
+        self.cfg = cfg or InstrumentationConfig()
+        self.clock = clock
+        self.chunks = 0
+        self.stages = {stage: LatencyHistogram() for stage in INSTRUMENTED_STAGES}
+        self.end_to_end = {checkpoint: LatencyHistogram() for checkpoint in END_TO_END_CHECKPOINTS}
+        self.dequeued_rows = LatencyHistogram(unit=1.0, max_value=1_000_000.0)
+        self._last_console_summary_at = time.perf_counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self.cfg.enabled
+
+    def start_chunk(self, block: AcquiredBlock) -> ChunkTimer | _NullChunkTimer:
+        """Start timing a freshly dequeued chunk and record its size."""
+
+        if not self.cfg.enabled or len(block) == 0:
+            return _NULL_CHUNK_TIMER
+        dequeued_at = self.clock()
+        self.dequeued_rows.record(len(block))
+        oldest_capture_time_s = float(block.capture_times_lsl_s.min())
+        self.end_to_end["dequeue"].record(dequeued_at - oldest_capture_time_s)
+        return ChunkTimer(
+            self,
+            oldest_capture_time_s=oldest_capture_time_s,
+            dequeued_at=dequeued_at,
+        )
+
+    def summary(self) -> dict[str, Any]:
+        """Return all histograms as a JSON-ready dict for the session metadata."""
+
+        if not self.cfg.enabled:
+            return {"enabled": False}
+        return {
+            "enabled": True,
+            "clock": "lsl_local_clock",
+            "latency_unit": "s",
+            "chunks": self.chunks,
+            "end_to_end_from_oldest_capture": {
+                checkpoint: histogram.summary()
+                for checkpoint, histogram in self.end_to_end.items()
+            },
+            "stage_duration_per_chunk": {
+                stage: histogram.summary() for stage, histogram in self.stages.items()
+            },
+            "dequeued_rows_per_chunk": self.dequeued_rows.summary(),
+        }
+
+    def due_console_summary(self) -> str | None:
+        """Return a one-line summary when the configured console interval elapsed."""
+
+        interval_s = self.cfg.console_summary_interval_s
+        if not self.cfg.enabled or interval_s <= 0.0:
+            return None
+        now = time.perf_counter()
+        if now - self._last_console_summary_at < interval_s:
+            return None
+        self._last_console_summary_at = now
+        return self.console_summary()
+
+    def console_summary(self) -> str:
+        """Format the headline percentiles as one console line."""
+
+        control = self.end_to_end["control_output"]
+        parts = [
+            f"LATENCY [{self.chunks} chunks]: capture->control "
+            f"p50={_format_ms(control.percentile(50.0))} "
+            f"p99={_format_ms(control.percentile(99.0))} "
+            f"max={_format_ms(control.max if control.count else math.nan)}"
+        ]
+        for stage, histogram in self.stages.items():
+            if histogram.count:
+                parts.append(f"{stage} p99={_format_ms(histogram.percentile(99.0))}")
+        if self.dequeued_rows.count:
+            parts.append(f"rows/chunk max={int(self.dequeued_rows.max)}")
+        return "; ".join(parts)
+
+
+def _format_ms(value_s: float) -> str:
+    if math.isnan(value_s):
+        return "n/a"
+    return f"{value_s * 1000.0:.2f}ms"
@@ -0,0 +1,370 @@
+"""Per-span processing shared by the single-belt and supervised live loops.
+
+Both loops drain :class:`src.connect.AcquiredBlock` chunks from a belt and
+hand each contiguous span to :meth:`LiveSpanProcessor.process_span`, which
+resets short-term state after a source gap, runs the pipeline, writes the
+device, signal, channel and QC exports, queues the control values for LSL,
+sends breath events and prints the console output. Control values from
+back-to-back spans are combined and pushed once per chunk by
+:meth:`LiveSpanProcessor.flush_control`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from .connect import AcquiredBlock
+from .instrumentation import ChunkTimer
+from .multichannel import (
+    MultiChannelPipelineState,
+    process_multichannel_rows,
+    reset_multichannel_state_for_source_gap,
+)
+from .pipeline import (
+    PipelineBatch,
+    PipelineConfig,
+    PipelineState,
+    ProcessingMode,
+    extrema_event_label,
+    process_device_rows,
+    reset_pipeline_state_for_source_gap,
+)
+from .settings import AppConfig
+
+
+@dataclass(frozen=True)
+class LiveSpan:
+    """One processed span, with the runtime offsets the caller's plots need."""
+
+    batch: PipelineBatch
+    source_sample_indices: np.ndarray
+    live_offsets: np.ndarray
+    live_codes: np.ndarray
+
+
+class LiveSpanProcessor:
+    """Pipeline, export, LSL and console handling for one belt's spans.
+
+    ``lsl_run_stats`` (see :func:`src.lsl_metadata.build_lsl_run_stats`) is
+    updated in place. ``log_prefix`` is prepended to every console line, and
+    ``chunk_timer`` laps are charged to the ``pipeline``, ``session_write``,
+    ``lsl_send`` and ``console`` stages.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        pipeline_cfg: PipelineConfig,
+        pipeline_state: PipelineState | MultiChannelPipelineState,
+        *,
+        session_writer,
+        control_sender,
+        event_sender,
+        lsl_run_stats: dict[str, Any],
+        log_prefix: str = "",
+    ) -> None:
+        self.config = config
+        self.pipeline_cfg = pipeline_cfg
+        self.pipeline_state = pipeline_state
+        self.multichannel = bool(pipeline_cfg.processed_sensor_columns)
+        self.session_writer = session_writer
+        self.control_sender = control_sender
+        self.event_sender = event_sender
+        self.lsl_run_stats = lsl_run_stats
+        self.runtime_value_label = _runtime_value_label(pipeline_cfg.processing_mode)
+        self.log_prefix = log_prefix
+        self.previous_source_sample_index: int | None = None
+        self.previous_runtime_lsl_timestamp: float | None = None
+        self.runtime_print_budget = 0
+        self._control_samples: list[np.ndarray] = []
+        self._control_timestamps: list[np.ndarray] = []
+        self._last_control_source_sample_index: int | None = None
+
+    def process_span(
+        self,
+        span_rows: AcquiredBlock,
+        chunk_timer: ChunkTimer | None = None,
+    ) -> LiveSpan:
+        """Process one contiguous span of device rows through every output."""
+
+        lap = _skip_lap if chunk_timer is None else chunk_timer.lap
+        source_sample_indices = span_rows.source_sample_indices
+        capture_times_lsl_s = span_rows.capture_times_lsl_s
+        self._handle_source_gap(int(source_sample_indices[0]))
+        self.previous_source_sample_index = int(source_sample_indices[-1])
+
+        device_rows = span_rows.device_rows
+        channel_batch = None
+        if self.multichannel:
+            channel_batch, self.pipeline_state = process_multichannel_rows(
+                device_rows,
+                self.pipeline_state,
+                self.pipeline_cfg,
+            )
+            batch = channel_batch.channel(self.pipeline_state.primary_position)
+            control_values = channel_batch.runtime_values
+            control_event_codes = channel_batch.extrema_event_code
+        else:
+            batch, self.pipeline_state = process_device_rows(
+                device_rows,
+                self.pipeline_state,
+                self.pipeline_cfg,
+            )
+            control_values = batch.runtime_values
+            control_event_codes = batch.extrema_event_code
+        lap("pipeline")
+        lsl_timestamps_s = capture_times_lsl_s - self.config.lsl.constant_delay_s
+        source_sample_index_list = source_sample_indices.tolist()
+        lsl_timestamp_list = lsl_timestamps_s.tolist()
+        self.session_writer.write_device_rows(
+            batch,
+            device_rows,
+            source_sample_indices=source_sample_index_list,
+            capture_times_lsl_s=capture_times_lsl_s.tolist(),
+            lsl_timestamps_s=lsl_timestamp_list,
+        )
+        lap("session_write")
+
+        runtime_values = batch.runtime_values
+        live_offsets = np.flatnonzero(batch.runtime_mask & ~np.isnan(runtime_values))
+        live_codes = batch.extrema_event_code[live_offsets]
+        if self.control_sender is not None and live_offsets.size > 0:
+            self._queue_control(
+                control_values,
+                lsl_timestamps_s,
+                live_offsets,
+                source_sample_indices[live_offsets],
+            )
+        event_timestamps_lsl_s = self._send_events(
+            control_event_codes,
+            lsl_timestamps_s,
+            live_offsets,
+            live_codes,
+            len(batch),
+        )
+        lap("lsl_send")
+
+        print_offsets: list[int] = []
+        if self.config.display.print_runtime_values:
+            print_positions, self.runtime_print_budget = runtime_print_positions(
+                self.runtime_print_budget,
+                self.config.display.runtime_print_percent,
+                int(live_offsets.size),
+            )
+            print_offsets = live_offsets[print_positions].tolist()
+        print_batch_console_output(
+            batch,
+            self.session_writer,
+            print_offsets=print_offsets,
+            event_offsets=live_offsets[live_codes != 0.0].tolist(),
+            runtime_value_label=self.runtime_value_label,
+            log_prefix=self.log_prefix,
+        )
+        lap("console")
+
+        self.session_writer.write_signal_batch(
+            batch,
+            source_sample_indices=source_sample_index_list,
+            capture_times_lsl_s=capture_times_lsl_s.tolist(),
+            lsl_timestamps_s=lsl_timestamp_list,
+            event_timestamps_lsl_s=event_timestamps_lsl_s,
+        )
+        if channel_batch is not None:
+            self.session_writer.write_channel_batch(
+                channel_batch,
+                source_sample_indices=source_sample_index_list,
+                lsl_timestamps_s=lsl_timestamp_list,
+            )
+        lap("session_write")
+        return LiveSpan(
+            batch=batch,
+            source_sample_indices=source_sample_indices,
+            live_offsets=live_offsets,
+            live_codes=live_codes,
+        )
+
+    def flush_control(self) -> None:
+        """Push the control values queued since the last flush."""
+
+        self._last_control_source_sample_index = None
+        samples = self._control_samples
+        timestamps = self._control_timestamps
+        span_values = np.concatenate(samples) if samples else np.empty(0)
+        span_timestamps = np.concatenate(timestamps) if timestamps else np.empty(0)
+        samples.clear()
+        timestamps.clear()
+        sender = self.control_sender
+        if sender is None or span_values.size == 0:
+            return
+
+        lsl_run_stats = self.lsl_run_stats
+        sample_count = int(span_values.shape[0])
+        if sample_count == 1:
+            sample = span_values[0]
+            sender.send(
+                float(sample) if span_values.ndim == 1 else sample.tolist(),
+                timestamp=float(span_timestamps[0]),
+            )
+            lsl_run_stats["control_samples_sent_individually"] += 1
+        else:
+            sender.send_chunk_array(
+                span_values.astype(np.float32).reshape(sample_count, -1),
+                span_timestamps,
+            )
+            lsl_run_stats["control_samples_sent_via_chunks"] += sample_count
+            lsl_run_stats["control_chunks_sent"] += 1
+        lsl_run_stats["control_samples_sent"] += sample_count
+
+    def _handle_source_gap(self, first_source_sample_index: int) -> None:
+        previous = self.previous_source_sample_index
+        if previous is None or first_source_sample_index == previous + 1:
+            return
+        missing_samples = max(first_source_sample_index - previous - 1, 0)
+        self.lsl_run_stats["observed_gap_count"] += 1
+        if self.multichannel:
+            reset_multichannel_state_for_source_gap(self.pipeline_state)
+        else:
+            reset_pipeline_state_for_source_gap(self.pipeline_state)
+        self.previous_runtime_lsl_timestamp = None
+        print(
+            f"{self.log_prefix}WARNING [source_gap]: "
+            f"detected non-contiguous source samples ({missing_samples} "
+            "missing sample(s)); reset short-term pipeline state."
+        )
+
+    def _queue_control(
+        self,
+        control_values: np.ndarray,
+        lsl_timestamps_s: np.ndarray,
+        live_offsets: np.ndarray,
+        live_source_indices: np.ndarray,
+    ) -> None:
+        """Queue contiguous runs of live values, flushing before a source jump."""
+
+        run_starts = [0, *(np.flatnonzero(np.diff(live_source_indices) != 1) + 1).tolist()]
+        run_stops = [*run_starts[1:], int(live_offsets.size)]
+        for run_start, run_stop in zip(run_starts, run_stops):
+            if (
+                self._last_control_source_sample_index is not None
+                and int(live_source_indices[run_start])
+                != self._last_control_source_sample_index + 1
+            ):
+                self.flush_control()
+            run_offsets = live_offsets[run_start:run_stop]
+            self._control_samples.append(control_values[run_offsets])
+            self._control_timestamps.append(lsl_timestamps_s[run_offsets])
+            self._last_control_source_sample_index = int(live_source_indices[run_stop - 1])
+
+    def _send_events(
+        self,
+        control_event_codes: np.ndarray,
+        lsl_timestamps_s: np.ndarray,
+        live_offsets: np.ndarray,
+        live_codes: np.ndarray,
+        row_count: int,
+    ) -> list[float | None]:
+        """Send breath events and return the per-row event timestamps to export."""
+
+        # Each live row's event timestamp is the previous live row's timestamp.
+        live_lsl_timestamps_s = lsl_timestamps_s[live_offsets].tolist()
+        previous_live_lsl_timestamps_s = [
+            self.previous_runtime_lsl_timestamp,
+            *live_lsl_timestamps_s[:-1],
+        ]
+        event_timestamps_lsl_s: list[float | None] = [None] * row_count
+        if self.event_sender is not None:
+            live_event_codes = control_event_codes[live_offsets]
+            event_rows = live_event_codes != 0.0
+            if event_rows.ndim == 2:
+                event_rows = event_rows.any(axis=1)
+            for live_position in np.flatnonzero(event_rows).tolist():
+                event_timestamp_lsl_s = previous_live_lsl_timestamps_s[live_position]
+                if event_timestamp_lsl_s is None:
+                    continue
+                if live_codes[live_position] != 0.0:
+                    event_timestamps_lsl_s[int(live_offsets[live_position])] = (
+                        event_timestamp_lsl_s
+                    )
+                self.event_sender.send(
+                    live_event_codes[live_position].tolist(),
+                    timestamp=event_timestamp_lsl_s,
+                )
+                self.lsl_run_stats["event_samples_sent"] += 1
+        if live_lsl_timestamps_s:
+            self.previous_runtime_lsl_timestamp = live_lsl_timestamps_s[-1]
+        return event_timestamps_lsl_s
+
+
+def runtime_print_positions(
+    print_budget: int,
+    sample_percent: int,
+    sample_count: int,
+) -> tuple[np.ndarray, int]:
+    """Return which of ``sample_count`` runtime values to print and the new budget.
+
+    Every runtime value adds ``sample_percent`` to the budget; a value is
+    printed each time the budget reaches 100, which then wraps back down.
+    """
+
+    if sample_percent <= 0 or sample_count <= 0:
+        return np.zeros(0, dtype=np.int64), 0 if sample_percent <= 0 else print_budget
+
+    budgets = print_budget + sample_percent * np.arange(sample_count + 1, dtype=np.int64)
+    wraps = budgets // 100
+    positions = np.flatnonzero(np.diff(wraps) > 0)
+    return positions, int(budgets[-1] % 100)
+
+
+def print_batch_console_output(
+    batch: PipelineBatch,
+    session_writer,
+    *,
+    print_offsets: list[int],
+    event_offsets: list[int],
+    runtime_value_label: str,
+    log_prefix: str = "",
+) -> None:
+    """Print batch messages and persist QC events in per-sample order."""
+
+    if not (batch.messages or batch.qc_events or print_offsets or event_offsets):
+        return
+
+    messages_by_offset: dict[int, list[str]] = {}
+    for offset, message in batch.messages:
+        messages_by_offset.setdefault(offset, []).append(message)
+    qc_events_by_offset: dict[int, list] = {}
+    for offset, event in batch.qc_events:
+        qc_events_by_offset.setdefault(offset, []).append(event)
+    print_offset_set = set(print_offsets)
+    event_offset_set = set(event_offsets)
+    runtime_values = batch.runtime_values
+
+    for offset in sorted(
+        messages_by_offset.keys() | qc_events_by_offset.keys() | print_offset_set | event_offset_set
+    ):
+        for message in messages_by_offset.get(offset, ()):
+            print(f"{log_prefix}{message}")
+        for event in qc_events_by_offset.get(offset, ()):
+            print(f"{log_prefix}WARNING [{event.event_type}]: {event.message}")
+            session_writer.write_qc_event(event)
+        if offset in print_offset_set:
+            print(f"{log_prefix}{runtime_value_label}: {float(runtime_values[offset]):.4f}")
+        if offset in event_offset_set:
+            label = extrema_event_label(float(batch.extrema_event_code[offset]))
+            if label is not None:
+                print(f"{log_prefix}Breath event: {label}")
+
+
+def _runtime_value_label(processing_mode: ProcessingMode) -> str:
+    if processing_mode == "movement":
+        return "Movement proxy"
+    if processing_mode == "adaptive":
+        return "Adaptive normalized"
+    return "Normalized"
+
+
+def _skip_lap(stage: str) -> None:
+    del stage
@@ -24,30 +24,30 @@ def build_control_lsl_metadata(config: AppConfig, processing_mode: str) -> dict[
     if processing_mode == "movement":
         return {
             "enabled": True,
-            "channel_count": 1,
+            "channel_count": len(_channel_names(config, "movement_value")),
             "stream_name": f"{config.lsl.stream_name}Movement",
             "stream_type": "BreathingMovement",
             "source_id": f"{config.lsl.source_id}_movement",
-            "channel_names": ["movement_value"],
+            "channel_names": _channel_names(config, "movement_value"),
             "nominal_srate_hz": config.device.sampling_rate_hz,
         }
     if processing_mode == "adaptive":
         return {
             "enabled": True,
-            "channel_count": 1,
+            "channel_count": len(_channel_names(config, "breath_level")),
             "stream_name": f"{config.lsl.stream_name}Adaptive",
             "stream_type": "BreathingAdaptive",
             "source_id": f"{config.lsl.source_id}_adaptive",
-            "channel_names": ["breath_level"],
+            "channel_names": _channel_names(config, "breath_level"),
             "nominal_srate_hz": config.device.sampling_rate_hz,
         }
     return {
         "enabled": True,
-        "channel_count": 1,
+        "channel_count": len(_channel_names(config, "breath_level")),
         "stream_name": config.lsl.stream_name,
         "stream_type": config.lsl.stream_type,
         "source_id": config.lsl.source_id,
-        "channel_names": ["breath_level"],
+        "channel_names": _channel_names(config, "breath_level"),
         "nominal_srate_hz": config.device.sampling_rate_hz,
     }
 
@@ -70,11 +70,11 @@ def build_event_lsl_metadata(config: AppConfig, processing_mode: str) -> dict[st
     control_metadata = build_control_lsl_metadata(config, processing_mode)
     return {
         "enabled": True,
-        "channel_count": 1,
+        "channel_count": control_metadata["channel_count"],
         "stream_name": f"{control_metadata['stream_name']}Events",
         "stream_type": "BreathingEvents",
         "source_id": f"{control_metadata['source_id']}_events",
-        "channel_names": ["event_code"],
+        "channel_names": _channel_names(config, "event_code"),
         "nominal_srate_hz": 0.0,
         "event_code_map": {
             "1.0": "inhale_peak",
@@ -93,3 +93,28 @@ def build_lsl_timing_metadata(config: AppConfig) -> dict[str, str | float]:
         "constant_delay_s": config.lsl.constant_delay_s,
         "discontinuity_policy": "preserve_timestamp_gaps_after_loss",
     }
+
+
+def build_lsl_run_stats(config: AppConfig) -> dict[str, Any]:
+    """Return the zeroed LSL send counters a live run updates and exports."""
+
+    return {
+        "control_send_strategy": "hybrid_explicit_timestamps",
+        "sender": config.lsl.sender,
+        "control_samples_sent": 0,
+        "control_samples_sent_individually": 0,
+        "control_samples_sent_via_chunks": 0,
+        "control_chunks_sent": 0,
+        "event_samples_sent": 0,
+        "queue_dropped_rows_total": 0,
+        "observed_gap_count": 0,
+    }
+
+
+def _channel_names(config: AppConfig, base_name: str) -> list[str]:
+    """Return one channel name, or one per processed column in multi-channel mode."""
+
+    columns = config.device.processed_sensor_columns
+    if not columns:
+        return [base_name]
+    return [f"{base_name}_col{column}" for column in columns]
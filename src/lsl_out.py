@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
+import ctypes
+from typing import Any
 
+import numpy as np
 from pylsl import StreamInfo, StreamOutlet, local_clock
 
+from .bounded_worker import BoundedWorker
+from .instrumentation import LatencyHistogram
+
 
 class LSLBreathingSender:
     """Publish breathing control or event data as a numeric LSL stream."""
@@ -28,6 +34,7 @@ class LSLBreathingSender:
         if labels and len(labels) != channel_count:
             raise ValueError("channel_labels must match channel_count when provided.")
 
+        self.channel_count = channel_count
         self.info = StreamInfo(
             name,
             type,
@@ -103,6 +110,49 @@ class LSLBreathingSender:
             for sample, timestamp in zip(normalized_samples, timestamp_list, strict=True):
                 self.outlet.push_sample(sample, float(timestamp))
 
+    def send_chunk_array(
+        self,
+        samples: np.ndarray,
+        timestamps: np.ndarray | None = None,
+    ) -> None:
+        """Send a ``(n_samples, channel_count)`` array with one timestamp per row.
+
+        A C-contiguous ``float32`` array and ``float64`` timestamps are handed
+        to liblsl as raw buffers without per-sample Python work; other dtypes
+        or layouts are converted once with NumPy first.
+        """
+
+        samples = np.ascontiguousarray(samples, dtype=np.float32)
+        if samples.ndim == 1 and self.channel_count == 1:
+            samples = samples.reshape(-1, 1)
+        if samples.ndim != 2 or samples.shape[1] != self.channel_count:
+            raise ValueError("samples must have shape (n_samples, channel_count).")
+        if samples.shape[0] == 0:
+            return
+        if timestamps is None:
+            self.outlet.push_chunk(samples)
+            return
+
+        timestamps = np.ascontiguousarray(timestamps, dtype=np.float64)
+        if timestamps.shape != (samples.shape[0],):
+            raise ValueError("timestamps must match the number of samples in the chunk.")
+        push_chunk_n = getattr(self.outlet, "do_push_chunk_n", None)
+        if push_chunk_n is None:
+            self.outlet.push_chunk(samples, timestamps.tolist())
+            return
+        # pylsl's own push_chunk copies per-sample timestamps into a ctypes
+        # array element by element; liblsl's push_chunk_ftnp reads both
+        # buffers directly.
+        error_code = push_chunk_n(
+            self.outlet.obj,
+            ctypes.c_void_p(samples.ctypes.data),
+            ctypes.c_long(samples.size),
+            ctypes.c_void_p(timestamps.ctypes.data),
+            ctypes.c_int(1),
+        )
+        if error_code is not None and error_code < 0:
+            raise RuntimeError(f"liblsl push_chunk failed with error code {error_code}.")
+
     @staticmethod
     def _normalize_sample(
         data: float | int | Iterable[float | int],
@@ -110,3 +160,158 @@ class LSLBreathingSender:
         if isinstance(data, (float, int)):
             return [float(data)]
         return [float(value) for value in data]
+
+
+class LSLSenderThread:
+    """Own the control and event senders and push to them from a dedicated thread.
+
+    :attr:`control` and :attr:`event` expose the ``send``, ``send_chunk`` and
+    ``send_chunk_array`` interface of :class:`LSLBreathingSender`, but only
+    copy the sample values and timestamps into the bounded queue of a
+    :class:`BoundedWorker`, which performs the outlet pushes in submission
+    order.
+
+    Send lag is tracked per block as the time from enqueue to push completion
+    and, for explicitly timestamped blocks, as the LSL clock at push
+    completion minus the newest sample timestamp in the block.
+    """
+
+    def __init__(
+        self,
+        control_sender: LSLBreathingSender | None,
+        event_sender: LSLBreathingSender | None,
+        *,
+        queue_max_blocks: int = 64,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if queue_max_blocks <= 0:
+            raise ValueError("queue_max_blocks must be positive.")
+        self._senders = {"control": control_sender, "event": event_sender}
+        self.control = None if control_sender is None else _QueuedSender(self, "control")
+        self.event = None if event_sender is None else _QueuedSender(self, "event")
+        self._clock = clock or (lambda: float(local_clock()))
+        self._samples_sent = 0
+        self._send_lag = LatencyHistogram()
+        self._sample_to_push_lag = LatencyHistogram()
+        self._worker = BoundedWorker(
+            name="LSLSenderThread",
+            max_items=queue_max_blocks,
+            error_message="LSL sender thread failed.",
+            on_complete=self._send_lag.record,
+        )
+
+    def drain(self) -> None:
+        """Block until every queued block has been pushed."""
+
+        self._worker.drain()
+
+    def close(self) -> None:
+        """Push all queued blocks and stop the sender thread."""
+
+        self._worker.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth, back-pressure and send-lag statistics."""
+
+        worker = self._worker
+        return {
+            "mode": "thread",
+            "queue_max_blocks": worker.max_items,
+            "blocks_enqueued": worker.items_enqueued,
+            "blocks_sent": worker.items_completed,
+            "samples_sent": self._samples_sent,
+            "max_queue_depth": worker.max_queue_depth,
+            "backpressure_waits": worker.backpressure_waits,
+            "backpressure_wait_s_total": worker.backpressure_wait_s_total,
+            "send_lag_s": self._send_lag.summary(),
+            "sample_to_push_lag_s": self._sample_to_push_lag.summary(),
+        }
+
+    def _submit(
+        self,
+        stream: str,
+        samples: list[list[float]] | np.ndarray,
+        timestamps: list[float] | np.ndarray | None,
+    ) -> None:
+        self._worker.submit(lambda: self._push(stream, samples, timestamps))
+
+    def _push(
+        self,
+        stream: str,
+        samples: list[list[float]] | np.ndarray,
+        timestamps: list[float] | np.ndarray | None,
+    ) -> None:
+        sender = self._senders[stream]
+        if isinstance(samples, np.ndarray):
+            sender.send_chunk_array(samples, timestamps)
+        elif len(samples) == 1:
+            sender.send(
+                samples[0],
+                timestamp=None if timestamps is None else timestamps[0],
+            )
+        else:
+            sender.send_chunk(samples, timestamps=timestamps)
+        if timestamps is not None and len(timestamps):
+            self._sample_to_push_lag.record(self._clock() - float(np.max(timestamps)))
+        self._samples_sent += len(samples)
+
+
+class _QueuedSender:
+    """``LSLBreathingSender``-like facade that queues blocks on an :class:`LSLSenderThread`."""
+
+    def __init__(self, owner: LSLSenderThread, stream: str) -> None:
+        self._owner = owner
+        self._stream = stream
+
+    def send(
+        self,
+        data: float | int | Iterable[float | int],
+        timestamp: float | None = None,
+    ) -> None:
+        """Queue one sample."""
+
+        self._owner._submit(
+            self._stream,
+            [LSLBreathingSender._normalize_sample(data)],
+            None if timestamp is None else [float(timestamp)],
+        )
+
+    def send_chunk(
+        self,
+        samples: Sequence[float | int | Iterable[float | int]],
+        *,
+        timestamps: Sequence[float] | None = None,
+    ) -> None:
+        """Queue a chunk of samples; the caller may reuse its buffers afterwards."""
+
+        normalized_samples = [LSLBreathingSender._normalize_sample(sample) for sample in samples]
+        if not normalized_samples:
+            return
+        if timestamps is not None and len(timestamps) != len(normalized_samples):
+            raise ValueError("timestamps must match the number of samples in the chunk.")
+        self._owner._submit(
+            self._stream,
+            normalized_samples,
+            None if timestamps is None else [float(timestamp) for timestamp in timestamps],
+        )
+
+    def send_chunk_array(
+        self,
+        samples: np.ndarray,
+        timestamps: np.ndarray | None = None,
+    ) -> None:
+        """Queue a copy of a sample array and its per-row timestamps."""
+
+        channel_count = self._owner._senders[self._stream].channel_count
+        samples = np.array(samples, dtype=np.float32, order="C")
+        if samples.ndim == 1 and channel_count == 1:
+            samples = samples.reshape(-1, 1)
+        if samples.ndim != 2 or samples.shape[1] != channel_count:
+            raise ValueError("samples must have shape (n_samples, channel_count).")
+        if samples.shape[0] == 0:
+            return
+        if timestamps is not None:
+            timestamps = np.array(timestamps, dtype=np.float64)
+            if timestamps.shape != (samples.shape[0],):
+                raise ValueError("timestamps must match the number of samples in the chunk.")
+        self._owner._submit(self._stream, samples, timestamps)
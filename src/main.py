@@ -7,9 +7,8 @@ from argparse import ArgumentParser
 from datetime import datetime
 from pathlib import Path
 import sys
-import time
 import traceback
-from typing import Callable, TextIO
+from typing import Any, Callable, TextIO
 
 import numpy as np
 
@@ -19,24 +18,42 @@ if __package__ in {None, ""}:
         sys.path.insert(0, str(repo_root))
 
     from src import __version__
+    from src.instrumentation import LoopInstrumentation
+    from src.live_span import LiveSpanProcessor
     from src.lsl_metadata import (
         build_control_lsl_metadata,
         build_event_lsl_metadata,
+        build_lsl_run_stats,
         build_lsl_timing_metadata,
     )
+    from src.multichannel import create_multichannel_state, multichannel_summary
     from src.pipeline import (
         PipelineConfig,
         ProcessingMode,
         create_pipeline_state,
-        process_device_row,
-        reset_pipeline_state_for_source_gap,
     )
+    from src.plot_process import LivePlotProcess, PlotProcessOptions, plot_window_messages
+    from src.profiling import PROFILE_MODES, LoopProfiler, create_loop_profiler
     from src.quality import raw_qc_summary
-    from src.session_writer import SessionWriter, build_session_metadata
+    from src.replay import replay_session
+    from src.reprocess import reprocess_sessions
+    from src.sweep import (
+        grid_search_points,
+        random_search_points,
+        run_sweep,
+        write_sweep_results,
+    )
+    from src.session_writer import (
+        AsyncSessionWriter,
+        SessionWriter,
+        build_session_metadata,
+        finalize_session,
+    )
     from src.settings import (
         AppConfig,
         expected_bitalino_row_width,
         load_config,
+        parse_config_override,
         validate_live_acquisition_config,
     )
 
@@ -54,26 +71,59 @@ if __package__ in {None, ""}:
         from src.lsl_out import LSLBreathingSender
 
         return LSLBreathingSender
+
+    def _import_lsl_sender_thread():
+        from src.lsl_out import LSLSenderThread
+
+        return LSLSenderThread
+
+    def _import_synthetic_device():
+        from src.synthetic_device import SyntheticBITalino
+
+        return SyntheticBITalino
+
+    def _import_supervisor():
+        from src.supervisor import format_supervisor_summary, run_supervisor
+
+        return run_supervisor, format_supervisor_summary
 else:
     from . import __version__
+    from .instrumentation import LoopInstrumentation
+    from .live_span import LiveSpanProcessor
     from .lsl_metadata import (
         build_control_lsl_metadata,
         build_event_lsl_metadata,
+        build_lsl_run_stats,
         build_lsl_timing_metadata,
     )
+    from .multichannel import create_multichannel_state, multichannel_summary
     from .pipeline import (
         PipelineConfig,
         ProcessingMode,
         create_pipeline_state,
-        process_device_row,
-        reset_pipeline_state_for_source_gap,
     )
+    from .plot_process import LivePlotProcess, PlotProcessOptions, plot_window_messages
+    from .profiling import PROFILE_MODES, LoopProfiler, create_loop_profiler
     from .quality import raw_qc_summary
-    from .session_writer import SessionWriter, build_session_metadata
+    from .replay import replay_session
+    from .reprocess import reprocess_sessions
+    from .sweep import (
+        grid_search_points,
+        random_search_points,
+        run_sweep,
+        write_sweep_results,
+    )
+    from .session_writer import (
+        AsyncSessionWriter,
+        SessionWriter,
+        build_session_metadata,
+        finalize_session,
+    )
     from .settings import (
         AppConfig,
         expected_bitalino_row_width,
         load_config,
+        parse_config_override,
         validate_live_acquisition_config,
     )
 
@@ -92,9 +142,29 @@ else:
 
         return LSLBreathingSender
 
+    def _import_lsl_sender_thread():
+        from .lsl_out import LSLSenderThread
+
+        return LSLSenderThread
+
+    def _import_synthetic_device():
+        from .synthetic_device import SyntheticBITalino
+
+        return SyntheticBITalino
+
+    def _import_supervisor():
+        from .supervisor import format_supervisor_summary, run_supervisor
+
+        return run_supervisor, format_supervisor_summary
+
+
+# Upper bound on one blocking wait for device rows, so the stop key is still
+# polled regularly while no data arrive.
+_ROW_WAIT_TIMEOUT_S = 0.05
+
 
 def main(argv: list[str] | None = None) -> int:
-    """Run live acquisition from a TOML configuration file."""
+    """Run live acquisition, or replay a recorded session with ``replay``."""
 
     parser = ArgumentParser(description="Live breathing-belt acquisition and normalization")
     parser.add_argument(
@@ -102,17 +172,149 @@ def main(argv: list[str] | None = None) -> int:
         default="config.toml",
         help="Path to the TOML configuration file. Defaults to ./config.toml.",
     )
+    parser.add_argument(
+        "--profile",
+        choices=PROFILE_MODES,
+        default=None,
+        help=(
+            "Profile the live acquisition loop with cProfile or a periodic stack "
+            "sampler; writes profile.pstats and profile.collapsed into the session folder."
+        ),
+    )
+    parser.add_argument(
+        "--profile-interval-ms",
+        type=float,
+        default=5.0,
+        help="Stack sampling interval for --profile sample. Defaults to 5 ms.",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    replay_parser = subparsers.add_parser(
+        "replay",
+        help="Re-run a recorded session's device_samples.csv through the pipeline.",
+    )
+    replay_parser.add_argument("session_dir", help="Recorded session directory.")
+    replay_parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        default=[],
+        metavar="SECTION.KEY=VALUE",
+        help="Override one resolved config value (TOML syntax). Repeatable.",
+    )
+    replay_parser.add_argument(
+        "--mode",
+        choices=("control", "movement", "adaptive"),
+        default=None,
+        help="Processing mode. Defaults to the mode recorded in session_metadata.json.",
+    )
+    replay_parser.add_argument(
+        "--output-root",
+        default=None,
+        help="Directory for the replayed session. Defaults to <session_dir>/replays.",
+    )
+    replay_parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="Pace the replay at the recorded capture rate instead of running flat out.",
+    )
+    reprocess_parser = subparsers.add_parser(
+        "reprocess",
+        help="Replay every session folder below a directory in parallel worker processes.",
+    )
+    reprocess_parser.add_argument("archive_dir", help="Directory holding session folders.")
+    reprocess_parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        default=[],
+        metavar="SECTION.KEY=VALUE",
+        help="Override one resolved config value for every session (TOML syntax). Repeatable.",
+    )
+    reprocess_parser.add_argument(
+        "--mode",
+        choices=("control", "movement", "adaptive"),
+        default=None,
+        help="Processing mode. Defaults to the mode recorded in each session.",
+    )
+    reprocess_parser.add_argument(
+        "--output-root",
+        default=None,
+        help="Directory for the derived sessions. Defaults to <archive_dir>_reprocessed_<timestamp>.",
+    )
+    reprocess_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes. Defaults to the CPU count.",
+    )
+    sweep_parser = subparsers.add_parser(
+        "sweep",
+        help="Evaluate hold/smoothing/extrema/adaptation settings over a recorded session.",
+    )
+    sweep_parser.add_argument("session_dir", help="Recorded session directory.")
+    sweep_parser.add_argument(
+        "--param",
+        dest="params",
+        action="append",
+        default=[],
+        metavar="SECTION.KEY=VALUES",
+        help=(
+            "Swept parameter with a TOML list of values, or an inline table "
+            "{low = ..., high = ...} with --random. Repeatable."
+        ),
+    )
+    sweep_parser.add_argument(
+        "--random",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Draw N random points instead of the full grid.",
+    )
+    sweep_parser.add_argument("--seed", type=int, default=0, help="Random-search seed.")
+    sweep_parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        default=[],
+        metavar="SECTION.KEY=VALUE",
+        help="Override one base config value for every point (TOML syntax). Repeatable.",
+    )
+    sweep_parser.add_argument(
+        "--mode",
+        choices=("control", "movement", "adaptive"),
+        default=None,
+        help="Processing mode. Defaults to the mode recorded in session_metadata.json.",
+    )
+    sweep_parser.add_argument(
+        "--output",
+        default=None,
+        help="Results CSV path. Defaults to <session_dir>/sweeps/sweep_<timestamp>.csv.",
+    )
     args = parser.parse_args(argv)
 
+    if args.command == "sweep":
+        return _run_sweep_command(args)
+    if args.command == "replay":
+        return _run_replay_command(args)
+    if args.command == "reprocess":
+        return _run_reprocess_command(args)
+
     try:
         config = load_config(args.config)
         validate_live_acquisition_config(config)
+        profiler = create_loop_profiler(
+            args.profile,
+            interval_s=args.profile_interval_ms / 1000.0,
+        )
     except Exception as error:
         print(f"Configuration error: {error}", file=sys.stderr)
         return 2
 
     try:
-        run_acquisition(config=config)
+        if config.devices:
+            run_supervised_acquisition(config=config, profiler=profiler)
+        else:
+            run_acquisition(config=config, profiler=profiler)
     except KeyboardInterrupt:
         print("Interrupted by user.")
         return 130
@@ -122,6 +324,133 @@ def main(argv: list[str] | None = None) -> int:
     return 0
 
 
+def _run_replay_command(args) -> int:
+    overrides: dict[str, dict[str, object]] = {}
+    try:
+        for text in args.overrides:
+            section_name, key, value = parse_config_override(text)
+            overrides.setdefault(section_name, {})[key] = value
+        result = replay_session(
+            args.session_dir,
+            overrides=overrides,
+            processing_mode=args.mode,
+            output_root=args.output_root,
+            realtime=args.realtime,
+        )
+    except (FileNotFoundError, ValueError) as error:
+        print(f"Replay error: {error}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        print("Interrupted by user.")
+        return 130
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+    rate = result.samples_processed / result.elapsed_s if result.elapsed_s > 0.0 else float("inf")
+    print(
+        f"Replayed {result.samples_processed} samples ({result.processing_mode} mode) "
+        f"in {result.elapsed_s:.2f}s ({rate:.0f} samples/s)."
+    )
+    if result.observed_gap_count:
+        print(f"Reset pipeline state at {result.observed_gap_count} source gap(s).")
+    print(f"Wrote replayed session to {result.session_dir}")
+    return 0
+
+
+def _run_reprocess_command(args) -> int:
+    overrides: dict[str, dict[str, object]] = {}
+
+    def report(session) -> None:
+        if session.ok:
+            print(
+                f"OK {session.source_session_dir}: {session.samples_processed} samples "
+                f"in {session.elapsed_s:.2f}s ({session.samples_per_s:.0f} samples/s)"
+            )
+        else:
+            print(f"FAILED {session.source_session_dir}: {session.error}")
+
+    try:
+        for text in args.overrides:
+            section_name, key, value = parse_config_override(text)
+            overrides.setdefault(section_name, {})[key] = value
+        result = reprocess_sessions(
+            args.archive_dir,
+            overrides=overrides,
+            processing_mode=args.mode,
+            output_root=args.output_root,
+            workers=args.workers,
+            on_result=report,
+        )
+    except (FileNotFoundError, ValueError) as error:
+        print(f"Reprocess error: {error}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        print("Interrupted by user.")
+        return 130
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+    rate = result.samples_processed / result.elapsed_s if result.elapsed_s > 0.0 else float("inf")
+    print(
+        f"Reprocessed {len(result.sessions) - len(result.failures)}/{len(result.sessions)} "
+        f"sessions ({result.samples_processed} samples) in {result.elapsed_s:.2f}s with "
+        f"{result.workers} worker(s) ({rate:.0f} samples/s)."
+    )
+    print(f"Wrote derived sessions to {result.output_root}")
+    return 1 if result.failures else 0
+
+
+def _run_sweep_command(args) -> int:
+    overrides: dict[str, dict[str, object]] = {}
+    space: dict[str, dict[str, object]] = {}
+    try:
+        for text in args.overrides:
+            section_name, key, value = parse_config_override(text)
+            overrides.setdefault(section_name, {})[key] = value
+        for text in args.params:
+            section_name, key, value = parse_config_override(text)
+            space.setdefault(section_name, {})[key] = value
+        if args.random is None:
+            points = grid_search_points(space)
+        else:
+            points = random_search_points(space, args.random, seed=args.seed)
+        result = run_sweep(
+            args.session_dir,
+            points,
+            overrides=overrides,
+            processing_mode=args.mode,
+        )
+        output_path = (
+            Path(args.output)
+            if args.output is not None
+            else Path(args.session_dir)
+            / "sweeps"
+            / f"sweep_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.csv"
+        )
+        write_sweep_results(output_path, result)
+    except (FileNotFoundError, ValueError) as error:
+        print(f"Sweep error: {error}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        print("Interrupted by user.")
+        return 130
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+    failed = sum(1 for point in result.points if point.error is not None)
+    rate = len(result.points) / result.elapsed_s if result.elapsed_s > 0.0 else float("inf")
+    print(
+        f"Evaluated {len(result.points)} sweep points ({failed} invalid, "
+        f"{result.prepared.processing_mode} mode) in {result.elapsed_s:.2f}s "
+        f"({rate:.1f} points/s; shared preparation {result.prepared.prepare_s:.2f}s)."
+    )
+    print(f"Wrote sweep results to {output_path}")
+    return 0
+
+
 def prompt_processing_mode(
     input_func: Callable[[str], str] = input,
     output_stream: TextIO | None = None,
@@ -158,68 +487,73 @@ def _processing_mode_description(processing_mode: ProcessingMode) -> str:
     return "Legacy control (0..1, hold/smoothing)"
 
 
-def _runtime_value_label(processing_mode: ProcessingMode) -> str:
+def _plot_panel_config(processing_mode: ProcessingMode) -> tuple[str, str]:
     if processing_mode == "movement":
-        return "Movement proxy"
+        return "Movement Proxy (Centered)", "Movement Proxy"
     if processing_mode == "adaptive":
-        return "Adaptive normalized"
-    return "Normalized"
+        return "Adaptive Breath Level (0-1)", "Adaptive Breath Level"
+    return "Breath Level (0-1)", "Breath Level"
 
 
-def _advance_runtime_print_budget(
-    print_budget: int,
-    sample_percent: int,
-) -> tuple[bool, int]:
-    """Return whether to print this sample and the updated print budget."""
+def _device_factory(config: AppConfig):
+    """Return the configured device factory, or ``None`` for hardware BITalino."""
 
-    if sample_percent <= 0:
-        return False, 0
+    if config.device.backend != "synthetic":
+        return None
+    SyntheticBITalino = _import_synthetic_device()
+    return lambda: SyntheticBITalino(config.synthetic_device)
 
-    next_budget = print_budget + sample_percent
-    if next_budget < 100:
-        return False, next_budget
-    return True, next_budget - 100
 
+def run_supervised_acquisition(
+    config: AppConfig,
+    profiler: LoopProfiler | None = None,
+) -> None:
+    """Acquire from every configured ``[[devices]]`` belt in one process."""
 
-def _plot_panel_config(processing_mode: ProcessingMode) -> tuple[str, str]:
-    if processing_mode == "movement":
-        return "Movement Proxy (Centered)", "Movement Proxy"
-    if processing_mode == "adaptive":
-        return "Adaptive Breath Level (0-1)", "Adaptive Breath Level"
-    return "Breath Level (0-1)", "Breath Level"
+    import keyboard
+
+    run_supervisor, format_supervisor_summary = _import_supervisor()
+    selected_mode_number, processing_mode = prompt_processing_mode()
+    print(
+        "Selected mode "
+        f"{selected_mode_number}: "
+        + _processing_mode_description(processing_mode)
+    )
+    names = ", ".join(entry.name for entry in config.devices)
+    print(f"Supervising {len(config.devices)} devices: {names}.")
+    print("Press 'c' to stop acquisition.")
+    profiler = profiler or LoopProfiler()
+    # The supervisor owns its scheduler loop, so the whole run is profiled.
+    profiler.start()
+    profiler.resume()
+    try:
+        result = run_supervisor(
+            config,
+            processing_mode,
+            should_stop=lambda: keyboard.is_pressed("c"),
+            selected_mode_number=selected_mode_number,
+        )
+    finally:
+        profiler.stop()
+    print(format_supervisor_summary(result.summary))
+    print(f"Wrote device sessions to {result.supervisor_dir}")
+    _write_profile(profiler, result.supervisor_dir)
 
 
-def _effective_lsl_timestamp(capture_time_lsl_s: float, constant_delay_s: float) -> float:
-    return float(capture_time_lsl_s - constant_delay_s)
+def _write_profile(profiler: LoopProfiler, output_dir: Path) -> None:
+    written = profiler.write(output_dir)
+    if written is not None:
+        pstats_path, collapsed_path = written
+        print(f"Wrote {profiler.mode} profile to {pstats_path} and {collapsed_path}")
 
 
-def _flush_control_span(
-    sender,
-    *,
-    samples: list[float],
-    timestamps: list[float],
-    lsl_run_stats: dict[str, int | str],
-) -> None:
-    if sender is None or not samples:
-        samples.clear()
-        timestamps.clear()
-        return
-
-    if len(samples) == 1:
-        sender.send(samples[0], timestamp=timestamps[0])
-        lsl_run_stats["control_samples_sent"] += 1
-        lsl_run_stats["control_samples_sent_individually"] += 1
-    else:
-        sender.send_chunk(samples, timestamps=timestamps)
-        lsl_run_stats["control_samples_sent"] += len(samples)
-        lsl_run_stats["control_samples_sent_via_chunks"] += len(samples)
-        lsl_run_stats["control_chunks_sent"] += 1
-    samples.clear()
-    timestamps.clear()
-
-
-def run_acquisition(config: AppConfig) -> None:
-    """Acquire, normalize, plot, stream, and persist breathing-belt data."""
+def run_acquisition(config: AppConfig, profiler: LoopProfiler | None = None) -> None:
+    """Acquire, normalize, plot, stream, and persist breathing-belt data.
+
+    ``profiler`` (see :mod:`src.profiling`) is resumed for each dequeued
+    chunk and paused once it has been handled; its output is written into the
+    session folder.
+    """
 
     import keyboard
 
@@ -230,11 +564,13 @@ def run_acquisition(config: AppConfig) -> None:
     session_writer = None
     lsl_control_sender = None
     lsl_event_sender = None
+    lsl_sender_thread = None
     raw_ax = None
     raw_line = None
     normalized_ax = None
     normalized_line = None
     blit_manager = None
+    plot_process = None
     raw_sample_indices: deque[int] = deque(maxlen=plot_window_samples)
     raw_signal: deque[float] = deque(maxlen=plot_window_samples)
     normalized_sample_indices: deque[int] = deque(maxlen=plot_window_samples)
@@ -243,41 +579,24 @@ def run_acquisition(config: AppConfig) -> None:
     peak_raw_values: deque[float] = deque(maxlen=plot_window_samples)
     trough_sample_indices: deque[int] = deque(maxlen=plot_window_samples)
     trough_raw_values: deque[float] = deque(maxlen=plot_window_samples)
-    previous_source_sample_index: int | None = None
-    previous_runtime_lsl_timestamp: float | None = None
-    runtime_print_budget = 0
+    span_processor = None
     reported_dropped_rows_total = 0
-    lsl_run_stats: dict[str, int | str] = {
-        "control_send_strategy": "hybrid_explicit_timestamps",
-        "control_samples_sent": 0,
-        "control_samples_sent_individually": 0,
-        "control_samples_sent_via_chunks": 0,
-        "control_chunks_sent": 0,
-        "event_samples_sent": 0,
-        "queue_dropped_rows_total": 0,
-        "observed_gap_count": 0,
-    }
+    lsl_run_stats = build_lsl_run_stats(config)
     selected_mode_number, processing_mode = prompt_processing_mode()
     print(
         "Selected mode "
         f"{selected_mode_number}: "
         + _processing_mode_description(processing_mode)
     )
-    pipeline_cfg = PipelineConfig(
-        sampling_rate_hz=config.device.sampling_rate_hz,
-        processed_sensor_column=config.device.processed_sensor_column,
-        invert_signal=config.device.invert_signal,
-        filter=config.filter,
-        calibration=config.calibration,
-        adaptation=config.adaptation,
-        hold=config.hold,
-        output_smoothing=config.output_smoothing,
-        extrema=config.extrema,
-        raw_qc=config.raw_qc,
-        processing_mode=processing_mode,
-        movement=config.movement,
-    )
-    pipeline_state = create_pipeline_state(pipeline_cfg)
+    pipeline_cfg = PipelineConfig.from_app_config(config, processing_mode)
+    multichannel = bool(pipeline_cfg.processed_sensor_columns)
+    pipeline_state = (
+        create_multichannel_state(pipeline_cfg)
+        if multichannel
+        else create_pipeline_state(pipeline_cfg)
+    )
+    instrumentation = LoopInstrumentation(config.instrumentation)
+    profiler = profiler or LoopProfiler()
     session_started_at = datetime.now().astimezone().isoformat()
     device_sample_width = expected_bitalino_row_width(config.device.channels)
 
@@ -293,16 +612,38 @@ def run_acquisition(config: AppConfig) -> None:
             read_error_backoff_s=config.device.read_error_backoff_s,
             retries=config.device.retries,
             retry_delay_s=config.device.retry_delay_s,
+            device_factory=_device_factory(config),
         )
         belt.start()
 
-        session_writer = SessionWriter(
+        writer_cls = AsyncSessionWriter if config.output.writer == "async" else SessionWriter
+        session_writer = writer_cls(
             config.output.root_dir,
             config,
             device_sample_width=device_sample_width,
+            **(
+                {"channel_columns": pipeline_cfg.processed_sensor_columns}
+                if multichannel
+                else {}
+            ),
         )
 
-        if config.display.enable_plot:
+        update_live_plots = None
+        if config.display.enable_plot and config.display.plot_backend == "process":
+            normalized_title, normalized_label = _plot_panel_config(processing_mode)
+            plot_process = LivePlotProcess(
+                plot_window_samples,
+                PlotProcessOptions(
+                    refresh_hz=config.display.plot_refresh_hz,
+                    width_px=config.display.plot_width_px,
+                    processing_mode=processing_mode,
+                    normalized_title=normalized_title,
+                    normalized_label=normalized_label,
+                    sampling_rate_hz=config.device.sampling_rate_hz,
+                    debug_window_bounds=config.display.debug_plot_window_bounds,
+                ),
+            )
+        elif config.display.enable_plot:
             setup_live_plots, update_live_plots = _import_plot_helpers()
             normalized_title, normalized_label = _plot_panel_config(processing_mode)
             _, raw_ax, raw_line, normalized_ax, normalized_line, blit_manager = (
@@ -311,8 +652,6 @@ def run_acquisition(config: AppConfig) -> None:
                     normalized_label=normalized_label,
                 )
             )
-        else:
-            update_live_plots = None
 
         if config.lsl.enable:
             LSLBreathingSender = _import_lsl_sender()
@@ -320,7 +659,7 @@ def run_acquisition(config: AppConfig) -> None:
             lsl_control_sender = LSLBreathingSender(
                 name=str(control_lsl_metadata["stream_name"]),
                 type=str(control_lsl_metadata["stream_type"]),
-                channel_count=1,
+                channel_count=int(control_lsl_metadata["channel_count"]),
                 nominal_srate=config.device.sampling_rate_hz,
                 source_id=str(control_lsl_metadata["source_id"]),
                 channel_labels=tuple(control_lsl_metadata["channel_names"]),
@@ -330,7 +669,7 @@ def run_acquisition(config: AppConfig) -> None:
             lsl_event_sender = LSLBreathingSender(
                 name=str(event_lsl_metadata["stream_name"]),
                 type=str(event_lsl_metadata["stream_type"]),
-                channel_count=1,
+                channel_count=int(event_lsl_metadata["channel_count"]),
                 nominal_srate=0,
                 source_id=str(event_lsl_metadata["source_id"]),
                 channel_labels=tuple(event_lsl_metadata["channel_names"]),
@@ -340,6 +679,25 @@ def run_acquisition(config: AppConfig) -> None:
                     for code, label in dict(event_lsl_metadata["event_code_map"]).items()
                 },
             )
+            if config.lsl.sender == "thread":
+                LSLSenderThread = _import_lsl_sender_thread()
+                lsl_sender_thread = LSLSenderThread(
+                    lsl_control_sender,
+                    lsl_event_sender,
+                    queue_max_blocks=config.lsl.sender_queue_max_blocks,
+                )
+                lsl_control_sender = lsl_sender_thread.control
+                lsl_event_sender = lsl_sender_thread.event
+
+        span_processor = LiveSpanProcessor(
+            config,
+            pipeline_cfg,
+            pipeline_state,
+            session_writer=session_writer,
+            control_sender=lsl_control_sender,
+            event_sender=lsl_event_sender,
+            lsl_run_stats=lsl_run_stats,
+        )
 
         print(
             f"Starting startup calibration for {config.calibration.duration_s:.1f}s "
@@ -348,11 +706,15 @@ def run_acquisition(config: AppConfig) -> None:
         print("Breathe normally and include full inhale/exhale range.")
         print("Press 'c' to stop acquisition.")
 
+        profiler.start()
         while not keyboard.is_pressed("c"):
-            acquired_rows = belt.get_all()
+            if not belt.wait_for_rows(timeout=_ROW_WAIT_TIMEOUT_S):
+                continue
+            acquired_rows = belt.get_block()
             if len(acquired_rows) == 0:
-                time.sleep(0.001)
                 continue
+            profiler.resume()
+            chunk_timer = instrumentation.start_chunk(acquired_rows)
 
             dropped_rows_total = int(getattr(belt, "dropped_rows_total", 0))
             if dropped_rows_total > reported_dropped_rows_total:
@@ -364,161 +726,56 @@ def run_acquisition(config: AppConfig) -> None:
                 reported_dropped_rows_total = dropped_rows_total
                 lsl_run_stats["queue_dropped_rows_total"] = dropped_rows_total
 
-            control_span_samples: list[float] = []
-            control_span_timestamps: list[float] = []
-            last_control_source_sample_index: int | None = None
-
-            for acquired_row in acquired_rows:
-                if (
-                    previous_source_sample_index is not None
-                    and acquired_row.source_sample_index != previous_source_sample_index + 1
-                ):
-                    missing_samples = max(
-                        acquired_row.source_sample_index - previous_source_sample_index - 1,
-                        0,
+            for span_rows in acquired_rows.contiguous_spans():
+                span = span_processor.process_span(span_rows, chunk_timer)
+                batch = span.batch
+                source_sample_indices = span.source_sample_indices
+                live_offsets = span.live_offsets
+                live_source_indices = source_sample_indices[live_offsets]
+                live_values = batch.runtime_values[live_offsets]
+                peak_offsets = live_offsets[span.live_codes > 0.0]
+                trough_offsets = live_offsets[span.live_codes < 0.0]
+                if plot_process is not None:
+                    plot_process.append(
+                        source_sample_indices,
+                        batch.selected_sensor_raw,
+                        live_source_indices,
+                        live_values,
+                        peak_x=source_sample_indices[peak_offsets],
+                        peak_y=batch.selected_sensor_raw[peak_offsets],
+                        trough_x=source_sample_indices[trough_offsets],
+                        trough_y=batch.selected_sensor_raw[trough_offsets],
                     )
-                    lsl_run_stats["observed_gap_count"] += 1
-                    reset_pipeline_state_for_source_gap(pipeline_state)
-                    previous_runtime_lsl_timestamp = None
-                    print(
-                        "WARNING [source_gap]: "
-                        f"detected non-contiguous source samples ({missing_samples} "
-                        "missing sample(s)); reset short-term pipeline state."
-                    )
-                previous_source_sample_index = acquired_row.source_sample_index
-
-                sample, pipeline_state = process_device_row(
-                    acquired_row.device_row,
-                    pipeline_state,
-                    pipeline_cfg,
-                )
-                lsl_timestamp_s = _effective_lsl_timestamp(
-                    acquired_row.capture_time_lsl_s,
-                    config.lsl.constant_delay_s,
-                )
-                session_writer.write_device_row(
-                    stage=sample.stage,
-                    sample_index=sample.sample_index,
-                    relative_time_s=sample.relative_time_s,
-                    device_row=acquired_row.device_row,
-                    source_sample_index=acquired_row.source_sample_index,
-                    capture_time_lsl_s=acquired_row.capture_time_lsl_s,
-                    lsl_timestamp_s=lsl_timestamp_s,
-                )
-
-                for message in sample.messages:
-                    print(message)
-                for event in sample.qc_events:
-                    print(f"WARNING [{event.event_type}]: {event.message}")
-                    session_writer.write_qc_event(event)
-
-                raw_sample_indices.append(acquired_row.source_sample_index)
-                raw_signal.append(sample.selected_sensor_raw)
-
-                event_timestamp_lsl_s: float | None = None
-                if sample.stage == "runtime":
-                    runtime_value = (
-                        sample.movement_value if processing_mode == "movement" else sample.normalized_value
-                    )
-                    if runtime_value is not None:
-                        normalized_sample_indices.append(acquired_row.source_sample_index)
-                        normalized_signal.append(runtime_value)
-                        if sample.extrema_event_code > 0.0:
-                            peak_sample_indices.append(acquired_row.source_sample_index)
-                            peak_raw_values.append(sample.selected_sensor_raw)
-                        elif sample.extrema_event_code < 0.0:
-                            trough_sample_indices.append(acquired_row.source_sample_index)
-                            trough_raw_values.append(sample.selected_sensor_raw)
-                        if lsl_control_sender is not None:
-                            if (
-                                last_control_source_sample_index is not None
-                                and acquired_row.source_sample_index
-                                != last_control_source_sample_index + 1
-                            ):
-                                _flush_control_span(
-                                    lsl_control_sender,
-                                    samples=control_span_samples,
-                                    timestamps=control_span_timestamps,
-                                    lsl_run_stats=lsl_run_stats,
-                                )
-                            control_span_samples.append(float(runtime_value))
-                            control_span_timestamps.append(lsl_timestamp_s)
-                            last_control_source_sample_index = acquired_row.source_sample_index
-
-                        if (
-                            lsl_event_sender is not None
-                            and sample.extrema_event_code != 0.0
-                            and previous_runtime_lsl_timestamp is not None
-                        ):
-                            event_timestamp_lsl_s = previous_runtime_lsl_timestamp
-                            lsl_event_sender.send(
-                                float(sample.extrema_event_code),
-                                timestamp=event_timestamp_lsl_s,
-                            )
-                            lsl_run_stats["event_samples_sent"] += 1
-                        should_print_runtime_value = False
-                        if config.display.print_runtime_values:
-                            should_print_runtime_value, runtime_print_budget = (
-                                _advance_runtime_print_budget(
-                                    runtime_print_budget,
-                                    config.display.runtime_print_percent,
-                                )
-                            )
-                        if should_print_runtime_value:
-                            print(
-                                f"{_runtime_value_label(processing_mode)}: "
-                                f"{runtime_value:.4f}"
-                            )
-                        if sample.extrema_event_label is not None:
-                            print(f"Breath event: {sample.extrema_event_label}")
-                        previous_runtime_lsl_timestamp = lsl_timestamp_s
-
-                session_writer.write_signal_sample(
-                    sample,
-                    source_sample_index=acquired_row.source_sample_index,
-                    capture_time_lsl_s=acquired_row.capture_time_lsl_s,
-                    lsl_timestamp_s=lsl_timestamp_s,
-                    event_timestamp_lsl_s=event_timestamp_lsl_s,
-                )
-
-            _flush_control_span(
-                lsl_control_sender,
-                samples=control_span_samples,
-                timestamps=control_span_timestamps,
-                lsl_run_stats=lsl_run_stats,
-            )
+                elif update_live_plots is not None:
+                    raw_sample_indices.extend(source_sample_indices.tolist())
+                    raw_signal.extend(batch.selected_sensor_raw.tolist())
+                    normalized_sample_indices.extend(live_source_indices.tolist())
+                    normalized_signal.extend(live_values.tolist())
+                    peak_sample_indices.extend(source_sample_indices[peak_offsets].tolist())
+                    peak_raw_values.extend(batch.selected_sensor_raw[peak_offsets].tolist())
+                    trough_sample_indices.extend(source_sample_indices[trough_offsets].tolist())
+                    trough_raw_values.extend(batch.selected_sensor_raw[trough_offsets].tolist())
+                chunk_timer.lap("plot")
+
+            span_processor.flush_control()
+            chunk_timer.lap("lsl_send")
+            chunk_timer.mark("control_output")
             session_writer.flush_incremental()
-
-            if config.display.enable_plot and raw_signal and update_live_plots is not None:
-                if normalized_signal:
-                    normalized_array = np.asarray(normalized_signal, dtype=float)
-                    window_min = float(np.min(normalized_array))
-                    window_max = float(np.max(normalized_array))
-                else:
-                    normalized_array = np.asarray([], dtype=float)
-                    window_min = 0.0
-                    window_max = 0.0
-
-                if (
-                    config.display.debug_plot_window_bounds
-                    and normalized_sample_indices
-                    and (
-                        normalized_sample_indices[-1] % config.device.sampling_rate_hz
-                    ) < len(acquired_rows)
-                ):
-                    print(
-                        f"Plot window range check: min={window_min:.4f}, "
-                        f"max={window_max:.4f}, points={len(normalized_array)}"
-                    )
-                if (
-                    processing_mode != "movement"
-                    and normalized_array.size > 0
-                    and (window_min < 0.0 or window_max > 1.0)
+            chunk_timer.lap("session_write")
+
+            if raw_signal and update_live_plots is not None:
+                for message in plot_window_messages(
+                    np.asarray(normalized_signal, dtype=float),
+                    processing_mode=processing_mode,
+                    report_range=(
+                        config.display.debug_plot_window_bounds
+                        and bool(normalized_sample_indices)
+                        and (
+                            normalized_sample_indices[-1] % config.device.sampling_rate_hz
+                        ) < len(acquired_rows)
+                    ),
                 ):
-                    print(
-                        "WARNING: plotted window out of [0,1] "
-                        f"(min={window_min:.6f}, max={window_max:.6f})"
-                    )
+                    print(message)
 
                 update_live_plots(
                     raw_signal,
@@ -538,28 +795,68 @@ def run_acquisition(config: AppConfig) -> None:
                     normalized_autoscale_y=processing_mode == "movement",
                     blit_manager=blit_manager,
                 )
+            chunk_timer.lap("plot")
+            chunk_timer.finish()
+            instrumentation_summary = instrumentation.due_console_summary()
+            if instrumentation_summary is not None:
+                print(instrumentation_summary)
+            profiler.pause()
     finally:
+        profiler.stop()
         print("Stopping acquisition...")
         if belt is not None:
             belt.stop()
+        plot_stats = None
+        if plot_process is not None:
+            plot_process.close()
+            plot_stats = plot_process.stats()
+        sender_error: RuntimeError | None = None
+        if lsl_sender_thread is not None:
+            try:
+                lsl_sender_thread.close()
+            except RuntimeError as error:
+                # Finalize the session first; the failure is re-raised below.
+                sender_error = error
+                lsl_run_stats["sender_error"] = repr(error.__cause__ or error)
+            lsl_run_stats["sender_thread"] = lsl_sender_thread.stats()
 
         session_ended_at = datetime.now().astimezone().isoformat()
+        if span_processor is not None:
+            pipeline_state = span_processor.pipeline_state
         if session_writer is not None:
-            metadata = build_session_metadata(
-                config=config,
-                resolved_config_path=session_writer.resolved_config_path,
-                software_version=__version__,
-                started_at=session_started_at,
-                ended_at=session_ended_at,
-                calibration_result=pipeline_state.calibration_result,
-                adaptive_state=pipeline_state.adaptive_state,
-                qc_summary=raw_qc_summary(pipeline_state.qc_state),
-                processing_mode=processing_mode,
-                selected_mode_number=selected_mode_number,
-                lsl_run_stats=lsl_run_stats,
-            )
-            session_writer.finalize(metadata)
+            profile_summary = profiler.summary()
+
+            def build_metadata() -> dict[str, Any]:
+                metadata = build_session_metadata(
+                    config=config,
+                    resolved_config_path=session_writer.resolved_config_path,
+                    software_version=__version__,
+                    started_at=session_started_at,
+                    ended_at=session_ended_at,
+                    calibration_result=pipeline_state.calibration_result,
+                    adaptive_state=pipeline_state.adaptive_state,
+                    qc_summary=raw_qc_summary(pipeline_state.qc_state),
+                    processing_mode=processing_mode,
+                    selected_mode_number=selected_mode_number,
+                    lsl_run_stats=lsl_run_stats,
+                    writer_stats=session_writer.writer_stats(),
+                    instrumentation_summary=instrumentation.summary(),
+                    multichannel_summary=(
+                        multichannel_summary(pipeline_state) if multichannel else None
+                    ),
+                )
+                if profile_summary is not None:
+                    metadata["profile"] = profile_summary
+                if plot_stats is not None:
+                    metadata["plot"] = plot_stats
+                return metadata
+
+            finalize_session(session_writer, build_metadata)
+            if profile_summary is not None:
+                _write_profile(profiler, session_writer.session_dir)
         print("Connection closed.")
+        if sender_error is not None:
+            raise sender_error
 
 
 if __name__ == "__main__":
@@ -0,0 +1,956 @@
+"""Channel-stacked live processing of several device-row columns at once.
+
+:func:`process_multichannel_rows` applies the per-mode processing of
+:func:`src.pipeline.process_device_rows` to every column listed in
+``PipelineConfig.processed_sensor_columns`` in one pass. Per-channel state
+(filter delay lines, calibration, reference and adaptive range, hold,
+smoothing and extrema state) lives in arrays indexed by channel position:
+
+- the causal filters run once over the ``(n, channels)`` block,
+- activity windows, control mapping and smoothing coefficients are evaluated
+  for the whole block with NumPy,
+- only the genuinely recursive updates (hold latch, output smoothing,
+  movement slowdown, adaptive range, extrema confirmation) step through the
+  rows, on plain floats, and extrema confirmation only visits turning points.
+  Each step calls the same helper as the single-channel pipeline.
+
+Calibration progress and the calibration/runtime split are shared by all
+channels. Each channel is calibrated with the configured
+``calibration.engine``: the batch engine buffers the span and sorts it once,
+the streaming engine keeps one :class:`StreamingCalibrationWindow` per
+channel up to date as rows arrive.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+import math
+from typing import Any
+
+import numpy as np
+from scipy.signal import sosfilt
+
+from .calibration import AdaptiveRangeState, CalibrationResult, StreamingCalibrationWindow
+from .pipeline import (
+    PipelineBatch,
+    PipelineConfig,
+    ProcessingMode,
+    calibration_complete_messages,
+    confirm_extremum,
+    extremum_interval_elapsed,
+    finalize_calibration,
+    step_hold_latch,
+    step_movement_slowdown,
+    step_output_smoothing,
+    update_adaptive_span,
+    with_raw_calibration_saturation,
+)
+from .quality import (
+    RawQCEvent,
+    RawQCState,
+    create_raw_qc_state,
+    raw_qc_summary,
+    update_raw_qc_block,
+)
+
+
+@dataclass(frozen=True)
+class MultiChannelBatch:
+    """Columnar processing results for one block, one column per channel.
+
+    Per-row columns have shape ``(n,)``; per-channel columns have shape
+    ``(n, channels)`` in ``channel_columns`` order. Missing values are NaN as
+    in :class:`PipelineBatch`. ``messages`` are shared by all channels and
+    ``qc_events`` are ``(row_offset, channel_position, event)`` triples.
+    """
+
+    processing_mode: ProcessingMode
+    channel_columns: tuple[int, ...]
+    runtime_mask: np.ndarray
+    sample_index: np.ndarray
+    relative_time_s: np.ndarray
+    selected_sensor_raw: np.ndarray
+    filtered_value: np.ndarray
+    normalized_value: np.ndarray
+    movement_value: np.ndarray
+    hold_mode_active: np.ndarray
+    adaptive_center: np.ndarray
+    adaptive_amplitude: np.ndarray
+    extrema_event_code: np.ndarray
+    messages: tuple[tuple[int, str], ...] = ()
+    qc_events: tuple[tuple[int, int, RawQCEvent], ...] = ()
+
+    def __len__(self) -> int:
+        return int(self.sample_index.shape[0])
+
+    @property
+    def runtime_values(self) -> np.ndarray:
+        """Mode-specific live output per channel: movement proxy or normalized level."""
+
+        if self.processing_mode == "movement":
+            return self.movement_value
+        return self.normalized_value
+
+    def channel(self, position: int) -> PipelineBatch:
+        """Return one channel as a single-channel :class:`PipelineBatch`."""
+
+        return PipelineBatch(
+            processing_mode=self.processing_mode,
+            runtime_mask=self.runtime_mask,
+            sample_index=self.sample_index,
+            relative_time_s=self.relative_time_s,
+            selected_sensor_raw=self.selected_sensor_raw[:, position],
+            filtered_value=self.filtered_value[:, position],
+            cleaned_value=self.filtered_value[:, position],
+            normalized_value=self.normalized_value[:, position],
+            movement_value=self.movement_value[:, position],
+            hold_mode_active=self.hold_mode_active[:, position],
+            adaptive_center=self.adaptive_center[:, position],
+            adaptive_amplitude=self.adaptive_amplitude[:, position],
+            extrema_event_code=self.extrema_event_code[:, position],
+            messages=self.messages,
+            qc_events=tuple(
+                (offset, event)
+                for offset, event_position, event in self.qc_events
+                if event_position == position
+            ),
+        )
+
+
+class _StackedSosFilter:
+    """One second-order-section cascade applied to every channel column."""
+
+    def __init__(self, sos: np.ndarray, zi: np.ndarray) -> None:
+        self.sos = sos
+        self.zi = zi
+
+    @classmethod
+    def scaled(cls, sos: np.ndarray, unit_zi: np.ndarray, initial_values: np.ndarray):
+        """Create the filter with steady-state delay lines scaled per channel."""
+
+        return cls(sos, unit_zi[:, :, np.newaxis] * initial_values[np.newaxis, np.newaxis, :])
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        filtered, self.zi = sosfilt(self.sos, block, axis=0, zi=self.zi)
+        return filtered
+
+
+class _ActivityWindow:
+    """Per-channel window of recent absolute velocities.
+
+    Equivalent to one :class:`src.preprocessing.RunningMean` per channel, but
+    a block of values is appended at once and the window mean after every
+    appended row is returned from a single cumulative sum.
+    """
+
+    def __init__(self, maxlen: int, channel_count: int) -> None:
+        self.maxlen = int(maxlen)
+        self.channel_count = int(channel_count)
+        self.clear()
+
+    def clear(self) -> None:
+        self._history = np.zeros((0, self.channel_count), dtype=float)
+
+    def extend(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Append ``(n, channels)`` values; return per-row means and is-full flags."""
+
+        history_rows = self._history.shape[0]
+        combined = np.concatenate([self._history, values])
+        cumulative = np.concatenate(
+            [np.zeros((1, self.channel_count)), np.cumsum(combined, axis=0)]
+        )
+        ends = history_rows + np.arange(1, values.shape[0] + 1)
+        starts = np.maximum(ends - self.maxlen, 0)
+        means = (cumulative[ends] - cumulative[starts]) / (ends - starts)[:, np.newaxis]
+        self._history = combined[-self.maxlen:]
+        return means, ends - starts >= self.maxlen
+
+
+@dataclass
+class MultiChannelPipelineState:
+    """Mutable state for channel-stacked processing; arrays are indexed by channel."""
+
+    channel_columns: tuple[int, ...]
+    primary_position: int
+    qc_states: list[RawQCState]
+    hold_activity: _ActivityWindow
+    output_activity: _ActivityWindow
+    movement_activity: _ActivityWindow
+    adaptive_activity: _ActivityWindow
+    hp_filter: _StackedSosFilter | None = None
+    lp_filter: _StackedSosFilter | None = None
+    calibration_blocks: list[np.ndarray] = field(default_factory=list)
+    calibration_windows: list[StreamingCalibrationWindow] | None = None
+    calibration_sample_count: int = 0
+    calibration_raw_saturated_counts: np.ndarray | None = None
+    calibration_results: tuple[CalibrationResult, ...] | None = None
+    reference_center: np.ndarray | None = None
+    reference_amplitude: np.ndarray | None = None
+    abs_dev_ema: np.ndarray | None = None
+    abs_dev_to_amplitude_scale: np.ndarray | None = None
+    runtime_processed_samples: int = 0
+    startup_mode_active: bool = False
+    calibration_last_reported_sec: int = -1
+    stage_sample_index: int = 0
+    previous_cleaned_value: np.ndarray | None = None
+    previous_movement_activity_value: np.ndarray | None = None
+    previous_adaptive_value: np.ndarray | None = None
+    hold_mode_active: np.ndarray | None = None
+    frozen_normalized_value: np.ndarray | None = None
+    emitted_normalized_value: np.ndarray | None = None
+    slowed_movement_value: np.ndarray | None = None
+    previous_signal_value: np.ndarray | None = None
+    previous_delta_sign: np.ndarray | None = None
+    last_event_sample_index: np.ndarray | None = None
+    last_peak_value: np.ndarray | None = None
+    last_trough_value: np.ndarray | None = None
+
+    @property
+    def channel_count(self) -> int:
+        return len(self.channel_columns)
+
+    @property
+    def stage(self) -> str:
+        return "calibration" if self.calibration_results is None else "runtime"
+
+    @property
+    def adaptive_states(self) -> tuple[AdaptiveRangeState, ...] | None:
+        """Current per-channel reference or adaptive range."""
+
+        if self.reference_center is None:
+            return None
+        return tuple(
+            AdaptiveRangeState(
+                center=float(center),
+                amplitude=float(amplitude),
+                abs_dev_ema=float(abs_dev_ema),
+                abs_dev_to_amplitude_scale=float(scale),
+            )
+            for center, amplitude, abs_dev_ema, scale in zip(
+                self.reference_center.tolist(),
+                self.reference_amplitude.tolist(),
+                self.abs_dev_ema.tolist(),
+                self.abs_dev_to_amplitude_scale.tolist(),
+            )
+        )
+
+    @property
+    def calibration_result(self) -> CalibrationResult | None:
+        """Calibration of the primary (``device.processed_sensor_column``) channel."""
+
+        if self.calibration_results is None:
+            return None
+        return self.calibration_results[self.primary_position]
+
+    @property
+    def adaptive_state(self) -> AdaptiveRangeState | None:
+        """Reference or adaptive range of the primary channel."""
+
+        states = self.adaptive_states
+        return None if states is None else states[self.primary_position]
+
+    @property
+    def qc_state(self) -> RawQCState:
+        """Raw-QC state of the primary channel."""
+
+        return self.qc_states[self.primary_position]
+
+
+def create_multichannel_state(cfg: PipelineConfig) -> MultiChannelPipelineState:
+    """Create channel-stacked state for ``cfg.processed_sensor_columns``."""
+
+    columns = tuple(int(column) for column in cfg.processed_sensor_columns)
+    if not columns:
+        raise ValueError("PipelineConfig.processed_sensor_columns must not be empty.")
+    if cfg.processed_sensor_column not in columns:
+        raise ValueError(
+            "device.processed_sensor_columns must include device.processed_sensor_column."
+        )
+    channel_count = len(columns)
+    state = MultiChannelPipelineState(
+        channel_columns=columns,
+        primary_position=columns.index(cfg.processed_sensor_column),
+        qc_states=[create_raw_qc_state() for _ in columns],
+        hold_activity=_ActivityWindow(cfg.hold_activity_window_samples, channel_count),
+        output_activity=_ActivityWindow(
+            cfg.output_smoothing_activity_window_samples,
+            channel_count,
+        ),
+        movement_activity=_ActivityWindow(
+            cfg.movement_low_activity_window_samples,
+            channel_count,
+        ),
+        adaptive_activity=_ActivityWindow(
+            cfg.adaptation_low_activity_window_samples,
+            channel_count,
+        ),
+        calibration_raw_saturated_counts=np.zeros(channel_count, dtype=np.int64),
+        calibration_windows=(
+            [StreamingCalibrationWindow() for _ in columns]
+            if cfg.calibration.engine == "streaming"
+            else None
+        ),
+    )
+    _reset_continuity_sensitive_state(
+        state,
+        reset_runtime_progress=True,
+        reset_stage_sample_index=True,
+    )
+    return state
+
+
+def reset_multichannel_state_for_source_gap(state: MultiChannelPipelineState) -> None:
+    """Reset short-lived continuity-sensitive state of every channel after a gap."""
+
+    _reset_continuity_sensitive_state(
+        state,
+        reset_runtime_progress=False,
+        reset_stage_sample_index=False,
+    )
+
+
+def multichannel_summary(state: MultiChannelPipelineState) -> dict[str, Any]:
+    """Return per-channel calibration, range and QC results for the session metadata."""
+
+    adaptive_states = state.adaptive_states
+    return {
+        "enabled": True,
+        "primary_column": state.channel_columns[state.primary_position],
+        "channels": [
+            {
+                "column": column,
+                "calibration_result": (
+                    None
+                    if state.calibration_results is None
+                    else asdict(state.calibration_results[position])
+                ),
+                "final_adaptive_state": (
+                    None if adaptive_states is None else asdict(adaptive_states[position])
+                ),
+                "raw_qc_summary": raw_qc_summary(state.qc_states[position]),
+            }
+            for position, column in enumerate(state.channel_columns)
+        ],
+    }
+
+
+def process_multichannel_rows(
+    device_rows: np.ndarray,
+    state: MultiChannelPipelineState,
+    cfg: PipelineConfig,
+) -> tuple[MultiChannelBatch, MultiChannelPipelineState]:
+    """Process one contiguous ``(n, width)`` block of rows on every configured channel.
+
+    Channel ``k`` of the result matches what :func:`src.pipeline.process_device_rows`
+    produces with ``processed_sensor_column = channel_columns[k]``, up to
+    floating-point rounding; QC runs per channel.
+    """
+
+    block = np.asarray(device_rows)
+    if block.ndim != 2:
+        raise ValueError(
+            f"device_rows must be two-dimensional, got shape {tuple(block.shape)}."
+        )
+    out_of_bounds = [column for column in state.channel_columns if column >= block.shape[1]]
+    if out_of_bounds:
+        raise ValueError(
+            f"device.processed_sensor_columns={list(out_of_bounds)} are out of bounds "
+            f"for acquired device_row width {block.shape[1]}."
+        )
+    raw_values = block[:, list(state.channel_columns)].astype(float)
+    calibration_target_samples = cfg.calibration_target_samples
+
+    spans: list[dict[str, np.ndarray]] = []
+    messages: list[tuple[int, str]] = []
+    qc_events: list[tuple[int, int, RawQCEvent]] = []
+    start = 0
+    row_count = int(raw_values.shape[0])
+    while start < row_count:
+        if state.stage == "calibration":
+            remaining = calibration_target_samples - state.calibration_sample_count
+            stop = min(row_count, start + max(remaining, 1))
+        else:
+            stop = row_count
+        span, span_messages, span_qc_events = _process_span(raw_values[start:stop], state, cfg)
+        spans.append(span)
+        messages.extend((start + offset, message) for offset, message in span_messages)
+        qc_events.extend(
+            (start + offset, position, event) for offset, position, event in span_qc_events
+        )
+        start = stop
+
+    if not spans:
+        return _empty_batch(state, cfg), state
+    return (
+        MultiChannelBatch(
+            processing_mode=cfg.processing_mode,
+            channel_columns=state.channel_columns,
+            selected_sensor_raw=raw_values,
+            messages=tuple(messages),
+            qc_events=tuple(qc_events),
+            **{name: np.concatenate([span[name] for span in spans]) for name in spans[0]},
+        ),
+        state,
+    )
+
+
+def _empty_batch(state: MultiChannelPipelineState, cfg: PipelineConfig) -> MultiChannelBatch:
+    per_channel = np.zeros((0, state.channel_count), dtype=float)
+    return MultiChannelBatch(
+        processing_mode=cfg.processing_mode,
+        channel_columns=state.channel_columns,
+        runtime_mask=np.zeros(0, dtype=bool),
+        sample_index=np.zeros(0, dtype=np.int64),
+        relative_time_s=np.zeros(0, dtype=float),
+        selected_sensor_raw=per_channel,
+        filtered_value=per_channel,
+        normalized_value=per_channel,
+        movement_value=per_channel,
+        hold_mode_active=np.zeros((0, state.channel_count), dtype=bool),
+        adaptive_center=per_channel,
+        adaptive_amplitude=per_channel,
+        extrema_event_code=per_channel,
+    )
+
+
+def _process_span(
+    raw_values: np.ndarray,
+    state: MultiChannelPipelineState,
+    cfg: PipelineConfig,
+) -> tuple[dict[str, np.ndarray], list[tuple[int, str]], list[tuple[int, int, RawQCEvent]]]:
+    """Process rows that share one stage (the last row may complete calibration)."""
+
+    row_count, channel_count = raw_values.shape
+    stage = state.stage
+    sample_indices = state.stage_sample_index + np.arange(row_count, dtype=np.int64)
+    relative_times_s = sample_indices / cfg.plan.fs_hz
+    control_inputs = -raw_values if cfg.invert_signal else raw_values
+    filtered_values = _filter_span(control_inputs, state, cfg)
+    qc_events = _update_qc(raw_values, stage, sample_indices, relative_times_s, state, cfg)
+
+    span = {
+        "runtime_mask": np.full(row_count, stage == "runtime"),
+        "sample_index": sample_indices,
+        "relative_time_s": relative_times_s,
+        "filtered_value": filtered_values,
+        "normalized_value": np.full((row_count, channel_count), np.nan),
+        "movement_value": np.full((row_count, channel_count), np.nan),
+        "hold_mode_active": np.zeros((row_count, channel_count), dtype=bool),
+        "adaptive_center": np.full((row_count, channel_count), np.nan),
+        "adaptive_amplitude": np.full((row_count, channel_count), np.nan),
+        "extrema_event_code": np.zeros((row_count, channel_count), dtype=float),
+    }
+    if stage == "calibration":
+        messages = _collect_calibration_span(raw_values, filtered_values, span, state, cfg)
+    else:
+        messages = []
+        _process_runtime_span(filtered_values, sample_indices, span, state, cfg)
+    return span, messages, qc_events
+
+
+def _filter_span(
+    control_inputs: np.ndarray,
+    state: MultiChannelPipelineState,
+    cfg: PipelineConfig,
+) -> np.ndarray:
+    if state.lp_filter is None:
+        first_inputs = control_inputs[0]
+        plan = cfg.plan
+        if cfg.processing_mode == "movement":
+            state.hp_filter = _StackedSosFilter.scaled(plan.hp_sos, plan.hp_zi, first_inputs)
+            state.lp_filter = _StackedSosFilter.scaled(
+                plan.lp_sos,
+                plan.lp_zi,
+                np.zeros_like(first_inputs),
+            )
+        else:
+            state.lp_filter = _StackedSosFilter.scaled(plan.lp_sos, plan.lp_zi, first_inputs)
+
+    if state.hp_filter is None:
+        return state.lp_filter.process(control_inputs)
+    filtered_values = state.lp_filter.process(state.hp_filter.process(control_inputs))
+    return _apply_movement_low_activity_slowdown(control_inputs, filtered_values, state, cfg)
+
+
+def _apply_movement_low_activity_slowdown(
+    control_inputs: np.ndarray,
+    filtered_values: np.ndarray,
+    state: MultiChannelPipelineState,
+    cfg: PipelineConfig,
+) -> np.ndarray:
+    if state.stage != "runtime":
+        state.slowed_movement_value = filtered_values[-1].copy()
+        return filtered_values
+
+    abs_velocity = _abs_velocity(
+        control_inputs,
+        state.previous_movement_activity_value,
+        cfg.sampling_rate_hz,
+    )
+    state.previous_movement_activity_value = control_inputs[-1].copy()
+    activity, window_full = state.movement_activity.extend(abs_velocity)
+    threshold = np.maximum(
+        cfg.movement.low_activity_floor_per_sec,
+        _floored_reference_amplitude(state, cfg) * cfg.movement.low_activity_ratio_per_sec,
+    )
+    low_activity = (
+        cfg.movement.low_activity_slowdown_enabled
+        & window_full[:, np.newaxis]
+        & (activity < threshold)
+        & (abs_velocity < threshold)
+    )
+    drift_scale = cfg.movement.low_activity_drift_scale
+
+    slowed_values = np.empty_like(filtered_values)
+    for position in range(state.channel_count):
+        slowed = _optional(state.slowed_movement_value[position])
+        column = slowed_values[:, position]
+        for row, (filtered, low) in enumerate(
+            zip(filtered_values[:, position].tolist(), low_activity[:, position].tolist())
+        ):
+            slowed = step_movement_slowdown(
+                filtered,
+                slowed=slowed,
+                low_activity=low,
+                drift_scale=drift_scale,
+            )
+            column[row] = slowed
+        state.slowed_movement_value[position] = slowed
+    return slowed_values
+
+
+def _update_qc(
+    raw_values: np.ndarray,
+    stage: str,
+    sample_indices: np.ndarray,
+    relative_times_s: np.ndarray,
+    state: MultiChannelPipelineState,
+    cfg: PipelineConfig,
+) -> list[tuple[int, int, RawQCEvent]]:
+    if not cfg.raw_qc.enabled:
+        return []
+    events: list[tuple[int, int, RawQCEvent]] = []
+    for position in range(state.channel_count):
+        channel_events, state.qc_states[position] = update_raw_qc_block(
+            raw_values[:, position],
+            stage=stage,
+            sample_indices=sample_indices,
+            relative_times_s=relative_times_s,
+            state=state.qc_states[position],
+            cfg=cfg.raw_qc,
+            fs_hz=float(cfg.sampling_rate_hz),
+        )
+        events.extend((offset, position, event) for offset, event in channel_events)
+    events.sort(key=lambda item: (item[0], item[1]))
+    return events
+
+
+def _collect_calibration_span(
+    raw_values: np.ndarray,
+    filtered_values: np.ndarray,
+    span: dict[str, np.ndarray],
+    state: MultiChannelPipelineState,
+    cfg: PipelineConfig,
+) -> list[tuple[int, str]]:
+    row_count = raw_values.shape[0]
+    target = cfg.calibration_target_samples
+    state.calibration_raw_saturated_counts += np.count_nonzero(
+        (raw_values <= cfg.raw_qc.raw_saturation_lo) | (raw_values >= cfg.raw_qc.raw_saturation_hi),
+        axis=0,
+    )
+    collected = state.calibration_sample_count + np.arange(1, row_count + 1)
+    if state.calibration_windows is not None:
+        for window, column_values in zip(state.calibration_windows, filtered_values.T.tolist()):
+            for value in column_values:
+                window.add(value)
+    else:
+        state.calibration_blocks.append(filtered_values)
+    state.calibration_sample_count += row_count
+
+    messages: list[tuple[int, str]] = []
+    clipped_collected = np.minimum(collected, target)
+    reported_secs = (clipped_collected / cfg.plan.fs_hz).astype(np.int64)
+    for offset, (reported_sec, clipped) in enumerate(
+        zip(reported_secs.tolist(), clipped_collected.tolist())
+    ):
+        if reported_sec != state.calibration_last_reported_sec:
+            state.calibration_last_reported_sec = reported_sec
+            messages.append((offset, f"Calibration progress: {clipped}/{target} samples"))
+
+    if state.calibration_sample_count < target:
+        state.stage_sample_index += row_count
+        return messages
+
+    state.stage_sample_index += row_count - 1
+    completed_offset = row_count - 1
+    messages.extend(
+        (completed_offset, message) for message in _finalize_calibration(state, cfg)
+    )
+    span["adaptive_center"][completed_offset] = state.reference_center
+    span["adaptive_amplitude"][completed_offset] = state.reference_amplitude
+    _reset_continuity_sensitive_state(
+        state,
+        reset_runtime_progress=True,
+        reset_stage_sample_index=True,
+    )
+    return messages
+
+
+def _finalize_calibration(state: MultiChannelPipelineState, cfg: PipelineConfig) -> list[str]:
+    if state.calibration_windows is not None:
+        calibrations: list[np.ndarray] | list[StreamingCalibrationWindow] = state.calibration_windows
+    else:
+        calibration_values = np.concatenate(state.calibration_blocks)[: cfg.calibration_target_samples]
+        calibrations = list(calibration_values.T)
+        state.calibration_blocks = []
+    results: list[CalibrationResult] = []
+    adaptive_states: list[AdaptiveRangeState] = []
+    messages: list[str] = []
+    for position, (column, calibration) in enumerate(zip(state.channel_columns, calibrations)):
+        result, adaptive_state = finalize_calibration(calibration, cfg)
+        result = with_raw_calibration_saturation(
+            result,
+            int(state.calibration_raw_saturated_counts[position]),
+        )
+        results.append(result)
+        adaptive_states.append(adaptive_state)
+        # The title line is shared; each channel adds its own summary line.
+        column_messages = calibration_complete_messages(result, adaptive_state, cfg, column=column)
+        messages.extend(column_messages if not messages else column_messages[1:])
+
+    state.calibration_results = tuple(results)
+    state.reference_center = np.asarray([item.center for item in adaptive_states], dtype=float)
+    state.reference_amplitude = np.asarray([item.amplitude for item in adaptive_states], dtype=float)
+    state.abs_dev_ema = np.asarray([item.abs_dev_ema for item in adaptive_states], dtype=float)
+    state.abs_dev_to_amplitude_scale = np.asarray(
+        [item.abs_dev_to_amplitude_scale for item in adaptive_states],
+        dtype=float,
+    )
+    return messages
+
+
+def _process_runtime_span(
+    filtered_values: np.ndarray,
+    sample_indices: np.ndarray,
+    span: dict[str, np.ndarray],
+    state: MultiChannelPipelineState,
+    cfg: PipelineConfig,
+) -> None:
+    row_count = filtered_values.shape[0]
+    if cfg.processing_mode == "movement":
+        centers = np.asarray([result.center for result in state.calibration_results])
+        movement_values = filtered_values - centers
+        span["movement_value"] = movement_values
+        span["adaptive_center"][:] = state.reference_center
+        span["adaptive_amplitude"][:] = state.reference_amplitude
+        span["extrema_event_code"] = _detect_extrema(
+            movement_values,
+            sample_indices,
+            np.broadcast_to(state.reference_amplitude, movement_values.shape),
+            np.zeros(state.channel_count),
+            state,
+            cfg,
+        )
+    elif cfg.processing_mode == "adaptive":
+        normalized_values, movement_values, centers, amplitudes, updated_amplitudes = (
+            _normalize_adaptive_span(filtered_values, state, cfg)
+        )
+        span["normalized_value"] = normalized_values
+        span["movement_value"] = movement_values
+        span["adaptive_center"] = centers
+        span["adaptive_amplitude"] = amplitudes
+        span["extrema_event_code"] = _detect_extrema(
+            movement_values,
+            sample_indices,
+            updated_amplitudes,
+            np.zeros(state.channel_count),
+            state,
+            cfg,
+        )
+    else:
+        span["normalized_value"], span["hold_mode_active"] = _normalize_control_span(
+            filtered_values,
+            state,
+            cfg,
+        )
+        span["adaptive_center"][:] = state.reference_center
+        span["adaptive_amplitude"][:] = state.reference_amplitude
+        span["extrema_event_code"] = _detect_extrema(
+            filtered_values,
+            sample_indices,
+            np.broadcast_to(state.reference_amplitude, filtered_values.shape),
+            state.reference_center,
+            state,
+            cfg,
+        )
+    state.runtime_processed_samples += row_count
+    state.stage_sample_index += row_count
+
+
+def _normalize_control_span(
+    cleaned_values: np.ndarray,
+    state: MultiChannelPipelineState,
+    cfg: PipelineConfig,
+) -> tuple[np.ndarray, np.ndarray]:
+    abs_velocity = _abs_velocity(cleaned_values, state.previous_cleaned_value, cfg.sampling_rate_hz)
+    state.previous_cleaned_value = cleaned_values[-1].copy()
+    hold_activity, hold_window_full = state.hold_activity.extend(abs_velocity)
+    output_activity, output_window_full = state.output_activity.extend(abs_velocity)
+
+    control_min = np.asarray([result.y_min for result in state.calibration_results])
+    control_max = np.asarray([result.y_max for result in state.calibration_results])
+    if np.any(control_max <= control_min):
+        raise RuntimeError("Control bounds must define a positive range.")
+    candidates = np.clip((cleaned_values - control_min) / (control_max - control_min), 0.0, 1.0)
+    amplitude = np.maximum(
+        np.asarray([result.amplitude for result in state.calibration_results]),
+        cfg.calibration.amplitude_floor,
+    )
+
+    hold = cfg.hold
+    enter_threshold = np.maximum(hold.floor_per_sec, amplitude * hold.ratio_per_sec_enter)
+    exit_threshold = np.maximum(hold.floor_per_sec, amplitude * hold.ratio_per_sec_exit)
+    may_enter_hold = (
+        hold_window_full[:, np.newaxis]
+        & (hold_activity < enter_threshold)
+        & (abs_velocity < enter_threshold)
+        & (
+            (candidates <= hold.edge_margin_ratio)
+            | (candidates >= 1.0 - hold.edge_margin_ratio)
+        )
+    )
+    must_exit_hold = abs_velocity > exit_threshold
+
+    smoothing = cfg.output_smoothing
+    low_threshold = np.maximum(
+        smoothing.activity_floor_per_sec,
+        amplitude * smoothing.activity_low_ratio_per_sec,
+    )
+    high_threshold = np.maximum(
+        smoothing.activity_floor_per_sec,
+        amplitude * smoothing.activity_high_ratio_per_sec,
+    )
+    activity = np.where(output_window_full[:, np.newaxis], output_activity, high_threshold)
+    activity_ratio = np.clip((activity - low_threshold) / (high_threshold - low_threshold), 0.0, 1.0)
+    base_tau_s = smoothing.tau_hold_s + activity_ratio * (smoothing.tau_active_s - smoothing.tau_hold_s)
+    distance_to_edge = np.minimum(candidates, 1.0 - candidates)
+    edge_factor = np.where(
+        distance_to_edge >= smoothing.edge_margin_ratio,
+        0.0,
+        1.0 - distance_to_edge / smoothing.edge_margin_ratio,
+    )
+    extreme_tau_s = np.minimum(base_tau_s, smoothing.tau_extreme_s)
+    tau_s = base_tau_s + edge_factor * (extreme_tau_s - base_tau_s)
+    alphas = 1.0 - np.exp(-1.0 / (cfg.sampling_rate_hz * tau_s))
+
+    normalized_values = np.empty_like(cleaned_values)
+    hold_flags = np.zeros(cleaned_values.shape, dtype=bool)
+    for position in range(state.channel_count):
+        active = bool(state.hold_mode_active[position])
+        frozen = _optional(state.frozen_normalized_value[position])
+        emitted = _optional(state.emitted_normalized_value[position])
+        for row, (candidate, may_enter, must_exit, alpha) in enumerate(
+            zip(
+                candidates[:, position].tolist(),
+                may_enter_hold[:, position].tolist(),
+                must_exit_hold[:, position].tolist(),
+                alphas[:, position].tolist(),
+            )
+        ):
+            level = candidate
+            if not hold.enabled:
+                active = False
+                frozen = None
+            else:
+                active, frozen = step_hold_latch(
+                    candidate,
+                    active=active,
+                    frozen=frozen,
+                    may_enter=may_enter,
+                    must_exit=must_exit,
+                )
+                if active:
+                    level = frozen
+
+            if active or not smoothing.enabled:
+                emitted = level
+            else:
+                emitted = step_output_smoothing(level, emitted=emitted, alpha=alpha)
+            normalized_values[row, position] = emitted
+            hold_flags[row, position] = active
+        state.hold_mode_active[position] = active
+        state.frozen_normalized_value[position] = _nan_if_none(frozen)
+        state.emitted_normalized_value[position] = _nan_if_none(emitted)
+    return normalized_values, hold_flags
+
+
+def _normalize_adaptive_span(
+    cleaned_values: np.ndarray,
+    state: MultiChannelPipelineState,
+    cfg: PipelineConfig,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return normalized, movement, pre-update center/amplitude and post-update amplitude."""
+
+    row_count = cleaned_values.shape[0]
+    abs_velocity = _abs_velocity(cleaned_values, state.previous_adaptive_value, cfg.sampling_rate_hz)
+    state.previous_adaptive_value = cleaned_values[-1].copy()
+    activity, window_full = state.adaptive_activity.extend(abs_velocity)
+    plan = cfg.plan
+    in_startup = (
+        state.runtime_processed_samples + np.arange(row_count) < plan.startup_target_samples
+    )
+    state.startup_mode_active = bool(in_startup[-1])
+    startup_samples = int(np.count_nonzero(in_startup))
+
+    normalized_values = np.empty_like(cleaned_values)
+    centers = np.empty_like(cleaned_values)
+    amplitudes = np.empty_like(cleaned_values)
+    updated_amplitudes = np.empty_like(cleaned_values)
+    for position in range(state.channel_count):
+        (
+            normalized_values[:, position],
+            centers[:, position],
+            amplitudes[:, position],
+            updated_amplitudes[:, position],
+            adaptive_state,
+        ) = update_adaptive_span(
+            cleaned_values[:, position],
+            abs_velocity[:, position],
+            activity[:, position],
+            window_full,
+            AdaptiveRangeState(
+                center=float(state.reference_center[position]),
+                amplitude=float(state.reference_amplitude[position]),
+                abs_dev_ema=float(state.abs_dev_ema[position]),
+                abs_dev_to_amplitude_scale=float(state.abs_dev_to_amplitude_scale[position]),
+            ),
+            startup_samples,
+            cfg,
+        )
+        state.reference_center[position] = adaptive_state.center
+        state.reference_amplitude[position] = adaptive_state.amplitude
+        state.abs_dev_ema[position] = adaptive_state.abs_dev_ema
+    movement_values = cleaned_values - centers
+    return normalized_values, movement_values, centers, amplitudes, updated_amplitudes
+
+
+def _detect_extrema(
+    signal_values: np.ndarray,
+    sample_indices: np.ndarray,
+    amplitudes: np.ndarray,
+    baselines: np.ndarray,
+    state: MultiChannelPipelineState,
+    cfg: PipelineConfig,
+) -> np.ndarray:
+    """Confirm inhale peaks and exhale troughs; only turning points are visited."""
+
+    floor = cfg.calibration.amplitude_floor
+    prominence_thresholds = np.maximum(
+        floor,
+        cfg.extrema.prominence_ratio * np.maximum(amplitudes, floor),
+    )
+    min_interval = cfg.extrema_min_interval_samples
+    candidate_indices = np.maximum(sample_indices - 1, 0).tolist()
+    event_codes = np.zeros(signal_values.shape, dtype=float)
+
+    previous_values = np.concatenate([state.previous_signal_value[np.newaxis, :], signal_values[:-1]])
+    deltas = signal_values - previous_values
+    signs = np.nan_to_num(np.sign(deltas)).astype(np.int64)
+    previous_signs = np.concatenate([state.previous_delta_sign[np.newaxis, :], signs[:-1]])
+    turning = ((previous_signs > 0) & (deltas <= 0.0)) | ((previous_signs < 0) & (deltas >= 0.0))
+
+    for position in range(state.channel_count):
+        last_event = _optional(state.last_event_sample_index[position])
+        last_peak = _optional(state.last_peak_value[position])
+        last_trough = _optional(state.last_trough_value[position])
+        baseline = float(baselines[position])
+        for row in np.flatnonzero(turning[:, position]).tolist():
+            candidate_index = candidate_indices[row]
+            if not extremum_interval_elapsed(candidate_index, last_event, min_interval):
+                continue
+            candidate_value = float(previous_values[row, position])
+            event_code = confirm_extremum(
+                candidate_value,
+                rising=bool(previous_signs[row, position] > 0),
+                last_peak=last_peak,
+                last_trough=last_trough,
+                baseline=baseline,
+                prominence_threshold=float(prominence_thresholds[row, position]),
+            )
+            if event_code != 0.0:
+                event_codes[row, position] = event_code
+                last_event = candidate_index
+                if event_code > 0.0:
+                    last_peak = candidate_value
+                else:
+                    last_trough = candidate_value
+        state.last_event_sample_index[position] = _nan_if_none(last_event)
+        state.last_peak_value[position] = _nan_if_none(last_peak)
+        state.last_trough_value[position] = _nan_if_none(last_trough)
+
+    state.previous_signal_value = signal_values[-1].copy()
+    state.previous_delta_sign = signs[-1].copy()
+    return event_codes
+
+
+def _abs_velocity(values: np.ndarray, previous_values: np.ndarray, fs_hz: int) -> np.ndarray:
+    """Per-row ``|x[t] - x[t-1]| * fs``; zero where no previous value exists."""
+
+    previous = np.concatenate([previous_values[np.newaxis, :], values[:-1]])
+    return np.nan_to_num(np.abs(values - previous) * fs_hz, nan=0.0)
+
+
+def _floored_reference_amplitude(
+    state: MultiChannelPipelineState,
+    cfg: PipelineConfig,
+) -> np.ndarray:
+    return np.maximum(
+        np.asarray([result.amplitude for result in state.calibration_results]),
+        cfg.calibration.amplitude_floor,
+    )
+
+
+def _optional(value: float) -> float | None:
+    """Read one channel's slot of a NaN-for-missing state array as a float or ``None``."""
+
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def _nan_if_none(value: float | None) -> float:
+    return math.nan if value is None else value
+
+
+def _reset_continuity_sensitive_state(
+    state: MultiChannelPipelineState,
+    *,
+    reset_runtime_progress: bool,
+    reset_stage_sample_index: bool,
+) -> None:
+    channel_count = state.channel_count
+    for window in (
+        state.hold_activity,
+        state.output_activity,
+        state.movement_activity,
+        state.adaptive_activity,
+    ):
+        window.clear()
+    state.hp_filter = None
+    state.lp_filter = None
+    state.previous_cleaned_value = np.full(channel_count, np.nan)
+    state.previous_movement_activity_value = np.full(channel_count, np.nan)
+    state.previous_adaptive_value = np.full(channel_count, np.nan)
+    state.hold_mode_active = np.zeros(channel_count, dtype=bool)
+    state.frozen_normalized_value = np.full(channel_count, np.nan)
+    state.emitted_normalized_value = np.full(channel_count, np.nan)
+    state.slowed_movement_value = np.full(channel_count, np.nan)
+    state.startup_mode_active = False
+    state.previous_signal_value = np.full(channel_count, np.nan)
+    state.previous_delta_sign = np.zeros(channel_count, dtype=np.int64)
+    state.last_event_sample_index = np.full(channel_count, np.nan)
+    state.last_peak_value = np.full(channel_count, np.nan)
+    state.last_trough_value = np.full(channel_count, np.nan)
+    if reset_runtime_progress:
+        state.runtime_processed_samples = 0
+    if reset_stage_sample_index:
+        state.stage_sample_index = 0
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass, field, replace
+from functools import cached_property
 import math
-from typing import Literal
+from typing import Literal, Sequence
 
 import numpy as np
 
@@ -14,19 +14,32 @@ from .calibration import (
     AdaptiveRangeState,
     CalibrationConfig,
     CalibrationResult,
+    StreamingCalibrationWindow,
+    adaptive_range_alphas,
+    finalize_streaming_range_calibration,
     initialize_adaptive_range,
+    initialize_adaptive_range_from_abs_dev,
+    percentile_indices,
     run_range_calibration,
     update_adaptive_range,
+    update_adaptive_range_block,
 )
 from .preprocessing import (
+    RunningMean,
+    SosFilter,
     get_high_pass_filter_coeffs,
     get_low_pass_filter_coeffs,
-    high_pass_filter_sample,
-    low_pass_filter_sample,
 )
-from .quality import RawQCEvent, RawQCState, create_raw_qc_state, update_raw_qc
+from .quality import (
+    RawQCEvent,
+    RawQCState,
+    create_raw_qc_state,
+    update_raw_qc,
+    update_raw_qc_block,
+)
 from .settings import (
     AdaptationSettings,
+    AppConfig,
     CalibrationSettings,
     ExtremaConfig,
     FilterConfig,
@@ -37,7 +50,13 @@ from .settings import (
 )
 
 
-_HOLD_RELEASE_DRIFT = 0.03
+HOLD_RELEASE_DRIFT = 0.03
+# Shorter runtime spans update the adaptive map sample by sample.
+_MIN_ADAPTIVE_SPAN_SAMPLES = 16
+# Below this block length the per-row loop beats the span path's fixed
+# per-call overhead (sosfilt setup, block QC); see the benchmark crossover.
+_MIN_BLOCK_SAMPLES = 48
+_EXTREMA_EVENT_LABELS = {1.0: "inhale_peak", -1.0: "exhale_trough"}
 ProcessingMode = Literal["control", "movement", "adaptive"]
 
 
@@ -57,89 +76,185 @@ class PipelineConfig:
     raw_qc: RawQCConfig
     processing_mode: ProcessingMode = "control"
     movement: MovementConfig = field(default_factory=MovementConfig)
+    processed_sensor_columns: tuple[int, ...] = ()
+
+    @classmethod
+    def from_app_config(
+        cls,
+        config: AppConfig,
+        processing_mode: ProcessingMode = "control",
+    ) -> "PipelineConfig":
+        """Build the pipeline configuration from resolved application settings."""
+
+        return cls(
+            sampling_rate_hz=config.device.sampling_rate_hz,
+            processed_sensor_column=config.device.processed_sensor_column,
+            invert_signal=config.device.invert_signal,
+            filter=config.filter,
+            calibration=config.calibration,
+            adaptation=config.adaptation,
+            hold=config.hold,
+            output_smoothing=config.output_smoothing,
+            extrema=config.extrema,
+            raw_qc=config.raw_qc,
+            processing_mode=processing_mode,
+            movement=config.movement,
+            processed_sensor_columns=config.device.processed_sensor_columns,
+        )
+
+    @cached_property
+    def plan(self) -> PipelinePlan:
+        """Derived constants, compiled on first access and kept with this config."""
+
+        return compile_pipeline_plan(self)
 
     @property
     def calibration_cfg(self) -> CalibrationConfig:
-        return CalibrationConfig(
-            duration_s=self.calibration.duration_s,
-            fs_hz=float(self.sampling_rate_hz),
-            percentile_lo=self.calibration.percentile_lo,
-            percentile_hi=self.calibration.percentile_hi,
-            saturation_lo=float("-inf"),
-            saturation_hi=float("inf"),
-            amplitude_floor=self.calibration.amplitude_floor,
-            padding_ratio=self.calibration.padding_ratio,
-        )
+        return self.plan.calibration_cfg
 
     @property
     def adaptive_cfg_startup(self) -> AdaptiveRangeConfig:
-        return AdaptiveRangeConfig(
-            fs_hz=float(self.sampling_rate_hz),
-            center_tau_s=self.adaptation.startup_center_tau_s,
-            amplitude_tau_s=self.adaptation.startup_amplitude_tau_s,
-            amplitude_floor=self.calibration.amplitude_floor,
-        )
+        return self.plan.adaptive_cfg_startup
 
     @property
     def adaptive_cfg_runtime(self) -> AdaptiveRangeConfig:
-        return AdaptiveRangeConfig(
-            fs_hz=float(self.sampling_rate_hz),
-            center_tau_s=self.adaptation.center_tau_s,
-            amplitude_tau_s=self.adaptation.amplitude_tau_s,
-            amplitude_floor=self.calibration.amplitude_floor,
-        )
+        return self.plan.adaptive_cfg_runtime
 
     @property
     def calibration_target_samples(self) -> int:
-        return max(1, int(round(self.calibration.duration_s * self.sampling_rate_hz)))
+        return self.plan.calibration_target_samples
 
     @property
     def startup_target_samples(self) -> int:
-        return max(1, int(round(self.adaptation.startup_duration_s * self.sampling_rate_hz)))
+        return self.plan.startup_target_samples
 
     @property
     def hold_activity_window_samples(self) -> int:
-        return max(3, int(round((self.hold.activity_window_ms / 1000.0) * self.sampling_rate_hz)))
+        return self.plan.hold_activity_window_samples
 
     @property
     def output_smoothing_activity_window_samples(self) -> int:
-        return max(
-            3,
-            int(
-                round(
-                    (self.output_smoothing.activity_window_ms / 1000.0)
-                    * self.sampling_rate_hz
-                )
-            ),
-        )
+        return self.plan.output_smoothing_activity_window_samples
 
     @property
     def movement_low_activity_window_samples(self) -> int:
-        return max(
-            3,
-            int(
-                round(
-                    (self.movement.low_activity_window_ms / 1000.0)
-                    * self.sampling_rate_hz
-                )
-            ),
-        )
+        return self.plan.movement_low_activity_window_samples
 
     @property
     def adaptation_low_activity_window_samples(self) -> int:
-        return max(
-            3,
-            int(
-                round(
-                    (self.adaptation.low_activity_window_ms / 1000.0)
-                    * self.sampling_rate_hz
-                )
-            ),
-        )
+        return self.plan.adaptation_low_activity_window_samples
 
     @property
     def extrema_min_interval_samples(self) -> int:
-        return max(1, int(round((self.extrema.min_interval_ms / 1000.0) * self.sampling_rate_hz)))
+        return self.plan.extrema_min_interval_samples
+
+
+@dataclass(frozen=True, eq=False)
+class PipelinePlan:
+    """Constants derived from a :class:`PipelineConfig`, computed once.
+
+    The per-sample stages read sample counts, EMA coefficients and filter
+    designs from here instead of rebuilding them on every access. Obtain it
+    through :attr:`PipelineConfig.plan`; a config changed with
+    :func:`dataclasses.replace` compiles its own plan.
+    """
+
+    fs_hz: float
+    calibration_cfg: CalibrationConfig
+    adaptive_cfg_startup: AdaptiveRangeConfig
+    adaptive_cfg_runtime: AdaptiveRangeConfig
+    adaptive_alphas_startup: tuple[float, float]
+    adaptive_alphas_runtime: tuple[float, float]
+    calibration_target_samples: int
+    startup_target_samples: int
+    hold_activity_window_samples: int
+    output_smoothing_activity_window_samples: int
+    movement_low_activity_window_samples: int
+    adaptation_low_activity_window_samples: int
+    extrema_min_interval_samples: int
+    lp_sos: np.ndarray
+    lp_zi: np.ndarray
+    hp_sos: np.ndarray | None = None
+    hp_zi: np.ndarray | None = None
+
+
+def compile_pipeline_plan(cfg: PipelineConfig) -> PipelinePlan:
+    """Compute every config-only constant the live pipeline uses."""
+
+    fs_hz = float(cfg.sampling_rate_hz)
+    adaptive_cfg_startup = AdaptiveRangeConfig(
+        fs_hz=fs_hz,
+        center_tau_s=cfg.adaptation.startup_center_tau_s,
+        amplitude_tau_s=cfg.adaptation.startup_amplitude_tau_s,
+        amplitude_floor=cfg.calibration.amplitude_floor,
+    )
+    adaptive_cfg_runtime = AdaptiveRangeConfig(
+        fs_hz=fs_hz,
+        center_tau_s=cfg.adaptation.center_tau_s,
+        amplitude_tau_s=cfg.adaptation.amplitude_tau_s,
+        amplitude_floor=cfg.calibration.amplitude_floor,
+    )
+    hp_sos: np.ndarray | None = None
+    hp_zi: np.ndarray | None = None
+    if cfg.processing_mode == "movement":
+        hp_sos, hp_zi = get_high_pass_filter_coeffs(
+            cfg.movement.hp_cutoff_hz,
+            cfg.sampling_rate_hz,
+            cfg.movement.hp_order,
+        )
+        lp_sos, lp_zi = get_low_pass_filter_coeffs(
+            cfg.movement.lp_cutoff_hz,
+            cfg.sampling_rate_hz,
+            cfg.movement.lp_order,
+        )
+    else:
+        lp_sos, lp_zi = get_low_pass_filter_coeffs(
+            cfg.filter.lp_cutoff_hz,
+            cfg.sampling_rate_hz,
+            cfg.filter.lp_order,
+        )
+    return PipelinePlan(
+        fs_hz=fs_hz,
+        calibration_cfg=CalibrationConfig(
+            duration_s=cfg.calibration.duration_s,
+            fs_hz=fs_hz,
+            percentile_lo=cfg.calibration.percentile_lo,
+            percentile_hi=cfg.calibration.percentile_hi,
+            saturation_lo=float("-inf"),
+            saturation_hi=float("inf"),
+            amplitude_floor=cfg.calibration.amplitude_floor,
+            padding_ratio=cfg.calibration.padding_ratio,
+        ),
+        adaptive_cfg_startup=adaptive_cfg_startup,
+        adaptive_cfg_runtime=adaptive_cfg_runtime,
+        adaptive_alphas_startup=adaptive_range_alphas(adaptive_cfg_startup),
+        adaptive_alphas_runtime=adaptive_range_alphas(adaptive_cfg_runtime),
+        calibration_target_samples=max(
+            1, int(round(cfg.calibration.duration_s * cfg.sampling_rate_hz))
+        ),
+        startup_target_samples=max(
+            1, int(round(cfg.adaptation.startup_duration_s * cfg.sampling_rate_hz))
+        ),
+        hold_activity_window_samples=_window_samples(cfg.hold.activity_window_ms, cfg, 3),
+        output_smoothing_activity_window_samples=_window_samples(
+            cfg.output_smoothing.activity_window_ms, cfg, 3
+        ),
+        movement_low_activity_window_samples=_window_samples(
+            cfg.movement.low_activity_window_ms, cfg, 3
+        ),
+        adaptation_low_activity_window_samples=_window_samples(
+            cfg.adaptation.low_activity_window_ms, cfg, 3
+        ),
+        extrema_min_interval_samples=_window_samples(cfg.extrema.min_interval_ms, cfg, 1),
+        lp_sos=lp_sos,
+        lp_zi=lp_zi,
+        hp_sos=hp_sos,
+        hp_zi=hp_zi,
+    )
+
+
+def _window_samples(duration_ms: float, cfg: PipelineConfig, minimum: int) -> int:
+    return max(minimum, int(round((duration_ms / 1000.0) * cfg.sampling_rate_hz)))
 
 
 @dataclass(frozen=True)
@@ -164,20 +279,170 @@ class PipelineSample:
     qc_events: tuple[RawQCEvent, ...] = ()
 
 
+@dataclass(frozen=True)
+class PipelineBatch:
+    """Columnar processing results for one block of device rows.
+
+    Each array holds one entry per processed row. Optional values that a
+    :class:`PipelineSample` reports as ``None`` are stored as ``NaN``, and the
+    rare console messages and QC events are stored sparsely as
+    ``(row_offset, value)`` pairs.
+    """
+
+    processing_mode: ProcessingMode
+    runtime_mask: np.ndarray
+    sample_index: np.ndarray
+    relative_time_s: np.ndarray
+    selected_sensor_raw: np.ndarray
+    filtered_value: np.ndarray
+    cleaned_value: np.ndarray
+    normalized_value: np.ndarray
+    movement_value: np.ndarray
+    hold_mode_active: np.ndarray
+    adaptive_center: np.ndarray
+    adaptive_amplitude: np.ndarray
+    extrema_event_code: np.ndarray
+    messages: tuple[tuple[int, str], ...] = ()
+    qc_events: tuple[tuple[int, RawQCEvent], ...] = ()
+
+    def __len__(self) -> int:
+        return int(self.sample_index.shape[0])
+
+    @property
+    def stages(self) -> list[str]:
+        """Per-row stage labels as exported in the session files."""
+
+        return ["runtime" if runtime else "calibration" for runtime in self.runtime_mask.tolist()]
+
+    @property
+    def runtime_values(self) -> np.ndarray:
+        """Mode-specific live output: movement proxy or normalized level."""
+
+        if self.processing_mode == "movement":
+            return self.movement_value
+        return self.normalized_value
+
+    def sample(self, offset: int) -> PipelineSample:
+        """Return one row as a scalar :class:`PipelineSample`."""
+
+        extrema_event_code = float(self.extrema_event_code[offset])
+        return PipelineSample(
+            stage="runtime" if bool(self.runtime_mask[offset]) else "calibration",
+            sample_index=int(self.sample_index[offset]),
+            relative_time_s=float(self.relative_time_s[offset]),
+            selected_sensor_raw=float(self.selected_sensor_raw[offset]),
+            filtered_value=float(self.filtered_value[offset]),
+            cleaned_value=float(self.cleaned_value[offset]),
+            normalized_value=_optional_float(self.normalized_value[offset]),
+            hold_mode_active=bool(self.hold_mode_active[offset]),
+            adaptive_center=_optional_float(self.adaptive_center[offset]),
+            adaptive_amplitude=_optional_float(self.adaptive_amplitude[offset]),
+            processing_mode=self.processing_mode,
+            movement_value=_optional_float(self.movement_value[offset]),
+            extrema_event_code=extrema_event_code,
+            extrema_event_label=extrema_event_label(extrema_event_code),
+            messages=tuple(message for row, message in self.messages if row == offset),
+            qc_events=tuple(event for row, event in self.qc_events if row == offset),
+        )
+
+    def to_samples(self) -> list[PipelineSample]:
+        """Expand the batch into one :class:`PipelineSample` per row."""
+
+        return [self.sample(offset) for offset in range(len(self))]
+
+    @classmethod
+    def empty(cls, processing_mode: ProcessingMode = "control") -> "PipelineBatch":
+        """Return a zero-length batch."""
+
+        return cls.from_samples((), processing_mode=processing_mode)
+
+    @classmethod
+    def from_samples(
+        cls,
+        samples: Sequence[PipelineSample],
+        *,
+        processing_mode: ProcessingMode | None = None,
+    ) -> "PipelineBatch":
+        """Build a columnar batch from scalar samples."""
+
+        if processing_mode is None:
+            processing_mode = samples[0].processing_mode if samples else "control"
+        return cls(
+            processing_mode=processing_mode,
+            runtime_mask=np.asarray([sample.stage == "runtime" for sample in samples], dtype=bool),
+            sample_index=np.asarray([sample.sample_index for sample in samples], dtype=np.int64),
+            relative_time_s=np.asarray([sample.relative_time_s for sample in samples], dtype=float),
+            selected_sensor_raw=np.asarray(
+                [sample.selected_sensor_raw for sample in samples],
+                dtype=float,
+            ),
+            filtered_value=np.asarray([sample.filtered_value for sample in samples], dtype=float),
+            cleaned_value=np.asarray([sample.cleaned_value for sample in samples], dtype=float),
+            normalized_value=_optional_column(tuple(sample.normalized_value for sample in samples)),
+            movement_value=_optional_column(tuple(sample.movement_value for sample in samples)),
+            hold_mode_active=np.asarray([sample.hold_mode_active for sample in samples], dtype=bool),
+            adaptive_center=_optional_column(tuple(sample.adaptive_center for sample in samples)),
+            adaptive_amplitude=_optional_column(
+                tuple(sample.adaptive_amplitude for sample in samples)
+            ),
+            extrema_event_code=np.asarray(
+                [sample.extrema_event_code for sample in samples],
+                dtype=float,
+            ),
+            messages=tuple(
+                (offset, message)
+                for offset, sample in enumerate(samples)
+                for message in sample.messages
+            ),
+            qc_events=tuple(
+                (offset, event)
+                for offset, sample in enumerate(samples)
+                for event in sample.qc_events
+            ),
+        )
+
+
+def extrema_event_label(extrema_event_code: float) -> str | None:
+    """Return the exported label for an extrema event code."""
+
+    return _EXTREMA_EVENT_LABELS.get(float(extrema_event_code))
+
+
+def _optional_float(value: float) -> float | None:
+    return None if math.isnan(value) else float(value)
+
+
+_ProcessedValues = tuple[
+    str,
+    int,
+    float,
+    "float | None",
+    "float | None",
+    bool,
+    "float | None",
+    "float | None",
+    float,
+    "str | None",
+    list[str],
+    list[RawQCEvent],
+]
+
+# normalized, movement, pre-update center, pre-update amplitude, post-update amplitude
+_AdaptiveValues = tuple[float, float, float, float, float]
+
+
 @dataclass
 class PipelineState:
     """Mutable state for the live-processing pipeline."""
 
-    recent_abs_velocity: deque[float]
-    recent_output_abs_velocity: deque[float]
-    recent_movement_abs_velocity: deque[float]
-    recent_adaptive_abs_velocity: deque[float]
+    recent_abs_velocity: RunningMean
+    recent_output_abs_velocity: RunningMean
+    recent_movement_abs_velocity: RunningMean
+    recent_adaptive_abs_velocity: RunningMean
     qc_state: RawQCState
     filter_initialized: bool = False
-    sos_hp: np.ndarray | None = None
-    zi_hp: np.ndarray | None = None
-    sos_lp: np.ndarray | None = None
-    zi_lp: np.ndarray | None = None
+    hp_filter: SosFilter | None = None
+    lp_filter: SosFilter | None = None
     previous_filtered_value: float | None = None
     previous_cleaned_value: float | None = None
     previous_movement_activity_value: float | None = None
@@ -187,6 +452,7 @@ class PipelineState:
     emitted_normalized_value: float | None = None
     slowed_movement_value: float | None = None
     calibration_samples: list[float] = field(default_factory=list)
+    calibration_window: StreamingCalibrationWindow | None = None
     calibration_raw_saturated_count: int = 0
     calibration_result: CalibrationResult | None = None
     adaptive_state: AdaptiveRangeState | None = None
@@ -208,11 +474,14 @@ def create_pipeline_state(cfg: PipelineConfig) -> PipelineState:
     """Create a pipeline state object with config-dependent buffer sizes."""
 
     return PipelineState(
-        recent_abs_velocity=deque(maxlen=cfg.hold_activity_window_samples),
-        recent_output_abs_velocity=deque(maxlen=cfg.output_smoothing_activity_window_samples),
-        recent_movement_abs_velocity=deque(maxlen=cfg.movement_low_activity_window_samples),
-        recent_adaptive_abs_velocity=deque(maxlen=cfg.adaptation_low_activity_window_samples),
+        recent_abs_velocity=RunningMean(cfg.hold_activity_window_samples),
+        recent_output_abs_velocity=RunningMean(cfg.output_smoothing_activity_window_samples),
+        recent_movement_abs_velocity=RunningMean(cfg.movement_low_activity_window_samples),
+        recent_adaptive_abs_velocity=RunningMean(cfg.adaptation_low_activity_window_samples),
         qc_state=create_raw_qc_state(),
+        calibration_window=(
+            StreamingCalibrationWindow() if cfg.calibration.engine == "streaming" else None
+        ),
     )
 
 
@@ -242,31 +511,297 @@ def process_device_row(
         raise ValueError(
             f"device_row must be one-dimensional, got shape {tuple(row_values.shape)}."
         )
+    _validate_processed_sensor_column(int(row_values.shape[0]), cfg)
+    raw_sensor_value = float(row_values[cfg.processed_sensor_column])
+    filtered_value = _filter_sample(raw_sensor_value, state, cfg)
+    (
+        stage,
+        sample_index,
+        relative_time_s,
+        normalized_value,
+        movement_value,
+        hold_mode_active,
+        adaptive_center,
+        adaptive_amplitude,
+        extrema_event_code,
+        extrema_event_label,
+        messages,
+        qc_events,
+    ) = _process_filtered_sample(raw_sensor_value, filtered_value, state, cfg)
+    sample = PipelineSample(
+        stage=stage,
+        sample_index=sample_index,
+        relative_time_s=relative_time_s,
+        selected_sensor_raw=raw_sensor_value,
+        filtered_value=filtered_value,
+        cleaned_value=filtered_value,
+        normalized_value=normalized_value,
+        hold_mode_active=hold_mode_active,
+        adaptive_center=adaptive_center,
+        adaptive_amplitude=adaptive_amplitude,
+        processing_mode=cfg.processing_mode,
+        movement_value=movement_value,
+        extrema_event_code=extrema_event_code,
+        extrema_event_label=extrema_event_label,
+        messages=tuple(messages),
+        qc_events=tuple(qc_events),
+    )
+    return sample, state
 
-    stage = state.stage
-    sample_index = state.stage_sample_index
-    relative_time_s = sample_index / float(cfg.sampling_rate_hz)
-    row_width = int(row_values.shape[0])
+
+def process_device_rows(
+    device_rows: np.ndarray,
+    state: PipelineState,
+    cfg: PipelineConfig,
+) -> tuple[PipelineBatch, PipelineState]:
+    """Process one contiguous ``(n, width)`` block of BITalino rows.
+
+    The result holds the same per-sample values as calling
+    :func:`process_device_row` once per row, but the causal filters run once
+    per block span instead of once per sample and the output is columnar. A
+    block is split internally only where the filter state is re-initialized,
+    i.e. on the sample that completes startup calibration. Blocks shorter
+    than ``_MIN_BLOCK_SAMPLES`` run the per-row stages in a loop, which is
+    cheaper than the fixed per-span overhead at that size.
+    """
+
+    block = np.asarray(device_rows)
+    if block.ndim != 2:
+        raise ValueError(
+            f"device_rows must be two-dimensional, got shape {tuple(block.shape)}."
+        )
+    _validate_processed_sensor_column(int(block.shape[1]), cfg)
+    raw_values = block[:, cfg.processed_sensor_column].astype(float)
+    calibration_target_samples = cfg.calibration_target_samples
+
+    processed_values: list[_ProcessedValues] = []
+    row_count = int(raw_values.shape[0])
+    if row_count < _MIN_BLOCK_SAMPLES:
+        filtered_list: list[float] = []
+        for raw_sensor_value in raw_values.tolist():
+            filtered_value = _filter_sample(raw_sensor_value, state, cfg)
+            filtered_list.append(filtered_value)
+            processed_values.append(
+                _process_filtered_sample(raw_sensor_value, filtered_value, state, cfg)
+            )
+        filtered_values = np.asarray(filtered_list, dtype=float)
+        return _build_pipeline_batch(raw_values, filtered_values, processed_values, cfg), state
+
+    filtered_spans: list[np.ndarray] = []
+    start = 0
+    while start < row_count:
+        if state.stage == "calibration":
+            remaining = calibration_target_samples - _calibration_sample_count(state)
+            stop = min(row_count, start + max(remaining, 1))
+        else:
+            stop = row_count
+        span_raw_values = raw_values[start:stop]
+        span_filtered_values = _filter_block(span_raw_values, state, cfg)
+        filtered_spans.append(span_filtered_values)
+        _process_filtered_span(span_raw_values, span_filtered_values, state, cfg, processed_values)
+        start = stop
+
+    filtered_values = (
+        np.concatenate(filtered_spans) if filtered_spans else np.zeros(0, dtype=float)
+    )
+    return _build_pipeline_batch(raw_values, filtered_values, processed_values, cfg), state
+
+
+def process_filtered_values(
+    raw_values: np.ndarray,
+    filtered_values: np.ndarray,
+    state: PipelineState,
+    cfg: PipelineConfig,
+) -> tuple[PipelineBatch, PipelineState]:
+    """Run calibration and the runtime stages on values filtered by an earlier pass.
+
+    ``filtered_values`` must be the ``filtered_value`` column that
+    :func:`process_device_rows` produced for the same ``raw_values`` with the
+    same filter, movement and calibration settings and the same source-gap
+    resets. Hold, output-smoothing, extrema and adaptation settings do not
+    affect filtering, so parameter sweeps over them reuse one filtered trace.
+    ``state``'s own filters are not advanced.
+    """
+
+    raw_array = np.asarray(raw_values, dtype=float)
+    filtered_array = np.asarray(filtered_values, dtype=float)
+    if raw_array.shape != filtered_array.shape or raw_array.ndim != 1:
+        raise ValueError("raw_values and filtered_values must be one-dimensional and equal length.")
+    processed_values: list[_ProcessedValues] = []
+    start = 0
+    row_count = int(raw_array.shape[0])
+    while start < row_count:
+        if state.stage == "calibration":
+            remaining = cfg.calibration_target_samples - _calibration_sample_count(state)
+            stop = min(row_count, start + max(remaining, 1))
+        else:
+            stop = row_count
+        _process_filtered_span(
+            raw_array[start:stop],
+            filtered_array[start:stop],
+            state,
+            cfg,
+            processed_values,
+        )
+        start = stop
+    return _build_pipeline_batch(raw_array, filtered_array, processed_values, cfg), state
+
+
+def _process_filtered_span(
+    raw_values: np.ndarray,
+    filtered_values: np.ndarray,
+    state: PipelineState,
+    cfg: PipelineConfig,
+    processed_values: list[_ProcessedValues],
+) -> None:
+    """Process samples that share one stage (the last may complete calibration).
+
+    Raw QC runs once for the whole span; the remaining stages run per sample.
+    """
+
+    span_qc_events: dict[int, list[RawQCEvent]] = {}
+    if cfg.raw_qc.enabled:
+        fs_hz = cfg.plan.fs_hz
+        sample_indices = state.stage_sample_index + np.arange(raw_values.shape[0])
+        qc_events, state.qc_state = update_raw_qc_block(
+            raw_values,
+            stage=state.stage,
+            sample_indices=sample_indices,
+            relative_times_s=sample_indices / fs_hz,
+            state=state.qc_state,
+            cfg=cfg.raw_qc,
+            fs_hz=fs_hz,
+        )
+        for offset, event in qc_events:
+            span_qc_events.setdefault(offset, []).append(event)
+    span_adaptive_values: list[_AdaptiveValues] | None = None
+    if (
+        cfg.processing_mode == "adaptive"
+        and state.stage == "runtime"
+        and raw_values.shape[0] >= _MIN_ADAPTIVE_SPAN_SAMPLES
+    ):
+        span_adaptive_values = _normalize_runtime_adaptive_span(filtered_values, state, cfg)
+    for offset, (raw_sensor_value, filtered_value) in enumerate(
+        zip(raw_values.tolist(), filtered_values.tolist())
+    ):
+        processed_values.append(
+            _process_filtered_sample(
+                raw_sensor_value,
+                filtered_value,
+                state,
+                cfg,
+                qc_events=span_qc_events.get(offset, []),
+                adaptive_values=(
+                    None if span_adaptive_values is None else span_adaptive_values[offset]
+                ),
+            )
+        )
+
+
+def _build_pipeline_batch(
+    raw_values: np.ndarray,
+    filtered_values: np.ndarray,
+    processed_values: list[_ProcessedValues],
+    cfg: PipelineConfig,
+) -> PipelineBatch:
+    if not processed_values:
+        return PipelineBatch.empty(cfg.processing_mode)
+
+    (
+        stages,
+        sample_indices,
+        relative_times_s,
+        normalized_values,
+        movement_values,
+        hold_mode_flags,
+        adaptive_centers,
+        adaptive_amplitudes,
+        extrema_event_codes,
+        _,
+        messages,
+        qc_events,
+    ) = zip(*processed_values)
+    return PipelineBatch(
+        processing_mode=cfg.processing_mode,
+        runtime_mask=np.fromiter(
+            (stage == "runtime" for stage in stages),
+            dtype=bool,
+            count=len(stages),
+        ),
+        sample_index=np.asarray(sample_indices, dtype=np.int64),
+        relative_time_s=np.asarray(relative_times_s, dtype=float),
+        selected_sensor_raw=raw_values,
+        filtered_value=filtered_values,
+        cleaned_value=filtered_values,
+        normalized_value=_optional_column(normalized_values),
+        movement_value=_optional_column(movement_values),
+        hold_mode_active=np.asarray(hold_mode_flags, dtype=bool),
+        adaptive_center=_optional_column(adaptive_centers),
+        adaptive_amplitude=_optional_column(adaptive_amplitudes),
+        extrema_event_code=np.asarray(extrema_event_codes, dtype=float),
+        messages=tuple(
+            (offset, message)
+            for offset, sample_messages in enumerate(messages)
+            if sample_messages
+            for message in sample_messages
+        ),
+        qc_events=tuple(
+            (offset, event)
+            for offset, sample_events in enumerate(qc_events)
+            if sample_events
+            for event in sample_events
+        ),
+    )
+
+
+def _optional_column(values: tuple[float | None, ...]) -> np.ndarray:
+    return np.asarray(
+        [np.nan if value is None else value for value in values],
+        dtype=float,
+    )
+
+
+def _validate_processed_sensor_column(row_width: int, cfg: PipelineConfig) -> None:
     if cfg.processed_sensor_column >= row_width:
         raise ValueError(
             "device.processed_sensor_column="
             f"{cfg.processed_sensor_column} is out of bounds for acquired "
             f"device_row width {row_width}."
         )
-    raw_sensor_value = float(row_values[cfg.processed_sensor_column])
+
+
+def _process_filtered_sample(
+    raw_sensor_value: float,
+    filtered_value: float,
+    state: PipelineState,
+    cfg: PipelineConfig,
+    qc_events: list[RawQCEvent] | None = None,
+    adaptive_values: _AdaptiveValues | None = None,
+) -> _ProcessedValues:
+    """Run one sample through calibration or the runtime stages.
+
+    ``qc_events`` holds the sample's raw-QC events and ``adaptive_values`` its
+    adaptive-mode outputs when the caller already computed them for a whole
+    span; otherwise they are computed here for this sample.
+    """
+
+    plan = cfg.plan
+    stage = state.stage
+    sample_index = state.stage_sample_index
+    relative_time_s = sample_index / plan.fs_hz
     messages: list[str] = []
 
-    filtered_value = _filter_sample(raw_sensor_value, state, cfg)
     cleaned_value = filtered_value
-    qc_events, state.qc_state = update_raw_qc(
-        raw_value=raw_sensor_value,
-        stage=stage,
-        sample_index=sample_index,
-        relative_time_s=relative_time_s,
-        state=state.qc_state,
-        cfg=cfg.raw_qc,
-        fs_hz=float(cfg.sampling_rate_hz),
-    ) if cfg.raw_qc.enabled else ([], state.qc_state)
+    if qc_events is None:
+        qc_events, state.qc_state = update_raw_qc(
+            raw_value=raw_sensor_value,
+            stage=stage,
+            sample_index=sample_index,
+            relative_time_s=relative_time_s,
+            state=state.qc_state,
+            cfg=cfg.raw_qc,
+            fs_hz=plan.fs_hz,
+        ) if cfg.raw_qc.enabled else ([], state.qc_state)
 
     normalized_value: float | None = None
     movement_value: float | None = None
@@ -278,94 +813,33 @@ def process_device_row(
     if stage == "calibration":
         if _raw_sample_is_saturated(raw_sensor_value, cfg):
             state.calibration_raw_saturated_count += 1
-        state.calibration_samples.append(cleaned_value)
-        collected = len(state.calibration_samples)
-        clipped_collected = min(collected, cfg.calibration_target_samples)
-        reported_sec = int(clipped_collected / cfg.calibration_cfg.fs_hz)
+        if state.calibration_window is not None:
+            state.calibration_window.add(cleaned_value)
+        else:
+            state.calibration_samples.append(cleaned_value)
+        collected = _calibration_sample_count(state)
+        clipped_collected = min(collected, plan.calibration_target_samples)
+        reported_sec = int(clipped_collected / plan.fs_hz)
         if reported_sec != state.calibration_last_reported_sec:
             state.calibration_last_reported_sec = reported_sec
             messages.append(
-                f"Calibration progress: {clipped_collected}/{cfg.calibration_target_samples} samples"
+                f"Calibration progress: {clipped_collected}/{plan.calibration_target_samples} samples"
             )
 
-        if collected >= cfg.calibration_target_samples:
-            state.calibration_samples = state.calibration_samples[: cfg.calibration_target_samples]
-            if cfg.processing_mode == "movement":
-                state.calibration_result = _run_movement_calibration(
-                    state.calibration_samples,
-                    cfg,
-                )
-                state.adaptive_state = _build_fixed_reference_state(
-                    state.calibration_samples,
-                    state.calibration_result,
-                    cfg.calibration.amplitude_floor,
-                )
-            elif cfg.processing_mode == "adaptive":
-                state.calibration_result = run_range_calibration(
-                    state.calibration_samples,
-                    cfg.calibration_cfg,
-                )
-                state.adaptive_state = initialize_adaptive_range(
-                    state.calibration_samples,
-                    state.calibration_result,
-                    cfg.adaptive_cfg_startup,
-                )
-            else:
-                state.calibration_result = run_range_calibration(
-                    state.calibration_samples,
-                    cfg.calibration_cfg,
-                )
-                state.adaptive_state = _build_fixed_reference_state(
-                    state.calibration_samples,
-                    state.calibration_result,
-                    cfg.calibration.amplitude_floor,
-                )
-            state.calibration_result = _with_raw_calibration_saturation(
+        if collected >= plan.calibration_target_samples:
+            state.calibration_result, state.adaptive_state = _finalize_startup_calibration(
+                state,
+                cfg,
+            )
+            state.calibration_result = with_raw_calibration_saturation(
                 state.calibration_result,
                 state.calibration_raw_saturated_count,
             )
             adaptive_center = float(state.adaptive_state.center)
             adaptive_amplitude = float(state.adaptive_state.amplitude)
-            if cfg.processing_mode == "movement":
-                messages.extend(
-                    [
-                        "Movement-proxy calibration complete.",
-                        (
-                            "Movement-proxy reference: "
-                            f"center={state.calibration_result.center:.6f}, "
-                            f"reference_amplitude={state.calibration_result.amplitude:.6f}, "
-                            f"percentile_lo={state.calibration_result.global_min:.6f}, "
-                            f"percentile_hi={state.calibration_result.global_max:.6f}"
-                        ),
-                    ]
-                )
-            elif cfg.processing_mode == "adaptive":
-                messages.extend(
-                    [
-                        "Adaptive calibration complete.",
-                        (
-                            "Adaptive range initialized: "
-                            f"center={state.adaptive_state.center:.6f}, "
-                            f"amplitude={state.adaptive_state.amplitude:.6f}, "
-                            f"startup_duration_s={cfg.adaptation.startup_duration_s:.1f}"
-                        ),
-                    ]
-                )
-            else:
-                messages.extend(
-                    [
-                        "Calibration complete.",
-                        (
-                            "Fixed control map: "
-                            f"center={state.calibration_result.center:.6f}, "
-                            f"amplitude={state.calibration_result.amplitude:.6f}, "
-                            f"min={state.calibration_result.global_min:.6f}, "
-                            f"max={state.calibration_result.global_max:.6f}, "
-                            f"control_min={state.calibration_result.y_min:.6f}, "
-                            f"control_max={state.calibration_result.y_max:.6f}"
-                        ),
-                    ]
-                )
+            messages.extend(
+                calibration_complete_messages(state.calibration_result, state.adaptive_state, cfg)
+            )
             _reset_continuity_sensitive_state(
                 state,
                 reset_runtime_progress=True,
@@ -385,16 +859,27 @@ def process_device_row(
             )
         elif cfg.processing_mode == "adaptive":
             # Export one coherent pre-update adaptive snapshot with each sample.
-            normalized_value, movement_value = _normalize_runtime_adaptive_sample(
-                cleaned_value,
-                state,
-                cfg,
-            )
+            if adaptive_values is None:
+                normalized_value, movement_value = _normalize_runtime_adaptive_sample(
+                    cleaned_value,
+                    state,
+                    cfg,
+                )
+                extremum_amplitude = None
+            else:
+                (
+                    normalized_value,
+                    movement_value,
+                    adaptive_center,
+                    adaptive_amplitude,
+                    extremum_amplitude,
+                ) = adaptive_values
             extrema_event_code, extrema_event_label = _detect_runtime_extremum(
                 movement_value,
                 sample_index,
                 state,
                 cfg,
+                amplitude=extremum_amplitude,
             )
         else:
             normalized_value = _normalize_runtime_sample(cleaned_value, state, cfg)
@@ -405,12 +890,13 @@ def process_device_row(
                 cfg,
             )
         if cfg.processing_mode == "adaptive":
-            adaptive_center = (
-                float(sample_adaptive_state.center) if sample_adaptive_state else None
-            )
-            adaptive_amplitude = (
-                float(sample_adaptive_state.amplitude) if sample_adaptive_state else None
-            )
+            if adaptive_values is None:
+                adaptive_center = (
+                    float(sample_adaptive_state.center) if sample_adaptive_state else None
+                )
+                adaptive_amplitude = (
+                    float(sample_adaptive_state.amplitude) if sample_adaptive_state else None
+                )
         else:
             adaptive_center = float(state.adaptive_state.center) if state.adaptive_state else None
             adaptive_amplitude = (
@@ -419,27 +905,20 @@ def process_device_row(
         state.runtime_processed_samples += 1
         state.stage_sample_index += 1
 
-    sample = PipelineSample(
-        stage=stage,
-        sample_index=sample_index,
-        relative_time_s=relative_time_s,
-        selected_sensor_raw=raw_sensor_value,
-        filtered_value=filtered_value,
-        cleaned_value=cleaned_value,
-        normalized_value=normalized_value,
-        hold_mode_active=(
-            state.hold_mode_active if stage == "runtime" and cfg.processing_mode == "control" else False
-        ),
-        adaptive_center=adaptive_center,
-        adaptive_amplitude=adaptive_amplitude,
-        processing_mode=cfg.processing_mode,
-        movement_value=movement_value,
-        extrema_event_code=extrema_event_code if stage == "runtime" else 0.0,
-        extrema_event_label=extrema_event_label if stage == "runtime" else None,
-        messages=tuple(messages),
-        qc_events=tuple(qc_events),
+    return (
+        stage,
+        sample_index,
+        relative_time_s,
+        normalized_value,
+        movement_value,
+        state.hold_mode_active if stage == "runtime" and cfg.processing_mode == "control" else False,
+        adaptive_center,
+        adaptive_amplitude,
+        extrema_event_code if stage == "runtime" else 0.0,
+        extrema_event_label if stage == "runtime" else None,
+        messages,
+        qc_events,
     )
-    return sample, state
 
 
 def _reset_continuity_sensitive_state(
@@ -453,10 +932,8 @@ def _reset_continuity_sensitive_state(
     state.recent_movement_abs_velocity.clear()
     state.recent_adaptive_abs_velocity.clear()
     state.filter_initialized = False
-    state.sos_hp = None
-    state.zi_hp = None
-    state.sos_lp = None
-    state.zi_lp = None
+    state.hp_filter = None
+    state.lp_filter = None
     state.previous_filtered_value = None
     state.previous_cleaned_value = None
     state.previous_movement_activity_value = None
@@ -478,71 +955,200 @@ def _reset_continuity_sensitive_state(
 
 def _filter_sample(raw_sensor_value: float, state: PipelineState, cfg: PipelineConfig) -> float:
     control_input = -raw_sensor_value if cfg.invert_signal else raw_sensor_value
+    hp_filter, lp_filter = _ensure_filter_initialized(control_input, state, cfg)
+
+    if hp_filter is not None:
+        return _apply_movement_low_activity_slowdown(
+            control_input=float(control_input),
+            filtered_value=lp_filter.step(hp_filter.step(control_input)),
+            state=state,
+            cfg=cfg,
+        )
+    return lp_filter.step(control_input)
+
+
+def _filter_block(
+    raw_sensor_values: np.ndarray,
+    state: PipelineState,
+    cfg: PipelineConfig,
+) -> np.ndarray:
+    """Filter one span of raw values with a single block call per filter stage."""
+
+    control_inputs = -raw_sensor_values if cfg.invert_signal else raw_sensor_values
+    if control_inputs.size == 0:
+        return np.asarray(control_inputs, dtype=float)
+    hp_filter, lp_filter = _ensure_filter_initialized(float(control_inputs[0]), state, cfg)
+
+    if hp_filter is not None:
+        low_passed_values = lp_filter.process(hp_filter.process(control_inputs))
+        return np.asarray(
+            [
+                _apply_movement_low_activity_slowdown(
+                    control_input=control_input,
+                    filtered_value=filtered_value,
+                    state=state,
+                    cfg=cfg,
+                )
+                for control_input, filtered_value in zip(
+                    control_inputs.tolist(),
+                    low_passed_values.tolist(),
+                )
+            ],
+            dtype=float,
+        )
+
+    return lp_filter.process(control_inputs)
+
+
+def _ensure_filter_initialized(
+    control_input: float,
+    state: PipelineState,
+    cfg: PipelineConfig,
+) -> tuple[SosFilter | None, SosFilter]:
+    """Return ``(hp_filter, lp_filter)``; ``hp_filter`` is only used for movement mode."""
+
     if not state.filter_initialized:
+        plan = cfg.plan
         if cfg.processing_mode == "movement":
-            state.sos_hp, state.zi_hp = get_high_pass_filter_coeffs(
-                cfg.movement.hp_cutoff_hz,
-                cfg.sampling_rate_hz,
-                cfg.movement.hp_order,
-                initial_value=control_input,
-            )
-            state.sos_lp, state.zi_lp = get_low_pass_filter_coeffs(
-                cfg.movement.lp_cutoff_hz,
-                cfg.sampling_rate_hz,
-                cfg.movement.lp_order,
-                initial_value=0.0,
-            )
+            state.hp_filter = SosFilter(plan.hp_sos, plan.hp_zi * control_input)
+            state.lp_filter = SosFilter(plan.lp_sos, plan.lp_zi * 0.0)
         else:
-            state.sos_lp, state.zi_lp = get_low_pass_filter_coeffs(
-                cfg.filter.lp_cutoff_hz,
-                cfg.sampling_rate_hz,
-                cfg.filter.lp_order,
-                initial_value=control_input,
-            )
+            state.lp_filter = SosFilter(plan.lp_sos, plan.lp_zi * control_input)
         state.filter_initialized = True
 
-    if state.sos_lp is None or state.zi_lp is None:
+    if state.lp_filter is None:
         raise RuntimeError("Low-pass filter state must be initialized before filtering.")
+    if cfg.processing_mode != "movement":
+        return None, state.lp_filter
+    if state.hp_filter is None:
+        raise RuntimeError("High-pass filter state must be initialized for movement-proxy mode.")
+    return state.hp_filter, state.lp_filter
+
+
+def _raw_sample_is_saturated(raw_sensor_value: float, cfg: PipelineConfig) -> bool:
+    return (
+        float(raw_sensor_value) <= cfg.raw_qc.raw_saturation_lo
+        or float(raw_sensor_value) >= cfg.raw_qc.raw_saturation_hi
+    )
+
+
+def _calibration_sample_count(state: PipelineState) -> int:
+    if state.calibration_window is not None:
+        return len(state.calibration_window)
+    return len(state.calibration_samples)
+
+
+def calibration_complete_messages(
+    calibration_result: CalibrationResult,
+    adaptive_state: AdaptiveRangeState,
+    cfg: PipelineConfig,
+    *,
+    column: int | None = None,
+) -> list[str]:
+    """Return the mode-specific console lines announcing completed calibration.
+
+    With ``column``, the summary line names the sensor column it describes.
+    """
 
     if cfg.processing_mode == "movement":
-        if state.sos_hp is None or state.zi_hp is None:
-            raise RuntimeError("High-pass filter state must be initialized for movement-proxy mode.")
-        high_passed_value, state.zi_hp = high_pass_filter_sample(
-            control_input,
-            state.sos_hp,
-            state.zi_hp,
+        title = "Movement-proxy calibration complete."
+        summary = (
+            "Movement-proxy reference: "
+            f"center={calibration_result.center:.6f}, "
+            f"reference_amplitude={calibration_result.amplitude:.6f}, "
+            f"percentile_lo={calibration_result.global_min:.6f}, "
+            f"percentile_hi={calibration_result.global_max:.6f}"
         )
-        low_passed_value, state.zi_lp = low_pass_filter_sample(
-            float(high_passed_value),
-            state.sos_lp,
-            state.zi_lp,
-        )
-        low_passed_value = _apply_movement_low_activity_slowdown(
-            control_input=float(control_input),
-            filtered_value=float(low_passed_value),
-            state=state,
-            cfg=cfg,
+    elif cfg.processing_mode == "adaptive":
+        title = "Adaptive calibration complete."
+        summary = (
+            "Adaptive range initialized: "
+            f"center={adaptive_state.center:.6f}, "
+            f"amplitude={adaptive_state.amplitude:.6f}, "
+            f"startup_duration_s={cfg.adaptation.startup_duration_s:.1f}"
         )
     else:
-        low_passed_value, state.zi_lp = low_pass_filter_sample(
-            control_input,
-            state.sos_lp,
-            state.zi_lp,
+        title = "Calibration complete."
+        summary = (
+            "Fixed control map: "
+            f"center={calibration_result.center:.6f}, "
+            f"amplitude={calibration_result.amplitude:.6f}, "
+            f"min={calibration_result.global_min:.6f}, "
+            f"max={calibration_result.global_max:.6f}, "
+            f"control_min={calibration_result.y_min:.6f}, "
+            f"control_max={calibration_result.y_max:.6f}"
         )
-    return float(low_passed_value)
+    if column is not None:
+        summary = f"{summary} (column {column})"
+    return [title, summary]
 
 
-def _raw_sample_is_saturated(raw_sensor_value: float, cfg: PipelineConfig) -> bool:
-    return (
-        float(raw_sensor_value) <= cfg.raw_qc.raw_saturation_lo
-        or float(raw_sensor_value) >= cfg.raw_qc.raw_saturation_hi
-    )
+def _finalize_startup_calibration(
+    state: PipelineState,
+    cfg: PipelineConfig,
+) -> tuple[CalibrationResult, AdaptiveRangeState]:
+    if state.calibration_window is not None:
+        return finalize_calibration(state.calibration_window, cfg)
+    state.calibration_samples = state.calibration_samples[: cfg.calibration_target_samples]
+    return finalize_calibration(state.calibration_samples, cfg)
+
 
+def finalize_calibration(
+    calibration: list[float] | np.ndarray | StreamingCalibrationWindow,
+    cfg: PipelineConfig,
+) -> tuple[CalibrationResult, AdaptiveRangeState]:
+    """Derive one channel's calibration and initial range from its startup window.
+
+    ``calibration`` is the buffered sample window (``calibration.engine =
+    "batch"``) or the :class:`StreamingCalibrationWindow` that collected it.
+    """
 
-def _with_raw_calibration_saturation(
+    if isinstance(calibration, StreamingCalibrationWindow):
+        window = calibration
+        if cfg.processing_mode == "movement":
+            calibration_result = _run_streaming_movement_calibration(window, cfg)
+        else:
+            calibration_result = finalize_streaming_range_calibration(window, cfg.calibration_cfg)
+        abs_dev_ema = window.mean_abs_deviation(calibration_result.center)
+        if cfg.processing_mode == "adaptive":
+            adaptive_state = initialize_adaptive_range_from_abs_dev(
+                abs_dev_ema,
+                calibration_result,
+                cfg.adaptive_cfg_startup,
+            )
+        else:
+            adaptive_state = _fixed_reference_state_from_abs_dev(
+                abs_dev_ema,
+                calibration_result,
+                cfg.calibration.amplitude_floor,
+            )
+        return calibration_result, adaptive_state
+
+    if cfg.processing_mode == "movement":
+        calibration_result = run_movement_calibration(calibration, cfg)
+    else:
+        calibration_result = run_range_calibration(calibration, cfg.calibration_cfg)
+    if cfg.processing_mode == "adaptive":
+        adaptive_state = initialize_adaptive_range(
+            calibration,
+            calibration_result,
+            cfg.adaptive_cfg_startup,
+        )
+    else:
+        adaptive_state = build_fixed_reference_state(
+            calibration,
+            calibration_result,
+            cfg.calibration.amplitude_floor,
+        )
+    return calibration_result, adaptive_state
+
+
+def with_raw_calibration_saturation(
     calibration_result: CalibrationResult,
     saturated_count: int,
 ) -> CalibrationResult:
+    """Record the raw sensor saturation counted during calibration on its result."""
+
     return replace(
         calibration_result,
         saturated=bool(saturated_count > 0),
@@ -568,10 +1174,10 @@ def _normalize_runtime_sample(
     state.recent_output_abs_velocity.append(abs_velocity)
     state.previous_cleaned_value = value_float
 
-    if len(state.recent_abs_velocity) < state.recent_abs_velocity.maxlen:
+    if not state.recent_abs_velocity.is_full:
         activity_value = float("inf")
     else:
-        activity_value = float(np.mean(state.recent_abs_velocity))
+        activity_value = state.recent_abs_velocity.mean()
 
     amplitude = max(state.calibration_result.amplitude, cfg.calibration.amplitude_floor)
     enter_threshold = max(
@@ -590,29 +1196,19 @@ def _normalize_runtime_sample(
         state.hold_mode_active = False
         state.frozen_normalized_value = None
     else:
-        if not state.hold_mode_active:
-            if len(state.recent_abs_velocity) >= state.recent_abs_velocity.maxlen:
-                state.hold_mode_active = (
-                    activity_value < enter_threshold
-                    and abs_velocity < enter_threshold
-                    and _is_extrema_zone(normalized_candidate, cfg)
-                )
-                if state.hold_mode_active:
-                    state.frozen_normalized_value = float(normalized_candidate)
-        elif (
-            abs_velocity > exit_threshold
-            or (
-                state.frozen_normalized_value is not None
-                and abs(normalized_candidate - state.frozen_normalized_value)
-                > _HOLD_RELEASE_DRIFT
-            )
-        ):
-            state.hold_mode_active = False
-            state.frozen_normalized_value = None
-
+        state.hold_mode_active, state.frozen_normalized_value = step_hold_latch(
+            normalized_candidate,
+            active=state.hold_mode_active,
+            frozen=state.frozen_normalized_value,
+            may_enter=(
+                state.recent_abs_velocity.is_full
+                and activity_value < enter_threshold
+                and abs_velocity < enter_threshold
+                and _is_extrema_zone(normalized_candidate, cfg)
+            ),
+            must_exit=abs_velocity > exit_threshold,
+        )
         if state.hold_mode_active:
-            if state.frozen_normalized_value is None:
-                state.frozen_normalized_value = float(normalized_candidate)
             post_hold_level = float(state.frozen_normalized_value)
 
     return _smooth_output_level(
@@ -650,9 +1246,13 @@ def _normalize_runtime_adaptive_sample(
         fs_hz=cfg.sampling_rate_hz,
     )
     state.previous_adaptive_value = float(cleaned_value)
-    in_startup = state.runtime_processed_samples < cfg.startup_target_samples
+    plan = cfg.plan
+    in_startup = state.runtime_processed_samples < plan.startup_target_samples
     state.startup_mode_active = in_startup
-    adaptive_cfg = cfg.adaptive_cfg_startup if in_startup else cfg.adaptive_cfg_runtime
+    if in_startup:
+        adaptive_cfg, adaptive_alphas = plan.adaptive_cfg_startup, plan.adaptive_alphas_startup
+    else:
+        adaptive_cfg, adaptive_alphas = plan.adaptive_cfg_runtime, plan.adaptive_alphas_runtime
     low_activity = (
         cfg.adaptation.low_activity_gating_enabled
         and _is_low_activity(
@@ -672,10 +1272,245 @@ def _normalize_runtime_adaptive_sample(
         allow_update=allow_center_update or allow_amplitude_update,
         allow_center_update=allow_center_update,
         allow_amplitude_update=allow_amplitude_update,
+        alphas=adaptive_alphas,
     )
     return float(normalized_value), movement_value
 
 
+def _normalize_runtime_adaptive_span(
+    cleaned_values: np.ndarray,
+    state: PipelineState,
+    cfg: PipelineConfig,
+) -> list[_AdaptiveValues]:
+    """Span-level :func:`_normalize_runtime_adaptive_sample` for one runtime span."""
+
+    if state.adaptive_state is None:
+        raise RuntimeError("Adaptive state must be initialized before adaptive normalization.")
+
+    row_count = int(cleaned_values.shape[0])
+    abs_velocity, activity, window_full = _append_abs_velocities(
+        recent_abs_velocity=state.recent_adaptive_abs_velocity,
+        values=cleaned_values,
+        previous_value=state.previous_adaptive_value,
+        fs_hz=cfg.sampling_rate_hz,
+    )
+    state.previous_adaptive_value = float(cleaned_values[-1])
+    startup_samples = min(
+        row_count,
+        max(0, cfg.plan.startup_target_samples - state.runtime_processed_samples),
+    )
+    state.startup_mode_active = startup_samples == row_count
+    normalized, centers, amplitudes, updated_amplitudes, state.adaptive_state = (
+        update_adaptive_span(
+            cleaned_values,
+            abs_velocity,
+            activity,
+            window_full,
+            state.adaptive_state,
+            startup_samples,
+            cfg,
+        )
+    )
+    return list(
+        zip(
+            normalized.tolist(),
+            (cleaned_values - centers).tolist(),
+            centers.tolist(),
+            amplitudes.tolist(),
+            updated_amplitudes.tolist(),
+        )
+    )
+
+
+def update_adaptive_span(
+    values: np.ndarray,
+    abs_velocity: np.ndarray,
+    activity: np.ndarray,
+    window_full: np.ndarray,
+    adaptive_state: AdaptiveRangeState,
+    startup_samples: int,
+    cfg: PipelineConfig,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, AdaptiveRangeState]:
+    """Run the gated adaptive-range updates over one runtime span of one channel.
+
+    The first ``startup_samples`` use the startup time constants. Low-activity
+    gating compares activity against the amplitude, which the updates
+    themselves change, so each pass gates the rest of the span with the
+    amplitudes of the previous pass (the current amplitude on the first) and
+    keeps the result up to the first sample whose gating the actual
+    amplitudes contradict. The amplitude moves slowly, so one pass is
+    normally enough. Spans shorter than ``_MIN_ADAPTIVE_SPAN_SAMPLES`` are
+    updated sample by sample.
+    """
+
+    plan = cfg.plan
+    adaptation = cfg.adaptation
+    row_count = int(values.shape[0])
+    if row_count < _MIN_ADAPTIVE_SPAN_SAMPLES:
+        return _update_adaptive_samples(
+            values,
+            abs_velocity,
+            activity,
+            window_full,
+            adaptive_state,
+            startup_samples,
+            cfg,
+        )
+    parts: list[tuple[np.ndarray, ...]] = []
+    for start, stop, adaptive_cfg, alphas in (
+        (0, startup_samples, plan.adaptive_cfg_startup, plan.adaptive_alphas_startup),
+        (startup_samples, row_count, plan.adaptive_cfg_runtime, plan.adaptive_alphas_runtime),
+    ):
+        position = start
+        amplitude_guess: np.ndarray | None = None
+        while position < stop:
+            span = slice(position, stop)
+            if adaptation.low_activity_gating_enabled:
+                if amplitude_guess is None:
+                    amplitude_guess = np.full(stop - position, adaptive_state.amplitude)
+                low_activity = _low_activity_mask(
+                    amplitude_guess,
+                    abs_velocity[span],
+                    activity[span],
+                    window_full[span],
+                    cfg,
+                )
+            else:
+                low_activity = np.zeros(stop - position, dtype=bool)
+            center_mask = adaptation.center_enabled & ~low_activity
+            amplitude_mask = adaptation.amplitude_enabled & ~low_activity
+            *outputs, updated_state = update_adaptive_range_block(
+                values[span],
+                adaptive_state,
+                adaptive_cfg,
+                center_mask,
+                amplitude_mask,
+                alphas=alphas,
+            )
+            mismatches = (
+                np.flatnonzero(
+                    _low_activity_mask(
+                        outputs[2],
+                        abs_velocity[span],
+                        activity[span],
+                        window_full[span],
+                        cfg,
+                    )
+                    != low_activity
+                )
+                if adaptation.low_activity_gating_enabled
+                else np.zeros(0, dtype=int)
+            )
+            if mismatches.size == 0:
+                parts.append(tuple(outputs))
+                adaptive_state = updated_state
+                break
+            # Gating before the first mismatch is right; redo that prefix to get its state.
+            accepted = int(mismatches[0])
+            parts.append(tuple(output[:accepted] for output in outputs))
+            *_, adaptive_state = update_adaptive_range_block(
+                values[position : position + accepted],
+                adaptive_state,
+                adaptive_cfg,
+                center_mask[:accepted],
+                amplitude_mask[:accepted],
+                alphas=alphas,
+            )
+            amplitude_guess = outputs[2][accepted:]
+            position += accepted
+
+    normalized, centers, amplitudes, updated_amplitudes = (
+        np.concatenate([part[index] for part in parts]) for index in range(4)
+    )
+    return normalized, centers, amplitudes, updated_amplitudes, adaptive_state
+
+
+def _update_adaptive_samples(
+    values: np.ndarray,
+    abs_velocity: np.ndarray,
+    activity: np.ndarray,
+    window_full: np.ndarray,
+    adaptive_state: AdaptiveRangeState,
+    startup_samples: int,
+    cfg: PipelineConfig,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, AdaptiveRangeState]:
+    """Per-sample form of :func:`update_adaptive_span` on plain floats.
+
+    Follows :func:`update_adaptive_range` operation for operation without
+    allocating a state object per sample.
+    """
+
+    plan = cfg.plan
+    adaptation = cfg.adaptation
+    floor = cfg.calibration.amplitude_floor
+    center = adaptive_state.center
+    amplitude = adaptive_state.amplitude
+    abs_dev_ema = adaptive_state.abs_dev_ema
+    scale = adaptive_state.abs_dev_to_amplitude_scale
+    normalized = np.empty_like(values)
+    centers = np.empty_like(values)
+    amplitudes = np.empty_like(values)
+    updated_amplitudes = np.empty_like(values)
+    for offset, (value, velocity, window_activity, full) in enumerate(
+        zip(values.tolist(), abs_velocity.tolist(), activity.tolist(), window_full.tolist())
+    ):
+        centers[offset] = center
+        amplitudes[offset] = amplitude
+        floored_amplitude = max(amplitude, floor)
+        threshold = max(
+            adaptation.low_activity_floor_per_sec,
+            floored_amplitude * adaptation.low_activity_ratio_per_sec,
+        )
+        low_activity = (
+            adaptation.low_activity_gating_enabled
+            and full
+            and window_activity < threshold
+            and velocity < threshold
+        )
+        normalized[offset] = min(1.0, max(0.0, 0.5 + (value - center) / (2.0 * floored_amplitude)))
+        alpha_center, alpha_amplitude = (
+            plan.adaptive_alphas_startup if offset < startup_samples else plan.adaptive_alphas_runtime
+        )
+        update_center = adaptation.center_enabled and not low_activity
+        if update_center:
+            center = alpha_center * value + (1.0 - alpha_center) * center
+        if adaptation.amplitude_enabled and not low_activity:
+            abs_dev_ema = alpha_amplitude * abs(value - center) + (1.0 - alpha_amplitude) * abs_dev_ema
+            amplitude = max(abs_dev_ema * scale, floor)
+        elif update_center:
+            amplitude = floored_amplitude
+        updated_amplitudes[offset] = amplitude
+    return (
+        normalized,
+        centers,
+        amplitudes,
+        updated_amplitudes,
+        AdaptiveRangeState(
+            center=float(center),
+            amplitude=float(amplitude),
+            abs_dev_ema=float(abs_dev_ema),
+            abs_dev_to_amplitude_scale=float(scale),
+        ),
+    )
+
+
+def _low_activity_mask(
+    amplitudes: np.ndarray,
+    abs_velocity: np.ndarray,
+    activity: np.ndarray,
+    window_full: np.ndarray,
+    cfg: PipelineConfig,
+) -> np.ndarray:
+    """Vectorized :func:`_is_low_activity` for the adaptive-update gate."""
+
+    thresholds = np.maximum(
+        cfg.adaptation.low_activity_floor_per_sec,
+        np.maximum(amplitudes, cfg.calibration.amplitude_floor)
+        * cfg.adaptation.low_activity_ratio_per_sec,
+    )
+    return window_full & (activity < thresholds) & (abs_velocity < thresholds)
+
+
 def _apply_movement_low_activity_slowdown(
     *,
     control_input: float,
@@ -699,7 +1534,7 @@ def _apply_movement_low_activity_slowdown(
         state.slowed_movement_value = float(filtered_value)
         return float(filtered_value)
 
-    low_activity = (
+    low_activity = bool(
         cfg.movement.low_activity_slowdown_enabled
         and state.calibration_result is not None
         and _is_low_activity(
@@ -710,24 +1545,39 @@ def _apply_movement_low_activity_slowdown(
             floor_per_sec=cfg.movement.low_activity_floor_per_sec,
         )
     )
-    recentering_toward_zero = (
-        abs(float(filtered_value)) < abs(state.slowed_movement_value)
-        and float(filtered_value) * state.slowed_movement_value >= 0.0
-    )
-    drift_scale = (
-        cfg.movement.low_activity_drift_scale
-        if low_activity and recentering_toward_zero
-        else 1.0
-    )
-    state.slowed_movement_value = state.slowed_movement_value + drift_scale * (
-        float(filtered_value) - state.slowed_movement_value
+    state.slowed_movement_value = step_movement_slowdown(
+        float(filtered_value),
+        slowed=state.slowed_movement_value,
+        low_activity=low_activity,
+        drift_scale=cfg.movement.low_activity_drift_scale,
     )
     return float(state.slowed_movement_value)
 
 
+def step_movement_slowdown(
+    filtered_value: float,
+    *,
+    slowed: float | None,
+    low_activity: bool,
+    drift_scale: float,
+) -> float:
+    """Advance the slowed movement value by one sample.
+
+    Under low activity, moves back toward zero are scaled by ``drift_scale``;
+    every other move follows the filtered value. Shared with the
+    channel-stacked path so both apply the same recursion.
+    """
+
+    if slowed is None:
+        return filtered_value
+    recentering_toward_zero = abs(filtered_value) < abs(slowed) and filtered_value * slowed >= 0.0
+    scale = drift_scale if low_activity and recentering_toward_zero else 1.0
+    return slowed + scale * (filtered_value - slowed)
+
+
 def _append_abs_velocity(
     *,
-    recent_abs_velocity: deque[float],
+    recent_abs_velocity: RunningMean,
     current_value: float,
     previous_value: float | None,
     fs_hz: int,
@@ -740,18 +1590,45 @@ def _append_abs_velocity(
     return float(abs_velocity)
 
 
+def _append_abs_velocities(
+    *,
+    recent_abs_velocity: RunningMean,
+    values: np.ndarray,
+    previous_value: float | None,
+    fs_hz: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Append a span's absolute velocities; return them with the window mean and fill.
+
+    The window is the same :class:`RunningMean` the per-sample path uses, so
+    means match it exactly; the mean is ``inf`` until the window is full.
+    """
+
+    first_previous = values[0] if previous_value is None else previous_value
+    abs_velocity = np.abs(values - np.concatenate(([first_previous], values[:-1]))) * fs_hz
+    if previous_value is None:
+        abs_velocity[0] = 0.0
+    activity = np.full(values.shape, np.inf)
+    window_full = np.zeros(values.shape, dtype=bool)
+    for offset, velocity in enumerate(abs_velocity.tolist()):
+        recent_abs_velocity.append(velocity)
+        if recent_abs_velocity.is_full:
+            window_full[offset] = True
+            activity[offset] = recent_abs_velocity.mean()
+    return abs_velocity, activity, window_full
+
+
 def _is_low_activity(
     *,
-    recent_abs_velocity: deque[float],
+    recent_abs_velocity: RunningMean,
     abs_velocity: float,
     amplitude: float,
     ratio_per_sec: float,
     floor_per_sec: float,
 ) -> bool:
-    if len(recent_abs_velocity) < recent_abs_velocity.maxlen:
+    if not recent_abs_velocity.is_full:
         return False
     activity_threshold = max(float(floor_per_sec), float(amplitude) * float(ratio_per_sec))
-    activity_value = float(np.mean(recent_abs_velocity))
+    activity_value = recent_abs_velocity.mean()
     return activity_value < activity_threshold and float(abs_velocity) < activity_threshold
 
 
@@ -797,10 +1674,10 @@ def _smooth_output_level(
         amplitude * cfg.output_smoothing.activity_high_ratio_per_sec,
     )
 
-    if len(state.recent_output_abs_velocity) < state.recent_output_abs_velocity.maxlen:
+    if not state.recent_output_abs_velocity.is_full:
         activity_value = high_threshold
     else:
-        activity_value = float(np.mean(state.recent_output_abs_velocity))
+        activity_value = state.recent_output_abs_velocity.mean()
 
     activity_ratio = (activity_value - low_threshold) / (high_threshold - low_threshold)
     activity_ratio = float(min(1.0, max(0.0, activity_ratio)))
@@ -820,13 +1697,51 @@ def _smooth_output_level(
     tau_s = base_tau_s + edge_factor * (extreme_tau_s - base_tau_s)
     alpha = 1.0 - math.exp(-1.0 / (cfg.sampling_rate_hz * tau_s))
 
-    state.emitted_normalized_value = (
-        state.emitted_normalized_value
-        + alpha * (float(target_level) - state.emitted_normalized_value)
+    state.emitted_normalized_value = step_output_smoothing(
+        float(target_level),
+        emitted=state.emitted_normalized_value,
+        alpha=alpha,
     )
     return float(state.emitted_normalized_value)
 
 
+def step_hold_latch(
+    candidate_level: float,
+    *,
+    active: bool,
+    frozen: float | None,
+    may_enter: bool,
+    must_exit: bool,
+) -> tuple[bool, float | None]:
+    """Advance the hold latch by one sample; return ``(active, frozen_level)``.
+
+    An inactive latch freezes ``candidate_level`` when ``may_enter``. An
+    active latch releases on ``must_exit`` or once the candidate drifts more
+    than :data:`HOLD_RELEASE_DRIFT` from the frozen level.
+    """
+
+    if not active:
+        if may_enter:
+            return True, candidate_level
+        return False, frozen
+    if must_exit or (frozen is not None and abs(candidate_level - frozen) > HOLD_RELEASE_DRIFT):
+        return False, None
+    return True, candidate_level if frozen is None else frozen
+
+
+def step_output_smoothing(
+    target_level: float,
+    *,
+    emitted: float | None,
+    alpha: float,
+) -> float:
+    """Move the emitted level one smoothing step toward ``target_level``."""
+
+    if emitted is None:
+        return target_level
+    return emitted + alpha * (target_level - emitted)
+
+
 def _is_extrema_zone(
     normalized_value: float,
     cfg: PipelineConfig,
@@ -840,7 +1755,14 @@ def _detect_runtime_extremum(
     sample_index: int,
     state: PipelineState,
     cfg: PipelineConfig,
+    amplitude: float | None = None,
 ) -> tuple[float, str | None]:
+    """Confirm a peak or trough one sample late.
+
+    ``amplitude`` overrides the adaptive amplitude for span-level callers
+    that have not stored each sample's adaptive state.
+    """
+
     previous_value = state.previous_filtered_value
     state.previous_filtered_value = float(signal_value)
     if previous_value is None:
@@ -851,9 +1773,11 @@ def _detect_runtime_extremum(
     event_code = 0.0
     event_label: str | None = None
     candidate_index = max(sample_index - 1, 0)
+    if amplitude is None:
+        amplitude = state.adaptive_state.amplitude
     prominence_threshold = max(
         cfg.calibration.amplitude_floor,
-        cfg.extrema.prominence_ratio * max(state.adaptive_state.amplitude, cfg.calibration.amplitude_floor),
+        cfg.extrema.prominence_ratio * max(amplitude, cfg.calibration.amplitude_floor),
     )
     baseline_value = (
         0.0
@@ -861,35 +1785,29 @@ def _detect_runtime_extremum(
         else state.adaptive_state.center
     )
 
-    if state.previous_delta_sign > 0 and delta <= 0.0:
-        if _extremum_interval_elapsed(candidate_index, state, cfg):
-            candidate_value = float(previous_value)
-            reference_value = (
-                state.last_trough_value
-                if state.last_trough_value is not None
-                else baseline_value
-            )
-            if (
-                candidate_value - reference_value >= prominence_threshold
-            ):
-                event_code = 1.0
-                event_label = "inhale_peak"
-                state.last_event_sample_index = candidate_index
+    turning_point = (state.previous_delta_sign > 0 and delta <= 0.0) or (
+        state.previous_delta_sign < 0 and delta >= 0.0
+    )
+    if turning_point and extremum_interval_elapsed(
+        candidate_index,
+        state.last_event_sample_index,
+        cfg.plan.extrema_min_interval_samples,
+    ):
+        candidate_value = float(previous_value)
+        event_code = confirm_extremum(
+            candidate_value,
+            rising=state.previous_delta_sign > 0,
+            last_peak=state.last_peak_value,
+            last_trough=state.last_trough_value,
+            baseline=baseline_value,
+            prominence_threshold=prominence_threshold,
+        )
+        if event_code != 0.0:
+            event_label = _EXTREMA_EVENT_LABELS[event_code]
+            state.last_event_sample_index = candidate_index
+            if event_code > 0.0:
                 state.last_peak_value = candidate_value
-    elif state.previous_delta_sign < 0 and delta >= 0.0:
-        if _extremum_interval_elapsed(candidate_index, state, cfg):
-            candidate_value = float(previous_value)
-            reference_value = (
-                state.last_peak_value
-                if state.last_peak_value is not None
-                else baseline_value
-            )
-            if (
-                reference_value - candidate_value >= prominence_threshold
-            ):
-                event_code = -1.0
-                event_label = "exhale_trough"
-                state.last_event_sample_index = candidate_index
+            else:
                 state.last_trough_value = candidate_value
 
     if delta > 0.0:
@@ -901,37 +1819,107 @@ def _detect_runtime_extremum(
     return event_code, event_label
 
 
-def _extremum_interval_elapsed(
+def extremum_interval_elapsed(
     candidate_index: int,
-    state: PipelineState,
-    cfg: PipelineConfig,
+    last_event_sample_index: int | None,
+    min_interval_samples: int,
 ) -> bool:
-    if state.last_event_sample_index is None:
+    """Return whether a turning point is far enough from the last confirmed event."""
+
+    if last_event_sample_index is None:
         return True
-    return (candidate_index - state.last_event_sample_index) >= cfg.extrema_min_interval_samples
+    return (candidate_index - last_event_sample_index) >= min_interval_samples
 
 
-def _run_movement_calibration(
+def confirm_extremum(
+    candidate_value: float,
+    *,
+    rising: bool,
+    last_peak: float | None,
+    last_trough: float | None,
+    baseline: float,
+    prominence_threshold: float,
+) -> float:
+    """Return the event code of a turning point: ``1.0``, ``-1.0`` or ``0.0``.
+
+    A turning point after a rise is an inhale peak when it stands
+    ``prominence_threshold`` above the last trough (or ``baseline`` before
+    the first trough); after a fall it is an exhale trough measured against
+    the last peak.
+    """
+
+    if rising:
+        reference_value = baseline if last_trough is None else last_trough
+        return 1.0 if candidate_value - reference_value >= prominence_threshold else 0.0
+    reference_value = baseline if last_peak is None else last_peak
+    return -1.0 if reference_value - candidate_value >= prominence_threshold else 0.0
+
+
+def run_movement_calibration(
     calibration_samples: list[float] | np.ndarray,
     cfg: PipelineConfig,
 ) -> CalibrationResult:
+    """Derive the movement-proxy reference from buffered calibration samples."""
+
     samples = np.asarray(calibration_samples, dtype=float).reshape(-1)
     if samples.size == 0:
         raise ValueError("Movement-proxy calibration requires at least one sample.")
 
     sorted_samples = np.sort(samples)
     n_samples = int(sorted_samples.size)
-    lo_idx = int(n_samples * cfg.calibration.percentile_lo / 100.0)
-    hi_idx = int(n_samples * cfg.calibration.percentile_hi / 100.0) - 1
-    lo_idx = max(0, min(lo_idx, n_samples - 1))
-    hi_idx = max(0, min(hi_idx, n_samples - 1))
-    if hi_idx < lo_idx:
-        lo_idx = 0
-        hi_idx = n_samples - 1
-
-    percentile_lo = float(sorted_samples[lo_idx])
-    percentile_hi = float(sorted_samples[hi_idx])
-    center = float(np.median(samples))
+    lo_idx, hi_idx = percentile_indices(
+        n_samples,
+        cfg.calibration.percentile_lo,
+        cfg.calibration.percentile_hi,
+    )
+    return _build_movement_calibration_result(
+        percentile_lo=float(sorted_samples[lo_idx]),
+        percentile_hi=float(sorted_samples[hi_idx]),
+        center=float(np.median(samples)),
+        n_samples=n_samples,
+        lo_idx=lo_idx,
+        hi_idx=hi_idx,
+        cfg=cfg,
+        engine="batch",
+    )
+
+
+def _run_streaming_movement_calibration(
+    window: StreamingCalibrationWindow,
+    cfg: PipelineConfig,
+) -> CalibrationResult:
+    n_samples = len(window)
+    if n_samples == 0:
+        raise ValueError("Movement-proxy calibration requires at least one sample.")
+
+    lo_idx, hi_idx = percentile_indices(
+        n_samples,
+        cfg.calibration.percentile_lo,
+        cfg.calibration.percentile_hi,
+    )
+    return _build_movement_calibration_result(
+        percentile_lo=window.order_statistic(lo_idx),
+        percentile_hi=window.order_statistic(hi_idx),
+        center=window.median(),
+        n_samples=n_samples,
+        lo_idx=lo_idx,
+        hi_idx=hi_idx,
+        cfg=cfg,
+        engine="streaming",
+    )
+
+
+def _build_movement_calibration_result(
+    *,
+    percentile_lo: float,
+    percentile_hi: float,
+    center: float,
+    n_samples: int,
+    lo_idx: int,
+    hi_idx: int,
+    cfg: PipelineConfig,
+    engine: str,
+) -> CalibrationResult:
     amplitude = max(
         0.5 * (percentile_hi - percentile_lo),
         float(cfg.calibration.amplitude_floor),
@@ -949,18 +1937,29 @@ def _run_movement_calibration(
         saturated_count=0,
         lo_idx=lo_idx,
         hi_idx=hi_idx,
+        engine=engine,
     )
 
 
-def _build_fixed_reference_state(
+def build_fixed_reference_state(
     calibration_samples: list[float] | np.ndarray,
     calibration_result: CalibrationResult,
     amplitude_floor: float,
 ) -> AdaptiveRangeState:
+    """Build the fixed adaptive-range state that movement mode reports."""
+
     samples = np.asarray(calibration_samples, dtype=float).reshape(-1)
+    abs_dev_ema = float(np.mean(np.abs(samples - float(calibration_result.center))))
+    return _fixed_reference_state_from_abs_dev(abs_dev_ema, calibration_result, amplitude_floor)
+
+
+def _fixed_reference_state_from_abs_dev(
+    abs_dev_ema: float,
+    calibration_result: CalibrationResult,
+    amplitude_floor: float,
+) -> AdaptiveRangeState:
     center = float(calibration_result.center)
     amplitude = max(float(calibration_result.amplitude), float(amplitude_floor))
-    abs_dev_ema = float(np.mean(np.abs(samples - center)))
     abs_dev_to_amplitude_scale = amplitude / max(abs_dev_ema, 1e-12)
     return AdaptiveRangeState(
         center=center,
@@ -304,7 +304,7 @@ def _update_raw_event_markers(
     trough_times: Sequence[float] | np.ndarray | None,
     trough_values: Sequence[float] | np.ndarray | None,
 ) -> None:
-    _replace_raw_event_marker(
+    _update_raw_event_marker(
         ax,
         artist_attr_name="_peak_marker_artist",
         times=peak_times,
@@ -312,7 +312,7 @@ def _update_raw_event_markers(
         marker="^",
         color="tab:red",
     )
-    _replace_raw_event_marker(
+    _update_raw_event_marker(
         ax,
         artist_attr_name="_trough_marker_artist",
         times=trough_times,
@@ -322,7 +322,7 @@ def _update_raw_event_markers(
     )
 
 
-def _replace_raw_event_marker(
+def _update_raw_event_marker(
     ax: Axes,
     *,
     artist_attr_name: str,
@@ -331,22 +331,26 @@ def _replace_raw_event_marker(
     marker: str,
     color: str,
 ) -> None:
+    if times is None or values is None:
+        offsets = np.empty((0, 2), dtype=float)
+    else:
+        marker_x = np.asarray(times, dtype=float)
+        marker_y = np.asarray(values, dtype=float)
+        count = min(marker_x.size, marker_y.size)
+        offsets = np.column_stack((marker_x[:count], marker_y[:count]))
+
+    # The scatter artist is created once and then only has its offsets
+    # replaced, which avoids rebuilding a collection on every redraw.
     existing_artist = getattr(ax, artist_attr_name, None)
     if existing_artist is not None:
-        existing_artist.remove()
-        setattr(ax, artist_attr_name, None)
-
-    if times is None or values is None:
+        existing_artist.set_offsets(offsets)
         return
-
-    marker_x = np.asarray(times, dtype=float)
-    marker_y = np.asarray(values, dtype=float)
-    if marker_x.size == 0 or marker_y.size == 0:
+    if offsets.shape[0] == 0:
         return
 
     artist = ax.scatter(
-        marker_x,
-        marker_y,
+        offsets[:, 0],
+        offsets[:, 1],
         marker=marker,
         color=color,
         s=36,
@@ -356,6 +360,49 @@ def _replace_raw_event_marker(
     setattr(ax, artist_attr_name, artist)
 
 
+def decimate_min_max(
+    x_values: Sequence[float] | np.ndarray,
+    y_values: Sequence[float] | np.ndarray,
+    bin_count: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce a trace to the minimum and maximum of ``bin_count`` equal bins.
+
+    Each bin contributes its minimum and maximum sample in their original
+    order, so peaks and troughs survive at any zoom level while the line never
+    carries more than ``2 * bin_count`` points. Traces that are already short
+    enough are returned unchanged.
+    """
+
+    if bin_count <= 0:
+        raise ValueError("bin_count must be positive.")
+    x = np.asarray(x_values, dtype=float)
+    y = np.asarray(y_values, dtype=float)
+    if x.shape != y.shape:
+        raise ValueError("x_values and y_values must have matching shapes.")
+    sample_count = y.size
+    if sample_count <= 2 * bin_count:
+        return x, y
+
+    bin_width = -(-sample_count // bin_count)
+    padded = np.empty(bin_count * bin_width, dtype=float)
+    padded[:sample_count] = y
+    padded[sample_count:] = y[-1]
+    bins = padded.reshape(bin_count, bin_width)
+    min_positions = np.argmin(bins, axis=1)
+    max_positions = np.argmax(bins, axis=1)
+    bin_starts = np.arange(bin_count) * bin_width
+    positions = np.column_stack(
+        (
+            bin_starts + np.minimum(min_positions, max_positions),
+            bin_starts + np.maximum(min_positions, max_positions),
+        )
+    ).ravel()
+    positions = positions[positions < sample_count]
+    if positions[-1] != sample_count - 1:
+        positions = np.append(positions, sample_count - 1)
+    return x[positions], y[positions]
+
+
 def _show_live_figure() -> None:
     with warnings.catch_warnings():
         warnings.filterwarnings(
@@ -0,0 +1,347 @@
+"""Live plotting in a separate process fed through shared memory.
+
+With ``display.plot_backend = "process"`` the acquisition loop no longer
+redraws Matplotlib figures itself. It only copies each processed span into
+:class:`PlotSharedBuffer`, a set of fixed-size ring buffers in a
+``multiprocessing.shared_memory`` block, and a spawned child process redraws
+the dashboard from the newest window at ``display.plot_refresh_hz``,
+independent of the chunk cadence. Before drawing, the raw and normalized
+traces are min/max-decimated to ``display.plot_width_px`` bins.
+
+Writes are guarded by a sequence counter (odd while a write is in progress),
+so the child retries instead of drawing a torn window and the acquisition
+loop never waits for the plot. Closing the plot window only stops the child;
+acquisition continues.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import multiprocessing
+from multiprocessing import shared_memory
+import time
+from typing import Any
+
+import numpy as np
+
+
+PLOT_SERIES = ("raw", "normalized", "peak", "trough")
+
+# Header slots (int64): write sequence, one total-written count per series,
+# frames drawn by the child, and the stop request flag.
+_SEQUENCE_SLOT = 0
+_COUNT_SLOTS = {name: index + 1 for index, name in enumerate(PLOT_SERIES)}
+_FRAMES_SLOT = len(PLOT_SERIES) + 1
+_STOP_SLOT = len(PLOT_SERIES) + 2
+_HEADER_SLOTS = 8
+_SNAPSHOT_ATTEMPTS = 100
+
+
+@dataclass(frozen=True)
+class PlotProcessOptions:
+    """Settings passed to the plotting child process."""
+
+    refresh_hz: float
+    width_px: int
+    processing_mode: str
+    normalized_title: str
+    normalized_label: str
+    sampling_rate_hz: int
+    debug_window_bounds: bool
+
+
+@dataclass(frozen=True)
+class PlotSnapshot:
+    """Consistent copy of every plotted series, oldest sample first."""
+
+    sequence: int
+    series: dict[str, tuple[np.ndarray, np.ndarray]]
+
+
+class PlotSharedBuffer:
+    """Single-writer ring buffers of ``(x, y)`` points in shared memory."""
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        name: str | None = None,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive.")
+        self.capacity = capacity
+        series_bytes = capacity * 2 * np.dtype(np.float64).itemsize
+        size = _HEADER_SLOTS * np.dtype(np.int64).itemsize + len(PLOT_SERIES) * series_bytes
+        self._owner = name is None
+        self._shm = (
+            shared_memory.SharedMemory(create=True, size=size)
+            if name is None
+            else shared_memory.SharedMemory(name=name)
+        )
+        self._header = np.ndarray((_HEADER_SLOTS,), dtype=np.int64, buffer=self._shm.buf)
+        if self._owner:
+            self._header[:] = 0
+        self._series = {
+            series_name: np.ndarray(
+                (capacity, 2),
+                dtype=np.float64,
+                buffer=self._shm.buf,
+                offset=self._header.nbytes + index * series_bytes,
+            )
+            for index, series_name in enumerate(PLOT_SERIES)
+        }
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def frames_drawn(self) -> int:
+        return int(self._header[_FRAMES_SLOT])
+
+    @property
+    def stop_requested(self) -> bool:
+        return bool(self._header[_STOP_SLOT])
+
+    def request_stop(self) -> None:
+        self._header[_STOP_SLOT] = 1
+
+    def record_frame(self) -> None:
+        self._header[_FRAMES_SLOT] += 1
+
+    def append(self, **points: tuple[np.ndarray, np.ndarray]) -> None:
+        """Append ``(x, y)`` arrays to the named series in one guarded write."""
+
+        unknown = set(points) - set(PLOT_SERIES)
+        if unknown:
+            raise ValueError(f"Unknown plot series: {sorted(unknown)}.")
+        header = self._header
+        header[_SEQUENCE_SLOT] += 1
+        try:
+            for series_name, (x_values, y_values) in points.items():
+                self._append_series(series_name, x_values, y_values)
+        finally:
+            header[_SEQUENCE_SLOT] += 1
+
+    def snapshot(self) -> PlotSnapshot | None:
+        """Return a consistent copy of all series, or ``None`` if writes kept racing."""
+
+        header = self._header
+        for _ in range(_SNAPSHOT_ATTEMPTS):
+            sequence = int(header[_SEQUENCE_SLOT])
+            if sequence % 2:
+                time.sleep(0.0005)
+                continue
+            series = {
+                series_name: self._read_series(series_name) for series_name in PLOT_SERIES
+            }
+            if int(header[_SEQUENCE_SLOT]) == sequence:
+                return PlotSnapshot(sequence=sequence, series=series)
+        return None
+
+    def close(self) -> None:
+        """Release this handle and, for the creating side, the shared block."""
+
+        del self._header, self._series
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def _append_series(self, series_name: str, x_values: Any, y_values: Any) -> None:
+        x = np.asarray(x_values, dtype=np.float64)
+        y = np.asarray(y_values, dtype=np.float64)
+        if x.shape != y.shape or x.ndim != 1:
+            raise ValueError(f"{series_name} x and y values must be matching 1D arrays.")
+        if x.size == 0:
+            return
+        count_slot = _COUNT_SLOTS[series_name]
+        total_written = int(self._header[count_slot])
+        if x.size > self.capacity:
+            total_written += x.size - self.capacity
+            x = x[-self.capacity :]
+            y = y[-self.capacity :]
+        positions = (total_written + np.arange(x.size)) % self.capacity
+        data = self._series[series_name]
+        data[positions, 0] = x
+        data[positions, 1] = y
+        self._header[count_slot] = total_written + x.size
+
+    def _read_series(self, series_name: str) -> tuple[np.ndarray, np.ndarray]:
+        total_written = int(self._header[_COUNT_SLOTS[series_name]])
+        count = min(total_written, self.capacity)
+        positions = (total_written - count + np.arange(count)) % self.capacity
+        data = self._series[series_name][positions]
+        return data[:, 0], data[:, 1]
+
+
+class LivePlotProcess:
+    """Run the live dashboard in a spawned child process.
+
+    :meth:`append` is the only call made from the acquisition loop; it copies
+    one span of points into shared memory and never blocks on drawing.
+    """
+
+    def __init__(self, capacity: int, options: PlotProcessOptions) -> None:
+        self._buffer = PlotSharedBuffer(capacity)
+        context = multiprocessing.get_context("spawn")
+        self._process = context.Process(
+            target=run_plot_process,
+            args=(self._buffer.name, capacity, options),
+            name="LivePlotProcess",
+            daemon=True,
+        )
+        self._process.start()
+        self._closed_frames_drawn: int | None = None
+
+    @property
+    def frames_drawn(self) -> int:
+        if self._closed_frames_drawn is not None:
+            return self._closed_frames_drawn
+        return self._buffer.frames_drawn
+
+    def append(
+        self,
+        raw_x: np.ndarray,
+        raw_y: np.ndarray,
+        normalized_x: np.ndarray,
+        normalized_y: np.ndarray,
+        *,
+        peak_x: np.ndarray,
+        peak_y: np.ndarray,
+        trough_x: np.ndarray,
+        trough_y: np.ndarray,
+    ) -> None:
+        self._buffer.append(
+            raw=(raw_x, raw_y),
+            normalized=(normalized_x, normalized_y),
+            peak=(peak_x, peak_y),
+            trough=(trough_x, trough_y),
+        )
+
+    def close(self, timeout_s: float = 2.0) -> None:
+        """Ask the child to exit, terminate it if it does not, and free shared memory."""
+
+        if self._closed_frames_drawn is not None:
+            return
+        self._buffer.request_stop()
+        self._process.join(timeout_s)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._closed_frames_drawn = self._buffer.frames_drawn
+        self._buffer.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Return the frames drawn and the child's exit code for the session metadata."""
+
+        return {
+            "backend": "process",
+            "frames_drawn": self.frames_drawn,
+            "exitcode": self._process.exitcode,
+        }
+
+
+def plot_window_messages(
+    normalized_values: np.ndarray,
+    *,
+    processing_mode: str,
+    report_range: bool,
+) -> list[str]:
+    """Return the console diagnostics for the plotted normalized window."""
+
+    messages: list[str] = []
+    if normalized_values.size > 0:
+        window_min = float(np.min(normalized_values))
+        window_max = float(np.max(normalized_values))
+    else:
+        window_min = 0.0
+        window_max = 0.0
+    if report_range:
+        messages.append(
+            f"Plot window range check: min={window_min:.4f}, "
+            f"max={window_max:.4f}, points={normalized_values.size}"
+        )
+    if (
+        processing_mode != "movement"
+        and normalized_values.size > 0
+        and (window_min < 0.0 or window_max > 1.0)
+    ):
+        messages.append(
+            "WARNING: plotted window out of [0,1] "
+            f"(min={window_min:.6f}, max={window_max:.6f})"
+        )
+    return messages
+
+
+def run_plot_process(buffer_name: str, capacity: int, options: PlotProcessOptions) -> None:
+    """Child-process entry point: redraw the dashboard until asked to stop."""
+
+    import matplotlib.pyplot as plt
+
+    from .plot import decimate_min_max, setup_live_plots, update_live_plots
+
+    buffer = PlotSharedBuffer(capacity, name=buffer_name)
+    frame_interval_s = 1.0 / options.refresh_hz
+    movement = options.processing_mode == "movement"
+    last_sequence = -1
+    last_reported_second: int | None = None
+    try:
+        fig, raw_ax, raw_line, normalized_ax, normalized_line, _ = setup_live_plots(
+            normalized_title=options.normalized_title,
+            normalized_label=options.normalized_label,
+        )
+        while not buffer.stop_requested and plt.fignum_exists(fig.number):
+            frame_started = time.perf_counter()
+            snapshot = buffer.snapshot()
+            if snapshot is not None and snapshot.sequence != last_sequence:
+                last_sequence = snapshot.sequence
+                raw_x, raw_y = snapshot.series["raw"]
+                normalized_x, normalized_y = snapshot.series["normalized"]
+                if raw_x.size > 0:
+                    report_range = False
+                    if options.debug_window_bounds and normalized_x.size > 0:
+                        current_second = int(normalized_x[-1]) // options.sampling_rate_hz
+                        report_range = current_second != last_reported_second
+                        last_reported_second = current_second
+                    for message in plot_window_messages(
+                        normalized_y,
+                        processing_mode=options.processing_mode,
+                        report_range=report_range,
+                    ):
+                        print(message, flush=True)
+
+                    window_start = float(raw_x[0])
+                    peak_x, peak_y = snapshot.series["peak"]
+                    trough_x, trough_y = snapshot.series["trough"]
+                    peak_visible = peak_x >= window_start
+                    trough_visible = trough_x >= window_start
+                    raw_x, raw_y = decimate_min_max(raw_x, raw_y, options.width_px)
+                    normalized_x, normalized_y = decimate_min_max(
+                        normalized_x,
+                        normalized_y,
+                        options.width_px,
+                    )
+                    update_live_plots(
+                        raw_y,
+                        raw_x,
+                        normalized_y,
+                        normalized_x,
+                        raw_ax=raw_ax,
+                        raw_line=raw_line,
+                        normalized_ax=normalized_ax,
+                        normalized_line=normalized_line,
+                        peak_times=peak_x[peak_visible],
+                        peak_values=peak_y[peak_visible],
+                        trough_times=trough_x[trough_visible],
+                        trough_values=trough_y[trough_visible],
+                        normalized_clip_range=None if movement else (0.0, 1.0),
+                        normalized_fixed_ylim=None if movement else (0.0, 1.0),
+                        normalized_autoscale_y=movement,
+                    )
+                    buffer.record_frame()
+            remaining_s = frame_interval_s - (time.perf_counter() - frame_started)
+            # plt.pause keeps the GUI responsive while waiting for the next frame.
+            plt.pause(max(remaining_s, 0.001))
+        plt.close(fig)
+    finally:
+        buffer.close()
@@ -16,6 +16,7 @@ regression tests.
 
 from __future__ import annotations
 
+import math
 import time
 
 import numpy as np
@@ -185,6 +186,162 @@ def smooth_signal(signal: np.ndarray, window: int = 31) -> np.ndarray:
     return np.convolve(padded, kernel, mode="valid")
 
 
+class SosFilter:
+    """Stateful cascade of direct-form-II-transposed biquad sections.
+
+    The coefficients are converted once: to an ``sosfilt``-layout array for
+    :meth:`process` and to plain Python floats for :meth:`step`, which avoids
+    the per-call array allocation and argument validation of
+    ``sosfilt(sos, [sample], zi=zi)``. The delay state is kept in the form the
+    last call used (an ndarray after :meth:`process`, a float list after
+    :meth:`step`) and only converted when the caller switches between the
+    two. The recursion is the one ``sosfilt`` uses, so :meth:`step` and
+    :meth:`process` match it sample for sample.
+    """
+
+    __slots__ = ("_sos", "_sections", "_zi", "_state")
+
+    def __init__(self, sos: np.ndarray, zi: np.ndarray | None = None) -> None:
+        sos_array = np.array(sos, dtype=float)
+        if sos_array.ndim != 2 or sos_array.shape[1] != 6 or sos_array.shape[0] == 0:
+            raise ValueError(f"sos must have shape (n_sections, 6), got {sos_array.shape}.")
+        if not np.all(sos_array[:, 3] == 1.0):
+            raise ValueError("sos sections must be normalized so that a0 == 1.")
+        self._sos = sos_array
+        self._sections = [
+            (float(b0), float(b1), float(b2), float(a1), float(a2))
+            for b0, b1, b2, _, a1, a2 in sos_array.tolist()
+        ]
+        if zi is None:
+            self._zi: np.ndarray | None = np.zeros((len(self._sections), 2), dtype=float)
+        else:
+            zi_array = np.array(zi, dtype=float)
+            if zi_array.shape != (len(self._sections), 2):
+                raise ValueError(
+                    f"zi must have shape ({len(self._sections)}, 2), got {zi_array.shape}."
+                )
+            self._zi = zi_array
+        self._state: list[float] | None = None
+
+    @property
+    def sos(self) -> np.ndarray:
+        """Return a copy of the second-order-section coefficients in ``sosfilt`` layout."""
+
+        return self._sos.copy()
+
+    @property
+    def zi(self) -> np.ndarray:
+        """Return a copy of the current delay state in ``sosfilt`` layout."""
+
+        if self._zi is None:
+            return np.asarray(self._state, dtype=float).reshape(len(self._sections), 2)
+        return self._zi.copy()
+
+    def step(self, sample: float) -> float:
+        """Filter one sample and advance the delay state."""
+
+        state = self._state
+        if state is None:
+            state = self._state = self._zi.reshape(-1).tolist()
+            self._zi = None
+        value = float(sample)
+        offset = 0
+        for b0, b1, b2, a1, a2 in self._sections:
+            filtered = b0 * value + state[offset]
+            state[offset] = b1 * value - a1 * filtered + state[offset + 1]
+            state[offset + 1] = b2 * value - a2 * filtered
+            value = filtered
+            offset += 2
+        return value
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Filter one block of samples and advance the delay state."""
+
+        samples = np.asarray(block, dtype=float)
+        if samples.ndim != 1:
+            raise ValueError(f"block must be one-dimensional, got shape {samples.shape}.")
+        if samples.size == 0:
+            return samples.copy()
+        zi = self._zi
+        if zi is None:
+            zi = np.asarray(self._state, dtype=float).reshape(len(self._sections), 2)
+            self._state = None
+        filtered, self._zi = sosfilt(self._sos, samples, zi=zi)
+        return filtered
+
+
+class RunningMean:
+    """Fixed-capacity window of recent values with an O(1) running mean.
+
+    Values live in a preallocated ring and the window sum is updated
+    incrementally. The sum is recomputed exactly each time the ring wraps so
+    rounding error from repeated add/subtract cannot accumulate, which keeps
+    the amortized cost per append constant.
+    """
+
+    __slots__ = ("_values", "_maxlen", "_count", "_next_index", "_sum")
+
+    def __init__(self, maxlen: int) -> None:
+        if int(maxlen) <= 0:
+            raise ValueError("maxlen must be positive.")
+        self._maxlen = int(maxlen)
+        self._values = [0.0] * self._maxlen
+        self._count = 0
+        self._next_index = 0
+        self._sum = 0.0
+
+    @property
+    def maxlen(self) -> int:
+        """Return the window capacity."""
+
+        return self._maxlen
+
+    @property
+    def is_full(self) -> bool:
+        """Return whether the window holds ``maxlen`` values."""
+
+        return self._count == self._maxlen
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        start = self._next_index if self.is_full else 0
+        for offset in range(self._count):
+            yield self._values[(start + offset) % self._maxlen]
+
+    def append(self, value: float) -> None:
+        """Add one value, evicting the oldest one once the window is full."""
+
+        value = float(value)
+        index = self._next_index
+        if self._count == self._maxlen:
+            self._sum += value - self._values[index]
+        else:
+            self._sum += value
+            self._count += 1
+        self._values[index] = value
+        index += 1
+        if index == self._maxlen:
+            index = 0
+            self._sum = math.fsum(self._values[: self._count])
+        self._next_index = index
+
+    def clear(self) -> None:
+        """Drop all values while keeping the window capacity."""
+
+        self._count = 0
+        self._next_index = 0
+        self._sum = 0.0
+
+    def mean(self) -> float:
+        """Return the mean of the stored values, or ``nan`` when empty."""
+
+        if self._count == 0:
+            return float("nan")
+        return self._sum / self._count
+
+
 def high_pass_filter(
     data: np.ndarray,
     cutoff: float,
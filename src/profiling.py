@@ -0,0 +1,318 @@
+"""Opt-in profiling of the live acquisition loop (``--profile``).
+
+Two profilers share one interface. The acquisition loop calls ``resume()``
+when a chunk has been dequeued and ``pause()`` when it has been fully
+handled, so idle waits for the device are excluded from the main thread's
+profile:
+
+- ``cprofile`` runs :mod:`cProfile` only inside the loop body. Timings are
+  exact but every Python call pays the tracing overhead.
+- ``sample`` starts a daemon thread that records the stacks of all threads
+  every ``interval_s``. The reader, LSL sender and writer threads are sampled
+  for the whole run and the acquisition thread only inside the loop body. The
+  overhead is low and independent of the call rate.
+
+:meth:`LoopProfiler.write` stores ``profile.pstats`` (loadable with
+:class:`pstats.Stats` or snakeviz) and ``profile.collapsed`` (one
+``frame;frame;... weight`` line per stack, the input format of
+``flamegraph.pl`` and speedscope) in the session directory. Weights are
+microseconds. For ``cprofile``, the collapsed stacks are reconstructed from
+the caller graph by splitting each callee's time in proportion to its calls
+from each caller. For ``sample``, the pstats entries are derived from sample
+counts.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+import cProfile
+import marshal
+import os
+from pathlib import Path
+import pstats
+import sys
+import threading
+import time
+from types import FrameType
+from typing import Any
+
+PROFILE_MODES = ("cprofile", "sample")
+PSTATS_FILENAME = "profile.pstats"
+COLLAPSED_FILENAME = "profile.collapsed"
+
+_FunctionKey = tuple[str, int, str]
+_MAX_COLLAPSED_DEPTH = 200
+
+
+class LoopProfiler:
+    """Common interface of the live-loop profilers."""
+
+    mode = ""
+
+    def start(self) -> None:
+        """Begin a profiled run."""
+
+    def resume(self) -> None:
+        """Enter the profiled loop body."""
+
+    def pause(self) -> None:
+        """Leave the profiled loop body."""
+
+    def stop(self) -> None:
+        """End the profiled run; safe to call more than once."""
+
+    def summary(self) -> dict[str, Any] | None:
+        """Return a JSON-ready description for the session metadata."""
+
+        return None
+
+    def write(self, output_dir: str | Path) -> tuple[Path, Path] | None:
+        """Write the pstats and collapsed-stack files into ``output_dir``."""
+
+        del output_dir
+        return None
+
+
+class CProfileLoopProfiler(LoopProfiler):
+    """Deterministic :mod:`cProfile` profiler restricted to the loop body."""
+
+    mode = "cprofile"
+
+    def __init__(self) -> None:
+        self._profile = cProfile.Profile()
+        self._active = False
+        self._sections = 0
+
+    def resume(self) -> None:
+        if not self._active:
+            self._profile.enable()
+            self._active = True
+            self._sections += 1
+
+    def pause(self) -> None:
+        if self._active:
+            self._profile.disable()
+            self._active = False
+
+    def stop(self) -> None:
+        self.pause()
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "profiled_sections": self._sections,
+            "pstats_file": PSTATS_FILENAME,
+            "collapsed_file": COLLAPSED_FILENAME,
+        }
+
+    def write(self, output_dir: str | Path) -> tuple[Path, Path]:
+        self.stop()
+        output_path = Path(output_dir)
+        pstats_path = output_path / PSTATS_FILENAME
+        self._profile.dump_stats(pstats_path)
+        collapsed_path = output_path / COLLAPSED_FILENAME
+        _write_collapsed(collapsed_path, collapsed_from_pstats(pstats.Stats(str(pstats_path)).stats))
+        return pstats_path, collapsed_path
+
+
+class SamplingLoopProfiler(LoopProfiler):
+    """Periodic stack sampler over every thread of the process."""
+
+    mode = "sample"
+
+    def __init__(self, interval_s: float = 0.005) -> None:
+        if interval_s <= 0.0:
+            raise ValueError("interval_s must be positive.")
+        self.interval_s = float(interval_s)
+        self.samples = 0
+        self._stacks: Counter[tuple[str, tuple[_FunctionKey, ...]]] = Counter()
+        self._target_thread_id = threading.get_ident()
+        self._in_body = False
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_at: float | None = None
+        self._elapsed_s = 0.0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._target_thread_id = threading.get_ident()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="LoopProfilerSampler",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def resume(self) -> None:
+        self._in_body = True
+
+    def pause(self) -> None:
+        self._in_body = False
+
+    def stop(self) -> None:
+        self._in_body = False
+        thread = self._thread
+        if thread is None or self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        thread.join()
+        if self._started_at is not None:
+            self._elapsed_s = time.perf_counter() - self._started_at
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "interval_s": self.interval_s,
+            "samples": self.samples,
+            "sampled_stacks": sum(self._stacks.values()),
+            "elapsed_s": self._elapsed_s,
+            "pstats_file": PSTATS_FILENAME,
+            "collapsed_file": COLLAPSED_FILENAME,
+        }
+
+    def write(self, output_dir: str | Path) -> tuple[Path, Path]:
+        self.stop()
+        output_path = Path(output_dir)
+        weight_us = self.interval_s * 1e6
+        collapsed = Counter()
+        for (thread_name, stack), count in self._stacks.items():
+            frames = [thread_name, *(_frame_label(key) for key in stack)]
+            collapsed[";".join(frames)] += int(round(count * weight_us))
+        collapsed_path = output_path / COLLAPSED_FILENAME
+        _write_collapsed(collapsed_path, collapsed)
+        pstats_path = output_path / PSTATS_FILENAME
+        with pstats_path.open("wb") as handle:
+            marshal.dump(self._sampled_pstats(), handle)
+        return pstats_path, collapsed_path
+
+    def _run(self) -> None:
+        sampler_thread_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval_s):
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            self.samples += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == sampler_thread_id:
+                    continue
+                if thread_id == self._target_thread_id and not self._in_body:
+                    continue
+                thread_name = thread_names.get(thread_id, f"thread-{thread_id}")
+                self._stacks[(thread_name, _frame_stack(frame))] += 1
+
+    def _sampled_pstats(self) -> dict[_FunctionKey, tuple]:
+        """Build a :mod:`pstats`-compatible dict with sample times as timings."""
+
+        self_counts: Counter[_FunctionKey] = Counter()
+        inclusive_counts: Counter[_FunctionKey] = Counter()
+        edge_counts: Counter[tuple[_FunctionKey, _FunctionKey]] = Counter()
+        edge_self_counts: Counter[tuple[_FunctionKey, _FunctionKey]] = Counter()
+        for (_, stack), count in self._stacks.items():
+            if not stack:
+                continue
+            self_counts[stack[-1]] += count
+            for key in set(stack):
+                inclusive_counts[key] += count
+            for edge in set(zip(stack, stack[1:])):
+                edge_counts[edge] += count
+            if len(stack) > 1:
+                edge_self_counts[(stack[-2], stack[-1])] += count
+
+        interval_s = self.interval_s
+        callers: dict[_FunctionKey, dict[_FunctionKey, tuple]] = {
+            key: {} for key in inclusive_counts
+        }
+        for (caller, callee), count in edge_counts.items():
+            callers[callee][caller] = (
+                count,
+                count,
+                edge_self_counts[(caller, callee)] * interval_s,
+                count * interval_s,
+            )
+        return {
+            key: (
+                count,
+                count,
+                self_counts[key] * interval_s,
+                count * interval_s,
+                callers[key],
+            )
+            for key, count in inclusive_counts.items()
+        }
+
+
+def create_loop_profiler(mode: str | None, *, interval_s: float = 0.005) -> LoopProfiler:
+    """Return the profiler for ``--profile MODE``, or a no-op one for ``None``."""
+
+    if mode is None:
+        return LoopProfiler()
+    if mode == "cprofile":
+        return CProfileLoopProfiler()
+    if mode == "sample":
+        return SamplingLoopProfiler(interval_s)
+    raise ValueError(f"profile mode must be one of {', '.join(PROFILE_MODES)}.")
+
+
+def collapsed_from_pstats(stats: dict[_FunctionKey, tuple]) -> Counter[str]:
+    """Reconstruct collapsed stacks (weights in microseconds) from a pstats dict.
+
+    cProfile only records caller/callee pairs, so each function's time on a
+    given path is its total time scaled by the share of calls that reached it
+    from that path's caller.
+    """
+
+    callees: dict[_FunctionKey, list[tuple[_FunctionKey, float]]] = {}
+    for callee, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((callee, float(edge[3])))
+    roots = [
+        key
+        for key, (_, _, _, _, callers) in stats.items()
+        if not any(caller in stats for caller in callers)
+    ]
+
+    collapsed: Counter[str] = Counter()
+
+    def walk(key: _FunctionKey, path: tuple[_FunctionKey, ...], time_s: float) -> None:
+        total_s = float(stats[key][3])
+        share = time_s / total_s if total_s > 0.0 else 0.0
+        labels = ";".join(_frame_label(frame) for frame in path)
+        self_us = int(round(float(stats[key][2]) * share * 1e6))
+        if self_us > 0:
+            collapsed[labels] += self_us
+        if len(path) >= _MAX_COLLAPSED_DEPTH:
+            return
+        for callee, edge_time_s in callees.get(key, ()):
+            child_time_s = edge_time_s * share
+            if callee in path or child_time_s * 1e6 < 1.0:
+                continue
+            walk(callee, (*path, callee), child_time_s)
+
+    for root in roots:
+        walk(root, (root,), float(stats[root][3]))
+    return collapsed
+
+
+def _frame_stack(frame: FrameType | None) -> tuple[_FunctionKey, ...]:
+    stack: list[_FunctionKey] = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+
+def _frame_label(key: _FunctionKey) -> str:
+    filename, line, name = key
+    if filename == "~":
+        # cProfile's key for built-in functions.
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{line})"
+    return label.replace(";", ",")
+
+
+def _write_collapsed(path: Path, collapsed: Counter[str]) -> None:
+    lines = [f"{stack} {weight}" for stack, weight in collapsed.most_common() if weight > 0]
+    path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
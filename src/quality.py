@@ -3,10 +3,32 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-import math
+from functools import lru_cache
 
+import numpy as np
+from scipy.signal import lfilter
+
+from .calibration import tau_to_alpha
 from .settings import RawQCConfig
 
+_EVENT_MESSAGES = {
+    "saturation": (
+        "Raw sample reached the configured saturation threshold. "
+        "This may indicate clipping or excessive belt tension."
+    ),
+    "flatline": (
+        "Raw signal remained effectively flat for the configured duration. "
+        "This may indicate sensor disconnection or a stalled signal."
+    ),
+    "baseline_shift": (
+        "Raw baseline shifted abruptly beyond the configured threshold. "
+        "This may indicate belt slip or a sudden posture change."
+    ),
+}
+
+# Below this chunk length the per-sample loop beats the vectorized path.
+_MIN_VECTORIZED_SAMPLES = 32
+
 
 @dataclass(frozen=True)
 class RawQCEvent:
@@ -45,6 +67,16 @@ class RawQCState:
     last_event_sample_index: int | None = None
 
 
+@dataclass(frozen=True)
+class _RawQCConstants:
+    flatline_samples: int
+    warmup_samples: int
+    alpha_baseline: float
+    decay_baseline: float
+    alpha_abs_dev: float
+    decay_abs_dev: float
+
+
 def create_raw_qc_state() -> RawQCState:
     """Create an empty raw-QC state object."""
 
@@ -62,6 +94,7 @@ def update_raw_qc(
 ) -> tuple[list[RawQCEvent], RawQCState]:
     """Update raw-signal QC state and emit any new QC episode events."""
 
+    constants = _qc_constants(cfg, float(fs_hz))
     events: list[RawQCEvent] = []
     raw_float = float(raw_value)
     state.samples_seen += 1
@@ -74,23 +107,11 @@ def update_raw_qc(
         events.append(
             _record_event(
                 state,
-                RawQCEvent(
-                    event_type="saturation",
-                    stage=stage,
-                    sample_index=sample_index,
-                    relative_time_s=relative_time_s,
-                    raw_value=raw_float,
-                    threshold=float(threshold),
-                    message=(
-                        "Raw sample reached the configured saturation threshold. "
-                        "This may indicate clipping or excessive belt tension."
-                    ),
-                ),
+                _qc_event("saturation", stage, sample_index, relative_time_s, raw_float, threshold),
             )
         )
     state.saturation_active = saturated
 
-    flatline_samples = max(1, int(round(cfg.flatline_duration_s * fs_hz)))
     if state.last_raw_value is None:
         state.flatline_run_samples = 1
     elif abs(raw_float - state.last_raw_value) <= cfg.flatline_epsilon:
@@ -98,21 +119,17 @@ def update_raw_qc(
     else:
         state.flatline_run_samples = 1
         state.flatline_active = False
-    if state.flatline_run_samples >= flatline_samples and not state.flatline_active:
+    if state.flatline_run_samples >= constants.flatline_samples and not state.flatline_active:
         events.append(
             _record_event(
                 state,
-                RawQCEvent(
-                    event_type="flatline",
-                    stage=stage,
-                    sample_index=sample_index,
-                    relative_time_s=relative_time_s,
-                    raw_value=raw_float,
-                    threshold=float(cfg.flatline_epsilon),
-                    message=(
-                        "Raw signal remained effectively flat for the configured duration. "
-                        "This may indicate sensor disconnection or a stalled signal."
-                    ),
+                _qc_event(
+                    "flatline",
+                    stage,
+                    sample_index,
+                    relative_time_s,
+                    raw_float,
+                    cfg.flatline_epsilon,
                 ),
             )
         )
@@ -125,7 +142,7 @@ def update_raw_qc(
         relative_time_s=relative_time_s,
         state=state,
         cfg=cfg,
-        fs_hz=fs_hz,
+        constants=constants,
         events=events,
     )
 
@@ -133,6 +150,150 @@ def update_raw_qc(
     return events, state
 
 
+def update_raw_qc_block(
+    raw_values: np.ndarray,
+    stage: str,
+    sample_indices: np.ndarray,
+    relative_times_s: np.ndarray,
+    state: RawQCState,
+    cfg: RawQCConfig,
+    fs_hz: float,
+) -> tuple[list[tuple[int, RawQCEvent]], RawQCState]:
+    """Update raw-signal QC state for a contiguous chunk of samples.
+
+    Emits the same events and leaves the same state as calling
+    :func:`update_raw_qc` once per sample, but the saturation and flatline
+    checks are array operations and the baseline EMAs run through
+    :func:`scipy.signal.lfilter` with the state carried between chunks.
+    Events are returned as ``(offset, event)`` pairs in emission order.
+    Chunks shorter than ``_MIN_VECTORIZED_SAMPLES`` go through the per-sample
+    path, which is cheaper than the fixed NumPy overhead at that size.
+    """
+
+    raw_array = np.asarray(raw_values, dtype=float)
+    if raw_array.ndim != 1:
+        raise ValueError(
+            f"raw_values must be one-dimensional, got shape {tuple(raw_array.shape)}."
+        )
+    sample_count = int(raw_array.shape[0])
+    if sample_count == 0:
+        return [], state
+    index_list = np.asarray(sample_indices).tolist()
+    time_list = np.asarray(relative_times_s, dtype=float).tolist()
+    if len(index_list) != sample_count or len(time_list) != sample_count:
+        raise ValueError("sample_indices and relative_times_s must match raw_values in length.")
+    if sample_count < _MIN_VECTORIZED_SAMPLES:
+        events: list[tuple[int, RawQCEvent]] = []
+        for offset, raw_value in enumerate(raw_array.tolist()):
+            sample_events, state = update_raw_qc(
+                raw_value,
+                stage,
+                index_list[offset],
+                time_list[offset],
+                state,
+                cfg,
+                fs_hz,
+            )
+            events.extend((offset, event) for event in sample_events)
+        return events, state
+
+    constants = _qc_constants(cfg, float(fs_hz))
+    samples_seen = state.samples_seen + np.arange(1, sample_count + 1)
+    found: list[tuple[int, int, str, float]] = []
+
+    low = raw_array <= cfg.raw_saturation_lo
+    saturated = low | (raw_array >= cfg.raw_saturation_hi)
+    previous_saturated = np.concatenate(([state.saturation_active], saturated[:-1]))
+    for offset in np.flatnonzero(saturated & ~previous_saturated).tolist():
+        threshold = cfg.raw_saturation_lo if low[offset] else cfg.raw_saturation_hi
+        found.append((offset, 0, "saturation", threshold))
+    state.saturation_samples += int(np.count_nonzero(saturated))
+    state.saturation_active = bool(saturated[-1])
+
+    # A flat run continues while consecutive samples stay within epsilon. The
+    # episode fires on the first sample of a run that reaches the configured
+    # length, unless it was already reported before this chunk.
+    positions = np.arange(sample_count)
+    first_value = np.nan if state.last_raw_value is None else state.last_raw_value
+    previous_values = np.concatenate(([first_value], raw_array[:-1]))
+    steady = np.abs(raw_array - previous_values) <= cfg.flatline_epsilon
+    run_start = np.maximum.accumulate(np.where(steady, -1, positions))
+    run_lengths = np.where(
+        run_start >= 0,
+        positions - run_start + 1,
+        state.flatline_run_samples + positions + 1,
+    )
+    carried_run = run_start < 0
+    if state.last_raw_value is None:
+        # The very first sample starts a run without clearing the episode.
+        carried_run |= run_start == 0
+    reached = run_lengths >= constants.flatline_samples
+    reached_earlier = np.concatenate(([False], reached[:-1])) & steady
+    flatline = reached & ~reached_earlier
+    if state.flatline_active:
+        flatline &= ~carried_run
+    for offset in np.flatnonzero(flatline).tolist():
+        found.append((offset, 1, "flatline", cfg.flatline_epsilon))
+    state.flatline_active = bool(reached[-1] or (carried_run[-1] and state.flatline_active))
+    state.flatline_run_samples = int(run_lengths[-1])
+
+    first = 0
+    if state.baseline_ema is None:
+        state.baseline_ema = float(raw_array[0])
+        state.abs_dev_ema = 0.0
+        first = 1
+    if first < sample_count:
+        values = raw_array[first:]
+        baseline, _ = lfilter(
+            [constants.alpha_baseline],
+            [1.0, -constants.decay_baseline],
+            values,
+            zi=[constants.decay_baseline * state.baseline_ema],
+        )
+        deviation = np.abs(values - np.concatenate(([state.baseline_ema], baseline[:-1])))
+        abs_dev, _ = lfilter(
+            [constants.alpha_abs_dev],
+            [1.0, -constants.decay_abs_dev],
+            deviation,
+            zi=[constants.decay_abs_dev * state.abs_dev_ema],
+        )
+        previous_abs_dev = np.concatenate(([state.abs_dev_ema], abs_dev[:-1]))
+        thresholds = np.maximum(
+            cfg.baseline_shift_sigma * np.maximum(previous_abs_dev, 1e-6),
+            cfg.baseline_shift_floor,
+        )
+        shifted = (samples_seen[first:] >= constants.warmup_samples) & (deviation > thresholds)
+        previous_shifted = np.concatenate(([state.baseline_shift_active], shifted[:-1]))
+        for offset in np.flatnonzero(shifted & ~previous_shifted).tolist():
+            found.append((first + offset, 2, "baseline_shift", float(thresholds[offset])))
+        state.baseline_shift_active = bool(shifted[-1])
+        state.baseline_ema = float(baseline[-1])
+        state.abs_dev_ema = float(abs_dev[-1])
+
+    state.samples_seen += sample_count
+    state.last_raw_value = float(raw_array[-1])
+
+    found.sort()
+    events = [
+        (
+            offset,
+            _record_event(
+                state,
+                _qc_event(
+                    event_type,
+                    stage,
+                    index_list[offset],
+                    time_list[offset],
+                    float(raw_array[offset]),
+                    threshold,
+                ),
+            ),
+        )
+        for offset, _, event_type, threshold in found
+    ]
+    return events, state
+
+
 def raw_qc_summary(state: RawQCState) -> dict[str, object]:
     """Convert raw-QC state into a metadata-friendly summary mapping."""
 
@@ -154,7 +315,7 @@ def _update_baseline_shift_qc(
     relative_time_s: float,
     state: RawQCState,
     cfg: RawQCConfig,
-    fs_hz: float,
+    constants: _RawQCConstants,
     events: list[RawQCEvent],
 ) -> RawQCState:
     if state.baseline_ema is None:
@@ -163,38 +324,56 @@ def _update_baseline_shift_qc(
         return state
 
     deviation = abs(raw_float - state.baseline_ema)
-    warmup_samples = max(1, int(round(cfg.warmup_s * fs_hz)))
     threshold = max(cfg.baseline_shift_sigma * max(state.abs_dev_ema, 1e-6), cfg.baseline_shift_floor)
-    baseline_shift = state.samples_seen >= warmup_samples and deviation > threshold
+    baseline_shift = state.samples_seen >= constants.warmup_samples and deviation > threshold
 
     if baseline_shift and not state.baseline_shift_active:
         events.append(
             _record_event(
                 state,
-                RawQCEvent(
-                    event_type="baseline_shift",
-                    stage=stage,
-                    sample_index=sample_index,
-                    relative_time_s=relative_time_s,
-                    raw_value=raw_float,
-                    threshold=float(threshold),
-                    message=(
-                        "Raw baseline shifted abruptly beyond the configured threshold. "
-                        "This may indicate belt slip or a sudden posture change."
-                    ),
+                _qc_event(
+                    "baseline_shift",
+                    stage,
+                    sample_index,
+                    relative_time_s,
+                    raw_float,
+                    threshold,
                 ),
             )
         )
 
     state.baseline_shift_active = baseline_shift
 
-    alpha_baseline = _tau_to_alpha(cfg.baseline_ema_tau_s, fs_hz)
-    alpha_abs_dev = _tau_to_alpha(cfg.baseline_abs_dev_tau_s, fs_hz)
-    state.baseline_ema = state.baseline_ema + alpha_baseline * (raw_float - state.baseline_ema)
-    state.abs_dev_ema = state.abs_dev_ema + alpha_abs_dev * (deviation - state.abs_dev_ema)
+    # Written as ``alpha * x + (1 - alpha) * y`` so the per-sample update
+    # rounds exactly like the lfilter recursion in update_raw_qc_block.
+    state.baseline_ema = (
+        constants.alpha_baseline * raw_float + constants.decay_baseline * state.baseline_ema
+    )
+    state.abs_dev_ema = (
+        constants.alpha_abs_dev * deviation + constants.decay_abs_dev * state.abs_dev_ema
+    )
     return state
 
 
+def _qc_event(
+    event_type: str,
+    stage: str,
+    sample_index: int,
+    relative_time_s: float,
+    raw_value: float,
+    threshold: float,
+) -> RawQCEvent:
+    return RawQCEvent(
+        event_type=event_type,
+        stage=stage,
+        sample_index=sample_index,
+        relative_time_s=relative_time_s,
+        raw_value=raw_value,
+        threshold=float(threshold),
+        message=_EVENT_MESSAGES[event_type],
+    )
+
+
 def _record_event(state: RawQCState, event: RawQCEvent) -> RawQCEvent:
     state.event_counts[event.event_type] = state.event_counts.get(event.event_type, 0) + 1
     if state.first_event_sample_index is None:
@@ -203,7 +382,15 @@ def _record_event(state: RawQCState, event: RawQCEvent) -> RawQCEvent:
     return event
 
 
-def _tau_to_alpha(tau_s: float, fs_hz: float) -> float:
-    if tau_s <= 0.0:
-        return 1.0
-    return 1.0 - math.exp(-1.0 / (fs_hz * tau_s))
+@lru_cache(maxsize=16)
+def _qc_constants(cfg: RawQCConfig, fs_hz: float) -> _RawQCConstants:
+    alpha_baseline = tau_to_alpha(cfg.baseline_ema_tau_s, fs_hz)
+    alpha_abs_dev = tau_to_alpha(cfg.baseline_abs_dev_tau_s, fs_hz)
+    return _RawQCConstants(
+        flatline_samples=max(1, int(round(cfg.flatline_duration_s * fs_hz))),
+        warmup_samples=max(1, int(round(cfg.warmup_s * fs_hz))),
+        alpha_baseline=alpha_baseline,
+        decay_baseline=1.0 - alpha_baseline,
+        alpha_abs_dev=alpha_abs_dev,
+        decay_abs_dev=1.0 - alpha_abs_dev,
+    )
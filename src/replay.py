@@ -0,0 +1,344 @@
+"""Offline replay of recorded sessions through the live processing pipeline.
+
+A recorded session directory holds the raw device rows in
+``device_samples.csv`` (or the binary ``device_samples.bin`` table) next to
+``resolved_config.toml`` and ``session_metadata.json``. Replaying feeds those
+rows back through :func:`src.pipeline.process_device_rows` with the recorded
+(optionally overridden) configuration and writes the result as a fresh
+session with the same layout as a live run, so a replay can itself be
+replayed or compared against the original signal trace.
+
+Source-sample gaps in the recording reset the short-term pipeline state
+exactly as they did live. Replays run as fast as possible by default; with
+``realtime=True`` rows are released on the recorded capture-time schedule.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass
+from datetime import datetime
+import json
+from pathlib import Path
+import time
+from typing import Any, Mapping
+import warnings
+
+import numpy as np
+
+from . import __version__
+from .binary_export import binary_table_exists, read_binary_table
+from .calibration import AdaptiveRangeState, CalibrationResult
+from .connect import AcquiredBlock
+from .multichannel import (
+    create_multichannel_state,
+    multichannel_summary,
+    process_multichannel_rows,
+    reset_multichannel_state_for_source_gap,
+)
+from .pipeline import (
+    PipelineConfig,
+    ProcessingMode,
+    create_pipeline_state,
+    process_device_rows,
+    reset_pipeline_state_for_source_gap,
+)
+from .quality import raw_qc_summary
+from .session_writer import SessionWriter, build_session_metadata
+from .settings import AppConfig, apply_config_overrides, load_config
+
+_PROCESSING_MODE_NUMBERS: dict[str, int] = {"control": 1, "movement": 2, "adaptive": 3}
+_DEVICE_COLUMN_PREFIX = "device_col_"
+# Rows per pipeline batch when replaying as fast as possible. Large enough to
+# amortize per-batch overhead, small enough to keep memory flat on long runs.
+_FAST_REPLAY_CHUNK_ROWS = 4096
+
+
+@dataclass(frozen=True)
+class RecordedSession:
+    """Raw rows and settings loaded from one recorded session directory."""
+
+    session_dir: Path
+    config: AppConfig
+    processing_mode: ProcessingMode
+    rows: AcquiredBlock
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    """Summary of one completed replay."""
+
+    source_session_dir: Path
+    session_dir: Path
+    processing_mode: ProcessingMode
+    samples_processed: int
+    observed_gap_count: int
+    elapsed_s: float
+    calibration_result: CalibrationResult | None
+    adaptive_state: AdaptiveRangeState | None
+
+
+def load_recorded_session(session_dir: str | Path) -> RecordedSession:
+    """Load the resolved config, processing mode, and raw rows of a session."""
+
+    session_path = Path(session_dir)
+    device_samples_path = session_path / "device_samples.csv"
+    binary_device_samples = binary_table_exists(session_path / "device_samples")
+    if not binary_device_samples and not device_samples_path.exists():
+        raise FileNotFoundError(f"No device_samples export in session directory {session_path}.")
+    config_path = session_path / "resolved_config.toml"
+    if not config_path.exists():
+        raise FileNotFoundError(f"No resolved_config.toml in session directory {session_path}.")
+
+    config = load_config(config_path)
+    processing_mode: ProcessingMode = "control"
+    metadata_path = session_path / "session_metadata.json"
+    if metadata_path.exists():
+        metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+        processing_mode = _validated_processing_mode(metadata.get("processing_mode", "control"))
+
+    return RecordedSession(
+        session_dir=session_path,
+        config=config,
+        processing_mode=processing_mode,
+        rows=(
+            read_binary_device_samples(session_path / "device_samples")
+            if binary_device_samples
+            else read_device_samples(device_samples_path)
+        ),
+    )
+
+
+def read_device_samples(path: str | Path) -> AcquiredBlock:
+    """Read a ``device_samples.csv`` export back into one :class:`AcquiredBlock`."""
+
+    with Path(path).open("r", newline="", encoding="utf-8") as handle:
+        header = next(csv.reader([handle.readline()]), [])
+        try:
+            source_column = header.index("source_sample_index")
+            capture_column = header.index("capture_time_lsl_s")
+        except ValueError as error:
+            raise ValueError(f"{path} is not a device_samples.csv export.") from error
+        device_columns = [
+            idx for idx, name in enumerate(header) if name.startswith(_DEVICE_COLUMN_PREFIX)
+        ]
+        if not device_columns:
+            raise ValueError(f"{path} has no device_col_* columns.")
+
+        with warnings.catch_warnings():
+            # loadtxt warns on header-only files; an empty session is still valid.
+            warnings.simplefilter("ignore", UserWarning)
+            values = np.loadtxt(
+                handle,
+                delimiter=",",
+                usecols=(source_column, capture_column, *device_columns),
+                ndmin=2,
+            )
+
+    if values.shape[0] == 0:
+        return AcquiredBlock.empty(len(device_columns))
+    return AcquiredBlock(
+        device_rows=np.ascontiguousarray(values[:, 2:]),
+        source_sample_indices=values[:, 0].astype(np.int64),
+        capture_times_lsl_s=np.ascontiguousarray(values[:, 1]),
+    )
+
+
+def read_binary_device_samples(stem: str | Path) -> AcquiredBlock:
+    """Read a binary ``device_samples`` table back into one :class:`AcquiredBlock`."""
+
+    columns = read_binary_table(stem)
+    device_columns = sorted(
+        (name for name in columns if name.startswith(_DEVICE_COLUMN_PREFIX)),
+        key=lambda name: int(name[len(_DEVICE_COLUMN_PREFIX):]),
+    )
+    return AcquiredBlock(
+        device_rows=np.column_stack([columns[name] for name in device_columns]).astype(float),
+        source_sample_indices=columns["source_sample_index"].astype(np.int64),
+        capture_times_lsl_s=columns["capture_time_lsl_s"].astype(float),
+    )
+
+
+def replay_session(
+    session_dir: str | Path,
+    *,
+    overrides: Mapping[str, Mapping[str, Any]] | None = None,
+    processing_mode: ProcessingMode | None = None,
+    output_root: str | Path | None = None,
+    realtime: bool = False,
+    session_name: str | None = None,
+) -> ReplayResult:
+    """Re-run a recorded session through the pipeline and write a new session.
+
+    ``overrides`` maps config sections to ``{key: value}`` replacements and
+    goes through the same validation as TOML config files. The new session is
+    written under ``output_root``, defaulting to ``<session_dir>/replays``, in
+    a timestamped folder unless ``session_name`` is given.
+    """
+
+    recorded = load_recorded_session(session_dir)
+    config = recorded.config
+    if overrides:
+        config = apply_config_overrides(config, overrides)
+    mode = recorded.processing_mode
+    if processing_mode is not None:
+        mode = _validated_processing_mode(processing_mode)
+    if output_root is None:
+        output_root = recorded.session_dir / "replays"
+
+    pipeline_cfg = PipelineConfig.from_app_config(config, mode)
+    multichannel = bool(pipeline_cfg.processed_sensor_columns)
+    pipeline_state = (
+        create_multichannel_state(pipeline_cfg)
+        if multichannel
+        else create_pipeline_state(pipeline_cfg)
+    )
+    device_sample_width = recorded.rows.device_rows.shape[1]
+    chunk_rows = config.device.chunk_size if realtime else _FAST_REPLAY_CHUNK_ROWS
+    previous_source_sample_index: int | None = None
+    previous_runtime_lsl_timestamp: float | None = None
+    observed_gap_count = 0
+    samples_processed = 0
+
+    started_at = datetime.now().astimezone().isoformat()
+    replay_started = time.perf_counter()
+    first_capture_time_s = (
+        float(recorded.rows.capture_times_lsl_s[0]) if len(recorded.rows) else 0.0
+    )
+    session_writer = SessionWriter(
+        output_root,
+        config,
+        device_sample_width=device_sample_width,
+        channel_columns=pipeline_cfg.processed_sensor_columns,
+        session_name=session_name,
+    )
+    try:
+        for span_rows in recorded.rows.contiguous_spans():
+            first_source_sample_index = int(span_rows.source_sample_indices[0])
+            if (
+                previous_source_sample_index is not None
+                and first_source_sample_index != previous_source_sample_index + 1
+            ):
+                observed_gap_count += 1
+                if multichannel:
+                    reset_multichannel_state_for_source_gap(pipeline_state)
+                else:
+                    reset_pipeline_state_for_source_gap(pipeline_state)
+                previous_runtime_lsl_timestamp = None
+            previous_source_sample_index = int(span_rows.source_sample_indices[-1])
+
+            for start in range(0, len(span_rows), chunk_rows):
+                stop = min(start + chunk_rows, len(span_rows))
+                source_sample_indices = span_rows.source_sample_indices[start:stop]
+                capture_times_lsl_s = span_rows.capture_times_lsl_s[start:stop]
+                device_rows = span_rows.device_rows[start:stop]
+                if realtime:
+                    due_at = replay_started + float(capture_times_lsl_s[-1]) - first_capture_time_s
+                    delay_s = due_at - time.perf_counter()
+                    if delay_s > 0.0:
+                        time.sleep(delay_s)
+
+                if multichannel:
+                    channel_batch, pipeline_state = process_multichannel_rows(
+                        device_rows,
+                        pipeline_state,
+                        pipeline_cfg,
+                    )
+                    batch = channel_batch.channel(pipeline_state.primary_position)
+                else:
+                    batch, pipeline_state = process_device_rows(
+                        device_rows,
+                        pipeline_state,
+                        pipeline_cfg,
+                    )
+                lsl_timestamps_s = capture_times_lsl_s - config.lsl.constant_delay_s
+                session_writer.write_device_rows(
+                    batch,
+                    device_rows,
+                    source_sample_indices=source_sample_indices.tolist(),
+                    capture_times_lsl_s=capture_times_lsl_s.tolist(),
+                    lsl_timestamps_s=lsl_timestamps_s.tolist(),
+                )
+                for _, event in batch.qc_events:
+                    session_writer.write_qc_event(event)
+
+                # Mirror live event timestamping: events would only have been
+                # sent when LSL output was enabled, stamped with the previous
+                # live row's timestamp.
+                runtime_values = batch.runtime_values
+                live_offsets = np.flatnonzero(batch.runtime_mask & ~np.isnan(runtime_values))
+                live_lsl_timestamps_s = lsl_timestamps_s[live_offsets].tolist()
+                event_timestamps_lsl_s: list[float | None] = [None] * len(batch)
+                if config.lsl.enable:
+                    previous_live_lsl_timestamps_s = [
+                        previous_runtime_lsl_timestamp,
+                        *live_lsl_timestamps_s[:-1],
+                    ]
+                    live_codes = batch.extrema_event_code[live_offsets]
+                    for live_position in np.flatnonzero(live_codes != 0.0).tolist():
+                        event_timestamps_lsl_s[int(live_offsets[live_position])] = (
+                            previous_live_lsl_timestamps_s[live_position]
+                        )
+                if live_lsl_timestamps_s:
+                    previous_runtime_lsl_timestamp = live_lsl_timestamps_s[-1]
+
+                session_writer.write_signal_batch(
+                    batch,
+                    source_sample_indices=source_sample_indices.tolist(),
+                    capture_times_lsl_s=capture_times_lsl_s.tolist(),
+                    lsl_timestamps_s=lsl_timestamps_s.tolist(),
+                    event_timestamps_lsl_s=event_timestamps_lsl_s,
+                )
+                if multichannel:
+                    session_writer.write_channel_batch(
+                        channel_batch,
+                        source_sample_indices=source_sample_indices.tolist(),
+                        lsl_timestamps_s=lsl_timestamps_s.tolist(),
+                    )
+                samples_processed += len(batch)
+    finally:
+        elapsed_s = time.perf_counter() - replay_started
+        metadata = build_session_metadata(
+            config=config,
+            resolved_config_path=session_writer.resolved_config_path,
+            software_version=__version__,
+            started_at=started_at,
+            ended_at=datetime.now().astimezone().isoformat(),
+            calibration_result=pipeline_state.calibration_result,
+            adaptive_state=pipeline_state.adaptive_state,
+            qc_summary=raw_qc_summary(pipeline_state.qc_state),
+            processing_mode=mode,
+            selected_mode_number=_PROCESSING_MODE_NUMBERS[mode],
+            lsl_run_stats={"observed_gap_count": observed_gap_count},
+            multichannel_summary=multichannel_summary(pipeline_state) if multichannel else None,
+        )
+        metadata["replay"] = {
+            "source_session_dir": str(recorded.session_dir),
+            "config_overrides": {
+                section: dict(values) for section, values in (overrides or {}).items()
+            },
+            "realtime": realtime,
+            "samples_processed": samples_processed,
+            "elapsed_s": elapsed_s,
+        }
+        session_writer.finalize(metadata)
+
+    return ReplayResult(
+        source_session_dir=recorded.session_dir,
+        session_dir=session_writer.session_dir,
+        processing_mode=mode,
+        samples_processed=samples_processed,
+        observed_gap_count=observed_gap_count,
+        elapsed_s=elapsed_s,
+        calibration_result=pipeline_state.calibration_result,
+        adaptive_state=pipeline_state.adaptive_state,
+    )
+
+
+def _validated_processing_mode(processing_mode: Any) -> ProcessingMode:
+    if processing_mode not in _PROCESSING_MODE_NUMBERS:
+        raise ValueError(
+            "processing_mode must be 'control', 'movement', or 'adaptive', "
+            f"got {processing_mode!r}."
+        )
+    return processing_mode
@@ -0,0 +1,261 @@
+"""Parallel offline re-processing of an archive of recorded sessions.
+
+Every session folder below an archive directory (as written by
+:class:`src.session_writer.SessionWriter` under ``output.root_dir``, including
+the per-belt folders of a supervisor run) is replayed with
+:func:`src.replay.replay_session` in a pool of worker processes. Sessions are
+independent, so the archive is spread across CPU cores one session per task,
+largest first to keep the tail short.
+
+Derived sessions mirror the archive layout below ``output_root``, which
+defaults to a timestamped sibling of the archive so a later scan of the
+archive does not pick them up. ``reprocess_summary.json`` in ``output_root``
+lists per-session throughput and failures.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any, Callable, Mapping
+
+from .binary_export import binary_table_exists
+from .pipeline import ProcessingMode
+from .replay import replay_session
+
+
+@dataclass(frozen=True)
+class SessionReprocessResult:
+    """Outcome of re-processing one archived session."""
+
+    source_session_dir: Path
+    session_dir: Path | None
+    processing_mode: str | None
+    samples_processed: int
+    elapsed_s: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def samples_per_s(self) -> float:
+        return self.samples_processed / self.elapsed_s if self.elapsed_s > 0.0 else 0.0
+
+
+@dataclass(frozen=True)
+class ReprocessResult:
+    """Summary of one archive re-processing run."""
+
+    archive_dir: Path
+    output_root: Path
+    workers: int
+    elapsed_s: float
+    sessions: tuple[SessionReprocessResult, ...]
+
+    @property
+    def failures(self) -> tuple[SessionReprocessResult, ...]:
+        return tuple(session for session in self.sessions if not session.ok)
+
+    @property
+    def samples_processed(self) -> int:
+        return sum(session.samples_processed for session in self.sessions)
+
+
+def is_session_dir(path: str | Path) -> bool:
+    """Return whether ``path`` holds a replayable session export."""
+
+    session_path = Path(path)
+    return (session_path / "resolved_config.toml").is_file() and (
+        (session_path / "device_samples.csv").is_file()
+        or binary_table_exists(session_path / "device_samples")
+    )
+
+
+def find_session_dirs(
+    archive_dir: str | Path,
+    *,
+    exclude: tuple[str | Path, ...] = (),
+) -> list[Path]:
+    """Return every session folder below ``archive_dir`` in path order.
+
+    Folders nested inside another session (such as its ``replays``) and
+    everything below an ``exclude`` path are skipped.
+    """
+
+    archive_path = Path(archive_dir)
+    excluded = [Path(path).resolve() for path in exclude]
+    session_dirs: list[Path] = []
+    pending = [archive_path]
+    while pending:
+        path = pending.pop()
+        resolved = path.resolve()
+        if any(resolved == root or root in resolved.parents for root in excluded):
+            continue
+        if is_session_dir(path):
+            session_dirs.append(path)
+            continue
+        pending.extend(child for child in path.iterdir() if child.is_dir())
+    return sorted(session_dirs)
+
+
+def reprocess_sessions(
+    archive_dir: str | Path,
+    *,
+    overrides: Mapping[str, Mapping[str, Any]] | None = None,
+    processing_mode: ProcessingMode | None = None,
+    output_root: str | Path | None = None,
+    workers: int | None = None,
+    on_result: Callable[[SessionReprocessResult], None] | None = None,
+) -> ReprocessResult:
+    """Replay every session below ``archive_dir`` in parallel worker processes.
+
+    ``overrides`` and ``processing_mode`` apply to every session as in
+    :func:`src.replay.replay_session`. A session that fails is reported in the
+    result instead of aborting the run; ``on_result`` is called in the parent
+    process as each session finishes.
+    """
+
+    archive_path = Path(archive_dir)
+    if not archive_path.is_dir():
+        raise FileNotFoundError(f"Archive directory {archive_path} does not exist.")
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be positive.")
+    if output_root is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        output_root = archive_path.parent / f"{archive_path.name}_reprocessed_{timestamp}"
+    output_path = Path(output_root)
+
+    session_dirs = find_session_dirs(archive_path, exclude=(output_path,))
+    if not session_dirs:
+        raise FileNotFoundError(f"No session folders found below {archive_path}.")
+    session_dirs.sort(key=_session_size_bytes, reverse=True)
+    worker_count = min(workers or os.cpu_count() or 1, len(session_dirs))
+    overrides = {section: dict(values) for section, values in (overrides or {}).items()}
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    results: list[SessionReprocessResult] = []
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        futures = {}
+        for session_dir in session_dirs:
+            relative_path = session_dir.relative_to(archive_path)
+            if relative_path == Path("."):
+                relative_path = Path(archive_path.resolve().name)
+            future = executor.submit(
+                _reprocess_one,
+                session_dir,
+                output_path / relative_path.parent,
+                relative_path.name,
+                overrides,
+                processing_mode,
+            )
+            futures[future] = session_dir
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as error:
+                # Only reached when the worker process itself died.
+                result = SessionReprocessResult(
+                    source_session_dir=futures[future],
+                    session_dir=None,
+                    processing_mode=None,
+                    samples_processed=0,
+                    elapsed_s=0.0,
+                    error=f"{type(error).__name__}: {error}",
+                )
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+    results.sort(key=lambda result: result.source_session_dir)
+    reprocess_result = ReprocessResult(
+        archive_dir=archive_path,
+        output_root=output_path,
+        workers=worker_count,
+        elapsed_s=time.perf_counter() - started,
+        sessions=tuple(results),
+    )
+    _write_summary(reprocess_result, overrides=overrides, processing_mode=processing_mode)
+    return reprocess_result
+
+
+def _reprocess_one(
+    session_dir: Path,
+    output_root: Path,
+    session_name: str,
+    overrides: dict[str, dict[str, Any]],
+    processing_mode: ProcessingMode | None,
+) -> SessionReprocessResult:
+    started = time.perf_counter()
+    try:
+        replay = replay_session(
+            session_dir,
+            overrides=overrides,
+            processing_mode=processing_mode,
+            output_root=output_root,
+            session_name=session_name,
+        )
+    except Exception as error:
+        return SessionReprocessResult(
+            source_session_dir=session_dir,
+            session_dir=None,
+            processing_mode=processing_mode,
+            samples_processed=0,
+            elapsed_s=time.perf_counter() - started,
+            error=f"{type(error).__name__}: {error}",
+        )
+    return SessionReprocessResult(
+        source_session_dir=session_dir,
+        session_dir=replay.session_dir,
+        processing_mode=replay.processing_mode,
+        samples_processed=replay.samples_processed,
+        elapsed_s=replay.elapsed_s,
+    )
+
+
+def _session_size_bytes(session_dir: Path) -> int:
+    return sum(
+        path.stat().st_size
+        for path in session_dir.iterdir()
+        if path.is_file() and path.name.startswith("device_samples")
+    )
+
+
+def _write_summary(
+    result: ReprocessResult,
+    *,
+    overrides: dict[str, dict[str, Any]],
+    processing_mode: ProcessingMode | None,
+) -> None:
+    sessions = []
+    for session in result.sessions:
+        entry = asdict(session)
+        entry["source_session_dir"] = str(session.source_session_dir)
+        entry["session_dir"] = None if session.session_dir is None else str(session.session_dir)
+        entry["samples_per_s"] = session.samples_per_s
+        sessions.append(entry)
+    summary = {
+        "archive_dir": str(result.archive_dir),
+        "processing_mode": processing_mode,
+        "config_overrides": overrides,
+        "workers": result.workers,
+        "elapsed_s": result.elapsed_s,
+        "session_count": len(result.sessions),
+        "failure_count": len(result.failures),
+        "samples_processed": result.samples_processed,
+        "samples_per_s": (
+            result.samples_processed / result.elapsed_s if result.elapsed_s > 0.0 else 0.0
+        ),
+        "sessions": sessions,
+    }
+    (result.output_root / "reprocess_summary.json").write_text(
+        json.dumps(summary, indent=2) + "\n",
+        encoding="utf-8",
+    )
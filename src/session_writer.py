@@ -6,21 +6,37 @@ from csv import DictWriter
 from dataclasses import asdict
 from datetime import datetime
 import json
+import math
 import os
 from pathlib import Path
-from typing import Any
+import time
+from typing import Any, Callable, Sequence
 
 import numpy as np
 
+from .binary_export import (
+    QC_EVENTS_DTYPE,
+    SIGNAL_TRACE_DTYPE,
+    BinaryTableWriter,
+    channel_trace_column_names,
+    channel_trace_dtype,
+    device_samples_dtype,
+)
+from .bounded_worker import BoundedWorker
 from .lsl_metadata import (
     build_control_lsl_metadata,
     build_event_lsl_metadata,
+    build_lsl_run_stats,
     build_lsl_timing_metadata,
 )
-from .pipeline import PipelineSample
+from .multichannel import MultiChannelBatch
+from .pipeline import HOLD_RELEASE_DRIFT, PipelineBatch, PipelineSample, extrema_event_label
 from .quality import RawQCEvent
 from .settings import AppConfig, write_config_toml
 
+_STAGE_CATEGORIES = ("calibration", "runtime")
+_PROCESSING_MODE_CATEGORIES = ("control", "movement", "adaptive")
+
 
 class SessionWriter:
     """Write raw, processed, and metadata artifacts for one acquisition run."""
@@ -31,75 +47,45 @@ class SessionWriter:
         config: AppConfig,
         *,
         device_sample_width: int,
+        channel_columns: Sequence[int] = (),
+        session_name: str | None = None,
     ) -> None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        self.session_dir = Path(root_dir) / timestamp
+        if session_name is None:
+            session_name = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.session_dir = Path(root_dir) / session_name
         self.session_dir.mkdir(parents=True, exist_ok=False)
         self._device_sample_width = int(device_sample_width)
         if self._device_sample_width <= 0:
             raise ValueError("device_sample_width must be positive.")
+        self._channel_columns = tuple(int(column) for column in channel_columns)
 
-        device_columns = [f"device_col_{idx}" for idx in range(self._device_sample_width)]
-        self._device_file = (self.session_dir / "device_samples.csv").open(
-            "w",
-            newline="",
-            encoding="utf-8",
-        )
-        self._device_writer = DictWriter(
-            self._device_file,
-            fieldnames=[
-                "stage",
-                "sample_index",
-                "relative_time_s",
-                "source_sample_index",
-                "capture_time_lsl_s",
-                "lsl_timestamp_s",
-                *device_columns,
-            ],
-        )
-        self._device_writer.writeheader()
-        self._signal_file = (self.session_dir / "signal_trace.csv").open("w", newline="", encoding="utf-8")
-        self._signal_writer = DictWriter(
-            self._signal_file,
-            fieldnames=[
-                "stage",
-                "sample_index",
-                "relative_time_s",
-                "source_sample_index",
-                "capture_time_lsl_s",
-                "lsl_timestamp_s",
-                "event_timestamp_lsl_s",
-                "processing_mode",
-                "selected_sensor_raw",
-                "filtered_value",
-                "cleaned_value",
-                "normalized_value",
-                "movement_value",
-                "hold_mode_active",
-                "extrema_event_code",
-                "extrema_event_label",
-            ],
-        )
-        self._signal_writer.writeheader()
-        self._qc_file = (self.session_dir / "qc_events.csv").open("w", newline="", encoding="utf-8")
-        self._qc_writer = DictWriter(
-            self._qc_file,
-            fieldnames=[
-                "event_type",
-                "stage",
-                "sample_index",
-                "relative_time_s",
-                "raw_value",
-                "threshold",
-                "message",
-            ],
-        )
-        self._qc_writer.writeheader()
+        self.export_format = config.output.format
+        self._device_file = None
+        self._signal_file = None
+        self._qc_file = None
+        self._channel_file = None
+        self._device_table: BinaryTableWriter | None = None
+        self._signal_table: BinaryTableWriter | None = None
+        self._qc_table: BinaryTableWriter | None = None
+        self._channel_table: BinaryTableWriter | None = None
+        if self.export_format == "binary":
+            self._open_binary_tables()
+        else:
+            self._open_csv_tables()
+
+        self._durability = config.output.durability
+        self._durability_interval_s = config.output.durability_interval_ms / 1000.0
+        self._durability_rows = config.output.durability_rows
+        self._rows_since_sync = 0
+        self._last_sync_at = time.monotonic()
+        self._fsync_count = 0
+        self._fsync_latency_s_total = 0.0
+        self._fsync_latency_s_max = 0.0
 
         self.resolved_config_path = self.session_dir / "resolved_config.toml"
         write_config_toml(self.resolved_config_path, config)
         self.metadata_path = self.session_dir / "session_metadata.json"
-        self.flush_incremental()
+        self._flush_exports(fsync=True)
 
     def write_device_row(
         self,
@@ -121,6 +107,19 @@ class SessionWriter:
                 f"expected {self._device_sample_width}, observed {row_array.size}."
             )
 
+        self._rows_since_sync += 1
+        if self._device_table is not None:
+            self._append_device_records(
+                stage_codes=self._device_table.encode("stage", (stage,)),
+                sample_indices=[sample_index],
+                relative_times_s=[relative_time_s],
+                source_sample_indices=[source_sample_index],
+                capture_times_lsl_s=[capture_time_lsl_s],
+                lsl_timestamps_s=[lsl_timestamp_s],
+                device_rows=row_array.reshape(1, -1),
+            )
+            return
+
         row_payload = {
             "stage": stage,
             "sample_index": sample_index,
@@ -132,12 +131,83 @@ class SessionWriter:
         row_payload.update({f"device_col_{idx}": value for idx, value in enumerate(row_array)})
         self._device_writer.writerow(row_payload)
 
+    def write_device_rows(
+        self,
+        batch: PipelineBatch,
+        device_rows: np.ndarray,
+        *,
+        source_sample_indices: Sequence[int],
+        capture_times_lsl_s: Sequence[float],
+        lsl_timestamps_s: Sequence[float],
+    ) -> None:
+        """Append one block of raw device rows, one per batch sample."""
+
+        block = np.asarray(device_rows, dtype=float)
+        if block.ndim != 2 or block.shape[1] != self._device_sample_width:
+            raise ValueError(
+                "Raw device block width does not match expected export width: "
+                f"expected {self._device_sample_width}, observed shape {tuple(block.shape)}."
+            )
+        if block.shape[0] != len(batch):
+            raise ValueError(
+                "Raw device block length does not match the pipeline batch: "
+                f"expected {len(batch)}, observed {block.shape[0]}."
+            )
+
+        self._rows_since_sync += block.shape[0]
+        if self._device_table is not None:
+            self._append_device_records(
+                stage_codes=self._stage_codes(self._device_table, batch),
+                sample_indices=batch.sample_index,
+                relative_times_s=batch.relative_time_s,
+                source_sample_indices=source_sample_indices,
+                capture_times_lsl_s=capture_times_lsl_s,
+                lsl_timestamps_s=lsl_timestamps_s,
+                device_rows=block,
+            )
+            return
+
+        self._device_writer.writer.writerows(
+            [
+                stage,
+                sample_index,
+                f"{relative_time_s:.6f}",
+                source_sample_index,
+                f"{capture_time_lsl_s:.6f}",
+                f"{lsl_timestamp_s:.6f}",
+                *device_values,
+            ]
+            for (
+                stage,
+                sample_index,
+                relative_time_s,
+                source_sample_index,
+                capture_time_lsl_s,
+                lsl_timestamp_s,
+                device_values,
+            ) in zip(
+                batch.stages,
+                batch.sample_index.tolist(),
+                batch.relative_time_s.tolist(),
+                source_sample_indices,
+                capture_times_lsl_s,
+                lsl_timestamps_s,
+                block.tolist(),
+            )
+        )
+
     def flush_incremental(self) -> None:
-        """Flush and fsync all incremental CSV exports for chunk-level durability."""
+        """Flush all incremental exports and fsync them as ``output.durability`` requires.
 
-        self._flush_file(self._device_file)
-        self._flush_file(self._signal_file)
-        self._flush_file(self._qc_file)
+        Buffered rows always reach the operating system here, so a crash of
+        this process loses nothing already flushed. ``fsync`` (protection
+        against OS crashes and power loss) happens on every call for the
+        ``chunk`` policy, once ``durability_interval_ms`` or
+        ``durability_rows`` has passed since the last sync for ``interval`` and
+        ``rows``, and only on close for ``close``.
+        """
+
+        self._flush_exports(fsync=self._sync_due())
 
     def flush_raw(self) -> None:
         """Compatibility alias for chunk-level incremental export flushing."""
@@ -155,6 +225,16 @@ class SessionWriter:
     ) -> None:
         """Append one processed pipeline sample to the signal trace export."""
 
+        if self._signal_table is not None:
+            self.write_signal_batch(
+                PipelineBatch.from_samples([sample]),
+                source_sample_indices=[source_sample_index],
+                capture_times_lsl_s=[capture_time_lsl_s],
+                lsl_timestamps_s=[lsl_timestamp_s],
+                event_timestamps_lsl_s=[event_timestamp_lsl_s],
+            )
+            return
+
         self._signal_writer.writerow(
             {
                 "stage": sample.stage,
@@ -184,8 +264,162 @@ class SessionWriter:
             }
         )
 
+    def write_signal_batch(
+        self,
+        batch: PipelineBatch,
+        *,
+        source_sample_indices: Sequence[int],
+        capture_times_lsl_s: Sequence[float],
+        lsl_timestamps_s: Sequence[float],
+        event_timestamps_lsl_s: Sequence[float | None],
+    ) -> None:
+        """Append one columnar pipeline batch to the signal trace export.
+
+        Rows are formatted exactly as :meth:`write_signal_sample` would format
+        the equivalent scalar samples.
+        """
+
+        if self._signal_table is not None:
+            self._append_signal_records(
+                batch,
+                source_sample_indices=source_sample_indices,
+                capture_times_lsl_s=capture_times_lsl_s,
+                lsl_timestamps_s=lsl_timestamps_s,
+                event_timestamps_lsl_s=event_timestamps_lsl_s,
+            )
+            return
+
+        self._signal_writer.writer.writerows(
+            [
+                stage,
+                sample_index,
+                f"{relative_time_s:.6f}",
+                source_sample_index,
+                f"{capture_time_lsl_s:.6f}",
+                f"{lsl_timestamp_s:.6f}",
+                "" if event_timestamp_lsl_s is None else f"{event_timestamp_lsl_s:.6f}",
+                batch.processing_mode,
+                f"{selected_sensor_raw:.6f}",
+                f"{filtered_value:.6f}",
+                f"{cleaned_value:.6f}",
+                "" if math.isnan(normalized_value) else f"{normalized_value:.6f}",
+                "" if math.isnan(movement_value) else f"{movement_value:.6f}",
+                int(hold_mode_active),
+                f"{extrema_event_code:.1f}",
+                extrema_event_label(extrema_event_code) or "",
+            ]
+            for (
+                stage,
+                sample_index,
+                relative_time_s,
+                source_sample_index,
+                capture_time_lsl_s,
+                lsl_timestamp_s,
+                event_timestamp_lsl_s,
+                selected_sensor_raw,
+                filtered_value,
+                cleaned_value,
+                normalized_value,
+                movement_value,
+                hold_mode_active,
+                extrema_event_code,
+            ) in zip(
+                batch.stages,
+                batch.sample_index.tolist(),
+                batch.relative_time_s.tolist(),
+                source_sample_indices,
+                capture_times_lsl_s,
+                lsl_timestamps_s,
+                event_timestamps_lsl_s,
+                batch.selected_sensor_raw.tolist(),
+                batch.filtered_value.tolist(),
+                batch.cleaned_value.tolist(),
+                batch.normalized_value.tolist(),
+                batch.movement_value.tolist(),
+                batch.hold_mode_active.tolist(),
+                batch.extrema_event_code.tolist(),
+            )
+        )
+
+    def write_channel_batch(
+        self,
+        batch: MultiChannelBatch,
+        *,
+        source_sample_indices: Sequence[int],
+        lsl_timestamps_s: Sequence[float],
+    ) -> None:
+        """Append one multi-channel batch to the wide ``channel_trace`` export."""
+
+        if tuple(batch.channel_columns) != self._channel_columns:
+            raise ValueError(
+                "Multi-channel batch columns do not match the channel_trace export: "
+                f"expected {list(self._channel_columns)}, observed {list(batch.channel_columns)}."
+            )
+        per_channel = (
+            batch.selected_sensor_raw,
+            batch.filtered_value,
+            batch.normalized_value,
+            batch.movement_value,
+            batch.hold_mode_active,
+            batch.extrema_event_code,
+        )
+        if self._channel_table is not None:
+            table = self._channel_table
+            records = table.empty_records(len(batch))
+            records["stage"] = table.encode("stage", _STAGE_CATEGORIES)[
+                batch.runtime_mask.astype(np.intp)
+            ]
+            records["sample_index"] = batch.sample_index
+            records["relative_time_s"] = batch.relative_time_s
+            records["source_sample_index"] = source_sample_indices
+            records["lsl_timestamp_s"] = lsl_timestamps_s
+            names = iter(channel_trace_column_names(self._channel_columns))
+            for position in range(len(self._channel_columns)):
+                for values in per_channel:
+                    records[next(names)] = values[:, position]
+            table.append(records)
+            return
+
+        # Interleave per-channel columns as (raw, filtered, ..., code) per channel.
+        wide_values = np.stack(per_channel, axis=2).astype(float).reshape(len(batch), -1)
+        formats = ("{:.6f}", "{:.6f}", "{:.6f}", "{:.6f}", "{:.0f}", "{:.1f}")
+        row_formats = formats * len(self._channel_columns)
+        self._channel_writer.writer.writerows(
+            [
+                "runtime" if runtime else "calibration",
+                sample_index,
+                f"{relative_time_s:.6f}",
+                source_sample_index,
+                f"{lsl_timestamp_s:.6f}",
+                *(
+                    "" if math.isnan(value) else value_format.format(value)
+                    for value_format, value in zip(row_formats, values)
+                ),
+            ]
+            for runtime, sample_index, relative_time_s, source_sample_index, lsl_timestamp_s, values in zip(
+                batch.runtime_mask.tolist(),
+                batch.sample_index.tolist(),
+                batch.relative_time_s.tolist(),
+                source_sample_indices,
+                lsl_timestamps_s,
+                wide_values.tolist(),
+            )
+        )
+
     def write_qc_event(self, event: RawQCEvent) -> None:
-        """Append one QC episode event to the QC CSV export."""
+        """Append one QC episode event to the QC export."""
+
+        if self._qc_table is not None:
+            records = self._qc_table.empty_records(1)
+            records["event_type"] = self._qc_table.encode("event_type", (event.event_type,))
+            records["stage"] = self._qc_table.encode("stage", (event.stage,))
+            records["sample_index"] = event.sample_index
+            records["relative_time_s"] = event.relative_time_s
+            records["raw_value"] = event.raw_value
+            records["threshold"] = event.threshold
+            records["message"] = self._qc_table.encode("message", (event.message,))
+            self._qc_table.append(records)
+            return
 
         self._qc_writer.writerow(
             {
@@ -199,6 +433,26 @@ class SessionWriter:
             }
         )
 
+    def drain(self) -> None:
+        """Wait for pending writes; synchronous writers have none."""
+
+    def writer_stats(self) -> dict[str, Any]:
+        """Return export-writer statistics for the session metadata."""
+
+        return {"mode": "sync", **self.fsync_stats()}
+
+    def fsync_stats(self) -> dict[str, Any]:
+        """Return how often the exports were fsynced and what it cost."""
+
+        return {
+            "fsync_count": self._fsync_count,
+            "fsync_latency_s_total": self._fsync_latency_s_total,
+            "fsync_latency_s_mean": (
+                self._fsync_latency_s_total / self._fsync_count if self._fsync_count else 0.0
+            ),
+            "fsync_latency_s_max": self._fsync_latency_s_max,
+        }
+
     def finalize(self, metadata: dict[str, Any]) -> None:
         """Write session metadata and close all file handles."""
 
@@ -209,8 +463,22 @@ class SessionWriter:
         self.close()
 
     def close(self) -> None:
-        """Close any open session files."""
+        """Fsync and close any open session files."""
 
+        if any(
+            handle is not None
+            for handle in (
+                self._device_file,
+                self._signal_file,
+                self._qc_file,
+                self._channel_file,
+                self._device_table,
+                self._signal_table,
+                self._qc_table,
+                self._channel_table,
+            )
+        ):
+            self._flush_exports(fsync=True)
         if self._device_file is not None:
             self._device_file.close()
             self._device_file = None
@@ -220,13 +488,393 @@ class SessionWriter:
         if self._qc_file is not None:
             self._qc_file.close()
             self._qc_file = None
+        if self._channel_file is not None:
+            self._channel_file.close()
+            self._channel_file = None
+        for table in (
+            self._device_table,
+            self._signal_table,
+            self._qc_table,
+            self._channel_table,
+        ):
+            if table is not None:
+                table.close()
+
+    def _open_csv_tables(self) -> None:
+        device_columns = [f"device_col_{idx}" for idx in range(self._device_sample_width)]
+        self._device_file = (self.session_dir / "device_samples.csv").open(
+            "w",
+            newline="",
+            encoding="utf-8",
+        )
+        self._device_writer = DictWriter(
+            self._device_file,
+            fieldnames=[
+                "stage",
+                "sample_index",
+                "relative_time_s",
+                "source_sample_index",
+                "capture_time_lsl_s",
+                "lsl_timestamp_s",
+                *device_columns,
+            ],
+        )
+        self._device_writer.writeheader()
+        self._signal_file = (self.session_dir / "signal_trace.csv").open("w", newline="", encoding="utf-8")
+        self._signal_writer = DictWriter(
+            self._signal_file,
+            fieldnames=[
+                "stage",
+                "sample_index",
+                "relative_time_s",
+                "source_sample_index",
+                "capture_time_lsl_s",
+                "lsl_timestamp_s",
+                "event_timestamp_lsl_s",
+                "processing_mode",
+                "selected_sensor_raw",
+                "filtered_value",
+                "cleaned_value",
+                "normalized_value",
+                "movement_value",
+                "hold_mode_active",
+                "extrema_event_code",
+                "extrema_event_label",
+            ],
+        )
+        self._signal_writer.writeheader()
+        self._qc_file = (self.session_dir / "qc_events.csv").open("w", newline="", encoding="utf-8")
+        self._qc_writer = DictWriter(
+            self._qc_file,
+            fieldnames=[
+                "event_type",
+                "stage",
+                "sample_index",
+                "relative_time_s",
+                "raw_value",
+                "threshold",
+                "message",
+            ],
+        )
+        self._qc_writer.writeheader()
+        if self._channel_columns:
+            self._channel_file = (self.session_dir / "channel_trace.csv").open(
+                "w",
+                newline="",
+                encoding="utf-8",
+            )
+            self._channel_writer = DictWriter(
+                self._channel_file,
+                fieldnames=[
+                    "stage",
+                    "sample_index",
+                    "relative_time_s",
+                    "source_sample_index",
+                    "lsl_timestamp_s",
+                    *channel_trace_column_names(self._channel_columns),
+                ],
+            )
+            self._channel_writer.writeheader()
+
+    def _open_binary_tables(self) -> None:
+        self._device_table = BinaryTableWriter(
+            self.session_dir / "device_samples",
+            device_samples_dtype(self._device_sample_width),
+            categorical_columns=("stage",),
+            categories={"stage": _STAGE_CATEGORIES},
+        )
+        self._signal_table = BinaryTableWriter(
+            self.session_dir / "signal_trace",
+            SIGNAL_TRACE_DTYPE,
+            categorical_columns=("stage", "processing_mode", "extrema_event_label"),
+            categories={
+                "stage": _STAGE_CATEGORIES,
+                "processing_mode": _PROCESSING_MODE_CATEGORIES,
+                "extrema_event_label": ("", "inhale_peak", "exhale_trough"),
+            },
+        )
+        self._qc_table = BinaryTableWriter(
+            self.session_dir / "qc_events",
+            QC_EVENTS_DTYPE,
+            categorical_columns=("event_type", "stage", "message"),
+            categories={"stage": _STAGE_CATEGORIES},
+        )
+        if self._channel_columns:
+            self._channel_table = BinaryTableWriter(
+                self.session_dir / "channel_trace",
+                channel_trace_dtype(self._channel_columns),
+                categorical_columns=("stage",),
+                categories={"stage": _STAGE_CATEGORIES},
+            )
+
+    def _append_device_records(
+        self,
+        *,
+        stage_codes: np.ndarray,
+        sample_indices: Sequence[int] | np.ndarray,
+        relative_times_s: Sequence[float] | np.ndarray,
+        source_sample_indices: Sequence[int],
+        capture_times_lsl_s: Sequence[float],
+        lsl_timestamps_s: Sequence[float],
+        device_rows: np.ndarray,
+    ) -> None:
+        table = self._device_table
+        records = table.empty_records(device_rows.shape[0])
+        records["stage"] = stage_codes
+        records["sample_index"] = sample_indices
+        records["relative_time_s"] = relative_times_s
+        records["source_sample_index"] = source_sample_indices
+        records["capture_time_lsl_s"] = capture_times_lsl_s
+        records["lsl_timestamp_s"] = lsl_timestamps_s
+        for idx in range(self._device_sample_width):
+            records[f"device_col_{idx}"] = device_rows[:, idx]
+        table.append(records)
+
+    def _append_signal_records(
+        self,
+        batch: PipelineBatch,
+        *,
+        source_sample_indices: Sequence[int],
+        capture_times_lsl_s: Sequence[float],
+        lsl_timestamps_s: Sequence[float],
+        event_timestamps_lsl_s: Sequence[float | None],
+    ) -> None:
+        table = self._signal_table
+        records = table.empty_records(len(batch))
+        records["stage"] = self._stage_codes(table, batch)
+        records["sample_index"] = batch.sample_index
+        records["relative_time_s"] = batch.relative_time_s
+        records["source_sample_index"] = source_sample_indices
+        records["capture_time_lsl_s"] = capture_times_lsl_s
+        records["lsl_timestamp_s"] = lsl_timestamps_s
+        # None (no event timestamp) converts to NaN under a float dtype.
+        records["event_timestamp_lsl_s"] = np.asarray(event_timestamps_lsl_s, dtype=float)
+        records["processing_mode"] = table.encode("processing_mode", (batch.processing_mode,))
+        records["selected_sensor_raw"] = batch.selected_sensor_raw
+        records["filtered_value"] = batch.filtered_value
+        records["cleaned_value"] = batch.cleaned_value
+        records["normalized_value"] = batch.normalized_value
+        records["movement_value"] = batch.movement_value
+        records["hold_mode_active"] = batch.hold_mode_active
+        records["extrema_event_code"] = batch.extrema_event_code
+        event_codes, event_code_positions = np.unique(
+            batch.extrema_event_code,
+            return_inverse=True,
+        )
+        label_codes = table.encode(
+            "extrema_event_label",
+            (extrema_event_label(code) or "" for code in event_codes.tolist()),
+        )
+        records["extrema_event_label"] = label_codes[event_code_positions]
+        table.append(records)
 
     @staticmethod
-    def _flush_file(handle) -> None:
+    def _stage_codes(table: BinaryTableWriter, batch: PipelineBatch) -> np.ndarray:
+        return table.encode("stage", _STAGE_CATEGORIES)[batch.runtime_mask.astype(np.intp)]
+
+    def _sync_due(self) -> bool:
+        if self._durability == "chunk":
+            return True
+        if self._durability == "interval":
+            return time.monotonic() - self._last_sync_at >= self._durability_interval_s
+        if self._durability == "rows":
+            return self._rows_since_sync >= self._durability_rows
+        return False
+
+    def _flush_exports(self, *, fsync: bool) -> None:
+        started = time.perf_counter()
+        self._flush_file(self._device_file, fsync=fsync)
+        self._flush_file(self._signal_file, fsync=fsync)
+        self._flush_file(self._qc_file, fsync=fsync)
+        self._flush_file(self._channel_file, fsync=fsync)
+        for table in (
+            self._device_table,
+            self._signal_table,
+            self._qc_table,
+            self._channel_table,
+        ):
+            if table is not None:
+                table.flush(fsync=fsync)
+        if not fsync:
+            return
+        latency_s = time.perf_counter() - started
+        self._fsync_count += 1
+        self._fsync_latency_s_total += latency_s
+        self._fsync_latency_s_max = max(self._fsync_latency_s_max, latency_s)
+        self._rows_since_sync = 0
+        self._last_sync_at = time.monotonic()
+
+    @staticmethod
+    def _flush_file(handle, *, fsync: bool = True) -> None:
         if handle is None:
             return
         handle.flush()
-        os.fsync(handle.fileno())
+        if fsync:
+            os.fsync(handle.fileno())
+
+
+class AsyncSessionWriter:
+    """Run a :class:`SessionWriter` on a dedicated writer thread.
+
+    Write, flush and finalize calls are queued in order on a bounded queue and
+    executed by the writer thread, so disk latency (notably ``fsync`` in
+    :meth:`flush_incremental`) no longer blocks the acquisition loop. When the
+    queue is full the caller blocks until the writer catches up; such
+    back-pressure waits are counted and reported by :meth:`writer_stats`.
+
+    Arguments passed to queued calls must not be mutated afterwards. A failure
+    on the writer thread is re-raised on the next call from the caller.
+    """
+
+    def __init__(
+        self,
+        root_dir: str | Path,
+        config: AppConfig,
+        *,
+        device_sample_width: int,
+        channel_columns: Sequence[int] = (),
+        session_name: str | None = None,
+    ) -> None:
+        self._writer = SessionWriter(
+            root_dir,
+            config,
+            device_sample_width=device_sample_width,
+            channel_columns=channel_columns,
+            session_name=session_name,
+        )
+        self.session_dir = self._writer.session_dir
+        self.resolved_config_path = self._writer.resolved_config_path
+        self.metadata_path = self._writer.metadata_path
+        self.export_format = self._writer.export_format
+        self._worker = BoundedWorker(
+            name="SessionWriterThread",
+            max_items=config.output.writer_queue_max_items,
+            error_message="Session writer thread failed.",
+        )
+
+    def write_device_row(self, *args: Any, **kwargs: Any) -> None:
+        """Queue :meth:`SessionWriter.write_device_row`."""
+
+        self._submit(self._writer.write_device_row, args, kwargs)
+
+    def write_device_rows(self, *args: Any, **kwargs: Any) -> None:
+        """Queue :meth:`SessionWriter.write_device_rows`."""
+
+        self._submit(self._writer.write_device_rows, args, kwargs)
+
+    def write_signal_sample(self, *args: Any, **kwargs: Any) -> None:
+        """Queue :meth:`SessionWriter.write_signal_sample`."""
+
+        self._submit(self._writer.write_signal_sample, args, kwargs)
+
+    def write_signal_batch(self, *args: Any, **kwargs: Any) -> None:
+        """Queue :meth:`SessionWriter.write_signal_batch`."""
+
+        self._submit(self._writer.write_signal_batch, args, kwargs)
+
+    def write_channel_batch(self, *args: Any, **kwargs: Any) -> None:
+        """Queue :meth:`SessionWriter.write_channel_batch`."""
+
+        self._submit(self._writer.write_channel_batch, args, kwargs)
+
+    def write_qc_event(self, event: RawQCEvent) -> None:
+        """Queue :meth:`SessionWriter.write_qc_event`."""
+
+        self._submit(self._writer.write_qc_event, (event,), {})
+
+    def flush_incremental(self) -> None:
+        """Queue an incremental flush behind all previously queued writes."""
+
+        self._submit(self._writer.flush_incremental, (), {})
+
+    def flush_raw(self) -> None:
+        """Compatibility alias for chunk-level incremental export flushing."""
+
+        self.flush_incremental()
+
+    def drain(self) -> None:
+        """Block until every queued call has been executed."""
+
+        self._worker.drain()
+
+    def writer_stats(self) -> dict[str, Any]:
+        """Return queue depth, back-pressure and write-latency statistics."""
+
+        worker = self._worker
+        items_written = worker.items_completed
+        return {
+            "mode": "async",
+            "queue_max_items": worker.max_items,
+            "items_enqueued": worker.items_enqueued,
+            "items_written": items_written,
+            "max_queue_depth": worker.max_queue_depth,
+            "backpressure_waits": worker.backpressure_waits,
+            "backpressure_wait_s_total": worker.backpressure_wait_s_total,
+            "write_latency_s_mean": (
+                worker.latency_s_total / items_written if items_written else 0.0
+            ),
+            "write_latency_s_max": worker.latency_s_max,
+            "writer_busy_s_total": worker.busy_s_total,
+            **self._writer.fsync_stats(),
+        }
+
+    def finalize(self, metadata: dict[str, Any]) -> None:
+        """Drain queued writes, then write metadata and close the session files."""
+
+        self._worker.shutdown()
+        self._writer.finalize(metadata)
+        self._worker.raise_error()
+
+    def close(self) -> None:
+        """Drain queued writes and close the session files."""
+
+        self._worker.shutdown()
+        self._writer.close()
+        self._worker.raise_error()
+
+    def _submit(self, method, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        self._worker.submit(lambda: method(*args, **kwargs))
+
+
+def durability_loss_window(config: AppConfig) -> dict[str, Any]:
+    """Describe the configured fsync policy and its worst-case data-loss window.
+
+    The window bounds how much already-acquired data an OS crash or power
+    loss could discard, assuming the main loop drains about one read chunk
+    at a time; a loop that falls behind widens it. With the async writer,
+    up to ``writer_queue_max_items`` queued calls, each carrying at most one
+    chunk, are neither written nor fsynced and are lost with the process;
+    ``queued_rows`` reports that bound and it is included in
+    ``max_unsynced_rows``. ``None`` means the whole session is at risk until
+    the exports are closed.
+    """
+
+    output = config.output
+    sampling_rate_hz = float(config.device.sampling_rate_hz)
+    chunk_rows = config.device.chunk_size
+    if output.durability == "chunk":
+        max_unsynced_rows: int | None = chunk_rows
+    elif output.durability == "interval":
+        max_unsynced_rows = chunk_rows + math.ceil(
+            output.durability_interval_ms / 1000.0 * sampling_rate_hz
+        )
+    elif output.durability == "rows":
+        max_unsynced_rows = output.durability_rows + chunk_rows - 1
+    else:
+        max_unsynced_rows = None
+    queued_rows = output.writer_queue_max_items * chunk_rows if output.writer == "async" else 0
+    if max_unsynced_rows is not None:
+        max_unsynced_rows += queued_rows
+    return {
+        "policy": output.durability,
+        "interval_ms": output.durability_interval_ms if output.durability == "interval" else None,
+        "rows": output.durability_rows if output.durability == "rows" else None,
+        "queued_rows": queued_rows,
+        "max_unsynced_rows": max_unsynced_rows,
+        "max_unsynced_s": (
+            None if max_unsynced_rows is None else max_unsynced_rows / sampling_rate_hz
+        ),
+    }
 
 
 def build_session_metadata(
@@ -242,6 +890,9 @@ def build_session_metadata(
     processing_mode: str = "control",
     selected_mode_number: int = 1,
     lsl_run_stats: dict[str, Any] | None = None,
+    writer_stats: dict[str, Any] | None = None,
+    instrumentation_summary: dict[str, Any] | None = None,
+    multichannel_summary: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """Build a JSON-serializable metadata object for one session."""
 
@@ -263,18 +914,8 @@ def build_session_metadata(
         "authoritative_export_timestamp_field": "lsl_timestamp_s",
         "raw_capture_timestamp_field": "capture_time_lsl_s",
     }
-    default_lsl_run_stats = {
-        "control_send_strategy": "hybrid_explicit_timestamps",
-        "control_samples_sent": 0,
-        "control_samples_sent_individually": 0,
-        "control_samples_sent_via_chunks": 0,
-        "control_chunks_sent": 0,
-        "event_samples_sent": 0,
-        "queue_dropped_rows_total": 0,
-        "observed_gap_count": 0,
-    }
     merged_lsl_run_stats = {
-        **default_lsl_run_stats,
+        **build_lsl_run_stats(config),
         **({} if lsl_run_stats is None else lsl_run_stats),
     }
     metadata = {
@@ -286,6 +927,7 @@ def build_session_metadata(
         "selected_mode_number": selected_mode_number,
         "acquired_channels": list(config.device.channels),
         "processed_sensor_column": config.device.processed_sensor_column,
+        "processed_sensor_columns": list(config.device.processed_sensor_columns),
         "invert_signal": config.device.invert_signal,
         "calibration_result": calibration_payload,
         "adaptation_settings": {
@@ -315,7 +957,7 @@ def build_session_metadata(
             "freeze_exit_ratio_per_sec": config.hold.ratio_per_sec_exit,
             "freeze_floor_per_sec": config.hold.floor_per_sec,
             "hold_edge_margin_ratio": config.hold.edge_margin_ratio,
-            "hold_release_drift": 0.03,
+            "hold_release_drift": HOLD_RELEASE_DRIFT,
             "output_smoothing_enabled": config.output_smoothing.enabled,
             "output_smoothing_activity_window_ms": config.output_smoothing.activity_window_ms,
             "output_smoothing_tau_active_s": config.output_smoothing.tau_active_s,
@@ -387,7 +1029,43 @@ def build_session_metadata(
             "timing": lsl_timing,
             "run_stats": merged_lsl_run_stats,
         },
+        "export": {
+            "format": config.output.format,
+            "writer": {"mode": "sync"} if writer_stats is None else writer_stats,
+            "durability": durability_loss_window(config),
+        },
+        "instrumentation": (
+            {"enabled": False} if instrumentation_summary is None else instrumentation_summary
+        ),
+        "multichannel": (
+            {"enabled": False} if multichannel_summary is None else multichannel_summary
+        ),
         "final_adaptive_state": adaptive_payload,
         "raw_qc_summary": qc_summary,
     }
     return metadata
+
+
+def finalize_session(
+    session_writer: SessionWriter | AsyncSessionWriter,
+    build_metadata: Callable[[], dict[str, Any]],
+) -> None:
+    """Drain ``session_writer``, write its metadata and close it.
+
+    The files are closed and ``session_metadata.json`` is written even when
+    the writer thread failed; the failure is recorded under ``writer_error``
+    and re-raised by :meth:`AsyncSessionWriter.finalize`.
+    """
+
+    writer_error: RuntimeError | None = None
+    try:
+        try:
+            session_writer.drain()
+        except RuntimeError as error:
+            writer_error = error
+        metadata = build_metadata()
+        if writer_error is not None:
+            metadata["writer_error"] = repr(writer_error.__cause__ or writer_error)
+        session_writer.finalize(metadata)
+    finally:
+        session_writer.close()
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+import re
 import tomllib
-from typing import Any
+from typing import Any, Mapping
 
 
 BITALINO_ANALOG_START_COLUMN = 5
+# Supervised device names become session subdirectory names and LSL suffixes.
+_DEVICE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
 
 
 def expected_bitalino_row_width(channels: tuple[int, ...]) -> int:
@@ -25,6 +28,7 @@ class DeviceConfig:
     sampling_rate_hz: int = 100
     channels: tuple[int, ...] = (0, 1)
     processed_sensor_column: int = BITALINO_ANALOG_START_COLUMN
+    processed_sensor_columns: tuple[int, ...] = ()
     chunk_size: int = 10
     queue_max_samples: int = 1000
     timeout_s: float = 0.25
@@ -32,6 +36,15 @@ class DeviceConfig:
     retries: int = 3
     retry_delay_s: float = 2.0
     invert_signal: bool = False
+    backend: str = "bitalino"
+
+
+@dataclass(frozen=True)
+class SupervisedDeviceConfig:
+    """One named belt run by the multi-device supervisor."""
+
+    name: str
+    device: DeviceConfig
 
 
 @dataclass(frozen=True)
@@ -41,6 +54,9 @@ class DisplayConfig:
     enable_plot: bool = True
     plot_window_length: int = 3000
     debug_plot_window_bounds: bool = True
+    plot_backend: str = "inline"
+    plot_refresh_hz: float = 10.0
+    plot_width_px: int = 1000
     print_runtime_values: bool = False
     runtime_print_percent: int = 100
 
@@ -54,6 +70,8 @@ class LSLConfig:
     stream_type: str = "Breathing"
     source_id: str = "breathingbelt001"
     constant_delay_s: float = 0.0
+    sender: str = "inline"
+    sender_queue_max_blocks: int = 64
 
 
 @dataclass(frozen=True)
@@ -90,6 +108,7 @@ class CalibrationSettings:
     percentile_hi: float = 95.0
     amplitude_floor: float = 1e-3
     padding_ratio: float = 0.20
+    engine: str = "batch"
 
 
 @dataclass(frozen=True)
@@ -165,6 +184,40 @@ class OutputConfig:
     """Per-run export settings."""
 
     root_dir: str = "runs"
+    format: str = "csv"
+    writer: str = "sync"
+    writer_queue_max_items: int = 256
+    durability: str = "chunk"
+    durability_interval_ms: int = 1000
+    durability_rows: int = 1000
+
+
+@dataclass(frozen=True)
+class InstrumentationConfig:
+    """Opt-in live-loop latency instrumentation."""
+
+    enabled: bool = False
+    console_summary_interval_s: float = 0.0
+
+
+@dataclass(frozen=True)
+class SyntheticDeviceConfig:
+    """Signal and transport settings for the simulated BITalino backend."""
+
+    seed: int = 0
+    realtime: bool = True
+    baseline: float = 512.0
+    breathing_rate_hz: float = 0.25
+    breathing_amplitude: float = 120.0
+    noise_std: float = 3.0
+    drift_per_min: float = 0.0
+    clip_lo: float = 0.0
+    clip_hi: float = 1023.0
+    dropout_probability: float = 0.0
+    dropout_duration_s: float = 0.5
+    packet_drop_probability: float = 0.0
+    stall_probability: float = 0.0
+    stall_duration_s: float = 0.2
 
 
 @dataclass(frozen=True)
@@ -183,6 +236,9 @@ class AppConfig:
     extrema: ExtremaConfig
     raw_qc: RawQCConfig
     output: OutputConfig
+    synthetic_device: SyntheticDeviceConfig = field(default_factory=SyntheticDeviceConfig)
+    instrumentation: InstrumentationConfig = field(default_factory=InstrumentationConfig)
+    devices: tuple[SupervisedDeviceConfig, ...] = ()
 
 
 def default_config() -> AppConfig:
@@ -201,6 +257,8 @@ def default_config() -> AppConfig:
         extrema=ExtremaConfig(),
         raw_qc=RawQCConfig(),
         output=OutputConfig(),
+        synthetic_device=SyntheticDeviceConfig(),
+        instrumentation=InstrumentationConfig(),
     )
 
 
@@ -218,30 +276,71 @@ def load_config(path: str | Path) -> AppConfig:
         with config_path.open("rb") as handle:
             raw_config = tomllib.load(handle)
 
-        config = AppConfig(
-            device=_load_device_config(_section(raw_config, "device")),
-            display=_load_display_config(_section(raw_config, "display")),
-            lsl=_load_lsl_config(_section(raw_config, "lsl")),
-            filter=_load_filter_config(_section(raw_config, "filter")),
-            movement=_load_movement_config(_section(raw_config, "movement")),
-            calibration=_load_calibration_settings(_section(raw_config, "calibration")),
-            adaptation=_load_adaptation_settings(_section(raw_config, "adaptation")),
-            hold=_load_hold_config(_section(raw_config, "hold")),
-            output_smoothing=_load_output_smoothing_config(
-                _section(raw_config, "output_smoothing")
-            ),
-            extrema=_load_extrema_config(_section(raw_config, "extrema")),
-            raw_qc=_load_raw_qc_config(_section(raw_config, "raw_qc")),
-            output=_load_output_config(_section(raw_config, "output")),
-        )
+        config = _config_from_mapping(raw_config)
     _validate_config(config)
     return config
 
 
+def apply_config_overrides(
+    config: AppConfig,
+    overrides: Mapping[str, Mapping[str, Any]],
+) -> AppConfig:
+    """Return ``config`` with ``{section: {key: value}}`` overrides applied.
+
+    Overrides pass through the same coercion and validation as values loaded
+    from TOML. Unknown sections or keys are rejected rather than ignored so a
+    mistyped parameter name cannot silently leave a setting unchanged.
+    """
+
+    raw_config = config_to_dict(config)
+    for section_name, section_overrides in overrides.items():
+        if section_name not in raw_config:
+            raise ValueError(f"Unknown config section '{section_name}'.")
+        section = raw_config[section_name]
+        if not isinstance(section, dict):
+            raise ValueError(f"Config section '{section_name}' cannot be overridden.")
+        for key, value in section_overrides.items():
+            if key not in section:
+                raise ValueError(f"Unknown config key '{section_name}.{key}'.")
+            section[key] = value
+    overridden = _config_from_mapping(raw_config)
+    _validate_config(overridden)
+    return overridden
+
+
+def parse_config_override(text: str) -> tuple[str, str, Any]:
+    """Parse one ``section.key=value`` override into its parts.
+
+    The value is parsed as a TOML value, so ``true``, ``0.5`` and ``[1, 2]``
+    keep their types; anything that is not valid TOML is taken as a string.
+    """
+
+    name, separator, raw_value = text.partition("=")
+    section_name, dot, key = name.strip().partition(".")
+    if not separator or not dot or not section_name or not key:
+        raise ValueError(f"Config override must look like 'section.key=value', got '{text}'.")
+    try:
+        value = tomllib.loads(f"value = {raw_value.strip()}")["value"]
+    except tomllib.TOMLDecodeError:
+        value = raw_value.strip()
+    return section_name, key.strip(), value
+
+
 def config_to_dict(config: AppConfig) -> dict[str, Any]:
-    """Convert a typed configuration object to a serializable nested mapping."""
+    """Convert a typed configuration object to a serializable nested mapping.
+
+    Supervised devices are flattened to ``{"name": ..., <device keys>}``
+    tables, matching the ``[[devices]]`` layout they are loaded from, and are
+    omitted entirely for single-device configs.
+    """
 
-    return asdict(config)
+    raw_config = asdict(config)
+    del raw_config["devices"]
+    if config.devices:
+        raw_config["devices"] = [
+            {"name": entry.name, **asdict(entry.device)} for entry in config.devices
+        ]
+    return raw_config
 
 
 def write_config_toml(path: str | Path, config: AppConfig) -> None:
@@ -251,13 +350,20 @@ def write_config_toml(path: str | Path, config: AppConfig) -> None:
 
 
 def render_toml(mapping: dict[str, Any]) -> str:
-    """Serialize a nested mapping containing scalars, arrays, and subtables to TOML."""
+    """Serialize a nested mapping containing scalars, arrays, and subtables to TOML.
+
+    Non-empty lists of mappings are written as arrays of tables (``[[key]]``).
+    """
 
     lines: list[str] = []
     for key, value in mapping.items():
         if isinstance(value, dict):
             lines.extend(_render_toml_section(key, value))
             lines.append("")
+        elif _is_table_array(value):
+            for item in value:
+                lines.extend(_render_toml_section(key, item, header=f"[[{key}]]"))
+                lines.append("")
         else:
             lines.append(f"{key} = {_render_toml_value(value)}")
     while lines and lines[-1] == "":
@@ -265,8 +371,21 @@ def render_toml(mapping: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def _render_toml_section(prefix: str, mapping: dict[str, Any]) -> list[str]:
-    lines = [f"[{prefix}]"]
+def _is_table_array(value: Any) -> bool:
+    return (
+        isinstance(value, (list, tuple))
+        and len(value) > 0
+        and all(isinstance(item, dict) for item in value)
+    )
+
+
+def _render_toml_section(
+    prefix: str,
+    mapping: dict[str, Any],
+    *,
+    header: str | None = None,
+) -> list[str]:
+    lines = [header or f"[{prefix}]"]
     nested_items: list[tuple[str, dict[str, Any]]] = []
     for key, value in mapping.items():
         if isinstance(value, dict):
@@ -292,6 +411,26 @@ def _render_toml_value(value: Any) -> str:
     raise TypeError(f"Unsupported TOML value type: {type(value)!r}")
 
 
+def _config_from_mapping(raw_config: dict[str, Any]) -> AppConfig:
+    return AppConfig(
+        device=_load_device_config(_section(raw_config, "device")),
+        display=_load_display_config(_section(raw_config, "display")),
+        lsl=_load_lsl_config(_section(raw_config, "lsl")),
+        filter=_load_filter_config(_section(raw_config, "filter")),
+        movement=_load_movement_config(_section(raw_config, "movement")),
+        calibration=_load_calibration_settings(_section(raw_config, "calibration")),
+        adaptation=_load_adaptation_settings(_section(raw_config, "adaptation")),
+        hold=_load_hold_config(_section(raw_config, "hold")),
+        output_smoothing=_load_output_smoothing_config(_section(raw_config, "output_smoothing")),
+        extrema=_load_extrema_config(_section(raw_config, "extrema")),
+        raw_qc=_load_raw_qc_config(_section(raw_config, "raw_qc")),
+        output=_load_output_config(_section(raw_config, "output")),
+        synthetic_device=_load_synthetic_device_config(_section(raw_config, "synthetic_device")),
+        instrumentation=_load_instrumentation_config(_section(raw_config, "instrumentation")),
+        devices=_load_supervised_devices(raw_config),
+    )
+
+
 def _section(raw_config: dict[str, Any], name: str) -> dict[str, Any]:
     section = raw_config.get(name, {})
     if section is None:
@@ -310,6 +449,10 @@ def _load_device_config(section: dict[str, Any]) -> DeviceConfig:
         processed_sensor_column=int(
             section.get("processed_sensor_column", defaults.processed_sensor_column)
         ),
+        processed_sensor_columns=tuple(
+            int(x)
+            for x in section.get("processed_sensor_columns", defaults.processed_sensor_columns)
+        ),
         chunk_size=int(section.get("chunk_size", defaults.chunk_size)),
         queue_max_samples=int(section.get("queue_max_samples", defaults.queue_max_samples)),
         timeout_s=float(section.get("timeout_s", defaults.timeout_s)),
@@ -319,9 +462,31 @@ def _load_device_config(section: dict[str, Any]) -> DeviceConfig:
         retries=int(section.get("retries", defaults.retries)),
         retry_delay_s=float(section.get("retry_delay_s", defaults.retry_delay_s)),
         invert_signal=bool(section.get("invert_signal", defaults.invert_signal)),
+        backend=str(section.get("backend", defaults.backend)),
     )
 
 
+def _load_supervised_devices(raw_config: dict[str, Any]) -> tuple[SupervisedDeviceConfig, ...]:
+    """Load ``[[devices]]`` entries; unset keys fall back to the ``[device]`` table."""
+
+    entries = raw_config.get("devices", [])
+    if entries is None:
+        return ()
+    if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+        raise TypeError("Config section 'devices' must be an array of tables.")
+    base_section = _section(raw_config, "device")
+    devices: list[SupervisedDeviceConfig] = []
+    for entry in entries:
+        device_section = {key: value for key, value in entry.items() if key != "name"}
+        devices.append(
+            SupervisedDeviceConfig(
+                name=str(entry.get("name", "")),
+                device=_load_device_config({**base_section, **device_section}),
+            )
+        )
+    return tuple(devices)
+
+
 def _load_display_config(section: dict[str, Any]) -> DisplayConfig:
     defaults = DisplayConfig()
     return DisplayConfig(
@@ -335,6 +500,9 @@ def _load_display_config(section: dict[str, Any]) -> DisplayConfig:
                 defaults.debug_plot_window_bounds,
             )
         ),
+        plot_backend=str(section.get("plot_backend", defaults.plot_backend)),
+        plot_refresh_hz=float(section.get("plot_refresh_hz", defaults.plot_refresh_hz)),
+        plot_width_px=int(section.get("plot_width_px", defaults.plot_width_px)),
         print_runtime_values=bool(
             section.get("print_runtime_values", defaults.print_runtime_values)
         ),
@@ -354,6 +522,10 @@ def _load_lsl_config(section: dict[str, Any]) -> LSLConfig:
         constant_delay_s=float(
             section.get("constant_delay_s", defaults.constant_delay_s)
         ),
+        sender=str(section.get("sender", defaults.sender)),
+        sender_queue_max_blocks=int(
+            section.get("sender_queue_max_blocks", defaults.sender_queue_max_blocks)
+        ),
     )
 
 
@@ -415,6 +587,7 @@ def _load_calibration_settings(section: dict[str, Any]) -> CalibrationSettings:
             section.get("amplitude_floor", defaults.amplitude_floor)
         ),
         padding_ratio=float(section.get("padding_ratio", defaults.padding_ratio)),
+        engine=str(section.get("engine", defaults.engine)),
     )
 
 
@@ -565,53 +738,127 @@ def _load_extrema_config(section: dict[str, Any]) -> ExtremaConfig:
 
 def _load_output_config(section: dict[str, Any]) -> OutputConfig:
     defaults = OutputConfig()
-    return OutputConfig(root_dir=str(section.get("root_dir", defaults.root_dir)))
+    return OutputConfig(
+        root_dir=str(section.get("root_dir", defaults.root_dir)),
+        format=str(section.get("format", defaults.format)),
+        writer=str(section.get("writer", defaults.writer)),
+        writer_queue_max_items=int(
+            section.get("writer_queue_max_items", defaults.writer_queue_max_items)
+        ),
+        durability=str(section.get("durability", defaults.durability)),
+        durability_interval_ms=int(
+            section.get("durability_interval_ms", defaults.durability_interval_ms)
+        ),
+        durability_rows=int(section.get("durability_rows", defaults.durability_rows)),
+    )
+
+
+def _load_synthetic_device_config(section: dict[str, Any]) -> SyntheticDeviceConfig:
+    defaults = SyntheticDeviceConfig()
+    return SyntheticDeviceConfig(
+        seed=int(section.get("seed", defaults.seed)),
+        realtime=bool(section.get("realtime", defaults.realtime)),
+        baseline=float(section.get("baseline", defaults.baseline)),
+        breathing_rate_hz=float(section.get("breathing_rate_hz", defaults.breathing_rate_hz)),
+        breathing_amplitude=float(
+            section.get("breathing_amplitude", defaults.breathing_amplitude)
+        ),
+        noise_std=float(section.get("noise_std", defaults.noise_std)),
+        drift_per_min=float(section.get("drift_per_min", defaults.drift_per_min)),
+        clip_lo=float(section.get("clip_lo", defaults.clip_lo)),
+        clip_hi=float(section.get("clip_hi", defaults.clip_hi)),
+        dropout_probability=float(
+            section.get("dropout_probability", defaults.dropout_probability)
+        ),
+        dropout_duration_s=float(
+            section.get("dropout_duration_s", defaults.dropout_duration_s)
+        ),
+        packet_drop_probability=float(
+            section.get("packet_drop_probability", defaults.packet_drop_probability)
+        ),
+        stall_probability=float(section.get("stall_probability", defaults.stall_probability)),
+        stall_duration_s=float(section.get("stall_duration_s", defaults.stall_duration_s)),
+    )
+
+
+def _load_instrumentation_config(section: dict[str, Any]) -> InstrumentationConfig:
+    defaults = InstrumentationConfig()
+    return InstrumentationConfig(
+        enabled=bool(section.get("enabled", defaults.enabled)),
+        console_summary_interval_s=float(
+            section.get("console_summary_interval_s", defaults.console_summary_interval_s)
+        ),
+    )
 
 
 def _validate_config(config: AppConfig) -> None:
-    if config.device.sampling_rate_hz <= 0:
-        raise ValueError("device.sampling_rate_hz must be positive.")
-    if config.device.chunk_size <= 0:
-        raise ValueError("device.chunk_size must be positive.")
-    if config.device.processed_sensor_column < 0:
-        raise ValueError("device.processed_sensor_column must be non-negative.")
-    if not config.device.channels:
-        raise ValueError("device.channels must contain at least one channel.")
-    expected_row_width = expected_bitalino_row_width(config.device.channels)
-    if config.device.processed_sensor_column >= expected_row_width:
-        raise ValueError(
-            "device.processed_sensor_column must be less than the expected "
-            f"BITalino row width ({expected_row_width}) for the configured channels."
-        )
+    _validate_device_section(config.device, prefix="device")
+    device_names: set[str] = set()
+    for index, entry in enumerate(config.devices):
+        if not _DEVICE_NAME_PATTERN.match(entry.name):
+            raise ValueError(
+                f"devices[{index}].name must be a non-empty name of letters, digits, '_' or '-'."
+            )
+        if entry.name in device_names:
+            raise ValueError(f"devices[{index}].name '{entry.name}' is not unique.")
+        device_names.add(entry.name)
+        _validate_device_section(entry.device, prefix=f"devices[{index}]")
     if config.display.plot_window_length <= 0:
         raise ValueError("display.plot_window_length must be positive.")
+    if config.display.plot_backend not in {"inline", "process"}:
+        raise ValueError("display.plot_backend must be 'inline' or 'process'.")
+    if config.display.plot_refresh_hz <= 0.0:
+        raise ValueError("display.plot_refresh_hz must be positive.")
+    if config.display.plot_width_px <= 0:
+        raise ValueError("display.plot_width_px must be positive.")
     if not 0 <= config.display.runtime_print_percent <= 100:
         raise ValueError("display.runtime_print_percent must be between 0 and 100.")
     if config.lsl.constant_delay_s < 0.0:
         raise ValueError("lsl.constant_delay_s must be non-negative.")
-    _validate_filter_section(
-        config.device.sampling_rate_hz,
-        config.filter.hp_cutoff_hz,
-        config.filter.hp_order,
-        config.filter.lp_cutoff_hz,
-        config.filter.lp_order,
-        prefix="filter",
-        validate_high_pass=False,
-    )
-    _validate_filter_section(
-        config.device.sampling_rate_hz,
-        config.movement.hp_cutoff_hz,
-        config.movement.hp_order,
-        config.movement.lp_cutoff_hz,
-        config.movement.lp_order,
-        prefix="movement",
-    )
+    if config.lsl.sender not in {"inline", "thread"}:
+        raise ValueError("lsl.sender must be 'inline' or 'thread'.")
+    if config.lsl.sender_queue_max_blocks <= 0:
+        raise ValueError("lsl.sender_queue_max_blocks must be positive.")
+    sampling_rates_hz = {config.device.sampling_rate_hz}
+    sampling_rates_hz.update(entry.device.sampling_rate_hz for entry in config.devices)
+    for sampling_rate_hz in sorted(sampling_rates_hz):
+        _validate_filter_section(
+            sampling_rate_hz,
+            config.filter.hp_cutoff_hz,
+            config.filter.hp_order,
+            config.filter.lp_cutoff_hz,
+            config.filter.lp_order,
+            prefix="filter",
+            validate_high_pass=False,
+        )
+        _validate_filter_section(
+            sampling_rate_hz,
+            config.movement.hp_cutoff_hz,
+            config.movement.hp_order,
+            config.movement.lp_cutoff_hz,
+            config.movement.lp_order,
+            prefix="movement",
+        )
     if config.calibration.duration_s <= 0.0:
         raise ValueError("calibration.duration_s must be positive.")
     if config.calibration.amplitude_floor <= 0.0:
         raise ValueError("calibration.amplitude_floor must be positive.")
     if config.calibration.padding_ratio < 0.0:
         raise ValueError("calibration.padding_ratio must be non-negative.")
+    if config.calibration.engine not in {"batch", "streaming"}:
+        raise ValueError("calibration.engine must be 'batch' or 'streaming'.")
+    if config.output.format not in {"csv", "binary"}:
+        raise ValueError("output.format must be 'csv' or 'binary'.")
+    if config.output.writer not in {"sync", "async"}:
+        raise ValueError("output.writer must be 'sync' or 'async'.")
+    if config.output.writer_queue_max_items <= 0:
+        raise ValueError("output.writer_queue_max_items must be positive.")
+    if config.output.durability not in {"chunk", "interval", "rows", "close"}:
+        raise ValueError("output.durability must be 'chunk', 'interval', 'rows', or 'close'.")
+    if config.output.durability_interval_ms <= 0:
+        raise ValueError("output.durability_interval_ms must be positive.")
+    if config.output.durability_rows <= 0:
+        raise ValueError("output.durability_rows must be positive.")
     if config.adaptation.low_activity_window_ms <= 0:
         raise ValueError("adaptation.low_activity_window_ms must be positive.")
     if config.adaptation.low_activity_ratio_per_sec <= 0.0:
@@ -671,15 +918,70 @@ def _validate_config(config: AppConfig) -> None:
         raise ValueError("movement.low_activity_floor_per_sec must be positive.")
     if not (0.0 <= config.movement.low_activity_drift_scale <= 1.0):
         raise ValueError("movement.low_activity_drift_scale must be between 0 and 1.")
+    synthetic = config.synthetic_device
+    if synthetic.breathing_rate_hz <= 0.0:
+        raise ValueError("synthetic_device.breathing_rate_hz must be positive.")
+    if synthetic.noise_std < 0.0:
+        raise ValueError("synthetic_device.noise_std must be non-negative.")
+    if synthetic.clip_lo >= synthetic.clip_hi:
+        raise ValueError("synthetic_device clip bounds must be ordered.")
+    for name in ("dropout_probability", "packet_drop_probability", "stall_probability"):
+        if not 0.0 <= getattr(synthetic, name) < 1.0:
+            raise ValueError(f"synthetic_device.{name} must be in [0, 1).")
+    if synthetic.dropout_duration_s < 0.0 or synthetic.stall_duration_s < 0.0:
+        raise ValueError("synthetic_device durations must be non-negative.")
+    if config.instrumentation.console_summary_interval_s < 0.0:
+        raise ValueError("instrumentation.console_summary_interval_s must be non-negative.")
 
 
 def validate_live_acquisition_config(config: AppConfig) -> None:
     """Validate settings required specifically for live device acquisition."""
 
-    if not config.device.mac_address.strip():
+    if config.devices:
+        for index, entry in enumerate(config.devices):
+            if entry.device.backend == "bitalino" and not entry.device.mac_address.strip():
+                raise ValueError(f"devices[{index}].mac_address must be set for live acquisition.")
+        return
+    if config.device.backend == "bitalino" and not config.device.mac_address.strip():
         raise ValueError("device.mac_address must be set for live acquisition.")
 
 
+def _validate_device_section(device: DeviceConfig, *, prefix: str) -> None:
+    if device.sampling_rate_hz <= 0:
+        raise ValueError(f"{prefix}.sampling_rate_hz must be positive.")
+    if device.backend not in {"bitalino", "synthetic"}:
+        raise ValueError(f"{prefix}.backend must be 'bitalino' or 'synthetic'.")
+    if device.chunk_size <= 0:
+        raise ValueError(f"{prefix}.chunk_size must be positive.")
+    if device.processed_sensor_column < 0:
+        raise ValueError(f"{prefix}.processed_sensor_column must be non-negative.")
+    if not device.channels:
+        raise ValueError(f"{prefix}.channels must contain at least one channel.")
+    expected_row_width = expected_bitalino_row_width(device.channels)
+    if device.processed_sensor_column >= expected_row_width:
+        raise ValueError(
+            f"{prefix}.processed_sensor_column must be less than the expected "
+            f"BITalino row width ({expected_row_width}) for the configured channels."
+        )
+    if device.processed_sensor_columns:
+        if any(
+            not 0 <= column < expected_row_width
+            for column in device.processed_sensor_columns
+        ):
+            raise ValueError(
+                f"{prefix}.processed_sensor_columns must be within the expected "
+                f"BITalino row width ({expected_row_width}) for the configured channels."
+            )
+        if len(set(device.processed_sensor_columns)) != len(
+            device.processed_sensor_columns
+        ):
+            raise ValueError(f"{prefix}.processed_sensor_columns must not contain duplicates.")
+        if device.processed_sensor_column not in device.processed_sensor_columns:
+            raise ValueError(
+                f"{prefix}.processed_sensor_columns must include {prefix}.processed_sensor_column."
+            )
+
+
 def _validate_filter_section(
     sampling_rate_hz: int,
     hp_cutoff_hz: float,
@@ -0,0 +1,413 @@
+"""Run several breathing belts from one process with a shared scheduler.
+
+A config with ``[[devices]]`` entries describes one named belt per entry.
+Each belt keeps its own :class:`src.connect.BreathBelt` reader thread,
+pipeline state, LSL streams and session directory, but all processing
+happens on one scheduler loop: every reader sets a shared wakeup event when
+it stores a chunk, and the loop drains all belts that have rows, oldest
+capture time first. One interpreter therefore serves every participant and
+all capture timestamps come from the same local LSL clock.
+
+Sessions are written below one supervisor directory::
+
+    <output.root_dir>/<timestamp>/
+        supervisor_summary.json
+        <device name>/           # regular session layout, replayable as-is
+
+Each device session records a single-device ``resolved_config.toml`` derived
+with :func:`supervised_device_config`, so replays do not need the supervisor.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import datetime
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable
+
+from . import __version__
+from .connect import AcquiredBlock, BreathBelt
+from .live_span import LiveSpanProcessor
+from .lsl_metadata import (
+    build_control_lsl_metadata,
+    build_event_lsl_metadata,
+    build_lsl_run_stats,
+    build_lsl_timing_metadata,
+)
+from .multichannel import create_multichannel_state, multichannel_summary
+from .pipeline import PipelineConfig, ProcessingMode, create_pipeline_state
+from .quality import raw_qc_summary
+from .session_writer import (
+    AsyncSessionWriter,
+    SessionWriter,
+    build_session_metadata,
+    finalize_session,
+)
+from .settings import AppConfig, expected_bitalino_row_width, validate_live_acquisition_config
+from .synthetic_device import SyntheticBITalino
+
+# Upper bound on one scheduler wait, so ``should_stop`` is polled regularly
+# while no belt delivers rows.
+_SCHEDULER_WAIT_TIMEOUT_S = 0.05
+
+
+def _import_lsl_sender():
+    from .lsl_out import LSLBreathingSender
+
+    return LSLBreathingSender
+
+
+def _import_lsl_sender_thread():
+    from .lsl_out import LSLSenderThread
+
+    return LSLSenderThread
+
+
+@dataclass(frozen=True)
+class SupervisorResult:
+    """Summary of one completed multi-device run."""
+
+    supervisor_dir: Path
+    session_dirs: dict[str, Path]
+    summary: dict[str, Any]
+
+
+def supervised_device_config(config: AppConfig, index: int) -> AppConfig:
+    """Return the single-device config used for ``config.devices[index]``.
+
+    The entry's device settings replace ``[device]``, LSL stream names and
+    source ids get the device name as suffix, and the synthetic seed is offset
+    by the entry index so simulated belts do not produce identical signals.
+    """
+
+    entry = config.devices[index]
+    return replace(
+        config,
+        device=entry.device,
+        lsl=replace(
+            config.lsl,
+            stream_name=f"{config.lsl.stream_name}_{entry.name}",
+            source_id=f"{config.lsl.source_id}_{entry.name}",
+        ),
+        synthetic_device=replace(
+            config.synthetic_device,
+            seed=config.synthetic_device.seed + index,
+        ),
+        devices=(),
+    )
+
+
+class _SupervisedDevice:
+    """Pipeline, outputs and run statistics for one supervised belt."""
+
+    def __init__(
+        self,
+        name: str,
+        config: AppConfig,
+        processing_mode: ProcessingMode,
+        supervisor_dir: Path,
+        wakeup_event: threading.Event,
+    ) -> None:
+        self.name = name
+        self.config = config
+        self.processing_mode = processing_mode
+        self.pipeline_cfg = PipelineConfig.from_app_config(config, processing_mode)
+        self.multichannel = bool(self.pipeline_cfg.processed_sensor_columns)
+        self.started_at = datetime.now().astimezone().isoformat()
+        self.belt = BreathBelt(
+            mac_address=config.device.mac_address,
+            sampling_rate=config.device.sampling_rate_hz,
+            channels=config.device.channels,
+            read_chunk_size=config.device.chunk_size,
+            queue_max_samples=config.device.queue_max_samples,
+            timeout_s=config.device.timeout_s,
+            read_error_backoff_s=config.device.read_error_backoff_s,
+            retries=config.device.retries,
+            retry_delay_s=config.device.retry_delay_s,
+            device_factory=(
+                (lambda: SyntheticBITalino(config.synthetic_device))
+                if config.device.backend == "synthetic"
+                else None
+            ),
+            wakeup_event=wakeup_event,
+        )
+        writer_cls = AsyncSessionWriter if config.output.writer == "async" else SessionWriter
+        self.session_writer = writer_cls(
+            supervisor_dir,
+            config,
+            device_sample_width=expected_bitalino_row_width(config.device.channels),
+            channel_columns=self.pipeline_cfg.processed_sensor_columns,
+            session_name=name,
+        )
+        self.sender_thread = None
+        self.rows_processed = 0
+        self.blocks_processed = 0
+        self.processing_s = 0.0
+        self.reported_dropped_rows_total = 0
+        self.lsl_run_stats = build_lsl_run_stats(config)
+        self.span_processor = LiveSpanProcessor(
+            config,
+            self.pipeline_cfg,
+            (
+                create_multichannel_state(self.pipeline_cfg)
+                if self.multichannel
+                else create_pipeline_state(self.pipeline_cfg)
+            ),
+            session_writer=self.session_writer,
+            control_sender=None,
+            event_sender=None,
+            lsl_run_stats=self.lsl_run_stats,
+            log_prefix=f"[{name}] ",
+        )
+
+    def open_lsl_streams(self) -> None:
+        config = self.config
+        LSLBreathingSender = _import_lsl_sender()
+        control_lsl_metadata = build_control_lsl_metadata(config, self.processing_mode)
+        control_sender = LSLBreathingSender(
+            name=str(control_lsl_metadata["stream_name"]),
+            type=str(control_lsl_metadata["stream_type"]),
+            channel_count=int(control_lsl_metadata["channel_count"]),
+            nominal_srate=config.device.sampling_rate_hz,
+            source_id=str(control_lsl_metadata["source_id"]),
+            channel_labels=tuple(control_lsl_metadata["channel_names"]),
+            timing_metadata=build_lsl_timing_metadata(config),
+        )
+        event_lsl_metadata = build_event_lsl_metadata(config, self.processing_mode)
+        event_sender = LSLBreathingSender(
+            name=str(event_lsl_metadata["stream_name"]),
+            type=str(event_lsl_metadata["stream_type"]),
+            channel_count=int(event_lsl_metadata["channel_count"]),
+            nominal_srate=0,
+            source_id=str(event_lsl_metadata["source_id"]),
+            channel_labels=tuple(event_lsl_metadata["channel_names"]),
+            timing_metadata=build_lsl_timing_metadata(config),
+            event_code_map={
+                float(code): str(label)
+                for code, label in dict(event_lsl_metadata["event_code_map"]).items()
+            },
+        )
+        if config.lsl.sender == "thread":
+            LSLSenderThread = _import_lsl_sender_thread()
+            self.sender_thread = LSLSenderThread(
+                control_sender,
+                event_sender,
+                queue_max_blocks=config.lsl.sender_queue_max_blocks,
+            )
+            control_sender = self.sender_thread.control
+            event_sender = self.sender_thread.event
+        self.span_processor.control_sender = control_sender
+        self.span_processor.event_sender = event_sender
+
+    @property
+    def dropped_rows_total(self) -> int:
+        return int(getattr(self.belt, "dropped_rows_total", 0))
+
+    def process_block(self, acquired_rows: AcquiredBlock) -> None:
+        """Run one drained block through the pipeline and all outputs."""
+
+        started = time.perf_counter()
+        dropped_rows_total = self.dropped_rows_total
+        if dropped_rows_total > self.reported_dropped_rows_total:
+            print(
+                f"[{self.name}] WARNING [queue_overflow]: dropped "
+                f"{dropped_rows_total - self.reported_dropped_rows_total} queued samples "
+                "before processing."
+            )
+            self.reported_dropped_rows_total = dropped_rows_total
+            self.lsl_run_stats["queue_dropped_rows_total"] = dropped_rows_total
+
+        for span_rows in acquired_rows.contiguous_spans():
+            self.span_processor.process_span(span_rows)
+        self.span_processor.flush_control()
+        self.session_writer.flush_incremental()
+        self.rows_processed += len(acquired_rows)
+        self.blocks_processed += 1
+        self.processing_s += time.perf_counter() - started
+
+    def stats(self, elapsed_s: float) -> dict[str, Any]:
+        dropped_rows_total = self.dropped_rows_total
+        acquired_rows_total = self.rows_processed + dropped_rows_total
+        return {
+            "session_dir": str(self.session_writer.session_dir),
+            "rows_processed": self.rows_processed,
+            "blocks_processed": self.blocks_processed,
+            "dropped_rows_total": dropped_rows_total,
+            "drop_fraction": (
+                dropped_rows_total / acquired_rows_total if acquired_rows_total else 0.0
+            ),
+            "observed_gap_count": int(self.lsl_run_stats["observed_gap_count"]),
+            "processing_s": self.processing_s,
+            "rows_per_s": self.rows_processed / elapsed_s if elapsed_s > 0.0 else 0.0,
+        }
+
+    def finalize(self, *, selected_mode_number: int, supervisor: dict[str, Any]) -> None:
+        sender_error: RuntimeError | None = None
+        if self.sender_thread is not None:
+            try:
+                self.sender_thread.close()
+            except RuntimeError as error:
+                # Finalize the session first; the failure is re-raised below.
+                sender_error = error
+                self.lsl_run_stats["sender_error"] = repr(error.__cause__ or error)
+            self.lsl_run_stats["sender_thread"] = self.sender_thread.stats()
+        self.lsl_run_stats["queue_dropped_rows_total"] = self.dropped_rows_total
+
+        def build_metadata() -> dict[str, Any]:
+            metadata = build_session_metadata(
+                config=self.config,
+                resolved_config_path=self.session_writer.resolved_config_path,
+                software_version=__version__,
+                started_at=self.started_at,
+                ended_at=datetime.now().astimezone().isoformat(),
+                calibration_result=self.span_processor.pipeline_state.calibration_result,
+                adaptive_state=self.span_processor.pipeline_state.adaptive_state,
+                qc_summary=raw_qc_summary(self.span_processor.pipeline_state.qc_state),
+                processing_mode=self.processing_mode,
+                selected_mode_number=selected_mode_number,
+                lsl_run_stats=self.lsl_run_stats,
+                writer_stats=self.session_writer.writer_stats(),
+                multichannel_summary=(
+                    multichannel_summary(self.span_processor.pipeline_state) if self.multichannel else None
+                ),
+            )
+            metadata["supervisor"] = supervisor
+            return metadata
+
+        finalize_session(self.session_writer, build_metadata)
+        if sender_error is not None:
+            raise sender_error
+
+
+def run_supervisor(
+    config: AppConfig,
+    processing_mode: ProcessingMode,
+    *,
+    should_stop: Callable[[], bool],
+    selected_mode_number: int = 1,
+) -> SupervisorResult:
+    """Acquire from every ``config.devices`` entry until ``should_stop()`` is true.
+
+    All belts share one processing loop. The combined throughput and drop
+    statistics are returned and written to ``supervisor_summary.json``; each
+    device session's metadata carries the same summary under ``supervisor``.
+    """
+
+    if not config.devices:
+        raise ValueError("devices must contain at least one entry for the supervisor.")
+    validate_live_acquisition_config(config)
+
+    started_at = datetime.now().astimezone().isoformat()
+    supervisor_dir = Path(config.output.root_dir) / datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    supervisor_dir.mkdir(parents=True, exist_ok=False)
+    wakeup_event = threading.Event()
+    devices: list[_SupervisedDevice] = []
+    scheduler_passes = 0
+    run_started = time.perf_counter()
+    summary: dict[str, Any] = {}
+
+    try:
+        for index, entry in enumerate(config.devices):
+            device = _SupervisedDevice(
+                entry.name,
+                supervised_device_config(config, index),
+                processing_mode,
+                supervisor_dir,
+                wakeup_event,
+            )
+            devices.append(device)
+            if config.lsl.enable:
+                device.open_lsl_streams()
+        for device in devices:
+            print(f"[{device.name}] Starting acquisition...")
+            device.belt.start()
+        run_started = time.perf_counter()
+
+        while not should_stop():
+            if not wakeup_event.wait(timeout=_SCHEDULER_WAIT_TIMEOUT_S):
+                continue
+            # Clear before draining: a chunk stored meanwhile sets the event
+            # again, so no wakeup is lost between the drain and the next wait.
+            wakeup_event.clear()
+            pending = [(device, device.belt.get_block()) for device in devices]
+            pending = [(device, block) for device, block in pending if len(block) > 0]
+            pending.sort(key=lambda item: float(item[1].capture_times_lsl_s[0]))
+            for device, block in pending:
+                device.process_block(block)
+            scheduler_passes += 1
+    finally:
+        # One failing device must not leave the others unfinalized.
+        device_errors: dict[str, Exception] = {}
+        for device in devices:
+            try:
+                device.belt.stop()
+            except Exception as error:
+                device_errors.setdefault(device.name, error)
+        elapsed_s = time.perf_counter() - run_started
+        device_stats = {device.name: device.stats(elapsed_s) for device in devices}
+        rows_processed = sum(stats["rows_processed"] for stats in device_stats.values())
+        dropped_rows_total = sum(stats["dropped_rows_total"] for stats in device_stats.values())
+        summary = {
+            "software_version": __version__,
+            "started_at": started_at,
+            "ended_at": datetime.now().astimezone().isoformat(),
+            "processing_mode": processing_mode,
+            "elapsed_s": elapsed_s,
+            "scheduler_passes": scheduler_passes,
+            "rows_processed": rows_processed,
+            "dropped_rows_total": dropped_rows_total,
+            "drop_fraction": (
+                dropped_rows_total / (rows_processed + dropped_rows_total)
+                if rows_processed + dropped_rows_total
+                else 0.0
+            ),
+            "rows_per_s": rows_processed / elapsed_s if elapsed_s > 0.0 else 0.0,
+            "devices": device_stats,
+        }
+        for device in devices:
+            try:
+                device.finalize(
+                    selected_mode_number=selected_mode_number,
+                    supervisor={
+                        "device_name": device.name,
+                        "supervisor_dir": str(supervisor_dir),
+                        **summary,
+                    },
+                )
+            except Exception as error:
+                device_errors.setdefault(device.name, error)
+        summary["device_errors"] = {
+            name: repr(error.__cause__ or error) for name, error in device_errors.items()
+        }
+        (supervisor_dir / "supervisor_summary.json").write_text(
+            json.dumps(summary, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        if device_errors:
+            raise next(iter(device_errors.values()))
+
+    return SupervisorResult(
+        supervisor_dir=supervisor_dir,
+        session_dirs={device.name: device.session_writer.session_dir for device in devices},
+        summary=summary,
+    )
+
+
+def format_supervisor_summary(summary: dict[str, Any]) -> str:
+    """Return a one-line-per-device console summary of a supervisor run."""
+
+    lines = [
+        f"Supervisor: {summary['rows_processed']} rows in {summary['elapsed_s']:.1f}s "
+        f"({summary['rows_per_s']:.0f} rows/s), {summary['dropped_rows_total']} dropped "
+        f"({100.0 * summary['drop_fraction']:.2f}%)."
+    ]
+    for name, stats in summary["devices"].items():
+        lines.append(
+            f"  {name}: {stats['rows_processed']} rows ({stats['rows_per_s']:.0f} rows/s), "
+            f"{stats['dropped_rows_total']} dropped, {stats['observed_gap_count']} gap(s), "
+            f"{stats['processing_s']:.2f}s processing"
+        )
+    return "\n".join(lines)
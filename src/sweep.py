@@ -0,0 +1,453 @@
+"""Parameter sweeps over hold, smoothing, extrema and adaptation settings.
+
+A sweep replays one recorded session under many configurations that differ
+only in ``[hold]``, ``[output_smoothing]``, ``[extrema]`` and ``[adaptation]``
+values. None of those settings affect raw parsing, raw QC, filtering or the
+percentile calibration, so :func:`prepare_sweep_session` runs those stages
+once and keeps:
+
+- the raw and filtered traces of the processed column,
+- the pipeline state just before the sample that completes calibration.
+
+Each sweep point then restores that state and runs only calibration
+finalization and the runtime stages on the shared filtered trace via
+:func:`src.pipeline.process_filtered_values`, with raw QC disabled because its
+events are the same for every point. The per-point output is identical to a
+full replay with the same settings from the calibration-completing sample on.
+
+Search spaces map ``section -> {key: values}``. :func:`grid_search_points`
+takes the Cartesian product of value lists; :func:`random_search_points`
+draws from lists or from ``{"low": ..., "high": ...}`` ranges.
+"""
+
+from __future__ import annotations
+
+import copy
+import csv
+from dataclasses import dataclass, replace
+import itertools
+from pathlib import Path
+import time
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from .pipeline import (
+    PipelineBatch,
+    PipelineConfig,
+    PipelineState,
+    ProcessingMode,
+    create_pipeline_state,
+    process_device_rows,
+    process_filtered_values,
+    reset_pipeline_state_for_source_gap,
+)
+from .replay import RecordedSession, load_recorded_session
+from .settings import AppConfig, apply_config_overrides
+
+SWEEP_SECTIONS = ("hold", "output_smoothing", "extrema", "adaptation")
+SWEEP_METRIC_COLUMNS = (
+    "runtime_samples",
+    "inhale_peak_count",
+    "exhale_trough_count",
+    "breaths_per_min",
+    "peak_interval_cv",
+    "hold_episode_count",
+    "hold_time_s",
+    "hold_mean_s",
+    "hold_max_s",
+    "jitter_rms",
+    "jitter_p95_abs",
+    "jitter_second_diff_rms",
+)
+
+# Settings sections each processing mode reads after calibration. Points that
+# agree on these share one evaluation.
+_MODE_SECTIONS: dict[str, tuple[str, ...]] = {
+    "control": ("hold", "output_smoothing", "extrema"),
+    "movement": ("extrema",),
+    "adaptive": ("adaptation", "extrema"),
+}
+
+SweepPoint = dict[str, dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class PreparedSweepSession:
+    """Sweep-invariant stages of one recorded session."""
+
+    session_dir: Path
+    config: AppConfig
+    processing_mode: ProcessingMode
+    raw_values: np.ndarray
+    filtered_values: np.ndarray
+    spans: tuple[tuple[int, int, bool], ...]
+    snapshot_offset: int
+    snapshot_state: PipelineState
+    qc_event_count: int
+    prepare_s: float
+
+
+@dataclass(frozen=True)
+class SweepPointResult:
+    """Metrics, or the validation error, of one sweep point."""
+
+    point: SweepPoint
+    metrics: dict[str, float]
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """All evaluated points of one sweep."""
+
+    prepared: PreparedSweepSession
+    points: tuple[SweepPointResult, ...]
+    elapsed_s: float
+
+
+def grid_search_points(space: Mapping[str, Mapping[str, Sequence[Any]]]) -> list[SweepPoint]:
+    """Return every combination of the listed values, last key varying fastest."""
+
+    keys = _space_keys(space)
+    value_lists = []
+    for section_name, key in keys:
+        values = space[section_name][key]
+        if isinstance(values, (str, Mapping)) or not isinstance(values, Sequence) or not values:
+            raise ValueError(
+                f"Sweep values for '{section_name}.{key}' must be a non-empty list for a grid search."
+            )
+        value_lists.append(list(values))
+    return [_point(keys, combination) for combination in itertools.product(*value_lists)]
+
+
+def random_search_points(
+    space: Mapping[str, Mapping[str, Any]],
+    count: int,
+    *,
+    seed: int = 0,
+) -> list[SweepPoint]:
+    """Return ``count`` random points.
+
+    A list of values is sampled uniformly; ``{"low": a, "high": b}`` draws a
+    uniform float, or an integer when both bounds are integers.
+    """
+
+    if count <= 0:
+        raise ValueError("count must be positive.")
+    keys = _space_keys(space)
+    rng = np.random.default_rng(seed)
+    points = []
+    for _ in range(count):
+        values = []
+        for section_name, key in keys:
+            spec = space[section_name][key]
+            if isinstance(spec, Mapping):
+                if set(spec) != {"low", "high"} or spec["low"] > spec["high"]:
+                    raise ValueError(
+                        f"Sweep range for '{section_name}.{key}' must be {{low, high}} with low <= high."
+                    )
+                low, high = spec["low"], spec["high"]
+                if isinstance(low, int) and isinstance(high, int):
+                    values.append(int(rng.integers(low, high + 1)))
+                else:
+                    values.append(float(rng.uniform(float(low), float(high))))
+            elif isinstance(spec, Sequence) and not isinstance(spec, str) and spec:
+                values.append(spec[int(rng.integers(len(spec)))])
+            else:
+                raise ValueError(
+                    f"Sweep values for '{section_name}.{key}' must be a non-empty list or a range."
+                )
+        points.append(_point(keys, values))
+    return points
+
+
+def prepare_sweep_session(
+    session: str | Path | RecordedSession,
+    *,
+    overrides: Mapping[str, Mapping[str, Any]] | None = None,
+    processing_mode: ProcessingMode | None = None,
+) -> PreparedSweepSession:
+    """Parse, QC, filter and calibrate-up-to-completion one recorded session.
+
+    ``overrides`` change the base config for every point, like a replay's
+    ``--set``. Only the primary processed column is swept.
+    """
+
+    started = time.perf_counter()
+    recorded = session if isinstance(session, RecordedSession) else load_recorded_session(session)
+    config = recorded.config
+    if overrides:
+        config = apply_config_overrides(config, overrides)
+    config = replace(config, device=replace(config.device, processed_sensor_columns=()))
+    mode = processing_mode or recorded.processing_mode
+    cfg = PipelineConfig.from_app_config(config, mode)
+
+    rows = recorded.rows
+    row_count = len(rows)
+    spans: list[tuple[int, int, bool]] = []
+    start = 0
+    previous_source_sample_index: int | None = None
+    for span_rows in rows.contiguous_spans():
+        stop = start + len(span_rows)
+        first_source_sample_index = int(span_rows.source_sample_indices[0])
+        gap = (
+            previous_source_sample_index is not None
+            and first_source_sample_index != previous_source_sample_index + 1
+        )
+        spans.append((start, stop, gap))
+        previous_source_sample_index = int(span_rows.source_sample_indices[-1])
+        start = stop
+
+    # Snapshot before the sample that completes calibration: finalizing the
+    # adaptive startup range depends on swept adaptation settings.
+    snapshot_offset = min(cfg.calibration_target_samples - 1, row_count)
+    raw_values = np.zeros(row_count, dtype=float)
+    filtered_values = np.zeros(row_count, dtype=float)
+    state = create_pipeline_state(cfg)
+    snapshot_state: PipelineState | None = None
+    qc_event_count = 0
+    for span_start, span_stop, gap in spans:
+        for piece_start, piece_stop in _split_at(span_start, span_stop, snapshot_offset):
+            if piece_start == snapshot_offset and snapshot_state is None:
+                snapshot_state = copy.deepcopy(state)
+            if gap and piece_start == span_start:
+                reset_pipeline_state_for_source_gap(state)
+            batch, state = process_device_rows(rows.device_rows[piece_start:piece_stop], state, cfg)
+            raw_values[piece_start:piece_stop] = batch.selected_sensor_raw
+            filtered_values[piece_start:piece_stop] = batch.filtered_value
+            qc_event_count += len(batch.qc_events)
+    if snapshot_state is None:
+        snapshot_state = copy.deepcopy(state)
+
+    return PreparedSweepSession(
+        session_dir=recorded.session_dir,
+        config=config,
+        processing_mode=mode,
+        raw_values=raw_values,
+        filtered_values=filtered_values,
+        spans=tuple(spans),
+        snapshot_offset=snapshot_offset,
+        snapshot_state=snapshot_state,
+        qc_event_count=qc_event_count,
+        prepare_s=time.perf_counter() - started,
+    )
+
+
+def sweep_point_batches(
+    prepared: PreparedSweepSession,
+    point: Mapping[str, Mapping[str, Any]],
+) -> list[PipelineBatch]:
+    """Run one point from the calibration snapshot on; one batch per span piece."""
+
+    _validate_sweep_sections(point)
+    config = apply_config_overrides(prepared.config, point)
+    config = replace(config, raw_qc=replace(config.raw_qc, enabled=False))
+    cfg = PipelineConfig.from_app_config(config, prepared.processing_mode)
+
+    state = copy.deepcopy(prepared.snapshot_state)
+    # Activity windows are sized from swept settings and are still empty at
+    # the snapshot, so fresh ones are exact.
+    fresh_state = create_pipeline_state(cfg)
+    state.recent_abs_velocity = fresh_state.recent_abs_velocity
+    state.recent_output_abs_velocity = fresh_state.recent_output_abs_velocity
+    state.recent_movement_abs_velocity = fresh_state.recent_movement_abs_velocity
+    state.recent_adaptive_abs_velocity = fresh_state.recent_adaptive_abs_velocity
+
+    batches = []
+    for span_start, span_stop, gap in prepared.spans:
+        if span_stop <= prepared.snapshot_offset:
+            continue
+        piece_start = max(span_start, prepared.snapshot_offset)
+        if gap and piece_start == span_start:
+            reset_pipeline_state_for_source_gap(state)
+        batch, state = process_filtered_values(
+            prepared.raw_values[piece_start:span_stop],
+            prepared.filtered_values[piece_start:span_stop],
+            state,
+            cfg,
+        )
+        batches.append(batch)
+    return batches
+
+
+def sweep_metrics(batches: Sequence[PipelineBatch], sampling_rate_hz: int) -> dict[str, float]:
+    """Return event, hold and output-jitter metrics over the runtime rows of ``batches``.
+
+    Differences are taken within each batch only, so they never span a
+    source gap.
+    """
+
+    fs_hz = float(sampling_rate_hz)
+    runtime_samples = 0
+    peak_positions: list[np.ndarray] = []
+    trough_count = 0
+    hold_lengths: list[np.ndarray] = []
+    first_differences: list[np.ndarray] = []
+    second_differences: list[np.ndarray] = []
+    offset = 0
+    for batch in batches:
+        runtime_offsets = np.flatnonzero(batch.runtime_mask)
+        runtime_samples += int(runtime_offsets.size)
+        codes = batch.extrema_event_code[runtime_offsets]
+        peak_positions.append(offset + runtime_offsets[codes > 0.0])
+        trough_count += int(np.count_nonzero(codes < 0.0))
+        hold_lengths.append(_run_lengths(batch.hold_mode_active[runtime_offsets]))
+        values = batch.runtime_values[runtime_offsets]
+        values = values[~np.isnan(values)]
+        first_differences.append(np.diff(values))
+        second_differences.append(np.diff(values, n=2))
+        offset += len(batch)
+
+    peaks = np.concatenate(peak_positions) if peak_positions else np.zeros(0, dtype=np.int64)
+    holds = np.concatenate(hold_lengths) / fs_hz if hold_lengths else np.zeros(0)
+    diffs = np.concatenate(first_differences) if first_differences else np.zeros(0)
+    second_diffs = np.concatenate(second_differences) if second_differences else np.zeros(0)
+    peak_intervals = np.diff(peaks).astype(float)
+    runtime_min = runtime_samples / fs_hz / 60.0
+    return {
+        "runtime_samples": float(runtime_samples),
+        "inhale_peak_count": float(peaks.size),
+        "exhale_trough_count": float(trough_count),
+        "breaths_per_min": peaks.size / runtime_min if runtime_min > 0.0 else 0.0,
+        "peak_interval_cv": (
+            float(np.std(peak_intervals) / np.mean(peak_intervals))
+            if peak_intervals.size > 1
+            else float("nan")
+        ),
+        "hold_episode_count": float(holds.size),
+        "hold_time_s": float(np.sum(holds)),
+        "hold_mean_s": float(np.mean(holds)) if holds.size else 0.0,
+        "hold_max_s": float(np.max(holds)) if holds.size else 0.0,
+        "jitter_rms": float(np.sqrt(np.mean(diffs**2))) if diffs.size else 0.0,
+        "jitter_p95_abs": float(np.percentile(np.abs(diffs), 95.0)) if diffs.size else 0.0,
+        "jitter_second_diff_rms": (
+            float(np.sqrt(np.mean(second_diffs**2))) if second_diffs.size else 0.0
+        ),
+    }
+
+
+def run_sweep(
+    session: str | Path | RecordedSession | PreparedSweepSession,
+    points: Sequence[Mapping[str, Mapping[str, Any]]],
+    *,
+    overrides: Mapping[str, Mapping[str, Any]] | None = None,
+    processing_mode: ProcessingMode | None = None,
+) -> SweepResult:
+    """Evaluate every point against one prepared session.
+
+    Points whose values fail config validation are kept with ``error`` set
+    and empty metrics, so a grid with some invalid combinations still runs.
+    Points that differ only in sections the processing mode does not read
+    (e.g. ``hold`` in movement mode) are evaluated once.
+    """
+
+    started = time.perf_counter()
+    prepared = (
+        session
+        if isinstance(session, PreparedSweepSession)
+        else prepare_sweep_session(session, overrides=overrides, processing_mode=processing_mode)
+    )
+    sampling_rate_hz = prepared.config.device.sampling_rate_hz
+    mode_sections = _MODE_SECTIONS[prepared.processing_mode]
+    metrics_by_key: dict[tuple[Any, ...], dict[str, float]] = {}
+    results = []
+    for point in points:
+        normalized_point = {section: dict(values) for section, values in point.items()}
+        try:
+            _validate_sweep_sections(normalized_point)
+            point_config = apply_config_overrides(prepared.config, normalized_point)
+        except ValueError as error:
+            results.append(SweepPointResult(point=normalized_point, metrics={}, error=str(error)))
+            continue
+        key = tuple(getattr(point_config, section) for section in mode_sections)
+        if key not in metrics_by_key:
+            metrics_by_key[key] = sweep_metrics(
+                sweep_point_batches(prepared, normalized_point),
+                sampling_rate_hz,
+            )
+        results.append(SweepPointResult(point=normalized_point, metrics=metrics_by_key[key]))
+    return SweepResult(
+        prepared=prepared,
+        points=tuple(results),
+        elapsed_s=time.perf_counter() - started,
+    )
+
+
+def write_sweep_results(path: str | Path, result: SweepResult) -> None:
+    """Write one CSV row per point: parameters, metrics, shared QC count, error."""
+
+    parameter_columns: list[str] = []
+    for point_result in result.points:
+        for section_name, values in point_result.point.items():
+            for key in values:
+                column = f"{section_name}.{key}"
+                if column not in parameter_columns:
+                    parameter_columns.append(column)
+
+    output_path = Path(path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with output_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(
+            ["point", *parameter_columns, *SWEEP_METRIC_COLUMNS, "qc_event_count", "error"]
+        )
+        for index, point_result in enumerate(result.points):
+            parameters = {
+                f"{section_name}.{key}": value
+                for section_name, values in point_result.point.items()
+                for key, value in values.items()
+            }
+            writer.writerow(
+                [
+                    index,
+                    *(parameters.get(column, "") for column in parameter_columns),
+                    *(
+                        f"{point_result.metrics[column]:.6f}" if point_result.metrics else ""
+                        for column in SWEEP_METRIC_COLUMNS
+                    ),
+                    result.prepared.qc_event_count,
+                    point_result.error or "",
+                ]
+            )
+
+
+def _validate_sweep_sections(point: Mapping[str, Any]) -> None:
+    for section_name in point:
+        if section_name not in SWEEP_SECTIONS:
+            raise ValueError(
+                f"Sweep section '{section_name}' is not supported; sweepable sections are "
+                + ", ".join(SWEEP_SECTIONS)
+                + "."
+            )
+
+
+def _space_keys(space: Mapping[str, Mapping[str, Any]]) -> list[tuple[str, str]]:
+    _validate_sweep_sections(space)
+    keys = []
+    for section_name, values in space.items():
+        keys.extend((section_name, key) for key in values)
+    if not keys:
+        raise ValueError("Sweep space must contain at least one parameter.")
+    return keys
+
+
+def _point(keys: Sequence[tuple[str, str]], values: Sequence[Any]) -> SweepPoint:
+    point: SweepPoint = {}
+    for (section_name, key), value in zip(keys, values):
+        point.setdefault(section_name, {})[key] = value
+    return point
+
+
+def _split_at(start: int, stop: int, offset: int) -> list[tuple[int, int]]:
+    if start < offset < stop:
+        return [(start, offset), (offset, stop)]
+    return [(start, stop)]
+
+
+def _run_lengths(flags: np.ndarray) -> np.ndarray:
+    """Return the lengths of the ``True`` runs in ``flags``."""
+
+    padded = np.concatenate([[False], np.asarray(flags, dtype=bool), [False]])
+    edges = np.flatnonzero(np.diff(padded.astype(np.int8)))
+    return edges[1::2] - edges[::2]
@@ -0,0 +1,152 @@
+"""Simulated BITalino device for hardware-free acquisition runs.
+
+``SyntheticBITalino`` implements the subset of the ``bitalino.BITalino``
+interface that :class:`src.connect.BreathBelt` uses (``start``, ``read``,
+``stop``, ``close``). Rows follow the BITalino layout: a 4-bit sequence
+counter in column 0, four digital columns, then one 10-bit analog column per
+acquired channel.
+
+The analog channels carry a parametrized breathing waveform with Gaussian
+noise, linear baseline drift, ADC clipping, and optional sensor dropouts. The
+transport can be paced in real time or run as fast as the consumer reads, and
+it can optionally skip packets (producing sequence-counter jumps) or stall
+individual reads to exercise the gap and overflow handling downstream.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+
+import numpy as np
+
+from .settings import SyntheticDeviceConfig
+
+_DIGITAL_COLUMNS = np.array([1.0, 1.0, 0.0, 0.0])
+
+
+class SyntheticBITalino:
+    """Drop-in BITalino stand-in driven by a synthetic breathing model."""
+
+    def __init__(self, cfg: SyntheticDeviceConfig | None = None) -> None:
+        self.cfg = cfg or SyntheticDeviceConfig()
+        self._rng = np.random.default_rng(self.cfg.seed)
+        self._sampling_rate_hz = 0
+        self._channel_count = 0
+        self._next_sample_index = 0
+        self._dropout_remaining = 0
+        self._started_at: float | None = None
+        self.packets_dropped_total = 0
+        self.stalls_total = 0
+
+    def start(self, sampling_rate: int, channels: list[int] | tuple[int, ...]) -> None:
+        """Start a new synthetic acquisition."""
+
+        if int(sampling_rate) <= 0:
+            raise ValueError("sampling_rate must be positive.")
+        if not channels:
+            raise ValueError("channels must contain at least one channel.")
+        self._sampling_rate_hz = int(sampling_rate)
+        self._channel_count = len(channels)
+        self._next_sample_index = 0
+        self._dropout_remaining = 0
+        self._started_at = time.perf_counter()
+
+    def read(self, n_samples: int) -> np.ndarray:
+        """Return the next ``n_samples`` delivered rows.
+
+        In real-time mode the call blocks until the newest returned sample is
+        due, like a hardware read does. Dropped packets are skipped in the
+        returned rows but still advance the sequence counter and clock.
+        """
+
+        if self._started_at is None:
+            raise RuntimeError("SyntheticBITalino.read called before start.")
+        n_samples = int(n_samples)
+        if n_samples <= 0:
+            raise ValueError("n_samples must be positive.")
+
+        if self.cfg.stall_probability > 0.0 and self._rng.random() < self.cfg.stall_probability:
+            self.stalls_total += 1
+            time.sleep(self.cfg.stall_duration_s)
+
+        sample_indices = self._delivered_sample_indices(n_samples)
+        if self.cfg.realtime:
+            due_at = self._started_at + (float(sample_indices[-1]) + 1.0) / self._sampling_rate_hz
+            delay_s = due_at - time.perf_counter()
+            if delay_s > 0.0:
+                time.sleep(delay_s)
+
+        rows = np.empty((n_samples, 5 + self._channel_count), dtype=float)
+        rows[:, 0] = sample_indices % 16
+        rows[:, 1:5] = _DIGITAL_COLUMNS
+        rows[:, 5:] = self._analog_values(sample_indices)
+        return rows
+
+    def stop(self) -> None:
+        """Stop the synthetic acquisition."""
+
+        self._started_at = None
+
+    def close(self) -> None:
+        """Release the synthetic device."""
+
+        self._started_at = None
+
+    def _delivered_sample_indices(self, n_samples: int) -> np.ndarray:
+        """Return absolute indices of the next delivered (non-dropped) samples."""
+
+        drop_probability = self.cfg.packet_drop_probability
+        if drop_probability <= 0.0:
+            indices = self._next_sample_index + np.arange(n_samples, dtype=np.int64)
+            self._next_sample_index += n_samples
+            return indices
+
+        delivered: list[np.ndarray] = []
+        remaining = n_samples
+        while remaining > 0:
+            candidates = self._next_sample_index + np.arange(2 * remaining, dtype=np.int64)
+            kept = candidates[self._rng.random(candidates.size) >= drop_probability][:remaining]
+            if kept.size:
+                last_index = int(kept[-1])
+                self.packets_dropped_total += last_index + 1 - self._next_sample_index - kept.size
+                self._next_sample_index = last_index + 1
+                delivered.append(kept)
+                remaining -= kept.size
+            else:
+                self.packets_dropped_total += candidates.size
+                self._next_sample_index += candidates.size
+        return np.concatenate(delivered)
+
+    def _analog_values(self, sample_indices: np.ndarray) -> np.ndarray:
+        cfg = self.cfg
+        t_s = sample_indices.astype(float) / self._sampling_rate_hz
+        phase = 2.0 * math.pi * cfg.breathing_rate_hz * t_s
+        # A small second harmonic makes inhale and exhale slightly asymmetric.
+        breath = np.sin(phase) + 0.2 * np.sin(2.0 * phase + 0.6)
+        channel_gains = 1.0 / (1.0 + np.arange(self._channel_count, dtype=float))
+        values = (
+            cfg.baseline
+            + (cfg.drift_per_min / 60.0) * t_s[:, None]
+            + cfg.breathing_amplitude * breath[:, None] * channel_gains[None, :]
+        )
+        if cfg.noise_std > 0.0:
+            values = values + self._rng.normal(0.0, cfg.noise_std, size=values.shape)
+        values[self._dropout_mask(sample_indices.size)] = cfg.clip_lo
+        return np.rint(np.clip(values, cfg.clip_lo, cfg.clip_hi))
+
+    def _dropout_mask(self, row_count: int) -> np.ndarray:
+        """Mark rows where the sensor reads as disconnected."""
+
+        mask = np.zeros(row_count, dtype=bool)
+        if self.cfg.dropout_probability <= 0.0 and self._dropout_remaining == 0:
+            return mask
+        dropout_samples = max(1, int(round(self.cfg.dropout_duration_s * self._sampling_rate_hz)))
+        starts = self._rng.random(row_count) < self.cfg.dropout_probability
+        for offset in range(row_count):
+            if self._dropout_remaining == 0 and starts[offset]:
+                self._dropout_remaining = dropout_samples
+            if self._dropout_remaining > 0:
+                mask[offset] = True
+                self._dropout_remaining -= 1
+        return mask
@@ -11,6 +11,7 @@ from src.calibration import (
     initialize_adaptive_range,
     run_range_calibration,
     update_adaptive_range,
+    update_adaptive_range_block,
 )
 
 
@@ -214,3 +215,47 @@ def test_update_allows_disabling_amplitude_updates_only() -> None:
 
     assert updated_state.center != start_center
     assert np.isclose(updated_state.amplitude, start_amplitude)
+
+
+def test_block_update_matches_per_sample_updates() -> None:
+    """Block updates must reproduce the per-sample recursion exactly."""
+
+    _, adapt_cfg, initial_state = _make_calibrated_state()
+    rng = np.random.default_rng(7)
+    stream = 0.9 * np.sin(2.0 * np.pi * 0.22 * np.arange(600) / adapt_cfg.fs_hz)
+    stream += rng.normal(0.0, 0.05, stream.size)
+    mixed_center = rng.random(stream.size) > 0.2
+    mixed_amplitude = rng.random(stream.size) > 0.3
+
+    for allow_center, allow_amplitude in [
+        (True, True),
+        (False, True),
+        (True, False),
+        (mixed_center, mixed_amplitude),
+    ]:
+        center_mask = np.broadcast_to(allow_center, stream.shape)
+        amplitude_mask = np.broadcast_to(allow_amplitude, stream.shape)
+        expected = np.zeros(stream.size, dtype=float)
+        expected_amplitudes = np.zeros(stream.size, dtype=float)
+        state = initial_state
+        for idx, value in enumerate(stream):
+            expected[idx], state = update_adaptive_range(
+                x=float(value),
+                state=state,
+                cfg=adapt_cfg,
+                allow_center_update=bool(center_mask[idx]),
+                allow_amplitude_update=bool(amplitude_mask[idx]),
+            )
+            expected_amplitudes[idx] = state.amplitude
+
+        normalized, _, _, amplitudes, block_state = update_adaptive_range_block(
+            stream,
+            initial_state,
+            adapt_cfg,
+            allow_center_update=allow_center,
+            allow_amplitude_update=allow_amplitude,
+        )
+
+        np.testing.assert_array_equal(normalized, expected)
+        np.testing.assert_array_equal(amplitudes, expected_amplitudes)
+        assert block_state == state
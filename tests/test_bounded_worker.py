@@ -0,0 +1,57 @@
+"""Tests for the bounded-queue worker thread."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src.bounded_worker import BoundedWorker
+
+
+def test_bounded_worker_runs_calls_in_order_and_counts_backpressure() -> None:
+    release = threading.Event()
+    calls: list[int] = []
+    latencies: list[float] = []
+    worker = BoundedWorker(
+        name="TestWorker",
+        max_items=1,
+        error_message="Test worker failed.",
+        on_complete=latencies.append,
+    )
+
+    worker.submit(release.wait)
+    timer = threading.Timer(0.05, release.set)
+    timer.start()
+    for index in range(3):
+        worker.submit(lambda index=index: calls.append(index))
+    timer.join()
+    worker.close()
+
+    assert calls == [0, 1, 2]
+    assert worker.items_enqueued == worker.items_completed == 4
+    assert worker.max_queue_depth == 1
+    assert worker.backpressure_waits >= 1
+    assert len(latencies) == 4
+    with pytest.raises(RuntimeError, match="TestWorker is closed"):
+        worker.submit(lambda: None)
+
+
+def test_bounded_worker_latches_the_first_failure_and_skips_later_calls() -> None:
+    calls: list[str] = []
+    worker = BoundedWorker(name="TestWorker", max_items=4, error_message="Test worker failed.")
+
+    def fail() -> None:
+        raise OSError("disk full")
+
+    worker.submit(fail)
+    worker.submit(lambda: calls.append("after"))
+    with pytest.raises(RuntimeError, match="Test worker failed") as error_info:
+        worker.drain()
+    assert isinstance(error_info.value.__cause__, OSError)
+    assert isinstance(worker.error, OSError)
+    assert calls == []
+
+    worker.shutdown()
+    with pytest.raises(RuntimeError, match="Test worker failed"):
+        worker.close()
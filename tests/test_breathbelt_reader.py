@@ -311,6 +311,52 @@ def test_buffer_drops_oldest_when_full_and_counts_overflow(monkeypatch) -> None:
         belt.stop()
 
 
+def test_get_block_returns_one_columnar_copy_across_ring_wraparound(monkeypatch) -> None:
+    fake = FakeDevice(
+        [
+            np.vstack([_make_sample(0), _make_sample(1)]),
+            np.vstack([_make_sample(2), _make_sample(3)]),
+            np.vstack([_make_sample(4), _make_sample(5)]),
+            np.vstack([_make_sample(6), _make_sample(7), _make_sample(8), _make_sample(9)]),
+        ],
+        idle_delay_s=0.05,
+    )
+    belt = _make_belt(
+        monkeypatch,
+        fake,
+        queue_max_samples=3,
+        clock_values=[10.01],
+        read_chunk_size=2,
+    )
+    belt.start()
+    try:
+        def latest_is(sample_id: int) -> Callable[[], bool]:
+            def predicate() -> bool:
+                latest = belt.get_latest()
+                return latest is not None and int(latest.device_row[0]) == sample_id
+
+            return predicate
+
+        assert _wait_until(latest_is(1), timeout_s=1.0, poll_s=0.001)
+        first_block = belt.get_block()
+        assert first_block.source_sample_indices.tolist() == [0, 1]
+
+        assert _wait_until(latest_is(3), timeout_s=1.0, poll_s=0.001)
+        second_block = belt.get_block()
+        assert second_block.device_rows[:, 0].tolist() == [2.0, 3.0]
+
+        assert _wait_until(latest_is(9))
+        third_block = belt.get_block()
+        assert third_block.device_rows.shape == (3, 7)
+        assert third_block.device_rows[:, 0].tolist() == [7.0, 8.0, 9.0]
+        assert third_block.source_sample_indices.tolist() == [7, 8, 9]
+        assert np.allclose(third_block.capture_times_lsl_s, [10.07, 10.08, 10.09])
+        assert belt.dropped_rows_total == 3
+        assert len(belt.get_block()) == 0
+    finally:
+        belt.stop()
+
+
 def test_queue_overflow_preserves_a_natural_timestamp_gap_between_drains(monkeypatch) -> None:
     fake = FakeDevice(
         [
@@ -353,6 +399,30 @@ def test_queue_overflow_preserves_a_natural_timestamp_gap_between_drains(monkeyp
         belt.stop()
 
 
+def test_wait_for_rows_wakes_when_reader_stores_enough_rows(monkeypatch) -> None:
+    fake = FakeDevice(
+        [
+            _make_sample(0),
+            np.vstack([_make_sample(1), _make_sample(2)]),
+        ],
+        idle_delay_s=0.02,
+    )
+    belt = _make_belt(monkeypatch, fake, clock_values=[1.0], read_chunk_size=2)
+
+    assert belt.wait_for_rows(timeout=0.01) is False
+    belt.start()
+    try:
+        assert belt.wait_for_rows(timeout=2.0, min_rows=3) is True
+        assert len(belt.get_block()) == 3
+        started = time.perf_counter()
+        assert belt.wait_for_rows(timeout=0.05) is False
+        assert time.perf_counter() - started >= 0.04
+    finally:
+        belt.stop()
+
+    assert belt.wait_for_rows(timeout=None) is False
+
+
 def test_transient_read_error_does_not_kill_reader(monkeypatch) -> None:
     """A single read failure should be recorded without stopping acquisition."""
 
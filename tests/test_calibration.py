@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 import numpy as np
+import pytest
 
-from src.calibration import CalibrationConfig, normalize_sample, run_range_calibration
+from src.calibration import (
+    CalibrationConfig,
+    StreamingCalibrationWindow,
+    finalize_streaming_range_calibration,
+    normalize_sample,
+    run_range_calibration,
+)
 
 
 def test_percentile_clipping_rejects_outliers() -> None:
@@ -108,3 +117,29 @@ def test_fixed_calibration_stream_normalization_is_bounded() -> None:
     assert np.all(normalized <= 1.0)
     assert np.any(normalized == 0.0)
     assert np.any(normalized == 1.0)
+
+
+@pytest.mark.parametrize("n_samples", [1, 2, 7, 200, 1501])
+def test_streaming_calibration_window_matches_sorted_batch_statistics(n_samples: int) -> None:
+    rng = np.random.default_rng(n_samples)
+    samples = np.round(rng.normal(loc=512.0, scale=40.0, size=n_samples))
+    samples[:: max(1, n_samples // 5)] = 1023.0
+    cfg = CalibrationConfig(fs_hz=100.0, saturation_lo=440.0, saturation_hi=1020.0)
+
+    window = StreamingCalibrationWindow()
+    for value in samples.tolist():
+        window.add(value)
+
+    sorted_samples = np.sort(samples)
+    assert len(window) == n_samples
+    assert [window.order_statistic(index) for index in range(n_samples)] == sorted_samples.tolist()
+    assert window.median() == float(np.median(samples))
+    center = float(np.median(samples))
+    assert window.mean_abs_deviation(center) == pytest.approx(
+        float(np.mean(np.abs(samples - center))),
+        rel=1e-12,
+    )
+
+    result = finalize_streaming_range_calibration(window, cfg)
+    assert result.engine == "streaming"
+    assert result == replace(run_range_calibration(samples, cfg), engine="streaming")
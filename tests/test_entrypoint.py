@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 import io
+import json
 from pathlib import Path
+import shutil
 import subprocess
 import sys
 from types import SimpleNamespace
@@ -11,11 +14,87 @@ from uuid import uuid4
 
 import numpy as np
 
+import src.live_span as live_span_module
 import src.main as main_module
-from src.connect import AcquiredRow
+from src.connect import AcquiredBlock, AcquiredRow, lsl_local_clock
 from src.main import prompt_processing_mode
-from src.pipeline import PipelineSample
-from src.settings import AppConfig, default_config
+from src.pipeline import PipelineBatch, PipelineSample
+from src.settings import AppConfig, InstrumentationConfig, default_config
+
+
+def _rows_processor(process_row):
+    """Adapt a per-row fake processor to the chunk-level pipeline API."""
+
+    def process_rows(rows: np.ndarray, state: object, cfg: object) -> tuple[PipelineBatch, object]:
+        samples = []
+        for row in rows:
+            sample, state = process_row(row, state, cfg)
+            samples.append(sample)
+        return PipelineBatch.from_samples(samples), state
+
+    return process_rows
+
+
+class _RowListBelt:
+    """Serve per-row fake belt reads through the block drain API."""
+
+    def wait_for_rows(self, timeout: float | None = None, min_rows: int = 1) -> bool:
+        del timeout, min_rows
+        return True
+
+    def get_block(self) -> AcquiredBlock:
+        return AcquiredBlock.from_rows(self.get_all())
+
+
+class _RowwiseBatchWriter:
+    """Route batch writer calls to the per-row methods recorded by fakes."""
+
+    def drain(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def writer_stats(self) -> dict[str, str]:
+        return {"mode": "sync"}
+
+    def write_device_rows(
+        self,
+        batch: PipelineBatch,
+        device_rows: np.ndarray,
+        *,
+        source_sample_indices,
+        capture_times_lsl_s,
+        lsl_timestamps_s,
+    ) -> None:
+        for offset, sample in enumerate(batch.to_samples()):
+            self.write_device_row(
+                stage=sample.stage,
+                sample_index=sample.sample_index,
+                relative_time_s=sample.relative_time_s,
+                device_row=device_rows[offset],
+                source_sample_index=source_sample_indices[offset],
+                capture_time_lsl_s=capture_times_lsl_s[offset],
+                lsl_timestamp_s=lsl_timestamps_s[offset],
+            )
+
+    def write_signal_batch(
+        self,
+        batch: PipelineBatch,
+        *,
+        source_sample_indices,
+        capture_times_lsl_s,
+        lsl_timestamps_s,
+        event_timestamps_lsl_s,
+    ) -> None:
+        for offset, sample in enumerate(batch.to_samples()):
+            self.write_signal_sample(
+                sample,
+                source_sample_index=source_sample_indices[offset],
+                capture_time_lsl_s=capture_times_lsl_s[offset],
+                lsl_timestamp_s=lsl_timestamps_s[offset],
+                event_timestamp_lsl_s=event_timestamps_lsl_s[offset],
+            )
 
 
 def test_script_entrypoint_help_succeeds() -> None:
@@ -136,7 +215,7 @@ def test_run_acquisition_flushes_raw_export_once_per_chunk(monkeypatch) -> None:
         output=defaults.output.__class__(root_dir="ignored-in-test"),
     )
 
-    class FakeBelt:
+    class FakeBelt(_RowListBelt):
         def __init__(self, **_: object) -> None:
             self._reads = 0
 
@@ -165,7 +244,7 @@ def test_run_acquisition_flushes_raw_export_once_per_chunk(monkeypatch) -> None:
 
     writer_instances: list[object] = []
 
-    class FakeSessionWriter:
+    class FakeSessionWriter(_RowwiseBatchWriter):
         def __init__(
             self,
             root_dir: str,
@@ -264,7 +343,7 @@ def test_run_acquisition_flushes_raw_export_once_per_chunk(monkeypatch) -> None:
         "create_pipeline_state",
         lambda _: SimpleNamespace(calibration_result=None, adaptive_state=None, qc_state=None),
     )
-    monkeypatch.setattr(main_module, "process_device_row", fake_process_device_row)
+    monkeypatch.setattr(live_span_module, "process_device_rows", _rows_processor(fake_process_device_row))
     monkeypatch.setattr(main_module, "raw_qc_summary", lambda _: {})
     monkeypatch.setattr(main_module, "build_session_metadata", lambda **_: {})
 
@@ -310,7 +389,7 @@ def test_run_acquisition_throttles_runtime_value_prints_by_configured_percent(
         output=defaults.output.__class__(root_dir="ignored-in-test"),
     )
 
-    class FakeBelt:
+    class FakeBelt(_RowListBelt):
         def __init__(self, **_: object) -> None:
             self._reads = 0
 
@@ -336,7 +415,7 @@ def test_run_acquisition_throttles_runtime_value_prints_by_configured_percent(
         def stop(self) -> None:
             return None
 
-    class FakeSessionWriter:
+    class FakeSessionWriter(_RowwiseBatchWriter):
         def __init__(
             self,
             root_dir: str,
@@ -419,7 +498,7 @@ def test_run_acquisition_throttles_runtime_value_prints_by_configured_percent(
         "create_pipeline_state",
         lambda _: SimpleNamespace(calibration_result=None, adaptive_state=None, qc_state=None),
     )
-    monkeypatch.setattr(main_module, "process_device_row", fake_process_device_row)
+    monkeypatch.setattr(live_span_module, "process_device_rows", _rows_processor(fake_process_device_row))
     monkeypatch.setattr(main_module, "raw_qc_summary", lambda _: {})
     monkeypatch.setattr(main_module, "build_session_metadata", lambda **_: {})
 
@@ -460,7 +539,7 @@ def test_run_acquisition_resets_pipeline_state_when_source_samples_are_non_conti
         output=defaults.output.__class__(root_dir="ignored-in-test"),
     )
 
-    class FakeBelt:
+    class FakeBelt(_RowListBelt):
         def __init__(self, **_: object) -> None:
             self._reads = 0
 
@@ -489,7 +568,7 @@ def test_run_acquisition_resets_pipeline_state_when_source_samples_are_non_conti
 
     writer_instances: list[object] = []
 
-    class FakeSessionWriter:
+    class FakeSessionWriter(_RowwiseBatchWriter):
         def __init__(
             self,
             root_dir: str,
@@ -578,8 +657,8 @@ def test_run_acquisition_resets_pipeline_state_when_source_samples_are_non_conti
     monkeypatch.setattr(main_module, "_import_breath_belt", lambda: FakeBelt)
     monkeypatch.setattr(main_module, "SessionWriter", FakeSessionWriter)
     monkeypatch.setattr(main_module, "create_pipeline_state", lambda _: fake_state)
-    monkeypatch.setattr(main_module, "process_device_row", fake_process_device_row)
-    monkeypatch.setattr(main_module, "reset_pipeline_state_for_source_gap", fake_reset_pipeline_state_for_source_gap)
+    monkeypatch.setattr(live_span_module, "process_device_rows", _rows_processor(fake_process_device_row))
+    monkeypatch.setattr(live_span_module, "reset_pipeline_state_for_source_gap", fake_reset_pipeline_state_for_source_gap)
     monkeypatch.setattr(main_module, "raw_qc_summary", lambda _: {})
     monkeypatch.setattr(main_module, "build_session_metadata", lambda **kwargs: kwargs)
 
@@ -620,7 +699,7 @@ def test_run_acquisition_limits_live_plot_history_to_configured_window(monkeypat
         output=defaults.output.__class__(root_dir="ignored-in-test"),
     )
 
-    class FakeBelt:
+    class FakeBelt(_RowListBelt):
         def __init__(self, **_: object) -> None:
             self._reads = 0
 
@@ -648,7 +727,7 @@ def test_run_acquisition_limits_live_plot_history_to_configured_window(monkeypat
         def stop(self) -> None:
             return None
 
-    class FakeSessionWriter:
+    class FakeSessionWriter(_RowwiseBatchWriter):
         def __init__(
             self,
             root_dir: str,
@@ -785,7 +864,7 @@ def test_run_acquisition_limits_live_plot_history_to_configured_window(monkeypat
         "create_pipeline_state",
         lambda _: SimpleNamespace(calibration_result=None, adaptive_state=None, qc_state=None),
     )
-    monkeypatch.setattr(main_module, "process_device_row", fake_process_device_row)
+    monkeypatch.setattr(live_span_module, "process_device_rows", _rows_processor(fake_process_device_row))
     monkeypatch.setattr(main_module, "raw_qc_summary", lambda _: {})
     monkeypatch.setattr(main_module, "build_session_metadata", lambda **_: {})
 
@@ -797,3 +876,324 @@ def test_run_acquisition_limits_live_plot_history_to_configured_window(monkeypat
     assert plot_call["normalized_time"] == [5, 6, 7]
     assert plot_call["peak_times"] == [2, 4, 6]
     assert plot_call["trough_times"] == [3, 5, 7]
+
+
+def test_run_acquisition_exports_instrumentation_when_enabled(monkeypatch, capsys) -> None:
+    defaults = default_config()
+    config = replace(
+        defaults,
+        device=replace(defaults.device, mac_address="00:00:00:00:00:00"),
+        display=replace(defaults.display, enable_plot=False, print_runtime_values=False),
+        lsl=replace(defaults.lsl, enable=False),
+        output=replace(defaults.output, root_dir="ignored-in-test"),
+        instrumentation=InstrumentationConfig(enabled=True, console_summary_interval_s=1e-9),
+    )
+
+    class FakeBelt(_RowListBelt):
+        def __init__(self, **_: object) -> None:
+            self._reads = 0
+
+        def start(self) -> None:
+            return None
+
+        def get_all(self) -> list[AcquiredRow]:
+            self._reads += 1
+            if self._reads > 1:
+                return []
+            return [
+                AcquiredRow(
+                    device_row=np.array([index, 1, 2, 3, 4, 500 + index, 0], dtype=float),
+                    source_sample_index=index,
+                    capture_time_lsl_s=lsl_local_clock() - 0.01,
+                )
+                for index in range(3)
+            ]
+
+        def stop(self) -> None:
+            return None
+
+    writer_instances: list[object] = []
+
+    class FakeSessionWriter(_RowwiseBatchWriter):
+        def __init__(self, root_dir: str, app_config: AppConfig, *, device_sample_width: int) -> None:
+            del root_dir, app_config, device_sample_width
+            self.resolved_config_path = Path("resolved_config.toml")
+            self.metadata: dict[str, object] | None = None
+            writer_instances.append(self)
+
+        def write_device_row(self, *args: object, **kwargs: object) -> None:
+            del args, kwargs
+
+        def write_signal_sample(self, *args: object, **kwargs: object) -> None:
+            del args, kwargs
+
+        def write_qc_event(self, event: object) -> None:
+            del event
+
+        def flush_incremental(self) -> None:
+            return None
+
+        def finalize(self, metadata: dict[str, object]) -> None:
+            self.metadata = metadata
+
+    def fake_process_device_row(row: np.ndarray, state: object, cfg: object) -> tuple[PipelineSample, object]:
+        del cfg
+        return (
+            PipelineSample(
+                stage="runtime",
+                sample_index=int(row[0]),
+                relative_time_s=float(row[0]) / 100.0,
+                selected_sensor_raw=float(row[5]),
+                filtered_value=float(row[5]),
+                cleaned_value=float(row[5]),
+                normalized_value=0.5,
+                hold_mode_active=False,
+                adaptive_center=None,
+                adaptive_amplitude=None,
+            ),
+            state,
+        )
+
+    fake_state = SimpleNamespace(calibration_result=None, adaptive_state=None, qc_state=None)
+    pressed = iter([False, True])
+    monkeypatch.setitem(sys.modules, "keyboard", SimpleNamespace(is_pressed=lambda _: next(pressed)))
+    monkeypatch.setattr(main_module, "prompt_processing_mode", lambda: (1, "control"))
+    monkeypatch.setattr(main_module, "_import_breath_belt", lambda: FakeBelt)
+    monkeypatch.setattr(main_module, "SessionWriter", FakeSessionWriter)
+    monkeypatch.setattr(main_module, "create_pipeline_state", lambda _: fake_state)
+    monkeypatch.setattr(live_span_module, "process_device_rows", _rows_processor(fake_process_device_row))
+    monkeypatch.setattr(main_module, "raw_qc_summary", lambda _: {})
+    monkeypatch.setattr(main_module, "build_session_metadata", lambda **kwargs: kwargs)
+
+    main_module.run_acquisition(config)
+
+    summary = writer_instances[0].metadata["instrumentation_summary"]
+    assert summary["enabled"] is True
+    assert summary["chunks"] == 1
+    assert summary["dequeued_rows_per_chunk"]["max"] == 3
+    control_output = summary["end_to_end_from_oldest_capture"]["control_output"]
+    assert control_output["count"] == 1
+    assert control_output["min"] >= 0.01
+    assert summary["stage_duration_per_chunk"]["pipeline"]["count"] == 1
+    assert "LATENCY [1 chunks]: capture->control" in capsys.readouterr().out
+
+
+def test_run_acquisition_streams_and_exports_every_processed_column(monkeypatch) -> None:
+    defaults = default_config()
+    config = replace(
+        defaults,
+        device=replace(
+            defaults.device,
+            mac_address="00:00:00:00:00:00",
+            processed_sensor_column=6,
+            processed_sensor_columns=(5, 6),
+        ),
+        calibration=replace(defaults.calibration, duration_s=0.5),
+        display=replace(defaults.display, enable_plot=False, print_runtime_values=False),
+        lsl=replace(defaults.lsl, enable=True),
+        output=replace(
+            defaults.output,
+            root_dir=str(Path(".codex-tmp") / f"multichannel-run-{uuid4().hex}"),
+        ),
+    )
+    t = np.arange(300) / config.device.sampling_rate_hz
+
+    class FakeBelt(_RowListBelt):
+        def __init__(self, **_: object) -> None:
+            self._reads = 0
+
+        def start(self) -> None:
+            return None
+
+        def get_all(self) -> list[AcquiredRow]:
+            start = 30 * self._reads
+            self._reads += 1
+            return [
+                AcquiredRow(
+                    device_row=np.array(
+                        [
+                            index,
+                            0,
+                            0,
+                            0,
+                            0,
+                            500 + 20 * np.sin(2 * np.pi * 0.3 * t[index]),
+                            400 - 10 * np.sin(2 * np.pi * 0.2 * t[index]),
+                        ],
+                        dtype=float,
+                    ),
+                    source_sample_index=index,
+                    capture_time_lsl_s=100.0 + t[index],
+                )
+                for index in range(start, min(start + 30, t.size))
+            ]
+
+        def stop(self) -> None:
+            return None
+
+    senders: list[object] = []
+
+    class FakeSender:
+        def __init__(self, *, channel_count: int, channel_labels: tuple[str, ...], **_: object) -> None:
+            self.channel_count = channel_count
+            self.channel_labels = channel_labels
+            self.rows: list[list[float]] = []
+            senders.append(self)
+
+        def send(self, data, timestamp: float | None = None) -> None:
+            del timestamp
+            self.rows.append(list(data))
+
+        def send_chunk_array(self, samples: np.ndarray, timestamps: np.ndarray) -> None:
+            assert samples.shape == (timestamps.size, self.channel_count)
+            self.rows.extend(samples.tolist())
+
+    pressed = iter([False] * 10 + [True])
+    monkeypatch.setitem(sys.modules, "keyboard", SimpleNamespace(is_pressed=lambda _: next(pressed)))
+    monkeypatch.setattr(main_module, "prompt_processing_mode", lambda: (1, "control"))
+    monkeypatch.setattr(main_module, "_import_breath_belt", lambda: FakeBelt)
+    monkeypatch.setattr(main_module, "_import_lsl_sender", lambda: FakeSender)
+
+    try:
+        main_module.run_acquisition(config)
+        session_dir = next(Path(config.output.root_dir).iterdir())
+        header = (session_dir / "channel_trace.csv").read_text(encoding="utf-8").splitlines()[0]
+        metadata = json.loads((session_dir / "session_metadata.json").read_text(encoding="utf-8"))
+    finally:
+        shutil.rmtree(config.output.root_dir, ignore_errors=True)
+
+    control_sender, event_sender = senders
+    assert control_sender.channel_labels == ("breath_level_col5", "breath_level_col6")
+    assert len(control_sender.rows) == 250
+    assert all(len(row) == 2 for row in control_sender.rows + event_sender.rows)
+    assert "normalized_col5" in header and "extrema_event_code_col6" in header
+    assert metadata["processed_sensor_columns"] == [5, 6]
+    assert [channel["column"] for channel in metadata["multichannel"]["channels"]] == [5, 6]
+    assert metadata["calibration_result"] == metadata["multichannel"]["channels"][1]["calibration_result"]
+
+
+def test_run_acquisition_writes_metadata_when_async_writer_fails(
+    monkeypatch,
+    capsys,
+) -> None:
+    import time
+
+    from src.session_writer import SessionWriter
+
+    root_dir = Path(".codex-tmp") / f"writer-error-run-test-{uuid4().hex}"
+    config_path = root_dir / "config.toml"
+    root_dir.mkdir(parents=True)
+    config_path.write_text(
+        "\n".join(
+            [
+                "[device]",
+                'backend = "synthetic"',
+                "sampling_rate_hz = 100",
+                "channels = [0]",
+                "[display]",
+                "enable_plot = false",
+                "[lsl]",
+                "enable = false",
+                "[calibration]",
+                "duration_s = 1.0",
+                "[synthetic_device]",
+                "realtime = false",
+                "[output]",
+                'writer = "async"',
+                f'root_dir = "{(root_dir / "runs").as_posix()}"',
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    stop_at = time.monotonic() + 0.5
+
+    def failing_write_device_rows(self, *args, **kwargs) -> None:
+        del self, args, kwargs
+        raise OSError("disk full")
+
+    monkeypatch.setitem(
+        sys.modules,
+        "keyboard",
+        SimpleNamespace(is_pressed=lambda _: time.monotonic() >= stop_at),
+    )
+    monkeypatch.setattr(main_module, "prompt_processing_mode", lambda: (1, "control"))
+    monkeypatch.setattr(SessionWriter, "write_device_rows", failing_write_device_rows)
+    try:
+        exit_code = main_module.main(["--config", str(config_path)])
+        (session_dir,) = (root_dir / "runs").iterdir()
+        metadata = json.loads((session_dir / "session_metadata.json").read_text(encoding="utf-8"))
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert exit_code == 1
+    assert metadata["writer_error"] == "OSError('disk full')"
+    assert metadata["export"]["writer"]["mode"] == "async"
+    assert "Session writer thread failed." in capsys.readouterr().err
+
+
+def test_run_acquisition_writes_metadata_when_lsl_sender_thread_fails(
+    monkeypatch,
+    capsys,
+) -> None:
+    import time
+
+    root_dir = Path(".codex-tmp") / f"sender-error-run-test-{uuid4().hex}"
+    config_path = root_dir / "config.toml"
+    root_dir.mkdir(parents=True)
+    config_path.write_text(
+        "\n".join(
+            [
+                "[device]",
+                'backend = "synthetic"',
+                "sampling_rate_hz = 100",
+                "channels = [0]",
+                "[display]",
+                "enable_plot = false",
+                "[lsl]",
+                "enable = true",
+                'sender = "thread"',
+                "[calibration]",
+                "duration_s = 1.0",
+                "[synthetic_device]",
+                "realtime = false",
+                "[output]",
+                f'root_dir = "{(root_dir / "runs").as_posix()}"',
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    stop_at = time.monotonic() + 0.5
+
+    class _FailingSender:
+        def __init__(self, *, channel_count: int, **kwargs) -> None:
+            del kwargs
+            self.channel_count = channel_count
+
+        def send(self, data, timestamp=None) -> None:
+            del data, timestamp
+
+        def send_chunk_array(self, samples, timestamps=None) -> None:
+            del samples, timestamps
+            raise OSError("outlet gone")
+
+    monkeypatch.setitem(
+        sys.modules,
+        "keyboard",
+        SimpleNamespace(is_pressed=lambda _: time.monotonic() >= stop_at),
+    )
+    monkeypatch.setattr(main_module, "prompt_processing_mode", lambda: (1, "control"))
+    monkeypatch.setattr(main_module, "_import_lsl_sender", lambda: _FailingSender)
+    try:
+        exit_code = main_module.main(["--config", str(config_path)])
+        (session_dir,) = (root_dir / "runs").iterdir()
+        metadata = json.loads((session_dir / "session_metadata.json").read_text(encoding="utf-8"))
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert exit_code == 1
+    run_stats = metadata["lsl"]["run_stats"]
+    assert run_stats["sender_error"] == "OSError('outlet gone')"
+    assert run_stats["sender_thread"]["mode"] == "thread"
+    assert "LSL sender thread failed." in capsys.readouterr().err
@@ -0,0 +1,95 @@
+"""Tests for live-loop latency instrumentation."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from src.connect import AcquiredBlock
+from src.instrumentation import LatencyHistogram, LoopInstrumentation
+from src.settings import InstrumentationConfig
+
+
+def test_latency_histogram_percentiles_stay_within_bucket_precision() -> None:
+    values = np.random.default_rng(3).lognormal(mean=-6.0, sigma=1.5, size=20_000)
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.count == values.size
+    assert histogram.mean() == pytest.approx(float(values.mean()))
+    assert histogram.min == float(values.min())
+    assert histogram.max == float(values.max())
+    for percent in (50.0, 90.0, 99.0, 99.9):
+        expected = float(np.percentile(values, percent, method="inverted_cdf"))
+        assert histogram.percentile(percent) == pytest.approx(expected, rel=0.035, abs=2e-6)
+
+
+def test_latency_histogram_is_exact_for_small_tick_counts_and_clamps_large_values() -> None:
+    histogram = LatencyHistogram(unit=1.0, max_value=1000.0)
+    for value in (1, 2, 2, 3, 50):
+        histogram.record(value)
+    histogram.record(10_000)
+
+    assert histogram.percentile(50.0) == 2.0
+    assert histogram.percentile(80.0) == 50.0
+    assert histogram.percentile(100.0) == 10_000.0
+    assert histogram.summary()["count"] == 6
+    assert math.isnan(LatencyHistogram().percentile(50.0))
+    assert LatencyHistogram().summary() == {"count": 0}
+
+
+def test_chunk_timer_attributes_laps_to_stages_and_checkpoints() -> None:
+    clock_values = iter([10.010, 10.013, 10.014, 10.020, 10.021, 10.030, 10.040])
+    instrumentation = LoopInstrumentation(
+        InstrumentationConfig(enabled=True),
+        clock=lambda: next(clock_values),
+    )
+    block = AcquiredBlock(
+        device_rows=np.zeros((2, 7)),
+        source_sample_indices=np.array([0, 1]),
+        capture_times_lsl_s=np.array([10.000, 10.001]),
+    )
+
+    timer = instrumentation.start_chunk(block)  # dequeued at 10.010
+    timer.lap("pipeline")  # 10.013
+    timer.lap("session_write")  # 10.014
+    timer.lap("pipeline")  # 10.020
+    timer.mark("control_output")  # 10.021
+    timer.lap("plot")  # 10.030
+    timer.finish()  # loop_end at 10.040
+    summary = instrumentation.summary()
+
+    assert summary["chunks"] == 1
+    end_to_end = summary["end_to_end_from_oldest_capture"]
+    assert end_to_end["dequeue"]["max"] == pytest.approx(0.010)
+    assert end_to_end["control_output"]["max"] == pytest.approx(0.021)
+    assert end_to_end["loop_end"]["max"] == pytest.approx(0.040)
+    stages = summary["stage_duration_per_chunk"]
+    assert stages["pipeline"]["max"] == pytest.approx(0.009)
+    assert stages["session_write"]["max"] == pytest.approx(0.001)
+    assert stages["plot"]["max"] == pytest.approx(0.010)
+    assert stages["lsl_send"] == {"count": 0}
+    assert summary["dequeued_rows_per_chunk"]["max"] == 2
+    assert instrumentation.console_summary().startswith("LATENCY [1 chunks]: capture->control p50=21.")
+
+
+def test_disabled_instrumentation_is_a_no_op() -> None:
+    instrumentation = LoopInstrumentation(
+        clock=lambda: pytest.fail("disabled instrumentation must not read the clock"),
+    )
+    block = AcquiredBlock(
+        device_rows=np.zeros((1, 7)),
+        source_sample_indices=np.array([0]),
+        capture_times_lsl_s=np.array([1.0]),
+    )
+
+    timer = instrumentation.start_chunk(block)
+    timer.lap("pipeline")
+    timer.mark("control_output")
+    timer.finish()
+
+    assert instrumentation.summary() == {"enabled": False}
+    assert instrumentation.due_console_summary() is None
@@ -0,0 +1,136 @@
+"""Tests for the per-span processing shared by the live loops."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+
+import src.live_span as live_span_module
+from src.connect import AcquiredBlock
+from src.live_span import LiveSpanProcessor
+from src.lsl_metadata import build_lsl_run_stats
+from src.pipeline import PipelineBatch, PipelineConfig, PipelineSample
+from src.settings import default_config
+
+
+class _RecordingSender:
+    def __init__(self) -> None:
+        self.samples: list[tuple[object, float]] = []
+        self.chunks: list[tuple[np.ndarray, np.ndarray]] = []
+
+    def send(self, data, timestamp=None) -> None:
+        self.samples.append((data, timestamp))
+
+    def send_chunk_array(self, samples: np.ndarray, timestamps: np.ndarray) -> None:
+        self.chunks.append((samples, timestamps))
+
+
+class _RecordingWriter:
+    def __init__(self) -> None:
+        self.signal_event_timestamps: list[float | None] = []
+        self.qc_events: list[object] = []
+
+    def write_device_rows(self, *args, **kwargs) -> None:
+        del args, kwargs
+
+    def write_signal_batch(self, batch, *, event_timestamps_lsl_s, **kwargs) -> None:
+        del batch, kwargs
+        self.signal_event_timestamps.extend(event_timestamps_lsl_s)
+
+    def write_qc_event(self, event: object) -> None:
+        self.qc_events.append(event)
+
+
+def _fake_process_device_rows(rows: np.ndarray, state: object, cfg: object):
+    del cfg
+    samples = [
+        PipelineSample(
+            stage="runtime",
+            sample_index=int(row[0]),
+            relative_time_s=int(row[0]) / 100.0,
+            selected_sensor_raw=float(row[5]),
+            filtered_value=float(row[5]),
+            cleaned_value=float(row[5]),
+            normalized_value=float(row[5]) / 1000.0,
+            hold_mode_active=False,
+            adaptive_center=None,
+            adaptive_amplitude=None,
+            extrema_event_code=1.0 if int(row[0]) == 4 else 0.0,
+        )
+        for row in rows
+    ]
+    return PipelineBatch.from_samples(samples), state
+
+
+def _block(first_index: int, count: int) -> AcquiredBlock:
+    indices = np.arange(first_index, first_index + count, dtype=np.int64)
+    rows = np.zeros((count, 6), dtype=float)
+    rows[:, 0] = indices
+    rows[:, 5] = 500.0 + indices
+    return AcquiredBlock(
+        device_rows=rows,
+        source_sample_indices=indices,
+        capture_times_lsl_s=10.0 + indices / 100.0,
+    )
+
+
+def _make_processor(monkeypatch) -> tuple[LiveSpanProcessor, _RecordingSender, _RecordingSender]:
+    monkeypatch.setattr(live_span_module, "process_device_rows", _fake_process_device_rows)
+    config = default_config()
+    control_sender = _RecordingSender()
+    event_sender = _RecordingSender()
+    processor = LiveSpanProcessor(
+        config,
+        PipelineConfig.from_app_config(config, "control"),
+        SimpleNamespace(),
+        session_writer=_RecordingWriter(),
+        control_sender=control_sender,
+        event_sender=event_sender,
+        lsl_run_stats=build_lsl_run_stats(config),
+        log_prefix="[belt] ",
+    )
+    return processor, control_sender, event_sender
+
+
+def test_live_span_processor_combines_back_to_back_spans_into_one_push(monkeypatch) -> None:
+    processor, control_sender, event_sender = _make_processor(monkeypatch)
+
+    processor.process_span(_block(0, 3))
+    processor.process_span(_block(3, 4))
+    processor.flush_control()
+
+    [(samples, timestamps)] = control_sender.chunks
+    np.testing.assert_allclose(samples[:, 0], (500.0 + np.arange(7)) / 1000.0, rtol=1e-6)
+    np.testing.assert_allclose(timestamps, 10.0 + np.arange(7) / 100.0)
+    assert processor.lsl_run_stats["control_chunks_sent"] == 1
+    assert processor.lsl_run_stats["control_samples_sent"] == 7
+    # The inhale peak at source index 4 is stamped with the previous live row's timestamp.
+    assert event_sender.samples == [(1.0, 10.03)]
+    assert processor.session_writer.signal_event_timestamps[4] == 10.03
+
+
+def test_live_span_processor_flushes_and_resets_state_across_source_gaps(
+    monkeypatch,
+    capsys,
+) -> None:
+    processor, control_sender, _ = _make_processor(monkeypatch)
+    resets: list[object] = []
+    monkeypatch.setattr(
+        live_span_module,
+        "reset_pipeline_state_for_source_gap",
+        lambda state: resets.append(state),
+    )
+
+    processor.process_span(_block(0, 3))
+    processor.process_span(_block(5, 1))
+    processor.flush_control()
+
+    assert [chunk[0].shape[0] for chunk in control_sender.chunks] == [3]
+    assert control_sender.samples == [(0.505, 10.05)]
+    assert processor.lsl_run_stats["observed_gap_count"] == 1
+    assert processor.lsl_run_stats["control_samples_sent"] == 4
+    assert len(resets) == 1
+    assert "[belt] WARNING [source_gap]: detected non-contiguous source samples (2 missing" in (
+        capsys.readouterr().out
+    )
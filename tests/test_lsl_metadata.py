@@ -48,6 +48,22 @@ def test_build_event_lsl_metadata_and_timing_share_the_expected_contract() -> No
     assert timing_metadata["constant_delay_s"] == 0.25
 
 
+def test_build_lsl_metadata_names_one_channel_per_processed_column() -> None:
+    defaults = default_config()
+    config = replace(
+        defaults,
+        device=replace(defaults.device, processed_sensor_columns=(5, 6)),
+    )
+
+    control_metadata = build_control_lsl_metadata(config, "movement")
+    event_metadata = build_event_lsl_metadata(config, "movement")
+
+    assert control_metadata["channel_count"] == 2
+    assert control_metadata["channel_names"] == ["movement_value_col5", "movement_value_col6"]
+    assert event_metadata["channel_count"] == 2
+    assert event_metadata["channel_names"] == ["event_code_col5", "event_code_col6"]
+
+
 def test_build_lsl_metadata_returns_disabled_stubs_when_lsl_is_disabled() -> None:
     defaults = default_config()
     config = replace(defaults, lsl=replace(defaults.lsl, enable=False))
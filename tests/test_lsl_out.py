@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import ctypes
 import importlib
 import sys
 import types
 
+import numpy as np
+import pytest
+
 
 class _FakeNode:
     def __init__(self, name: str) -> None:
@@ -168,3 +172,125 @@ def test_lsl_sender_records_timing_and_event_metadata(monkeypatch) -> None:
     event_nodes = desc_children["event_codes"].children
     assert event_nodes[0].values == {"code": "1.0", "label": "inhale_peak"}
     assert event_nodes[1].values == {"code": "-1.0", "label": "exhale_trough"}
+
+
+def test_lsl_sender_thread_pushes_queued_blocks_in_order(monkeypatch) -> None:
+    lsl_out = _reload_lsl_module(monkeypatch)
+    control_sender = lsl_out.LSLBreathingSender()
+    event_sender = lsl_out.LSLBreathingSender(channel_labels=("event_code",))
+    sender_thread = lsl_out.LSLSenderThread(
+        control_sender,
+        event_sender,
+        queue_max_blocks=1,
+        clock=lambda: 2.5,
+    )
+
+    samples = [0.1, 0.2]
+    timestamps = [1.0, 1.01]
+    sender_thread.control.send_chunk(samples, timestamps=timestamps)
+    samples.clear()
+    timestamps.clear()
+    sender_thread.control.send(0.3, timestamp=1.02)
+    sender_thread.event.send(1.0, timestamp=1.01)
+    sender_thread.close()
+    stats = sender_thread.stats()
+
+    assert control_sender.outlet.chunks == [([[0.1], [0.2]], [1.0, 1.01])]
+    assert control_sender.outlet.samples == [[0.3]]
+    assert control_sender.outlet.timestamps == [1.02]
+    assert event_sender.outlet.samples == [[1.0]]
+    assert event_sender.outlet.timestamps == [1.01]
+    assert stats["blocks_enqueued"] == stats["blocks_sent"] == 3
+    assert stats["samples_sent"] == 4
+    assert stats["send_lag_s"]["count"] == 3
+    assert stats["sample_to_push_lag_s"]["max"] == pytest.approx(1.49)
+
+
+def test_lsl_sender_thread_surfaces_push_failures_to_the_caller(monkeypatch) -> None:
+    lsl_out = _reload_lsl_module(monkeypatch)
+    control_sender = lsl_out.LSLBreathingSender()
+
+    def fail_push(sample, timestamp=None):
+        raise OSError("outlet gone")
+
+    control_sender.outlet.push_sample = fail_push
+    sender_thread = lsl_out.LSLSenderThread(control_sender, None)
+    sender_thread.control.send(0.5, timestamp=1.0)
+
+    assert sender_thread.event is None
+    with pytest.raises(RuntimeError, match="LSL sender thread failed") as error_info:
+        sender_thread.drain()
+    assert isinstance(error_info.value.__cause__, OSError)
+
+
+def test_lsl_sender_sends_sample_arrays_through_the_buffer_push(monkeypatch) -> None:
+    lsl_out = _reload_lsl_module(monkeypatch)
+    sender = lsl_out.LSLBreathingSender()
+    pushed: list[tuple[list[float], list[float]]] = []
+
+    def push_chunk_n(obj, data, n_values, timestamps, pushthrough):
+        value_buffer = ctypes.cast(data, ctypes.POINTER(ctypes.c_float))
+        timestamp_buffer = ctypes.cast(timestamps, ctypes.POINTER(ctypes.c_double))
+        pushed.append(
+            (
+                np.ctypeslib.as_array(value_buffer, shape=(n_values.value,)).tolist(),
+                np.ctypeslib.as_array(timestamp_buffer, shape=(n_values.value,)).tolist(),
+            )
+        )
+        return 0
+
+    sender.outlet.obj = object()
+    sender.outlet.do_push_chunk_n = push_chunk_n
+    sender.send_chunk_array(
+        np.array([[0.25], [0.5], [0.75]], dtype=np.float32),
+        np.array([1.0, 1.01, 1.02]),
+    )
+
+    assert pushed == [([0.25, 0.5, 0.75], [1.0, 1.01, 1.02])]
+    assert sender.outlet.chunks == []
+    with pytest.raises(ValueError, match="timestamps must match"):
+        sender.send_chunk_array(np.zeros((2, 1), dtype=np.float32), np.zeros(3))
+    with pytest.raises(ValueError, match="samples must have shape"):
+        sender.send_chunk_array(np.zeros((2, 2), dtype=np.float32))
+
+
+def test_lsl_sender_array_path_falls_back_to_push_chunk(monkeypatch) -> None:
+    lsl_out = _reload_lsl_module(monkeypatch)
+    sender = lsl_out.LSLBreathingSender()
+    sender.send_chunk_array(np.array([0.1, 0.2]), np.array([1.0, 1.01]))
+
+    [(samples, timestamps)] = sender.outlet.chunks
+    assert samples.dtype == np.float32 and samples.shape == (2, 1)
+    assert timestamps == [1.0, 1.01]
+
+
+def test_lsl_sender_thread_queues_copies_of_sample_arrays(monkeypatch) -> None:
+    lsl_out = _reload_lsl_module(monkeypatch)
+    control_sender = lsl_out.LSLBreathingSender()
+    sender_thread = lsl_out.LSLSenderThread(control_sender, None, clock=lambda: 2.0)
+
+    values = np.array([0.1, 0.2])
+    timestamps = np.array([1.0, 1.5])
+    sender_thread.control.send_chunk_array(values, timestamps)
+    values[:] = 0.0
+    timestamps[:] = 0.0
+    sender_thread.close()
+
+    [(samples, pushed_timestamps)] = control_sender.outlet.chunks
+    np.testing.assert_allclose(samples[:, 0], [0.1, 0.2], rtol=1e-6)
+    assert pushed_timestamps == [1.0, 1.5]
+    assert sender_thread.stats()["sample_to_push_lag_s"]["max"] == 0.5
+
+
+def test_lsl_sender_thread_rejects_wrong_shaped_arrays_before_queuing(monkeypatch) -> None:
+    lsl_out = _reload_lsl_module(monkeypatch)
+    control_sender = lsl_out.LSLBreathingSender()
+    sender_thread = lsl_out.LSLSenderThread(control_sender, None)
+
+    with pytest.raises(ValueError, match="samples must have shape"):
+        sender_thread.control.send_chunk_array(np.zeros((2, 2), dtype=np.float32))
+    sender_thread.control.send_chunk_array(np.array([0.1]), np.array([1.0]))
+    sender_thread.close()
+
+    assert sender_thread.stats()["blocks_enqueued"] == 1
+    assert len(control_sender.outlet.chunks) == 1
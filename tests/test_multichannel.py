@@ -0,0 +1,193 @@
+"""Tests for channel-stacked multi-channel processing."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from src.multichannel import (
+    create_multichannel_state,
+    process_multichannel_rows,
+    reset_multichannel_state_for_source_gap,
+)
+from src.pipeline import (
+    PipelineConfig,
+    create_pipeline_state,
+    process_device_rows,
+    reset_pipeline_state_for_source_gap,
+)
+from src.quality import raw_qc_summary
+from src.settings import (
+    AdaptationSettings,
+    CalibrationSettings,
+    ExtremaConfig,
+    FilterConfig,
+    HoldConfig,
+    MovementConfig,
+    OutputSmoothingConfig,
+    RawQCConfig,
+)
+
+
+FS_HZ = 100
+_COMPARED_COLUMNS = (
+    "filtered_value",
+    "normalized_value",
+    "movement_value",
+    "adaptive_center",
+    "adaptive_amplitude",
+)
+
+
+def _make_pipeline_config(
+    *,
+    processing_mode: str,
+    invert_signal: bool = False,
+    calibration_engine: str = "batch",
+) -> PipelineConfig:
+    return PipelineConfig(
+        sampling_rate_hz=FS_HZ,
+        processed_sensor_column=5,
+        processed_sensor_columns=(4, 5, 6),
+        invert_signal=invert_signal,
+        filter=FilterConfig(hp_cutoff_hz=0.005, hp_order=1, lp_cutoff_hz=1.5, lp_order=2),
+        calibration=CalibrationSettings(
+            duration_s=1.0,
+            percentile_lo=5.0,
+            percentile_hi=95.0,
+            amplitude_floor=1e-3,
+            padding_ratio=0.20,
+            engine=calibration_engine,
+        ),
+        adaptation=AdaptationSettings(
+            center_tau_s=20.0,
+            amplitude_tau_s=0.5,
+            startup_duration_s=0.5,
+            startup_center_tau_s=0.2,
+            startup_amplitude_tau_s=0.2,
+        ),
+        hold=HoldConfig(activity_window_ms=100, ratio_per_sec_enter=0.2, ratio_per_sec_exit=0.4),
+        output_smoothing=OutputSmoothingConfig(activity_window_ms=500),
+        extrema=ExtremaConfig(min_interval_ms=800, prominence_ratio=0.1),
+        raw_qc=RawQCConfig(flatline_duration_s=0.2, warmup_s=0.1, baseline_shift_floor=10.0),
+        processing_mode=processing_mode,
+        movement=MovementConfig(low_activity_slowdown_enabled=True),
+    )
+
+
+def _make_rows(row_count: int) -> np.ndarray:
+    rng = np.random.default_rng(5)
+    t = np.arange(row_count, dtype=float) / FS_HZ
+    rows = np.zeros((row_count, 7), dtype=float)
+    rows[:, 4] = 500.0 + 20.0 * np.sin(2.0 * np.pi * 0.22 * t) + rng.normal(0.0, 0.5, row_count)
+    rows[:, 5] = 520.0 + 35.0 * np.sin(2.0 * np.pi * 0.31 * t + 1.0)
+    rows[row_count // 2 : row_count // 2 + 60, 5] = 540.0
+    rows[:, 6] = 480.0 + 10.0 * np.sin(2.0 * np.pi * 0.15 * t) + rng.normal(0.0, 2.0, row_count)
+    rows[-15:, 6] = 1023.0
+    return rows
+
+
+def _chunks(row_count: int, seed: int) -> list[tuple[int, int]]:
+    sizes = np.random.default_rng(seed).integers(1, 41, size=row_count)
+    bounds = np.minimum(np.concatenate([[0], np.cumsum(sizes)]), row_count)
+    return [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+
+@pytest.mark.parametrize("processing_mode", ["control", "movement", "adaptive"])
+@pytest.mark.parametrize("invert_signal", [False, True])
+@pytest.mark.parametrize("calibration_engine", ["batch", "streaming"])
+def test_multichannel_rows_match_single_channel_pipeline_per_column(
+    processing_mode: str,
+    invert_signal: bool,
+    calibration_engine: str,
+) -> None:
+    cfg = _make_pipeline_config(
+        processing_mode=processing_mode,
+        invert_signal=invert_signal,
+        calibration_engine=calibration_engine,
+    )
+    rows = _make_rows(900)
+    gap_at = 600
+
+    multi_state = create_multichannel_state(cfg)
+    multi_batches = []
+    for segment_start, segment_stop in ((0, gap_at), (gap_at, rows.shape[0])):
+        if segment_start:
+            reset_multichannel_state_for_source_gap(multi_state)
+        segment = rows[segment_start:segment_stop]
+        for start, stop in _chunks(segment.shape[0], seed=segment_start):
+            batch, multi_state = process_multichannel_rows(segment[start:stop], multi_state, cfg)
+            multi_batches.append(batch)
+
+    for position, column in enumerate(cfg.processed_sensor_columns):
+        single_cfg = replace(cfg, processed_sensor_column=column, processed_sensor_columns=())
+        single_state = create_pipeline_state(single_cfg)
+        first, single_state = process_device_rows(rows[:gap_at], single_state, single_cfg)
+        reset_pipeline_state_for_source_gap(single_state)
+        second, single_state = process_device_rows(rows[gap_at:], single_state, single_cfg)
+        channel_batches = [batch.channel(position) for batch in multi_batches]
+
+        assert np.array_equal(
+            np.concatenate([batch.runtime_mask for batch in channel_batches]),
+            np.concatenate([first.runtime_mask, second.runtime_mask]),
+        )
+        assert np.array_equal(
+            np.concatenate([batch.sample_index for batch in channel_batches]),
+            np.concatenate([first.sample_index, second.sample_index]),
+        )
+        for name in _COMPARED_COLUMNS:
+            expected = np.concatenate([getattr(first, name), getattr(second, name)])
+            actual = np.concatenate([getattr(batch, name) for batch in channel_batches])
+            np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-9, err_msg=name)
+        for name in ("hold_mode_active", "extrema_event_code"):
+            expected = np.concatenate([getattr(first, name), getattr(second, name)])
+            actual = np.concatenate([getattr(batch, name) for batch in channel_batches])
+            assert np.array_equal(actual, expected), name
+        assert np.count_nonzero(
+            np.concatenate([batch.extrema_event_code for batch in channel_batches])
+        ) > 0
+
+        expected_events = [
+            event for _, event in (*first.qc_events, *second.qc_events)
+        ]
+        assert [event for batch in channel_batches for _, event in batch.qc_events] == expected_events
+        assert raw_qc_summary(multi_state.qc_states[position]) == raw_qc_summary(single_state.qc_state)
+        assert multi_state.calibration_results[position] == single_state.calibration_result
+        assert multi_state.calibration_results[position].engine == calibration_engine
+        assert multi_state.adaptive_states[position] == pytest.approx(single_state.adaptive_state)
+
+    assert multi_state.calibration_result == multi_state.calibration_results[1]
+
+
+def test_multichannel_batch_reports_shared_progress_and_per_column_calibration() -> None:
+    cfg = _make_pipeline_config(processing_mode="control")
+    state = create_multichannel_state(cfg)
+
+    batch, state = process_multichannel_rows(_make_rows(150), state, cfg)
+
+    assert batch.runtime_values.shape == (150, 3)
+    assert batch.channel_columns == (4, 5, 6)
+    messages = [message for _, message in batch.messages]
+    assert messages.count("Calibration progress: 100/100 samples") == 1
+    assert messages.count("Calibration complete.") == 1
+    summaries = [message for message in messages if message.startswith("Fixed control map: ")]
+    assert [summary[summary.rindex("(") :] for summary in summaries] == [
+        "(column 4)",
+        "(column 5)",
+        "(column 6)",
+    ]
+    assert state.stage == "runtime"
+    assert state.stage_sample_index == 50
+
+
+def test_multichannel_state_rejects_invalid_columns() -> None:
+    cfg = _make_pipeline_config(processing_mode="control")
+
+    with pytest.raises(ValueError, match="must not be empty"):
+        create_multichannel_state(replace(cfg, processed_sensor_columns=()))
+    with pytest.raises(ValueError, match="must include"):
+        create_multichannel_state(replace(cfg, processed_sensor_columns=(4, 6)))
+    with pytest.raises(ValueError, match="out of bounds"):
+        process_multichannel_rows(np.zeros((3, 6)), create_multichannel_state(cfg), cfg)
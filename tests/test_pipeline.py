@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 import numpy as np
 import pytest
 
-from src.calibration import normalize_sample
+from src.calibration import adaptive_range_alphas, normalize_sample
 from src.pipeline import (
+    HOLD_RELEASE_DRIFT,
     PipelineConfig,
+    confirm_extremum,
     create_pipeline_state,
     process_device_row,
+    process_device_rows,
     reset_pipeline_state_for_source_gap,
+    step_hold_latch,
+)
+from src.quality import (
+    create_raw_qc_state,
+    raw_qc_summary,
+    update_raw_qc,
+    update_raw_qc_block,
 )
-from src.quality import create_raw_qc_state, raw_qc_summary, update_raw_qc
 from src.settings import (
     AdaptationSettings,
     CalibrationSettings,
@@ -40,6 +51,7 @@ def _make_pipeline_config(
     output_smoothing: OutputSmoothingConfig | None = None,
     extrema: ExtremaConfig | None = None,
     raw_qc: RawQCConfig | None = None,
+    calibration_engine: str = "batch",
 ) -> PipelineConfig:
     return PipelineConfig(
         sampling_rate_hz=FS_HZ,
@@ -52,6 +64,7 @@ def _make_pipeline_config(
             percentile_hi=95.0,
             amplitude_floor=1e-3,
             padding_ratio=0.20,
+            engine=calibration_engine,
         ),
         adaptation=adaptation
         or AdaptationSettings(
@@ -1160,8 +1173,7 @@ def test_pipeline_rejects_low_prominence_noise_as_extrema() -> None:
     assert state.adaptive_state is not None
 
     state.filter_initialized = False
-    state.sos_lp = None
-    state.zi_lp = None
+    state.lp_filter = None
     state.previous_filtered_value = None
     state.previous_cleaned_value = None
     state.previous_delta_sign = 0
@@ -1231,10 +1243,8 @@ def test_pipeline_gap_reset_preserves_long_lived_state_and_clears_short_term_sta
     assert len(state.recent_movement_abs_velocity) == 0
     assert len(state.recent_adaptive_abs_velocity) == 0
     assert state.filter_initialized is False
-    assert state.sos_hp is None
-    assert state.zi_hp is None
-    assert state.sos_lp is None
-    assert state.zi_lp is None
+    assert state.hp_filter is None
+    assert state.lp_filter is None
     assert state.previous_filtered_value is None
     assert state.previous_cleaned_value is None
     assert state.previous_movement_activity_value is None
@@ -1262,6 +1272,102 @@ def test_pipeline_gap_reset_preserves_long_lived_state_and_clears_short_term_sta
     assert state.stage_sample_index == stage_sample_index + 1
 
 
+@pytest.mark.parametrize("processing_mode", ["control", "movement", "adaptive"])
+@pytest.mark.parametrize("invert_signal", [False, True])
+def test_process_device_rows_matches_scalar_path_across_chunk_boundaries(
+    processing_mode: str,
+    invert_signal: bool,
+) -> None:
+    cfg = _make_pipeline_config(
+        calibration_duration_s=1.0,
+        processing_mode=processing_mode,
+        invert_signal=invert_signal,
+        movement=MovementConfig(low_activity_slowdown_enabled=True),
+        raw_qc=RawQCConfig(flatline_duration_s=0.2, warmup_s=0.1, baseline_shift_floor=10.0),
+    )
+    rng = np.random.default_rng(11)
+    values = np.concatenate(
+        [
+            _make_breathing_values(cfg.calibration_target_samples + 7, amplitude=20.0)
+            + rng.normal(0.0, 0.5, size=cfg.calibration_target_samples + 7),
+            np.full(40, 512.0),
+            _make_breathing_values(400, amplitude=35.0, offset=560.0),
+            np.full(10, 1023.0),
+        ]
+    )
+    rows = np.vstack([_make_row(float(value)) for value in values])
+
+    scalar_samples, scalar_state = _replay(values, cfg)
+
+    batch_state = create_pipeline_state(cfg)
+    batch_samples = []
+    # Mix blocks below and above the per-row loop threshold of 48 rows.
+    chunk_sizes = rng.integers(1, 97, size=rows.shape[0])
+    start = 0
+    for chunk_size in chunk_sizes:
+        if start >= rows.shape[0]:
+            break
+        batch, batch_state = process_device_rows(
+            rows[start : start + int(chunk_size)],
+            batch_state,
+            cfg,
+        )
+        assert len(batch) == min(int(chunk_size), rows.shape[0] - start)
+        batch_samples.extend(batch.to_samples())
+        start += int(chunk_size)
+
+    assert batch_samples == scalar_samples
+    assert batch_state.calibration_result == scalar_state.calibration_result
+    assert batch_state.adaptive_state == scalar_state.adaptive_state
+    assert raw_qc_summary(batch_state.qc_state) == raw_qc_summary(scalar_state.qc_state)
+
+
+@pytest.mark.parametrize("processing_mode", ["control", "movement", "adaptive"])
+def test_streaming_calibration_engine_matches_batch_calibration(processing_mode: str) -> None:
+    batch_cfg = _make_pipeline_config(
+        processing_mode=processing_mode,
+        calibration_duration_s=3.0,
+    )
+    streaming_cfg = _make_pipeline_config(
+        processing_mode=processing_mode,
+        calibration_duration_s=3.0,
+        calibration_engine="streaming",
+    )
+    rng = np.random.default_rng(11)
+    values = _make_breathing_values(batch_cfg.calibration_target_samples + 200, amplitude=25.0)
+    values = values + rng.normal(0.0, 1.5, size=values.size)
+
+    batch_samples, batch_state = _replay(values, batch_cfg)
+    streaming_samples, streaming_state = _replay(values, streaming_cfg)
+
+    assert batch_state.calibration_result.engine == "batch"
+    assert streaming_state.calibration_result.engine == "streaming"
+    assert streaming_state.calibration_samples == []
+    assert streaming_state.calibration_result == replace(
+        batch_state.calibration_result,
+        engine="streaming",
+    )
+    assert streaming_state.adaptive_state.abs_dev_ema == pytest.approx(
+        batch_state.adaptive_state.abs_dev_ema,
+        rel=1e-9,
+    )
+    assert [sample.stage for sample in streaming_samples] == [
+        sample.stage for sample in batch_samples
+    ]
+    assert [sample.messages for sample in streaming_samples] == [
+        sample.messages for sample in batch_samples
+    ]
+
+
+def test_process_device_rows_rejects_non_tabular_blocks_and_out_of_range_columns() -> None:
+    cfg = _make_pipeline_config(processed_sensor_column=6)
+
+    with pytest.raises(ValueError, match="two-dimensional"):
+        process_device_rows(_make_row(512.0), create_pipeline_state(cfg), cfg)
+    with pytest.raises(ValueError, match="out of bounds"):
+        process_device_rows(np.zeros((3, 6)), create_pipeline_state(cfg), cfg)
+
+
 def test_pipeline_raw_qc_reports_saturation_flatline_and_baseline_shift() -> None:
     cfg = _make_pipeline_config(
         raw_qc=RawQCConfig(
@@ -1327,3 +1433,120 @@ def test_raw_qc_flatline_triggers_on_the_exact_sample_duration_boundary() -> Non
         )
 
     assert flatline_event_indices == [19]
+
+
+def test_raw_qc_block_matches_per_sample_events_and_state_across_chunks() -> None:
+    cfg = RawQCConfig(
+        flatline_duration_s=0.2,
+        baseline_ema_tau_s=2.0,
+        baseline_abs_dev_tau_s=1.0,
+        baseline_shift_floor=20.0,
+        warmup_s=0.5,
+    )
+    rng = np.random.default_rng(7)
+    raw_values = 512.0 + 40.0 * np.sin(np.arange(3000) / 40.0) + rng.normal(0.0, 2.0, 3000)
+    raw_values[300:340] = 1023.0
+    raw_values[500:560] = raw_values[500]
+    raw_values[800:1400] = raw_values[800]
+    raw_values[1600:] += 300.0
+    raw_values[2000:2005] = 0.0
+    raw_values[2500:2530] = raw_values[2500]
+
+    scalar_state = create_raw_qc_state()
+    scalar_events = []
+    for sample_index, raw_value in enumerate(raw_values.tolist()):
+        events, scalar_state = update_raw_qc(
+            raw_value=raw_value,
+            stage="runtime",
+            sample_index=sample_index,
+            relative_time_s=sample_index / FS_HZ,
+            state=scalar_state,
+            cfg=cfg,
+            fs_hz=float(FS_HZ),
+        )
+        scalar_events.extend((sample_index, event) for event in events)
+
+    block_state = create_raw_qc_state()
+    block_events = []
+    start = 0
+    for chunk_size in [1, 7, 250, 33, 512, 10] * 20:
+        stop = min(start + chunk_size, raw_values.size)
+        sample_indices = np.arange(start, stop)
+        events, block_state = update_raw_qc_block(
+            raw_values[start:stop],
+            stage="runtime",
+            sample_indices=sample_indices,
+            relative_times_s=sample_indices / FS_HZ,
+            state=block_state,
+            cfg=cfg,
+            fs_hz=float(FS_HZ),
+        )
+        block_events.extend((start + offset, event) for offset, event in events)
+        start = stop
+
+    assert start == raw_values.size
+    assert {event.event_type for _, event in scalar_events} == {
+        "saturation",
+        "flatline",
+        "baseline_shift",
+    }
+    assert block_events == scalar_events
+    assert block_state == scalar_state
+
+
+def test_pipeline_config_plan_is_compiled_once_per_config() -> None:
+    cfg = _make_pipeline_config(processing_mode="movement")
+
+    plan = cfg.plan
+
+    assert cfg.plan is plan
+    assert plan.calibration_target_samples == cfg.calibration_target_samples == 20
+    assert plan.hold_activity_window_samples == 10
+    assert plan.output_smoothing_activity_window_samples == 50
+    assert plan.extrema_min_interval_samples == 80
+    assert cfg.calibration_cfg is plan.calibration_cfg
+    assert plan.calibration_cfg.fs_hz == float(FS_HZ)
+    assert plan.adaptive_alphas_startup == adaptive_range_alphas(cfg.adaptive_cfg_startup)
+    assert plan.adaptive_alphas_runtime == adaptive_range_alphas(cfg.adaptive_cfg_runtime)
+    assert plan.hp_sos is not None and plan.hp_zi is not None
+
+    control_cfg = replace(cfg, processing_mode="control")
+    assert control_cfg.plan is not plan
+    assert control_cfg.plan.hp_sos is None
+    assert control_cfg == replace(control_cfg)
+
+
+def test_hold_latch_freezes_on_entry_and_releases_on_drift() -> None:
+    active, frozen = step_hold_latch(0.98, active=False, frozen=None, may_enter=True, must_exit=False)
+    assert (active, frozen) == (True, 0.98)
+
+    active, frozen = step_hold_latch(
+        0.98 - HOLD_RELEASE_DRIFT / 2,
+        active=active,
+        frozen=frozen,
+        may_enter=False,
+        must_exit=False,
+    )
+    assert (active, frozen) == (True, 0.98)
+
+    assert step_hold_latch(
+        0.98 - 2 * HOLD_RELEASE_DRIFT,
+        active=active,
+        frozen=frozen,
+        may_enter=False,
+        must_exit=False,
+    ) == (False, None)
+    assert step_hold_latch(0.98, active=True, frozen=0.98, may_enter=False, must_exit=True) == (
+        False,
+        None,
+    )
+
+
+def test_confirm_extremum_measures_prominence_from_the_opposite_extremum() -> None:
+    common = {"last_peak": 1.0, "last_trough": -1.0, "baseline": 0.0, "prominence_threshold": 0.5}
+
+    assert confirm_extremum(0.6, rising=True, **common) == 1.0
+    assert confirm_extremum(-0.6, rising=False, **common) == -1.0
+    assert confirm_extremum(0.6, rising=False, **common) == 0.0
+    # Before the first trough the peak is measured against the baseline.
+    assert confirm_extremum(0.4, rising=True, **{**common, "last_trough": None}) == 0.0
@@ -9,7 +9,7 @@ matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 
-from src.plot import setup_live_plots, update_live_plots
+from src.plot import decimate_min_max, setup_live_plots, update_live_plots
 
 
 def test_setup_live_plots_creates_side_by_side_dashboard() -> None:
@@ -229,3 +229,48 @@ def test_update_live_plots_supports_autoscaled_movement_trace() -> None:
         assert normalized_y_limits[1] > 8.0
     finally:
         plt.close(fig)
+
+
+def test_update_live_plots_reuses_marker_artists_between_redraws() -> None:
+    fig, raw_ax, raw_line, normalized_ax, normalized_line, _ = setup_live_plots()
+
+    try:
+        for peak_time in (1.0, 2.0):
+            update_live_plots(
+                raw_channel_data=np.array([10.0, 20.0, 30.0], dtype=float),
+                raw_time=np.array([0.0, 1.0, 2.0], dtype=float),
+                normalized_channel_data=np.array([0.2, 0.4, 0.6], dtype=float),
+                normalized_time=np.array([0.0, 1.0, 2.0], dtype=float),
+                raw_ax=raw_ax,
+                raw_line=raw_line,
+                normalized_ax=normalized_ax,
+                normalized_line=normalized_line,
+                peak_times=np.array([peak_time], dtype=float),
+                peak_values=np.array([20.0], dtype=float),
+            )
+            if peak_time == 1.0:
+                peak_artist = raw_ax._peak_marker_artist
+
+        assert raw_ax._peak_marker_artist is peak_artist
+        assert np.allclose(peak_artist.get_offsets(), [[2.0, 20.0]])
+        assert len(raw_ax.collections) == 1
+    finally:
+        plt.close(fig)
+
+
+def test_decimate_min_max_keeps_extremes_in_order() -> None:
+    x_values = np.arange(10_000, dtype=float)
+    y_values = np.sin(x_values / 300.0)
+    y_values[4321] = 5.0
+    y_values[8765] = -5.0
+
+    decimated_x, decimated_y = decimate_min_max(x_values, y_values, 100)
+
+    assert decimated_x.size <= 201
+    assert np.all(np.diff(decimated_x) >= 0.0)
+    assert (decimated_x[0], decimated_x[-1]) == (0.0, 9999.0)
+    assert 4321.0 in decimated_x and 8765.0 in decimated_x
+    assert decimated_y.max() == 5.0 and decimated_y.min() == -5.0
+    short_x, short_y = decimate_min_max(x_values[:150], y_values[:150], 100)
+    assert np.array_equal(short_x, x_values[:150])
+    assert np.array_equal(short_y, y_values[:150])
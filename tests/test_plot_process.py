@@ -0,0 +1,94 @@
+"""Tests for the shared-memory live plotting process."""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from src.plot_process import (
+    LivePlotProcess,
+    PlotProcessOptions,
+    PlotSharedBuffer,
+    plot_window_messages,
+)
+
+
+def test_plot_shared_buffer_keeps_newest_window_across_wraps() -> None:
+    writer = PlotSharedBuffer(5)
+    reader = PlotSharedBuffer(5, name=writer.name)
+    try:
+        writer.append(raw=(np.arange(3), np.arange(3) * 10.0))
+        writer.append(raw=(np.arange(3, 7), np.arange(3, 7) * 10.0), peak=([4], [40.0]))
+        first = reader.snapshot()
+        writer.append(raw=(np.arange(7, 20), np.arange(7, 20) * 10.0))
+        second = reader.snapshot()
+
+        with pytest.raises(ValueError, match="Unknown plot series"):
+            writer.append(markers=([0], [0.0]))
+        with pytest.raises(ValueError, match="matching 1D arrays"):
+            writer.append(trough=([0, 1], [0.0]))
+    finally:
+        reader.close()
+        writer.close()
+
+    assert first is not None and second is not None
+    assert first.series["raw"][0].tolist() == [2.0, 3.0, 4.0, 5.0, 6.0]
+    assert first.series["raw"][1].tolist() == [20.0, 30.0, 40.0, 50.0, 60.0]
+    assert first.series["peak"][0].tolist() == [4.0]
+    assert first.series["normalized"][0].size == 0
+    assert second.series["raw"][0].tolist() == [15.0, 16.0, 17.0, 18.0, 19.0]
+    assert second.sequence > first.sequence
+
+
+def test_plot_window_messages_report_range_and_out_of_bounds_values() -> None:
+    values = np.array([-0.1, 0.5, 1.2])
+
+    assert plot_window_messages(values, processing_mode="control", report_range=True) == [
+        "Plot window range check: min=-0.1000, max=1.2000, points=3",
+        "WARNING: plotted window out of [0,1] (min=-0.100000, max=1.200000)",
+    ]
+    assert plot_window_messages(values, processing_mode="movement", report_range=False) == []
+
+
+def test_live_plot_process_draws_frames_from_shared_memory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("MPLBACKEND", "Agg")
+    plot_process = LivePlotProcess(
+        300,
+        PlotProcessOptions(
+            refresh_hz=50.0,
+            width_px=50,
+            processing_mode="control",
+            normalized_title="Breath Level (0-1)",
+            normalized_label="Breath Level",
+            sampling_rate_hz=100,
+            debug_window_bounds=False,
+        ),
+    )
+    try:
+        indices = np.arange(1000)
+        plot_process.append(
+            indices,
+            np.sin(indices / 20.0),
+            indices,
+            0.5 + 0.5 * np.sin(indices / 20.0),
+            peak_x=np.array([31]),
+            peak_y=np.array([1.0]),
+            trough_x=np.array([94]),
+            trough_y=np.array([-1.0]),
+        )
+        deadline = time.monotonic() + 30.0
+        while plot_process.frames_drawn == 0 and time.monotonic() < deadline:
+            assert plot_process.stats()["exitcode"] is None
+            time.sleep(0.05)
+        frames_drawn = plot_process.frames_drawn
+    finally:
+        plot_process.close()
+
+    stats = plot_process.stats()
+    assert frames_drawn >= 1
+    assert stats["backend"] == "process"
+    assert stats["exitcode"] == 0
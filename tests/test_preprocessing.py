@@ -0,0 +1,91 @@
+"""Regression tests for the stateful live-filter helpers."""
+
+from __future__ import annotations
+
+from collections import deque
+
+import numpy as np
+import pytest
+from scipy.signal import sosfilt
+
+from src.preprocessing import (
+    RunningMean,
+    SosFilter,
+    get_high_pass_filter_coeffs,
+    get_low_pass_filter_coeffs,
+)
+
+
+@pytest.mark.parametrize(
+    "coeffs",
+    [
+        get_high_pass_filter_coeffs(0.05, 100, 5, initial_value=512.0),
+        get_low_pass_filter_coeffs(1.0, 100, 2, initial_value=512.0),
+    ],
+)
+def test_sos_filter_step_and_process_match_sosfilt(coeffs) -> None:
+    sos, zi = coeffs
+    rng = np.random.default_rng(7)
+    values = 512.0 + 30.0 * np.sin(np.arange(600) / 25.0) + rng.normal(0.0, 2.0, size=600)
+    expected, expected_zf = sosfilt(sos, values, zi=zi)
+
+    stepped = SosFilter(sos, zi)
+    stepped_values = np.asarray([stepped.step(value) for value in values.tolist()])
+    blocked = SosFilter(sos, zi)
+    blocked_values = np.concatenate(
+        [blocked.process(values[:1]), blocked.process(values[1:250]), blocked.process(values[250:])]
+    )
+    mixed = SosFilter(sos, zi)
+    mixed_values = np.concatenate(
+        [
+            [mixed.step(value) for value in values[:100].tolist()],
+            mixed.process(values[100:400]),
+            [mixed.step(value) for value in values[400:].tolist()],
+        ]
+    )
+
+    np.testing.assert_allclose(stepped_values, expected, rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(blocked_values, expected, rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(mixed_values, expected, rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(stepped.zi, expected_zf, rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(blocked.zi, expected_zf, rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(mixed.zi, expected_zf, rtol=1e-12, atol=1e-9)
+    np.testing.assert_array_equal(blocked.sos, sos)
+
+
+def test_sos_filter_rejects_malformed_coefficients_and_state() -> None:
+    sos, zi = get_low_pass_filter_coeffs(1.0, 100, 2)
+
+    with pytest.raises(ValueError, match="n_sections, 6"):
+        SosFilter(sos[:, :5])
+    with pytest.raises(ValueError, match="a0 == 1"):
+        SosFilter(sos * 2.0)
+    with pytest.raises(ValueError, match="zi must have shape"):
+        SosFilter(sos, zi.reshape(-1))
+    with pytest.raises(ValueError, match="one-dimensional"):
+        SosFilter(sos).process(np.zeros((2, 2)))
+
+
+def test_running_mean_tracks_deque_window_mean() -> None:
+    window = RunningMean(7)
+    reference: deque[float] = deque(maxlen=7)
+    rng = np.random.default_rng(3)
+
+    assert np.isnan(window.mean())
+    for value in rng.uniform(0.0, 1e4, size=500).tolist():
+        window.append(value)
+        reference.append(value)
+        assert len(window) == len(reference)
+        assert window.is_full == (len(reference) == reference.maxlen)
+        assert list(window) == list(reference)
+        assert window.mean() == pytest.approx(float(np.mean(reference)), rel=1e-12)
+
+    window.clear()
+    assert len(window) == 0
+    assert not window.is_full
+    assert window.maxlen == 7
+    window.append(2.0)
+    assert window.mean() == 2.0
+
+    with pytest.raises(ValueError, match="maxlen must be positive"):
+        RunningMean(0)
@@ -0,0 +1,201 @@
+"""Tests for the live-loop profilers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import pstats
+import shutil
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+import src.main as main_module
+from src.profiling import (
+    CProfileLoopProfiler,
+    SamplingLoopProfiler,
+    collapsed_from_pstats,
+    create_loop_profiler,
+)
+
+
+def _busy_work(duration_s: float) -> int:
+    total = 0
+    deadline = time.perf_counter() + duration_s
+    while time.perf_counter() < deadline:
+        total += sum(range(200))
+    return total
+
+
+def _unprofiled_work(duration_s: float) -> int:
+    return _busy_work(duration_s)
+
+
+def _collapsed_lines(path: Path) -> list[tuple[str, int]]:
+    lines = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        stack, weight = line.rsplit(" ", 1)
+        lines.append((stack, int(weight)))
+    return lines
+
+
+def test_cprofile_loop_profiler_only_records_the_loop_body() -> None:
+    output_dir = Path(".codex-tmp") / f"cprofile-test-{uuid4().hex}"
+    output_dir.mkdir(parents=True)
+    profiler = CProfileLoopProfiler()
+    try:
+        profiler.start()
+        for _ in range(2):
+            profiler.resume()
+            _busy_work(0.02)
+            profiler.pause()
+            _unprofiled_work(0.01)
+        pstats_path, collapsed_path = profiler.write(output_dir)
+        stats = pstats.Stats(str(pstats_path))
+        collapsed = _collapsed_lines(collapsed_path)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    function_names = {name for _, _, name in stats.stats}
+    assert "_busy_work" in function_names
+    assert "_unprofiled_work" not in function_names
+    assert profiler.summary()["profiled_sections"] == 2
+    assert any(stack.startswith("_busy_work (test_profiling.py:") for stack, _ in collapsed)
+    assert all(weight > 0 for _, weight in collapsed)
+
+
+def test_sampling_loop_profiler_samples_other_threads_and_the_loop_body() -> None:
+    output_dir = Path(".codex-tmp") / f"sampling-test-{uuid4().hex}"
+    output_dir.mkdir(parents=True)
+    profiler = SamplingLoopProfiler(interval_s=0.002)
+    worker = threading.Thread(target=_busy_work, args=(0.3,), name="BenchWorker")
+    try:
+        profiler.start()
+        worker.start()
+        profiler.resume()
+        _busy_work(0.15)
+        profiler.pause()
+        _unprofiled_work(0.1)
+        worker.join()
+        pstats_path, collapsed_path = profiler.write(output_dir)
+        stats = pstats.Stats(str(pstats_path))
+        collapsed = _collapsed_lines(collapsed_path)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    summary = profiler.summary()
+    assert summary["samples"] > 10
+    assert summary["elapsed_s"] > 0.2
+    assert any(stack.startswith("BenchWorker;") for stack, _ in collapsed)
+    main_stacks = [stack for stack, _ in collapsed if stack.startswith("MainThread;")]
+    assert any("_busy_work" in stack for stack in main_stacks)
+    assert not any("_unprofiled_work" in stack for stack in main_stacks)
+    busy_key = next(key for key in stats.stats if key[2] == "_busy_work")
+    cc, nc, tt, ct, callers = stats.stats[busy_key]
+    assert 0.0 < tt <= ct
+    assert callers
+
+
+def test_collapsed_from_pstats_splits_callee_time_between_callers() -> None:
+    main = ("app.py", 1, "main")
+    left = ("app.py", 10, "left")
+    right = ("app.py", 20, "right")
+    shared = ("app.py", 30, "shared")
+    stats = {
+        main: (1, 1, 0.001, 0.010, {}),
+        left: (1, 1, 0.001, 0.004, {main: (1, 1, 0.001, 0.004)}),
+        right: (1, 1, 0.002, 0.005, {main: (1, 1, 0.002, 0.005)}),
+        shared: (
+            4,
+            4,
+            0.006,
+            0.006,
+            {left: (1, 1, 0.003, 0.003), right: (3, 3, 0.003, 0.003)},
+        ),
+    }
+
+    collapsed = collapsed_from_pstats(stats)
+
+    assert collapsed == {
+        "main (app.py:1)": 1000,
+        "main (app.py:1);left (app.py:10)": 1000,
+        "main (app.py:1);left (app.py:10);shared (app.py:30)": 3000,
+        "main (app.py:1);right (app.py:20)": 2000,
+        "main (app.py:1);right (app.py:20);shared (app.py:30)": 3000,
+    }
+
+
+@pytest.mark.parametrize("mode", ["cprofile", "sample"])
+def test_main_profile_option_writes_profile_into_session_folder(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    mode: str,
+) -> None:
+    root_dir = Path(".codex-tmp") / f"profile-run-test-{uuid4().hex}"
+    config_path = root_dir / "config.toml"
+    root_dir.mkdir(parents=True)
+    config_path.write_text(
+        "\n".join(
+            [
+                "[device]",
+                'backend = "synthetic"',
+                "sampling_rate_hz = 100",
+                "channels = [0]",
+                "[display]",
+                "enable_plot = false",
+                "[lsl]",
+                "enable = false",
+                "[calibration]",
+                "duration_s = 1.0",
+                "[synthetic_device]",
+                "realtime = false",
+                "[output]",
+                f'root_dir = "{(root_dir / "runs").as_posix()}"',
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    stop_at = time.monotonic() + 0.5
+    monkeypatch.setitem(
+        sys.modules,
+        "keyboard",
+        SimpleNamespace(is_pressed=lambda _: time.monotonic() >= stop_at),
+    )
+    monkeypatch.setattr(main_module, "prompt_processing_mode", lambda: (1, "control"))
+    try:
+        exit_code = main_module.main(
+            [
+                "--config",
+                str(config_path),
+                "--profile",
+                mode,
+                "--profile-interval-ms",
+                "1",
+            ]
+        )
+        (session_dir,) = (root_dir / "runs").iterdir()
+        metadata = json.loads((session_dir / "session_metadata.json").read_text(encoding="utf-8"))
+        stats = pstats.Stats(str(session_dir / "profile.pstats"))
+        collapsed = (session_dir / "profile.collapsed").read_text(encoding="utf-8")
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert exit_code == 0
+    assert metadata["profile"]["mode"] == mode
+    assert collapsed
+    assert any(name == "process_device_rows" for _, _, name in stats.stats)
+    assert f"Wrote {mode} profile to" in capsys.readouterr().out
+
+
+def test_create_loop_profiler_rejects_unknown_modes() -> None:
+    assert create_loop_profiler(None).summary() is None
+    assert create_loop_profiler(None).write(".") is None
+    with pytest.raises(ValueError, match="profile mode must be one of"):
+        create_loop_profiler("perf")
+    with pytest.raises(ValueError, match="interval_s must be positive"):
+        create_loop_profiler("sample", interval_s=0.0)
@@ -0,0 +1,266 @@
+"""Tests for offline session replay."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+import json
+from pathlib import Path
+import shutil
+import time
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+import src.main as main_module
+from src.pipeline import PipelineConfig, create_pipeline_state, process_device_rows
+from src.replay import load_recorded_session, read_device_samples, replay_session
+from src.session_writer import SessionWriter
+from src.settings import AppConfig, default_config, expected_bitalino_row_width
+from src.synthetic_device import SyntheticBITalino
+
+
+def _make_config() -> AppConfig:
+    defaults = default_config()
+    return replace(
+        defaults,
+        device=replace(defaults.device, sampling_rate_hz=100, channels=(0,)),
+        calibration=replace(defaults.calibration, duration_s=2.0),
+        adaptation=replace(defaults.adaptation, startup_duration_s=1.0),
+        synthetic_device=replace(defaults.synthetic_device, realtime=False, seed=11),
+    )
+
+
+def _record_session(
+    root_dir: Path,
+    config: AppConfig,
+    *,
+    sample_count: int,
+    processing_mode: str = "control",
+    gap_after: int | None = None,
+) -> Path:
+    """Write a session directory shaped like a live run's export."""
+
+    device = SyntheticBITalino(config.synthetic_device)
+    device.start(config.device.sampling_rate_hz, list(config.device.channels))
+    device_rows = device.read(sample_count)
+    source_sample_indices = np.arange(sample_count, dtype=np.int64)
+    if gap_after is not None:
+        source_sample_indices[gap_after:] += 25
+    capture_times_lsl_s = 1000.0 + source_sample_indices / config.device.sampling_rate_hz
+
+    pipeline_cfg = PipelineConfig.from_app_config(config, processing_mode)
+    batch, _ = process_device_rows(device_rows, create_pipeline_state(pipeline_cfg), pipeline_cfg)
+    writer = SessionWriter(
+        root_dir,
+        config,
+        device_sample_width=expected_bitalino_row_width(config.device.channels),
+    )
+    writer.write_device_rows(
+        batch,
+        device_rows,
+        source_sample_indices=source_sample_indices.tolist(),
+        capture_times_lsl_s=capture_times_lsl_s.tolist(),
+        lsl_timestamps_s=capture_times_lsl_s.tolist(),
+    )
+    writer.finalize({"processing_mode": processing_mode})
+    return writer.session_dir
+
+
+def _signal_rows(session_dir: Path) -> list[str]:
+    return (session_dir / "signal_trace.csv").read_text(encoding="utf-8").splitlines()
+
+
+def test_read_device_samples_restores_rows_and_timing() -> None:
+    config = _make_config()
+    root_dir = Path(".codex-tmp") / f"replay-read-test-{uuid4().hex}"
+    try:
+        session_dir = _record_session(root_dir, config, sample_count=120, gap_after=60)
+        block = read_device_samples(session_dir / "device_samples.csv")
+        recorded = load_recorded_session(session_dir)
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert block.device_rows.shape == (120, expected_bitalino_row_width(config.device.channels))
+    assert block.source_sample_indices[59:61].tolist() == [59, 85]
+    assert block.capture_times_lsl_s[0] == pytest.approx(1000.0)
+    assert len(block.contiguous_spans()) == 2
+    assert recorded.config == config
+    assert recorded.processing_mode == "control"
+
+
+def test_replay_matches_direct_processing_and_is_reproducible() -> None:
+    config = _make_config()
+    root_dir = Path(".codex-tmp") / f"replay-roundtrip-test-{uuid4().hex}"
+    try:
+        session_dir = _record_session(
+            root_dir,
+            config,
+            sample_count=600,
+            processing_mode="adaptive",
+        )
+        first = replay_session(session_dir)
+        second = replay_session(first.session_dir)
+
+        recorded = load_recorded_session(session_dir)
+        pipeline_cfg = PipelineConfig.from_app_config(config, "adaptive")
+        expected, _ = process_device_rows(
+            recorded.rows.device_rows,
+            create_pipeline_state(pipeline_cfg),
+            pipeline_cfg,
+        )
+        first_rows = _signal_rows(first.session_dir)
+        second_rows = _signal_rows(second.session_dir)
+        metadata = json.loads(
+            (first.session_dir / "session_metadata.json").read_text(encoding="utf-8")
+        )
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert first.processing_mode == "adaptive"
+    assert first.samples_processed == 600
+    assert first.session_dir.parent == session_dir / "replays"
+    assert len(first_rows) == 601
+    assert first_rows == second_rows
+    assert first_rows[-1].split(",")[9] == f"{expected.filtered_value[-1]:.6f}"
+    assert metadata["processing_mode"] == "adaptive"
+    assert metadata["selected_mode_number"] == 3
+    assert metadata["replay"]["source_session_dir"] == str(session_dir)
+
+
+def test_replay_applies_overrides_and_resets_at_source_gaps() -> None:
+    config = _make_config()
+    root_dir = Path(".codex-tmp") / f"replay-override-test-{uuid4().hex}"
+    try:
+        session_dir = _record_session(root_dir, config, sample_count=500, gap_after=300)
+        baseline = replay_session(session_dir)
+        tuned = replay_session(
+            session_dir,
+            overrides={"output_smoothing": {"enabled": False}, "hold": {"enabled": False}},
+            processing_mode="control",
+        )
+        tuned_config = load_recorded_session(tuned.session_dir).config
+        baseline_rows = _signal_rows(baseline.session_dir)
+        tuned_rows = _signal_rows(tuned.session_dir)
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert baseline.observed_gap_count == 1
+    assert tuned.observed_gap_count == 1
+    assert tuned_config.output_smoothing.enabled is False
+    assert tuned_config.hold.enabled is False
+    assert tuned_rows[0] == baseline_rows[0]
+    assert tuned_rows != baseline_rows
+
+
+def test_replay_rejects_unknown_override_keys() -> None:
+    config = _make_config()
+    root_dir = Path(".codex-tmp") / f"replay-bad-override-test-{uuid4().hex}"
+    try:
+        session_dir = _record_session(root_dir, config, sample_count=10)
+        with pytest.raises(ValueError, match="hold.enabeld"):
+            replay_session(session_dir, overrides={"hold": {"enabeld": False}})
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+
+def test_realtime_replay_follows_recorded_capture_times() -> None:
+    config = _make_config()
+    config = replace(config, device=replace(config.device, chunk_size=10))
+    root_dir = Path(".codex-tmp") / f"replay-realtime-test-{uuid4().hex}"
+    try:
+        session_dir = _record_session(root_dir, config, sample_count=31)
+        started = time.perf_counter()
+        result = replay_session(session_dir, realtime=True)
+        elapsed_s = time.perf_counter() - started
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert result.samples_processed == 31
+    assert elapsed_s >= 0.28
+
+
+def test_replay_subcommand_writes_replayed_session(capsys: pytest.CaptureFixture[str]) -> None:
+    config = _make_config()
+    root_dir = Path(".codex-tmp") / f"replay-cli-test-{uuid4().hex}"
+    output_root = root_dir / "out"
+    try:
+        session_dir = _record_session(root_dir, config, sample_count=300)
+        exit_code = main_module.main(
+            [
+                "replay",
+                str(session_dir),
+                "--set",
+                "extrema.min_interval_ms=900",
+                "--mode",
+                "movement",
+                "--output-root",
+                str(output_root),
+            ]
+        )
+        replayed_dirs = list(output_root.iterdir())
+        replayed = load_recorded_session(replayed_dirs[0])
+        bad_exit_code = main_module.main(["replay", str(session_dir), "--set", "hold"])
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    captured = capsys.readouterr()
+    assert exit_code == 0
+    assert "Replayed 300 samples (movement mode)" in captured.out
+    assert len(replayed_dirs) == 1
+    assert replayed.processing_mode == "movement"
+    assert replayed.config.extrema.min_interval_ms == 900
+    assert bad_exit_code == 2
+    assert "section.key=value" in captured.err
+
+
+
+def test_replay_reads_binary_sessions_like_csv_sessions() -> None:
+    config = _make_config()
+    root_dir = Path(".codex-tmp") / f"replay-binary-test-{uuid4().hex}"
+    try:
+        session_dir = _record_session(root_dir, config, sample_count=400, gap_after=250)
+        csv_replay = replay_session(session_dir)
+        binary_replay = replay_session(session_dir, overrides={"output": {"format": "binary"}})
+        from_binary = replay_session(
+            binary_replay.session_dir,
+            overrides={"output": {"format": "csv"}},
+        )
+        binary_files = {path.name for path in binary_replay.session_dir.iterdir()}
+        csv_rows = _signal_rows(csv_replay.session_dir)
+        from_binary_rows = _signal_rows(from_binary.session_dir)
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert "device_samples.bin" in binary_files
+    assert "signal_trace.csv" not in binary_files
+    assert from_binary.observed_gap_count == 1
+    assert from_binary_rows == csv_rows
+
+
+def test_replay_processes_every_configured_column() -> None:
+    config = _make_config()
+    config = replace(config, device=replace(config.device, channels=(0, 1)))
+    root_dir = Path(".codex-tmp") / f"replay-multichannel-test-{uuid4().hex}"
+    try:
+        session_dir = _record_session(root_dir, config, sample_count=400, gap_after=250)
+        single = replay_session(session_dir)
+        multi = replay_session(
+            session_dir,
+            overrides={"device": {"processed_sensor_columns": [5, 6]}},
+        )
+        single_rows = _signal_rows(single.session_dir)
+        multi_rows = _signal_rows(multi.session_dir)
+        channel_rows = (
+            (multi.session_dir / "channel_trace.csv").read_text(encoding="utf-8").splitlines()
+        )
+        metadata = json.loads((multi.session_dir / "session_metadata.json").read_text(encoding="utf-8"))
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert not (single.session_dir / "channel_trace.csv").exists()
+    assert len(channel_rows) == 401
+    assert channel_rows[0].split(",")[5:7] == ["raw_col5", "filtered_col5"]
+    assert multi_rows == single_rows
+    assert [channel["column"] for channel in metadata["multichannel"]["channels"]] == [5, 6]
+    assert multi.calibration_result == single.calibration_result
@@ -0,0 +1,143 @@
+"""Tests for parallel re-processing of recorded session archives."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+import json
+from pathlib import Path
+import shutil
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+import src.main as main_module
+from src.pipeline import PipelineConfig, create_pipeline_state, process_device_rows
+from src.replay import replay_session
+from src.reprocess import find_session_dirs, reprocess_sessions
+from src.session_writer import SessionWriter
+from src.settings import AppConfig, default_config, expected_bitalino_row_width
+from src.synthetic_device import SyntheticBITalino
+
+
+def _make_config(seed: int) -> AppConfig:
+    defaults = default_config()
+    return replace(
+        defaults,
+        device=replace(defaults.device, sampling_rate_hz=100, channels=(0,)),
+        calibration=replace(defaults.calibration, duration_s=2.0),
+        synthetic_device=replace(defaults.synthetic_device, realtime=False, seed=seed),
+    )
+
+
+def _record_session(root_dir: Path, name: str, *, seed: int, sample_count: int) -> Path:
+    config = _make_config(seed)
+    device = SyntheticBITalino(config.synthetic_device)
+    device.start(config.device.sampling_rate_hz, list(config.device.channels))
+    device_rows = device.read(sample_count)
+    source_sample_indices = np.arange(sample_count, dtype=np.int64)
+    capture_times_lsl_s = 1000.0 + source_sample_indices / config.device.sampling_rate_hz
+
+    pipeline_cfg = PipelineConfig.from_app_config(config, "control")
+    batch, _ = process_device_rows(device_rows, create_pipeline_state(pipeline_cfg), pipeline_cfg)
+    writer = SessionWriter(
+        root_dir,
+        config,
+        device_sample_width=expected_bitalino_row_width(config.device.channels),
+        session_name=name,
+    )
+    writer.write_device_rows(
+        batch,
+        device_rows,
+        source_sample_indices=source_sample_indices.tolist(),
+        capture_times_lsl_s=capture_times_lsl_s.tolist(),
+        lsl_timestamps_s=capture_times_lsl_s.tolist(),
+    )
+    writer.finalize({"processing_mode": "control"})
+    return writer.session_dir
+
+
+def test_reprocess_sessions_replays_archive_in_parallel_and_reports_failures() -> None:
+    root_dir = Path(".codex-tmp") / f"reprocess-test-{uuid4().hex}"
+    archive_dir = root_dir / "runs"
+    output_root = root_dir / "derived"
+    try:
+        first = _record_session(archive_dir, "20240101_120000_000000", seed=1, sample_count=400)
+        second = _record_session(
+            archive_dir / "20240102_090000_000000",
+            "p01",
+            seed=2,
+            sample_count=300,
+        )
+        broken = _record_session(archive_dir, "20240103_080000_000000", seed=3, sample_count=200)
+        (broken / "device_samples.csv").write_text("not,a,session\n", encoding="utf-8")
+        replay_session(first)
+
+        assert find_session_dirs(archive_dir) == [first, second, broken]
+
+        reported = []
+        result = reprocess_sessions(
+            archive_dir,
+            processing_mode="movement",
+            overrides={"extrema": {"min_interval_ms": 900}},
+            output_root=output_root,
+            workers=2,
+            on_result=reported.append,
+        )
+        expected_first = replay_session(
+            first,
+            processing_mode="movement",
+            overrides={"extrema": {"min_interval_ms": 900}},
+            output_root=root_dir / "expected",
+        )
+        derived_rows = (
+            (output_root / first.name / "signal_trace.csv").read_text(encoding="utf-8")
+        )
+        expected_rows = (expected_first.session_dir / "signal_trace.csv").read_text(
+            encoding="utf-8"
+        )
+        summary = json.loads((output_root / "reprocess_summary.json").read_text(encoding="utf-8"))
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert result.workers == 2
+    assert len(reported) == 3
+    assert [session.source_session_dir for session in result.sessions] == [first, second, broken]
+    assert [session.samples_processed for session in result.sessions] == [400, 300, 0]
+    assert result.sessions[1].session_dir == output_root / "20240102_090000_000000" / "p01"
+    assert all(session.processing_mode == "movement" for session in result.sessions)
+    assert [session.source_session_dir for session in result.failures] == [broken]
+    assert "ValueError" in result.failures[0].error
+    assert derived_rows == expected_rows
+    assert summary["session_count"] == 3
+    assert summary["failure_count"] == 1
+    assert summary["samples_processed"] == 700
+
+
+def test_reprocess_subcommand_reports_sessions_and_exit_code(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    root_dir = Path(".codex-tmp") / f"reprocess-cli-test-{uuid4().hex}"
+    archive_dir = root_dir / "runs"
+    try:
+        _record_session(archive_dir, "20240101_120000_000000", seed=4, sample_count=300)
+        exit_code = main_module.main(
+            [
+                "reprocess",
+                str(archive_dir),
+                "--workers",
+                "1",
+                "--output-root",
+                str(root_dir / "derived"),
+            ]
+        )
+        missing_exit_code = main_module.main(["reprocess", str(root_dir / "missing")])
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    captured = capsys.readouterr()
+    assert exit_code == 0
+    assert "OK " in captured.out
+    assert "Reprocessed 1/1 sessions (300 samples)" in captured.out
+    assert missing_exit_code == 2
+    assert "does not exist" in captured.err
@@ -3,19 +3,29 @@
 from __future__ import annotations
 
 import csv
+from dataclasses import replace
 from datetime import datetime
 import json
 from pathlib import Path
 import shutil
+import time
 from uuid import uuid4
 
 import numpy as np
 import pytest
 
+from src.binary_export import read_binary_table
 from src.calibration import AdaptiveRangeState, CalibrationResult
-from src.pipeline import PipelineSample
+from src.multichannel import MultiChannelBatch
+from src.pipeline import PipelineBatch, PipelineSample
 from src.quality import RawQCEvent
-from src.session_writer import SessionWriter, build_session_metadata
+from src.session_writer import (
+    AsyncSessionWriter,
+    SessionWriter,
+    build_session_metadata,
+    durability_loss_window,
+    finalize_session,
+)
 from src.settings import AppConfig, default_config, expected_bitalino_row_width
 
 
@@ -303,6 +313,131 @@ def test_session_writer_rejects_raw_row_width_mismatch() -> None:
         shutil.rmtree(root_dir, ignore_errors=True)
 
 
+def test_session_writer_batch_exports_match_per_sample_exports() -> None:
+    config = _make_config()
+    root_dir = Path(".codex-tmp") / f"session-writer-batch-test-{uuid4().hex}"
+    root_dir.mkdir(parents=True, exist_ok=False)
+    samples = [
+        PipelineSample(
+            stage="calibration",
+            sample_index=0,
+            relative_time_s=0.0,
+            selected_sensor_raw=512.0,
+            filtered_value=510.25,
+            cleaned_value=510.25,
+            normalized_value=None,
+            hold_mode_active=False,
+            adaptive_center=None,
+            adaptive_amplitude=None,
+            processing_mode="adaptive",
+        ),
+        PipelineSample(
+            stage="runtime",
+            sample_index=0,
+            relative_time_s=0.0,
+            selected_sensor_raw=530.0,
+            filtered_value=528.5,
+            cleaned_value=528.5,
+            normalized_value=0.625,
+            hold_mode_active=False,
+            adaptive_center=520.0,
+            adaptive_amplitude=10.0,
+            processing_mode="adaptive",
+            movement_value=-0.125,
+            extrema_event_code=1.0,
+            extrema_event_label="inhale_peak",
+        ),
+        PipelineSample(
+            stage="runtime",
+            sample_index=1,
+            relative_time_s=0.01,
+            selected_sensor_raw=498.0,
+            filtered_value=499.75,
+            cleaned_value=499.75,
+            normalized_value=0.125,
+            hold_mode_active=True,
+            adaptive_center=520.0,
+            adaptive_amplitude=10.0,
+            processing_mode="adaptive",
+            movement_value=0.25,
+            extrema_event_code=-1.0,
+            extrema_event_label="exhale_trough",
+        ),
+    ]
+    device_rows = np.array(
+        [[index, 0, 1, 0, 1, 0, sample.selected_sensor_raw] for index, sample in enumerate(samples)],
+        dtype=float,
+    )
+    source_sample_indices = [40, 41, 42]
+    capture_times_lsl_s = [100.0, 100.01, 100.02]
+    lsl_timestamps_s = [99.98, 99.99, 100.0]
+    event_timestamps_lsl_s = [None, 99.97, 99.98]
+    try:
+        scalar_writer = SessionWriter(
+            root_dir / "scalar",
+            config,
+            device_sample_width=_device_sample_width(config),
+        )
+        for offset, sample in enumerate(samples):
+            scalar_writer.write_device_row(
+                sample.stage,
+                sample.sample_index,
+                sample.relative_time_s,
+                device_rows[offset],
+                source_sample_index=source_sample_indices[offset],
+                capture_time_lsl_s=capture_times_lsl_s[offset],
+                lsl_timestamp_s=lsl_timestamps_s[offset],
+            )
+            scalar_writer.write_signal_sample(
+                sample,
+                **_timing_kwargs(
+                    source_sample_index=source_sample_indices[offset],
+                    capture_time_lsl_s=capture_times_lsl_s[offset],
+                    lsl_timestamp_s=lsl_timestamps_s[offset],
+                    event_timestamp_lsl_s=event_timestamps_lsl_s[offset],
+                ),
+            )
+        scalar_writer.close()
+
+        batch = PipelineBatch.from_samples(samples)
+        assert batch.to_samples() == samples
+        batch_writer = SessionWriter(
+            root_dir / "batch",
+            config,
+            device_sample_width=_device_sample_width(config),
+        )
+        batch_writer.write_device_rows(
+            batch,
+            device_rows,
+            source_sample_indices=source_sample_indices,
+            capture_times_lsl_s=capture_times_lsl_s,
+            lsl_timestamps_s=lsl_timestamps_s,
+        )
+        batch_writer.write_signal_batch(
+            batch,
+            source_sample_indices=source_sample_indices,
+            capture_times_lsl_s=capture_times_lsl_s,
+            lsl_timestamps_s=lsl_timestamps_s,
+            event_timestamps_lsl_s=event_timestamps_lsl_s,
+        )
+        with pytest.raises(ValueError, match="expected 3, observed 2"):
+            batch_writer.write_device_rows(
+                batch,
+                device_rows[:2],
+                source_sample_indices=source_sample_indices,
+                capture_times_lsl_s=capture_times_lsl_s,
+                lsl_timestamps_s=lsl_timestamps_s,
+            )
+        batch_writer.close()
+
+        for file_name in ("device_samples.csv", "signal_trace.csv"):
+            assert (batch_writer.session_dir / file_name).read_text(encoding="utf-8") == (
+                scalar_writer.session_dir / file_name
+            ).read_text(encoding="utf-8")
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+
 def test_session_writer_flush_incremental_fsyncs_all_csv_exports(monkeypatch) -> None:
     config = _make_config()
     root_dir = Path(".codex-tmp") / f"session-writer-flush-test-{uuid4().hex}"
@@ -625,3 +760,367 @@ def test_session_writer_uses_microseconds_to_avoid_same_second_directory_collisi
         if writer_two is not None:
             writer_two.close()
         shutil.rmtree(root_dir, ignore_errors=True)
+
+
+def test_session_writer_binary_format_round_trips_all_tables() -> None:
+    config = _make_config()
+    config = replace(config, output=replace(config.output, format="binary"))
+    root_dir = Path(".codex-tmp") / f"session-writer-binary-test-{uuid4().hex}"
+    samples = [
+        PipelineSample(
+            stage="calibration",
+            sample_index=0,
+            relative_time_s=0.0,
+            selected_sensor_raw=512.0,
+            filtered_value=510.25,
+            cleaned_value=510.25,
+            normalized_value=None,
+            hold_mode_active=False,
+            adaptive_center=None,
+            adaptive_amplitude=None,
+            processing_mode="movement",
+        ),
+        PipelineSample(
+            stage="runtime",
+            sample_index=0,
+            relative_time_s=0.0,
+            selected_sensor_raw=530.0,
+            filtered_value=528.5,
+            cleaned_value=528.5,
+            normalized_value=None,
+            hold_mode_active=True,
+            adaptive_center=None,
+            adaptive_amplitude=None,
+            processing_mode="movement",
+            movement_value=-0.125,
+            extrema_event_code=-1.0,
+            extrema_event_label="exhale_trough",
+        ),
+    ]
+    device_rows = np.array(
+        [[index, 0, 1, 0, 1, 0, sample.selected_sensor_raw] for index, sample in enumerate(samples)],
+        dtype=float,
+    )
+    qc_event = RawQCEvent(
+        event_type="clipping",
+        stage="runtime",
+        sample_index=0,
+        relative_time_s=0.0,
+        raw_value=1023.0,
+        threshold=1020.0,
+        message="Raw signal clipped.",
+    )
+    try:
+        writer = SessionWriter(root_dir, config, device_sample_width=_device_sample_width(config))
+        writer.write_device_row(
+            "calibration",
+            0,
+            0.0,
+            device_rows[0],
+            source_sample_index=7,
+            capture_time_lsl_s=10.0,
+            lsl_timestamp_s=9.98,
+        )
+        writer.write_signal_sample(
+            samples[0],
+            **_timing_kwargs(source_sample_index=7, capture_time_lsl_s=10.0, lsl_timestamp_s=9.98),
+        )
+        batch = PipelineBatch.from_samples(samples[1:])
+        writer.write_device_rows(
+            batch,
+            device_rows[1:],
+            source_sample_indices=[8],
+            capture_times_lsl_s=[10.01],
+            lsl_timestamps_s=[9.99],
+        )
+        writer.write_signal_batch(
+            batch,
+            source_sample_indices=[8],
+            capture_times_lsl_s=[10.01],
+            lsl_timestamps_s=[9.99],
+            event_timestamps_lsl_s=[9.98],
+        )
+        writer.write_qc_event(qc_event)
+        writer.flush_incremental()
+        writer.close()
+
+        written_files = sorted(path.name for path in writer.session_dir.iterdir())
+        device = read_binary_table(writer.session_dir / "device_samples")
+        signal = read_binary_table(writer.session_dir / "signal_trace")
+        qc = read_binary_table(writer.session_dir / "qc_events")
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert not any(name.endswith(".csv") for name in written_files)
+    assert {"device_samples.bin", "signal_trace.schema.json", "qc_events.bin"} <= set(written_files)
+    assert device["stage"].tolist() == ["calibration", "runtime"]
+    assert device["source_sample_index"].tolist() == [7, 8]
+    assert np.array_equal(
+        np.column_stack([device[f"device_col_{idx}"] for idx in range(7)]),
+        device_rows,
+    )
+    assert signal["processing_mode"].tolist() == ["movement", "movement"]
+    assert signal["hold_mode_active"].tolist() == [0, 1]
+    assert np.isnan(signal["event_timestamp_lsl_s"][0])
+    assert signal["event_timestamp_lsl_s"][1] == 9.98
+    assert np.isnan(signal["movement_value"][0])
+    assert signal["movement_value"][1] == -0.125
+    assert signal["extrema_event_label"].tolist() == ["", "exhale_trough"]
+    assert qc["event_type"].tolist() == ["clipping"]
+    assert qc["message"].tolist() == ["Raw signal clipped."]
+    assert qc["raw_value"].tolist() == [1023.0]
+
+
+@pytest.mark.parametrize("export_format", ["csv", "binary"])
+def test_session_writer_exports_wide_channel_trace(export_format: str) -> None:
+    config = _make_config()
+    config = replace(config, output=replace(config.output, format=export_format))
+    root_dir = Path(".codex-tmp") / f"session-writer-channel-trace-{uuid4().hex}"
+    batch = MultiChannelBatch(
+        processing_mode="control",
+        channel_columns=(5, 6),
+        runtime_mask=np.array([False, True]),
+        sample_index=np.array([99, 0]),
+        relative_time_s=np.array([0.99, 0.0]),
+        selected_sensor_raw=np.array([[512.0, 400.0], [520.0, 401.0]]),
+        filtered_value=np.array([[511.5, 399.5], [519.0, 400.5]]),
+        normalized_value=np.array([[np.nan, np.nan], [0.25, 0.75]]),
+        movement_value=np.full((2, 2), np.nan),
+        hold_mode_active=np.array([[False, False], [False, True]]),
+        adaptive_center=np.full((2, 2), np.nan),
+        adaptive_amplitude=np.full((2, 2), np.nan),
+        extrema_event_code=np.array([[0.0, 0.0], [1.0, 0.0]]),
+    )
+
+    try:
+        writer = SessionWriter(
+            root_dir,
+            config,
+            device_sample_width=_device_sample_width(config),
+            channel_columns=(5, 6),
+        )
+        writer.write_channel_batch(batch, source_sample_indices=[10, 11], lsl_timestamps_s=[1.0, 1.01])
+        with pytest.raises(ValueError, match="columns do not match"):
+            writer.write_channel_batch(
+                replace(batch, channel_columns=(5, 4)),
+                source_sample_indices=[10, 11],
+                lsl_timestamps_s=[1.0, 1.01],
+            )
+        writer.close()
+        if export_format == "binary":
+            trace = read_binary_table(writer.session_dir / "channel_trace")
+            rows = [
+                {name: str(trace[name][offset]) for name in trace}
+                for offset in range(2)
+            ]
+        else:
+            with (writer.session_dir / "channel_trace.csv").open(newline="", encoding="utf-8") as handle:
+                rows = list(csv.DictReader(handle))
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert [row["stage"] for row in rows] == ["calibration", "runtime"]
+    assert float(rows[1]["normalized_col6"]) == 0.75
+    assert float(rows[1]["filtered_col5"]) == 519.0
+    assert int(rows[1]["hold_mode_active_col6"]) == 1
+    assert float(rows[1]["extrema_event_code_col5"]) == 1.0
+    assert rows[0]["normalized_col5"] in {"", "nan"}
+
+
+def _write_runtime_chunk(writer, source_sample_index: int) -> None:
+    sample = PipelineSample(
+        stage="runtime",
+        sample_index=source_sample_index,
+        relative_time_s=source_sample_index / 100.0,
+        selected_sensor_raw=500.0 + source_sample_index,
+        filtered_value=500.0,
+        cleaned_value=500.0,
+        normalized_value=0.5,
+        hold_mode_active=False,
+        adaptive_center=None,
+        adaptive_amplitude=None,
+    )
+    batch = PipelineBatch.from_samples([sample])
+    writer.write_device_rows(
+        batch,
+        np.array([[0, 1, 2, 3, 4, sample.selected_sensor_raw, 0]], dtype=float),
+        source_sample_indices=[source_sample_index],
+        capture_times_lsl_s=[1.0 + source_sample_index / 100.0],
+        lsl_timestamps_s=[1.0 + source_sample_index / 100.0],
+    )
+    writer.write_signal_batch(
+        batch,
+        source_sample_indices=[source_sample_index],
+        capture_times_lsl_s=[1.0 + source_sample_index / 100.0],
+        lsl_timestamps_s=[1.0 + source_sample_index / 100.0],
+        event_timestamps_lsl_s=[None],
+    )
+    writer.flush_incremental()
+
+
+def test_async_session_writer_matches_sync_output_and_reports_backpressure(monkeypatch) -> None:
+    config = _make_config()
+    async_config = replace(
+        config,
+        output=replace(config.output, writer="async", writer_queue_max_items=2),
+    )
+    root_dir = Path(".codex-tmp") / f"session-writer-async-test-{uuid4().hex}"
+    monkeypatch.setattr("src.session_writer.os.fsync", lambda fd: time.sleep(0.002))
+    try:
+        sync_writer = SessionWriter(root_dir / "sync", config, device_sample_width=_device_sample_width(config))
+        async_writer = AsyncSessionWriter(
+            root_dir / "async",
+            async_config,
+            device_sample_width=_device_sample_width(config),
+        )
+        for source_sample_index in range(20):
+            _write_runtime_chunk(sync_writer, source_sample_index)
+            _write_runtime_chunk(async_writer, source_sample_index)
+        async_writer.drain()
+        stats = async_writer.writer_stats()
+        metadata = build_session_metadata(
+            config=async_config,
+            resolved_config_path=async_writer.resolved_config_path,
+            software_version="test",
+            started_at="start",
+            ended_at="end",
+            calibration_result=None,
+            adaptive_state=None,
+            qc_summary={},
+            writer_stats=stats,
+        )
+        sync_writer.close()
+        async_writer.finalize(metadata)
+
+        for file_name in ("device_samples.csv", "signal_trace.csv"):
+            assert (async_writer.session_dir / file_name).read_text(encoding="utf-8") == (
+                sync_writer.session_dir / file_name
+            ).read_text(encoding="utf-8")
+        written_metadata = json.loads(async_writer.metadata_path.read_text(encoding="utf-8"))
+        with pytest.raises(RuntimeError, match="closed"):
+            async_writer.flush_incremental()
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert stats["mode"] == "async"
+    assert stats["items_enqueued"] == stats["items_written"] == 60
+    assert stats["max_queue_depth"] <= 2
+    assert stats["backpressure_waits"] > 0
+    assert stats["write_latency_s_max"] >= stats["write_latency_s_mean"] > 0.0
+    assert written_metadata["export"]["writer"]["items_written"] == 60
+    assert written_metadata["export"]["format"] == "csv"
+
+
+def test_async_session_writer_surfaces_writer_thread_errors() -> None:
+    config = _make_config()
+    config = replace(config, output=replace(config.output, writer="async"))
+    root_dir = Path(".codex-tmp") / f"session-writer-async-error-test-{uuid4().hex}"
+    try:
+        writer = AsyncSessionWriter(root_dir, config, device_sample_width=_device_sample_width(config))
+        writer.write_device_row(
+            "runtime",
+            0,
+            0.0,
+            np.zeros(3),
+            source_sample_index=0,
+            capture_time_lsl_s=1.0,
+            lsl_timestamp_s=1.0,
+        )
+        with pytest.raises(RuntimeError, match="writer thread failed") as error_info:
+            writer.drain()
+        assert isinstance(error_info.value.__cause__, ValueError)
+        with pytest.raises(RuntimeError, match="writer thread failed"):
+            writer.close()
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+
+def test_finalize_session_writes_metadata_and_closes_after_writer_error() -> None:
+    config = _make_config()
+    config = replace(config, output=replace(config.output, writer="async"))
+    root_dir = Path(".codex-tmp") / f"session-writer-finalize-error-test-{uuid4().hex}"
+    try:
+        writer = AsyncSessionWriter(root_dir, config, device_sample_width=_device_sample_width(config))
+        writer.write_device_row(
+            "runtime",
+            0,
+            0.0,
+            np.zeros(3),
+            source_sample_index=0,
+            capture_time_lsl_s=1.0,
+            lsl_timestamp_s=1.0,
+        )
+        with pytest.raises(RuntimeError, match="writer thread failed"):
+            finalize_session(writer, lambda: {"processing_mode": "control"})
+        written_metadata = json.loads(writer.metadata_path.read_text(encoding="utf-8"))
+        closed = writer._writer._device_file is None
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert written_metadata["processing_mode"] == "control"
+    assert written_metadata["writer_error"].startswith("ValueError(")
+    assert closed
+
+
+@pytest.mark.parametrize(
+    ("durability", "expected_syncs_per_chunk"),
+    [("chunk", [1, 1, 1, 1, 1, 1]), ("rows", [0, 0, 1, 0, 0, 1]), ("close", [0] * 6)],
+)
+def test_session_writer_durability_policy_controls_fsync_frequency(
+    monkeypatch,
+    durability: str,
+    expected_syncs_per_chunk: list[int],
+) -> None:
+    config = _make_config()
+    config = replace(
+        config,
+        output=replace(config.output, durability=durability, durability_rows=3),
+    )
+    root_dir = Path(".codex-tmp") / f"session-writer-durability-test-{uuid4().hex}"
+    fsync_calls: list[int] = []
+    monkeypatch.setattr("src.session_writer.os.fsync", lambda fd: fsync_calls.append(fd))
+    try:
+        writer = SessionWriter(root_dir, config, device_sample_width=_device_sample_width(config))
+        assert writer.fsync_stats()["fsync_count"] == 1
+        syncs_per_chunk = []
+        for source_sample_index in range(6):
+            fsync_count_before = writer.fsync_stats()["fsync_count"]
+            _write_runtime_chunk(writer, source_sample_index)
+            syncs_per_chunk.append(writer.fsync_stats()["fsync_count"] - fsync_count_before)
+        fsync_count_before_close = writer.fsync_stats()["fsync_count"]
+        writer.close()
+        stats = writer.writer_stats()
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    assert syncs_per_chunk == expected_syncs_per_chunk
+    assert stats["fsync_count"] == fsync_count_before_close + 1
+    assert len(fsync_calls) == 3 * stats["fsync_count"]
+    assert stats["fsync_latency_s_max"] >= stats["fsync_latency_s_mean"] >= 0.0
+
+
+def test_durability_loss_window_reflects_policy() -> None:
+    config = _make_config()
+    config = replace(config, device=replace(config.device, sampling_rate_hz=100, chunk_size=10))
+
+    def window(**output_overrides):
+        return durability_loss_window(
+            replace(config, output=replace(config.output, **output_overrides))
+        )
+
+    assert window(durability="chunk")["max_unsynced_rows"] == 10
+    assert window(durability="interval", durability_interval_ms=500) == {
+        "policy": "interval",
+        "interval_ms": 500,
+        "rows": None,
+        "queued_rows": 0,
+        "max_unsynced_rows": 60,
+        "max_unsynced_s": 0.6,
+    }
+    assert window(durability="rows", durability_rows=200)["max_unsynced_rows"] == 209
+    assert window(durability="close")["max_unsynced_s"] is None
+
+    async_window = window(durability="chunk", writer="async", writer_queue_max_items=32)
+    assert async_window["queued_rows"] == 320
+    assert async_window["max_unsynced_rows"] == 330
+    assert window(durability="close", writer="async")["max_unsynced_rows"] is None
@@ -8,7 +8,14 @@ from uuid import uuid4
 
 import pytest
 
-from src.settings import default_config, load_config, validate_live_acquisition_config
+from src.settings import (
+    apply_config_overrides,
+    config_to_dict,
+    default_config,
+    load_config,
+    validate_live_acquisition_config,
+    write_config_toml,
+)
 
 
 def test_load_config_returns_defaults_when_file_is_missing() -> None:
@@ -77,3 +84,170 @@ def test_load_config_reads_runtime_print_settings() -> None:
 
     assert config.display.print_runtime_values is True
     assert config.display.runtime_print_percent == 50
+
+
+def test_load_config_rejects_unknown_calibration_engine() -> None:
+    config_path = Path(".codex-tmp") / f"invalid-calibration-engine-{uuid4().hex}.toml"
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_path.write_text('[calibration]\nengine = "sketch"\n', encoding="utf-8")
+
+    try:
+        with pytest.raises(ValueError, match="calibration.engine must be 'batch' or 'streaming'"):
+            load_config(config_path)
+    finally:
+        config_path.unlink(missing_ok=True)
+
+
+def test_load_config_reads_and_validates_output_settings() -> None:
+    config_path = Path(".codex-tmp") / f"output-format-{uuid4().hex}.toml"
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        config_path.write_text('[output]\nformat = "binary"\n', encoding="utf-8")
+        assert load_config(config_path).output.format == "binary"
+        config_path.write_text('[output]\nformat = "parquet"\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="output.format must be 'csv' or 'binary'"):
+            load_config(config_path)
+        config_path.write_text('[output]\nwriter = "async"\nwriter_queue_max_items = 8\n', encoding="utf-8")
+        output = load_config(config_path).output
+        assert (output.writer, output.writer_queue_max_items) == ("async", 8)
+        config_path.write_text('[output]\nwriter_queue_max_items = 0\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="output.writer_queue_max_items must be positive"):
+            load_config(config_path)
+        config_path.write_text('[output]\ndurability = "sometimes"\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="output.durability must be 'chunk', 'interval'"):
+            load_config(config_path)
+    finally:
+        config_path.unlink(missing_ok=True)
+
+
+def test_load_config_reads_and_validates_lsl_sender_settings() -> None:
+    config_path = Path(".codex-tmp") / f"lsl-sender-{uuid4().hex}.toml"
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        config_path.write_text('[lsl]\nsender = "thread"\nsender_queue_max_blocks = 8\n', encoding="utf-8")
+        lsl = load_config(config_path).lsl
+        assert (lsl.sender, lsl.sender_queue_max_blocks) == ("thread", 8)
+        config_path.write_text('[lsl]\nsender = "process"\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="lsl.sender must be 'inline' or 'thread'"):
+            load_config(config_path)
+        config_path.write_text("[lsl]\nsender_queue_max_blocks = 0\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="lsl.sender_queue_max_blocks must be positive"):
+            load_config(config_path)
+    finally:
+        config_path.unlink(missing_ok=True)
+
+
+def test_load_config_reads_and_validates_plot_backend_settings() -> None:
+    config_path = Path(".codex-tmp") / f"plot-backend-{uuid4().hex}.toml"
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        config_path.write_text(
+            '[display]\nplot_backend = "process"\nplot_refresh_hz = 5\nplot_width_px = 400\n',
+            encoding="utf-8",
+        )
+        display = load_config(config_path).display
+        assert (display.plot_backend, display.plot_refresh_hz, display.plot_width_px) == (
+            "process",
+            5.0,
+            400,
+        )
+        config_path.write_text('[display]\nplot_backend = "thread"\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="display.plot_backend must be 'inline' or 'process'"):
+            load_config(config_path)
+        config_path.write_text("[display]\nplot_refresh_hz = 0\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="display.plot_refresh_hz must be positive"):
+            load_config(config_path)
+    finally:
+        config_path.unlink(missing_ok=True)
+
+
+def test_load_config_reads_and_validates_processed_sensor_columns() -> None:
+    config_path = Path(".codex-tmp") / f"processed-columns-{uuid4().hex}.toml"
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        config_path.write_text("[device]\nprocessed_sensor_columns = [5, 6]\n", encoding="utf-8")
+        assert load_config(config_path).device.processed_sensor_columns == (5, 6)
+        for columns, message in (
+            ("[5, 7]", "must be within the expected BITalino row width"),
+            ("[5, 5, 6]", "must not contain duplicates"),
+            ("[6]", "must include device.processed_sensor_column"),
+        ):
+            config_path.write_text(
+                f"[device]\nprocessed_sensor_columns = {columns}\n",
+                encoding="utf-8",
+            )
+            with pytest.raises(ValueError, match=message):
+                load_config(config_path)
+    finally:
+        config_path.unlink(missing_ok=True)
+
+
+def test_synthetic_backend_does_not_require_mac_address() -> None:
+    defaults = default_config()
+    config = replace(defaults, device=replace(defaults.device, backend="synthetic"))
+
+    validate_live_acquisition_config(config)
+
+
+def test_load_config_reads_synthetic_device_section() -> None:
+    config_path = Path(".codex-tmp") / f"synthetic-device-{uuid4().hex}.toml"
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_path.write_text(
+        '[device]\nbackend = "synthetic"\n\n'
+        "[synthetic_device]\nrealtime = false\npacket_drop_probability = 0.01\n",
+        encoding="utf-8",
+    )
+
+    try:
+        config = load_config(config_path)
+    finally:
+        config_path.unlink(missing_ok=True)
+
+    assert config.device.backend == "synthetic"
+    assert config.synthetic_device.realtime is False
+    assert config.synthetic_device.packet_drop_probability == 0.01
+
+
+def test_load_config_reads_supervised_devices_and_round_trips() -> None:
+    config_path = Path(".codex-tmp") / f"devices-{uuid4().hex}.toml"
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        config_path.write_text(
+            "[device]\nsampling_rate_hz = 200\nchannels = [0, 1]\n\n"
+            '[[devices]]\nname = "p01"\nmac_address = "00:00:00:00:00:01"\n\n'
+            '[[devices]]\nname = "p02"\nmac_address = "00:00:00:00:00:02"\n'
+            "invert_signal = true\n",
+            encoding="utf-8",
+        )
+        config = load_config(config_path)
+        assert [entry.name for entry in config.devices] == ["p01", "p02"]
+        assert config.devices[0].device.sampling_rate_hz == 200
+        assert config.devices[1].device.invert_signal is True
+        assert config.devices[1].device.mac_address == "00:00:00:00:00:02"
+        validate_live_acquisition_config(config)
+
+        write_config_toml(config_path, config)
+        assert load_config(config_path) == config
+        assert "devices" not in config_to_dict(default_config())
+
+        for entries, message in (
+            ('[[devices]]\nname = "p01"\n\n[[devices]]\nname = "p01"\n', "is not unique"),
+            ('[[devices]]\nname = "p 01"\n', "devices\\[0\\].name must be"),
+            ('[[devices]]\nname = "p01"\nchannels = []\n', "devices\\[0\\].channels"),
+        ):
+            config_path.write_text(entries, encoding="utf-8")
+            with pytest.raises(ValueError, match=message):
+                load_config(config_path)
+
+        config_path.write_text('[[devices]]\nname = "p01"\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="devices\\[0\\].mac_address must be set"):
+            validate_live_acquisition_config(load_config(config_path))
+        with pytest.raises(ValueError, match="cannot be overridden"):
+            apply_config_overrides(load_config(config_path), {"devices": {"name": "p02"}})
+    finally:
+        config_path.unlink(missing_ok=True)
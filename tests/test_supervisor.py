@@ -0,0 +1,155 @@
+"""Tests for the multi-device acquisition supervisor."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+import json
+from pathlib import Path
+import shutil
+import time
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+import src.supervisor as supervisor_module
+from src.replay import load_recorded_session
+from src.settings import (
+    CalibrationSettings,
+    SupervisedDeviceConfig,
+    default_config,
+)
+from src.supervisor import run_supervisor, supervised_device_config
+
+
+class _FakeSender:
+    instances: list["_FakeSender"] = []
+
+    def __init__(self, *, name: str, channel_count: int, **_: object) -> None:
+        self.name = name
+        self.channel_count = channel_count
+        self.samples_sent = 0
+        _FakeSender.instances.append(self)
+
+    def send(self, data, timestamp=None) -> None:
+        del data, timestamp
+        self.samples_sent += 1
+
+    def send_chunk_array(self, samples: np.ndarray, timestamps: np.ndarray) -> None:
+        assert samples.shape == (timestamps.shape[0], self.channel_count)
+        self.samples_sent += int(samples.shape[0])
+
+
+def _supervised_config(root_dir: Path):
+    defaults = default_config()
+    synthetic_device = replace(defaults.device, backend="synthetic", sampling_rate_hz=200)
+    return replace(
+        defaults,
+        calibration=CalibrationSettings(duration_s=0.25),
+        output=replace(defaults.output, root_dir=str(root_dir)),
+        devices=(
+            SupervisedDeviceConfig(name="p01", device=synthetic_device),
+            SupervisedDeviceConfig(
+                name="p02",
+                device=replace(synthetic_device, processed_sensor_columns=(5, 6)),
+            ),
+        ),
+    )
+
+
+def test_supervised_device_config_derives_single_device_settings() -> None:
+    config = _supervised_config(Path("runs"))
+
+    derived = supervised_device_config(config, 1)
+
+    assert derived.devices == ()
+    assert derived.device == config.devices[1].device
+    assert derived.lsl.stream_name == "BreathingBelt_p02"
+    assert derived.lsl.source_id == "breathingbelt001_p02"
+    assert derived.synthetic_device.seed == config.synthetic_device.seed + 1
+
+
+def test_run_supervisor_processes_all_devices_and_reports_combined_stats(monkeypatch) -> None:
+    root_dir = Path(".codex-tmp") / f"supervisor-{uuid4().hex}"
+    _FakeSender.instances = []
+    monkeypatch.setattr(supervisor_module, "_import_lsl_sender", lambda: _FakeSender)
+    deadline = time.monotonic() + 1.0
+
+    try:
+        result = run_supervisor(
+            _supervised_config(root_dir),
+            "control",
+            should_stop=lambda: time.monotonic() >= deadline,
+        )
+
+        summary = json.loads(
+            (result.supervisor_dir / "supervisor_summary.json").read_text(encoding="utf-8")
+        )
+        assert summary == result.summary
+        assert set(summary["devices"]) == {"p01", "p02"}
+        assert summary["rows_processed"] == sum(
+            stats["rows_processed"] for stats in summary["devices"].values()
+        )
+        assert summary["scheduler_passes"] > 0
+
+        for name, session_dir in result.session_dirs.items():
+            assert session_dir == result.supervisor_dir / name
+            metadata = json.loads(
+                (session_dir / "session_metadata.json").read_text(encoding="utf-8")
+            )
+            assert metadata["supervisor"]["device_name"] == name
+            assert metadata["supervisor"]["devices"] == summary["devices"]
+            recorded = load_recorded_session(session_dir)
+            assert recorded.config.devices == ()
+            assert len(recorded.rows) == summary["devices"][name]["rows_processed"]
+            assert summary["devices"][name]["rows_processed"] > 50
+        assert (result.session_dirs["p02"] / "channel_trace.csv").exists()
+        assert not (result.session_dirs["p01"] / "channel_trace.csv").exists()
+
+        control_senders = {sender.name: sender for sender in _FakeSender.instances[::2]}
+        assert set(control_senders) == {"BreathingBelt_p01", "BreathingBelt_p02"}
+        assert control_senders["BreathingBelt_p02"].channel_count == 2
+        assert all(sender.samples_sent > 0 for sender in control_senders.values())
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+
+def test_run_supervisor_finalizes_every_device_when_one_fails(monkeypatch) -> None:
+    from src.session_writer import SessionWriter
+
+    root_dir = Path(".codex-tmp") / f"supervisor-failure-{uuid4().hex}"
+    monkeypatch.setattr(supervisor_module, "_import_lsl_sender", lambda: _FakeSender)
+    write_device_rows = SessionWriter.write_device_rows
+
+    def failing_write_device_rows(self, *args, **kwargs) -> None:
+        if self.session_dir.name == "p01":
+            raise OSError("disk full")
+        write_device_rows(self, *args, **kwargs)
+
+    monkeypatch.setattr(SessionWriter, "write_device_rows", failing_write_device_rows)
+    config = _supervised_config(root_dir)
+    config = replace(config, output=replace(config.output, writer="async"))
+    deadline = time.monotonic() + 1.0
+
+    try:
+        with pytest.raises(RuntimeError, match="Session writer thread failed."):
+            run_supervisor(
+                config,
+                "control",
+                should_stop=lambda: time.monotonic() >= deadline,
+            )
+
+        (supervisor_dir,) = root_dir.iterdir()
+        summary = json.loads((supervisor_dir / "supervisor_summary.json").read_text(encoding="utf-8"))
+        assert summary["device_errors"] == {"p01": "OSError('disk full')"}
+        p01_metadata = json.loads(
+            (supervisor_dir / "p01" / "session_metadata.json").read_text(encoding="utf-8")
+        )
+        p02_metadata = json.loads(
+            (supervisor_dir / "p02" / "session_metadata.json").read_text(encoding="utf-8")
+        )
+        assert p01_metadata["writer_error"] == "OSError('disk full')"
+        assert "writer_error" not in p02_metadata
+        assert p02_metadata["supervisor"]["device_name"] == "p02"
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
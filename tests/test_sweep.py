@@ -0,0 +1,237 @@
+"""Tests for parameter sweeps over recorded sessions."""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import replace
+from pathlib import Path
+import shutil
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+import src.main as main_module
+from src.connect import AcquiredBlock
+from src.pipeline import (
+    PipelineConfig,
+    create_pipeline_state,
+    process_device_rows,
+    reset_pipeline_state_for_source_gap,
+)
+from src.replay import RecordedSession
+from src.session_writer import SessionWriter
+from src.settings import AppConfig, apply_config_overrides, default_config
+from src.sweep import (
+    grid_search_points,
+    prepare_sweep_session,
+    random_search_points,
+    run_sweep,
+    sweep_metrics,
+    sweep_point_batches,
+    write_sweep_results,
+)
+from src.synthetic_device import SyntheticBITalino
+
+_GAP_OFFSETS = (199, 900)
+
+
+def _make_config() -> AppConfig:
+    defaults = default_config()
+    return replace(
+        defaults,
+        device=replace(defaults.device, sampling_rate_hz=100, channels=(0,)),
+        calibration=replace(defaults.calibration, duration_s=2.0),
+        adaptation=replace(defaults.adaptation, startup_duration_s=1.0),
+        raw_qc=replace(defaults.raw_qc, flatline_duration_s=0.3, warmup_s=0.5),
+        synthetic_device=replace(
+            defaults.synthetic_device,
+            realtime=False,
+            seed=21,
+            dropout_probability=0.002,
+        ),
+    )
+
+
+def _recorded_session(processing_mode: str, row_count: int = 3000) -> RecordedSession:
+    config = _make_config()
+    device = SyntheticBITalino(config.synthetic_device)
+    device.start(config.device.sampling_rate_hz, list(config.device.channels))
+    source_sample_indices = np.arange(row_count, dtype=np.int64)
+    for gap_offset in _GAP_OFFSETS:
+        source_sample_indices[gap_offset:] += 10
+    return RecordedSession(
+        session_dir=Path("recorded"),
+        config=config,
+        processing_mode=processing_mode,
+        rows=AcquiredBlock(
+            device_rows=device.read(row_count),
+            source_sample_indices=source_sample_indices,
+            capture_times_lsl_s=source_sample_indices / config.device.sampling_rate_hz,
+        ),
+    )
+
+
+def _full_run_batches(recorded: RecordedSession, config: AppConfig, processing_mode: str):
+    cfg = PipelineConfig.from_app_config(config, processing_mode)
+    state = create_pipeline_state(cfg)
+    batches = []
+    for index, span_rows in enumerate(recorded.rows.contiguous_spans()):
+        if index:
+            reset_pipeline_state_for_source_gap(state)
+        batch, state = process_device_rows(span_rows.device_rows, state, cfg)
+        batches.append(batch)
+    return batches
+
+
+@pytest.mark.parametrize(
+    ("processing_mode", "point"),
+    [
+        ("control", {"hold": {"ratio_per_sec_enter": 0.4, "ratio_per_sec_exit": 0.9}}),
+        ("control", {"output_smoothing": {"tau_active_s": 0.1}, "extrema": {"min_interval_ms": 1500}}),
+        ("movement", {"extrema": {"prominence_ratio": 0.3}}),
+        ("adaptive", {"adaptation": {"startup_center_tau_s": 5.0, "amplitude_tau_s": 30.0}}),
+    ],
+)
+def test_sweep_point_matches_full_pipeline_run(processing_mode: str, point: dict) -> None:
+    recorded = _recorded_session(processing_mode)
+    prepared = prepare_sweep_session(recorded)
+
+    sweep_batches = sweep_point_batches(prepared, point)
+    full_batches = _full_run_batches(
+        recorded,
+        apply_config_overrides(recorded.config, point),
+        processing_mode,
+    )
+
+    assert prepared.snapshot_offset == _GAP_OFFSETS[0]
+    assert [len(batch) for batch in sweep_batches] == [
+        len(batch) for batch in full_batches[1:]
+    ]
+    for name in (
+        "runtime_mask",
+        "sample_index",
+        "filtered_value",
+        "normalized_value",
+        "movement_value",
+        "hold_mode_active",
+        "adaptive_center",
+        "adaptive_amplitude",
+        "extrema_event_code",
+    ):
+        expected = np.concatenate([getattr(batch, name) for batch in full_batches[1:]])
+        actual = np.concatenate([getattr(batch, name) for batch in sweep_batches])
+        np.testing.assert_array_equal(actual, expected, err_msg=name)
+    metrics = sweep_metrics(sweep_batches, 100)
+    assert metrics == sweep_metrics(full_batches, 100)
+    assert metrics["inhale_peak_count"] >= 3
+
+
+def test_run_sweep_reports_invalid_points_and_shares_unused_sections() -> None:
+    prepared = prepare_sweep_session(_recorded_session("movement"))
+    points = grid_search_points(
+        {
+            "hold": {"ratio_per_sec_enter": [0.5, 2.0]},
+            "extrema": {"min_interval_ms": [600, 1200]},
+        }
+    )
+
+    result = run_sweep(prepared, points)
+
+    assert [point.point for point in result.points][:2] == [
+        {"hold": {"ratio_per_sec_enter": 0.5}, "extrema": {"min_interval_ms": 600}},
+        {"hold": {"ratio_per_sec_enter": 0.5}, "extrema": {"min_interval_ms": 1200}},
+    ]
+    assert [point.error is None for point in result.points] == [True, True, False, False]
+    assert "hold.ratio_per_sec_exit must exceed" in result.points[2].error
+    assert result.points[0].metrics["inhale_peak_count"] > 0
+    assert (
+        result.points[1].metrics["inhale_peak_count"]
+        <= result.points[0].metrics["inhale_peak_count"]
+    )
+    assert prepared.qc_event_count > 0
+
+    with pytest.raises(ValueError, match="not supported"):
+        grid_search_points({"filter": {"lp_cutoff_hz": [1.0]}})
+    with pytest.raises(ValueError, match="non-empty list"):
+        grid_search_points({"hold": {"floor_per_sec": 0.5}})
+
+
+def test_random_search_points_draw_from_lists_and_ranges() -> None:
+    space = {
+        "extrema": {"min_interval_ms": {"low": 500, "high": 900}},
+        "hold": {"edge_margin_ratio": {"low": 0.1, "high": 0.3}, "enabled": [True, False]},
+    }
+
+    points = random_search_points(space, 20, seed=3)
+
+    assert points == random_search_points(space, 20, seed=3)
+    assert all(500 <= point["extrema"]["min_interval_ms"] <= 900 for point in points)
+    assert all(isinstance(point["extrema"]["min_interval_ms"], int) for point in points)
+    assert all(0.1 <= point["hold"]["edge_margin_ratio"] <= 0.3 for point in points)
+    assert {point["hold"]["enabled"] for point in points} == {True, False}
+
+
+def test_sweep_subcommand_writes_results_table(capsys: pytest.CaptureFixture[str]) -> None:
+    recorded = _recorded_session("control", row_count=800)
+    root_dir = Path(".codex-tmp") / f"sweep-cli-test-{uuid4().hex}"
+    output_path = root_dir / "results.csv"
+    try:
+        writer = SessionWriter(root_dir, recorded.config, device_sample_width=6)
+        rows = recorded.rows
+        cfg = PipelineConfig.from_app_config(recorded.config, "control")
+        batch, _ = process_device_rows(rows.device_rows, create_pipeline_state(cfg), cfg)
+        writer.write_device_rows(
+            batch,
+            rows.device_rows,
+            source_sample_indices=rows.source_sample_indices.tolist(),
+            capture_times_lsl_s=rows.capture_times_lsl_s.tolist(),
+            lsl_timestamps_s=rows.capture_times_lsl_s.tolist(),
+        )
+        writer.finalize({"processing_mode": "control"})
+        exit_code = main_module.main(
+            [
+                "sweep",
+                str(writer.session_dir),
+                "--param",
+                "hold.ratio_per_sec_enter=[0.5, 1.0]",
+                "--param",
+                "output_smoothing.tau_active_s=[0.1, 0.25, 0.5]",
+                "--output",
+                str(output_path),
+            ]
+        )
+        with output_path.open(newline="", encoding="utf-8") as handle:
+            rows_out = list(csv.DictReader(handle))
+        bad_exit_code = main_module.main(
+            ["sweep", str(writer.session_dir), "--param", "filter.lp_cutoff_hz=[1.0]"]
+        )
+    finally:
+        shutil.rmtree(root_dir, ignore_errors=True)
+
+    captured = capsys.readouterr()
+    assert exit_code == 0
+    assert "Evaluated 6 sweep points (0 invalid, control mode)" in captured.out
+    assert len(rows_out) == 6
+    assert rows_out[0]["hold.ratio_per_sec_enter"] == "0.5"
+    assert rows_out[5]["output_smoothing.tau_active_s"] == "0.5"
+    assert float(rows_out[0]["jitter_rms"]) > 0.0
+    assert rows_out[0]["error"] == ""
+    assert bad_exit_code == 2
+    assert "not supported" in captured.err
+
+
+def test_write_sweep_results_leaves_metrics_blank_for_invalid_points() -> None:
+    prepared = prepare_sweep_session(_recorded_session("control", row_count=400))
+    result = run_sweep(prepared, [{"extrema": {"min_interval_ms": 0}}])
+    output_path = Path(".codex-tmp") / f"sweep-results-{uuid4().hex}.csv"
+    try:
+        write_sweep_results(output_path, result)
+        with output_path.open(newline="", encoding="utf-8") as handle:
+            (row,) = list(csv.DictReader(handle))
+    finally:
+        output_path.unlink(missing_ok=True)
+
+    assert row["extrema.min_interval_ms"] == "0"
+    assert row["jitter_rms"] == ""
+    assert "extrema.min_interval_ms must be positive" in row["error"]
@@ -0,0 +1,86 @@
+"""Tests for the simulated BITalino device backend."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+import time
+
+import numpy as np
+import pytest
+
+from src.connect import BreathBelt
+from src.settings import SyntheticDeviceConfig
+from src.synthetic_device import SyntheticBITalino
+
+
+def _fast_config(**overrides: object) -> SyntheticDeviceConfig:
+    return replace(SyntheticDeviceConfig(realtime=False, seed=5), **overrides)
+
+
+def test_synthetic_rows_follow_bitalino_layout_and_breathing_range() -> None:
+    device = SyntheticBITalino(_fast_config(noise_std=0.0))
+    device.start(100, [0, 1, 2])
+    rows = np.vstack([device.read(50) for _ in range(20)])
+    device.stop()
+    device.close()
+
+    assert rows.shape == (1000, 8)
+    assert rows[:, 0].tolist() == [float(index % 16) for index in range(1000)]
+    assert np.all(rows[:, 1:5] == [1.0, 1.0, 0.0, 0.0])
+    assert np.all(rows[:, 5:] == np.rint(rows[:, 5:]))
+    assert 360.0 < rows[:, 5].min() < 420.0
+    assert 600.0 < rows[:, 5].max() < 660.0
+    assert np.ptp(rows[:, 6]) < np.ptp(rows[:, 5])
+
+
+def test_synthetic_device_clips_drops_out_and_skips_packets() -> None:
+    device = SyntheticBITalino(
+        _fast_config(
+            breathing_amplitude=900.0,
+            dropout_probability=0.01,
+            dropout_duration_s=0.1,
+            packet_drop_probability=0.05,
+        )
+    )
+    device.start(100, [0])
+    rows = device.read(2000)
+
+    assert rows[:, 5].min() == 0.0
+    assert rows[:, 5].max() == 1023.0
+    sequence_steps = np.diff(rows[:, 0]) % 16
+    assert np.any(sequence_steps != 1.0)
+    assert device.packets_dropped_total == int(np.sum(sequence_steps - 1.0))
+
+
+def test_synthetic_device_paces_reads_in_realtime() -> None:
+    device = SyntheticBITalino(SyntheticDeviceConfig(realtime=True))
+    device.start(1000, [0])
+    started = time.perf_counter()
+    device.read(100)
+    device.read(100)
+
+    assert time.perf_counter() - started >= 0.19
+    with pytest.raises(ValueError, match="n_samples must be positive"):
+        device.read(0)
+
+
+def test_breath_belt_acquires_from_synthetic_backend() -> None:
+    belt = BreathBelt(
+        mac_address="",
+        sampling_rate=1000,
+        channels=(0, 1, 2, 3),
+        read_chunk_size=50,
+        queue_max_samples=5000,
+        device_factory=lambda: SyntheticBITalino(SyntheticDeviceConfig(realtime=True)),
+    )
+    belt.start()
+    try:
+        assert belt.wait_for_rows(timeout=2.0, min_rows=200)
+        block = belt.get_block()
+    finally:
+        belt.stop()
+
+    assert block.device_rows.shape[1] == 9
+    assert block.source_sample_indices.tolist() == list(range(len(block)))
+    assert np.allclose(np.diff(block.capture_times_lsl_s), 0.001)
+    assert belt.dropped_rows_total == 0